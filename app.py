@@ -15,6 +15,9 @@ import streamlit as st
 import logging
 import sys
 from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+import hashlib
 import json
 import os
 import re
@@ -35,8 +38,11 @@ try:
     from core.pdf_processor import PDFProcessor
     from core.vlm_service import VLMServiceV50
     from core.hybrid_extractor import HybridExtractor
+    from core.page_pipeline import PagePipeline
+    from core.job_checkpoint import JobCheckpoint
     from core.semantic_chunker import SemanticChunker
-    from core.dual_qa_gate import DualQAGate, extract_pdf_text_layer
+    from core.dual_qa_gate import DualQAGate
+    from core.text_layer import PdfTextLayer, extract_text_layer
     from core.utils_fs import safe_temp_path, safe_remove
     
     logger.info("✅ 모듈 import 성공")
@@ -229,24 +235,163 @@ def to_review_md_basic(
     return '\n'.join(lines)
 
 
-def process_document_vlm_mode(pdf_path: str, pdf_text: str):
-    """VLM Mode 파이프라인"""
+@dataclass
+class UploadArtifacts:
+    """
+    ✅ Phase 1.0: 업로드별 산출물 (파일 해시 키)
+    
+    Streamlit 재실행마다 임시 파일 저장/텍스트 추출/분류를 반복하지 않도록
+    업로드 1건당 1회만 계산하여 session_state에 보관.
+    """
+    file_hash: str
+    file_name: str
+    temp_path: str
+    text_layer: Any  # PdfTextLayer
+    classification: Optional[Tuple[str, float, Dict[str, Any]]] = None
+    
+    @property
+    def pdf_text(self) -> str:
+        return self.text_layer.text
+    
+    @property
+    def page_count(self) -> int:
+        return self.text_layer.page_count
+
+
+def get_upload_artifacts(uploaded_file) -> UploadArtifacts:
+    """
+    ✅ Phase 1.0: 업로드 산출물 조회 (같은 파일이면 재사용)
+    
+    파일이 바뀌면 이전 임시 파일을 삭제하고 새로 저장 + 텍스트 1회 추출.
+    
+    Args:
+        uploaded_file: st.file_uploader 결과
+    
+    Returns:
+        UploadArtifacts
+    """
+    data = uploaded_file.getbuffer()
+    file_hash = hashlib.sha256(data).hexdigest()
+    
+    artifacts = st.session_state.upload_artifacts
+    if (
+        artifacts is not None
+        and artifacts.file_hash == file_hash
+        and os.path.exists(artifacts.temp_path)
+    ):
+        return artifacts
+    
+    if artifacts is not None:
+        safe_remove(artifacts.temp_path)
+    
+    temp_pdf = safe_temp_path(uploaded_file.name)
+    with open(temp_pdf, 'wb') as f:
+        f.write(data)
+    
+    # PDF 텍스트 추출 (페이지별 텍스트 + 오프셋)
+    try:
+        text_layer = extract_text_layer(str(temp_pdf))
+    except Exception as e:
+        logger.error(f"❌ PDF 텍스트 추출 실패: {e}")
+        text_layer = PdfTextLayer.from_pages([], backend='none')
+    
+    artifacts = UploadArtifacts(
+        file_hash=file_hash,
+        file_name=uploaded_file.name,
+        temp_path=str(temp_pdf),
+        text_layer=text_layer
+    )
+    st.session_state.upload_artifacts = artifacts
+    
+    logger.info(f"📦 업로드 산출물 생성: {uploaded_file.name} ({text_layer.page_count}페이지)")
+    return artifacts
+
+
+def process_document_vlm_mode(
+    pdf_path: str,
+    pdf_text: str,
+    page_count: Optional[int] = None,
+    text_layer=None
+):
+    """
+    VLM Mode 파이프라인
+    
+    ✅ Phase 1.0: page_count 전달 시 PDF 재조회 생략 (UploadArtifacts)
+    ✅ Phase 1.0: text_layer 전달 시 텍스트 레이어 우선 라우팅에 재사용
+    ✅ Phase 1.0: 페이지별 체크포인트 (같은 문서 재실행 시 완료 페이지 건너뛰고 재개)
+      → 20페이지 제한 제거 (PRISM_VLM_MAX_PAGES로 선택적 제한)
+    """
     
     st.info("🖼️ VLM Mode: 이미지 기반 처리 중...")
     progress_bar = st.progress(0)
     
+    processor = None
     try:
         processor = PDFProcessor()
-        pages = processor.process(pdf_path)
-        max_pages = 20
-        if len(pages) > max_pages:
-            st.warning(f"⚠️ 페이지 수 제한: {len(pages)} → {max_pages}")
-            pages = pages[:max_pages]
+        total_pages = page_count if page_count is not None else processor.get_page_count(pdf_path)
+        max_pages = int(os.getenv("PRISM_VLM_MAX_PAGES", "0")) or None
+        if max_pages is not None and total_pages > max_pages:
+            st.warning(f"⚠️ 페이지 수 제한: {total_pages} → {max_pages}")
+        pages_to_process = max(1, min(total_pages, max_pages or total_pages))
         
         vlm_service = VLMServiceV50(provider='azure_openai')
-        extractor = HybridExtractor(vlm_service)
-        markdown_text = extractor.extract(pages)
+        extractor = HybridExtractor(
+            vlm_service,
+            pdf_path,
+            pdf_processor=processor,
+            text_layer=text_layer
+        )
+        
+        # ✅ Phase 1.0: 작업 체크포인트 (결과에 영향을 주는 설정별로 분리)
+        job = JobCheckpoint.for_document(
+            pdf_path,
+            config={
+                'provider': vlm_service.provider,
+                'model': vlm_service.model,
+                'post_validation': vlm_service.POST_VALIDATION_VERSION,
+                'text_first': extractor.text_first,
+                'crop_regions': extractor.crop_regions,
+                'image_policy': processor.image_policy
+            },
+            total_pages=total_pages
+        )
+        done_pages = job.completed_pages()
+        pending_pages = [n for n in range(1, pages_to_process + 1) if n not in done_pages]
+        if done_pages and pending_pages:
+            # ✅ Phase 1.0: 이전 실행의 Fallback 페이지는 완료로 치지 않음 → 다시 처리
+            retry_pages = job.retry_pages()
+            st.info(
+                f"♻️ 이전 작업 재개: {len(done_pages)}페이지 완료, {len(pending_pages)}페이지 남음"
+                + (f" (Fallback 재시도 {len(retry_pages)}페이지)" if retry_pages else "")
+            )
+        
+        # ✅ Phase 1.0: 페이지 파이프라인 (렌더링/레이아웃 분석 ∥ VLM 호출)
+        # 레이아웃 분석은 저해상도 원시 픽셀 (프로세스 풀),
+        # 고해상도 렌더링/PNG 인코딩은 VLM 전송 페이지만, 단계 사이 대기 페이지 수 제한
+        # 완료 페이지는 즉시 디스크에 기록 (본문을 메모리에 누적하지 않음)
+        pipeline = PagePipeline(extractor, processor)
+        completed = len(done_pages)
+        if pending_pages:
+            for page_result in pipeline.run(pdf_path, max_pages=pages_to_process, pages=pending_pages):
+                job.save_page(page_result)
+                completed += 1
+                progress_bar.progress(int(50 * completed / pages_to_process))
+        if len(job.completed_pages()) >= total_pages:
+            job.mark_complete()
+        
+        page_contents = []
+        routes = {}
+        for record in job.iter_pages():
+            if record['page_num'] > pages_to_process:
+                continue
+            page_contents.append(record['content'])
+            routes[record['source']] = routes.get(record['source'], 0) + 1
+        
+        markdown_text = '\n\n'.join(page_contents)
         progress_bar.progress(50)
+        logger.info(f"🧭 페이지 라우팅: {routes}")
+        logger.info(f"♻️ 중복/빈 페이지로 절약한 VLM 호출: {extractor.dedup_stats()}")
+        logger.info(f"🔤 텍스트 레이어로 절약한 분석 OCR: {extractor.ocr_stats()}")
         
         st.info("🧩 의미 기반 청킹 중...")
         chunker = SemanticChunker()
@@ -268,21 +413,37 @@ def process_document_vlm_mode(pdf_path: str, pdf_text: str):
             'chunks': chunks,
             'qa_result': qa_result,
             'is_qa_pass': qa_result.get('is_pass', False),
+            'page_sources': routes,
+            'pipeline_stats': pipeline.stats(),
+            'job_dir': str(job.directory),
             'mode': 'VLM Mode'
         }
     
     except Exception as e:
         logger.error(f"❌ VLM 처리 실패: {e}")
         raise
+    
+    finally:
+        # ✅ Phase 1.0: 문서 핸들 정리 (렌더링/텍스트가 공유한 1회 파싱)
+        if processor is not None:
+            processor.close()
 
 
-def process_document_law_mode(pdf_path: str, pdf_text: str, document_title: str):
+def process_document_law_mode(
+    pdf_path: str,
+    pdf_text: str,
+    document_title: str,
+    page_index=None
+):
     """
     LawMode 파이프라인 (Phase 0.9.5.2)
     
     ✅ Phase 0.9.5.2:
     - annex_paragraph review 렌더링 추가
     - Phase 0.9.5.1 안정성 100% 유지
+    
+    ✅ Phase 1.0:
+    - page_index(PageOffsetIndex) 전달 시 청크에 page_start/page_end 기록
     """
     
     st.info("📜 LawMode: 규정/법령 파싱 중...")
@@ -298,7 +459,8 @@ def process_document_law_mode(pdf_path: str, pdf_text: str, document_title: str)
         pdf_text=pdf_text,
         document_title=document_title,
         clean_artifacts=True,
-        normalize_linebreaks=True
+        normalize_linebreaks=True,
+        page_index=page_index
     )
     
     progress_bar.progress(40)
@@ -321,11 +483,25 @@ def process_document_law_mode(pdf_path: str, pdf_text: str, document_title: str)
                 logger.info(f"   📊 {len(table_chunks)}개 표 청크 발견")
                 
                 new_chunks = []
+                grid_rows = {}  # ✅ Phase 1.0: (page_start, page_end) → 좌표 기반 구조화 결과
                 for chunk in chunks:
                     if chunk.get('metadata', {}).get('type') == 'annex_table_rows':
-                        # TableParser 시도
+                        # ✅ Phase 1.0: 텍스트 레이어 좌표로 표 셀 구조화 우선 (열 순서 뒤섞임 무관)
+                        # 같은 페이지 범위의 표 청크는 첫 청크에서 한 번만 생성
+                        meta = chunk['metadata']
+                        pages = (meta.get('page_start'), meta.get('page_end'))
+                        structured = []
+                        if pages[0] is not None and pages in grid_rows:
+                            if grid_rows[pages]:
+                                continue
+                        elif pages[0] is not None:
+                            grid_rows[pages] = table_parser.parse_pdf(pdf_path, pages=range(pages[0], pages[1] + 1))
+                            structured = grid_rows[pages]
+                        
+                        # TableParser 시도 (좌표 기반 실패 시 텍스트 패턴)
                         raw_text = chunk.get('content', '')
-                        structured = table_parser.parse(raw_text)
+                        if not structured:
+                            structured = table_parser.parse(raw_text)
                         
                         if structured and len(structured) > 0:
                             # 구조화 성공
@@ -424,8 +600,10 @@ def main():
     # 세션 상태 초기화
     if 'processing_result' not in st.session_state:
         st.session_state.processing_result = None
-    if 'processed_file_name' not in st.session_state:
-        st.session_state.processed_file_name = None
+    if 'processed_file_hash' not in st.session_state:
+        st.session_state.processed_file_hash = None
+    if 'upload_artifacts' not in st.session_state:
+        st.session_state.upload_artifacts = None
     
     # 메인 영역: 문서 처리
     st.header("📄 문서 처리")
@@ -466,26 +644,24 @@ def main():
         
         return
     
+    # ✅ Phase 1.0: 업로드당 1회 저장/추출 (재실행 시 재사용)
+    artifacts = get_upload_artifacts(uploaded_file)
+    
     # 파일이 바뀌면 결과 초기화
-    if st.session_state.processed_file_name != uploaded_file.name:
+    if st.session_state.processed_file_hash != artifacts.file_hash:
         st.session_state.processing_result = None
-        st.session_state.processed_file_name = uploaded_file.name
+        st.session_state.processed_file_hash = artifacts.file_hash
     
     # ✅ Phase 0.9.8.4: 문서 타입 자동 분류
     if CLASSIFIER_AVAILABLE:
-        # PDF 텍스트 미리 추출
-        temp_pdf = safe_temp_path(uploaded_file.name)
-        with open(temp_pdf, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
-        
-        pdf_text_preview = extract_pdf_text_layer(str(temp_pdf))
-        
-        # 문서 타입 자동 분류
-        classifier = DocumentClassifier()
-        doc_type, confidence, features = classifier.classify(
-            pdf_text_preview,
-            page_count=len(pdf_text_preview.split('\n\n'))
-        )
+        # ✅ Phase 1.0: 분류 결과도 업로드당 1회 (실제 페이지 수 사용)
+        if artifacts.classification is None:
+            classifier = DocumentClassifier()
+            artifacts.classification = classifier.classify(
+                artifacts.pdf_text,
+                page_count=artifacts.page_count
+            )
+        doc_type, confidence, features = artifacts.classification
         
         # 자동 추천 모드
         if doc_type in ['law_annex', 'form']:
@@ -517,25 +693,20 @@ def main():
     # 처리 버튼
     if st.button("🚀 처리 시작", type="primary"):
         try:
-            # 임시 파일 저장
-            temp_pdf = safe_temp_path(uploaded_file.name)
-            with open(temp_pdf, 'wb') as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # PDF 텍스트 추출
-            pdf_text = extract_pdf_text_layer(str(temp_pdf))
-            
-            # 처리 모드 분기
+            # ✅ Phase 1.0: 업로드 산출물 재사용 (임시 파일/텍스트 재생성 없음)
             if process_mode == "law":
                 result = process_document_law_mode(
-                    str(temp_pdf),
-                    pdf_text,
-                    uploaded_file.name
+                    artifacts.temp_path,
+                    artifacts.pdf_text,
+                    uploaded_file.name,
+                    page_index=artifacts.text_layer.page_index()
                 )
             else:
                 result = process_document_vlm_mode(
-                    str(temp_pdf),
-                    pdf_text
+                    artifacts.temp_path,
+                    artifacts.pdf_text,
+                    page_count=artifacts.page_count,
+                    text_layer=artifacts.text_layer
                 )
             
             # 결과를 세션에 저장
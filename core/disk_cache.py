@@ -0,0 +1,297 @@
+"""
+core/disk_cache.py
+PRISM Phase 1.0 - Content-Addressed Disk Cache
+
+✅ 기능:
+1. PDF 내용 해시(SHA-256) 기반 키 → 파일명/경로가 바뀌어도 동일 문서는 캐시 적중
+2. 원자적 쓰기 (임시 파일 + os.replace)
+3. 용량 제한 LRU 삭제 (접근 시각 기준) + 선택적 TTL 만료 (쓰기 시각 기준)
+4. 적중/미스 카운터
+
+환경 변수:
+- PRISM_CACHE_DIR: 캐시 루트 (기본 .prism_cache)
+- PRISM_CACHE_MAX_MB: 네임스페이스별 최대 용량 (기본 2048MB)
+- PRISM_CACHE_DISABLE: 1이면 기본 캐시 비활성화
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (절대경로, 크기, mtime_ns) → SHA-256 (같은 파일 반복 해시 방지)
+_FILE_HASH_MEMO: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    파일 내용 SHA-256 (크기/mtime 기준 메모이제이션)
+
+    Args:
+        path: 파일 경로
+        chunk_size: 읽기 단위
+
+    Returns:
+        16진수 해시
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    memo_key = (abs_path, stat.st_size, stat.st_mtime_ns)
+
+    cached = _FILE_HASH_MEMO.get(memo_key)
+    if cached:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(abs_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    sha = digest.hexdigest()
+    _FILE_HASH_MEMO[memo_key] = sha
+    return sha
+
+
+class DiskCache:
+    """
+    Phase 1.0 콘텐츠 주소 디스크 캐시
+
+    - 키: 임의 값 튜플 → SHA-256 → <root>/<namespace>/<ab>/<hash>
+    - LRU: 조회 시 atime 갱신, 초과 시 atime 오래된 순으로 삭제
+    - 쓰기: 같은 디렉터리 임시 파일에 쓴 뒤 os.replace (부분 파일 노출 없음)
+    - TTL: 쓰기 후 ttl_seconds가 지난 항목은 미스로 처리하고 삭제
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        namespace: str = "default",
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        초기화
+
+        Args:
+            root: 캐시 루트 (기본: PRISM_CACHE_DIR 또는 .prism_cache)
+            namespace: 하위 디렉터리 (pages, text 등)
+            max_bytes: 최대 용량 (기본: PRISM_CACHE_MAX_MB)
+            ttl_seconds: 항목 유효 기간 (None이면 만료 없음)
+        """
+        root = root or os.getenv("PRISM_CACHE_DIR", ".prism_cache")
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("PRISM_CACHE_MAX_MB", "2048")) * 1024 * 1024)
+
+        self.directory = Path(root) / namespace
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # 첫 쓰기 시 1회 스캔
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        logger.info(f"✅ DiskCache 초기화: {self.directory} (최대 {max_bytes / 1024 / 1024:.0f}MB)")
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """키 구성요소 → SHA-256 16진수"""
+        joined = '\x1f'.join(str(p) for p in parts)
+        return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def contains(self, key: str) -> bool:
+        """존재 여부만 확인 (읽기/통계/atime 갱신 없음)"""
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        캐시 조회
+
+        Args:
+            key: make_key() 결과
+
+        Returns:
+            저장된 바이트 또는 None
+        """
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if self._is_expired(stat.st_mtime):
+                self._remove(path, stat.st_size)
+                self._count(hit=False)
+                return None
+            data = path.read_bytes()
+        except (FileNotFoundError, OSError):
+            self._count(hit=False)
+            return None
+
+        # LRU: atime만 갱신 (mtime = 쓰기 시각 유지)
+        try:
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass
+
+        self._count(hit=True)
+        return data
+
+    def _count(self, hit: bool) -> None:
+        """적중/미스 집계 (여러 스레드 동시 조회 → 락 안에서 증가)"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        캐시 저장 (원자적 쓰기)
+
+        Args:
+            key: make_key() 결과
+            data: 저장할 바이트
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp_')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                # 같은 키 덮어쓰기 → 기존 파일 크기만큼 빼고 차이만 반영
+                try:
+                    old_size = path.stat().st_size
+                except OSError:
+                    old_size = 0
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            # 캐시 실패는 처리 결과에 영향 없음
+            logger.warning(f"   ⚠️ 캐시 저장 실패 ({self.namespace}): {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size = max(0, self._size + len(data) - old_size)
+
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _is_expired(self, mtime: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - mtime > self.ttl_seconds
+
+    def _remove(self, path: Path, size: int) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size = max(0, self._size - size)
+
+    def _iter_entries(self) -> Iterable[os.DirEntry]:
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_file() and not entry.name.startswith('.tmp_'):
+                    yield entry
+
+    def _scan_size(self) -> int:
+        return sum(entry.stat().st_size for entry in self._iter_entries())
+
+    def _evict(self) -> None:
+        """만료 항목 삭제 후 LRU 삭제: 최대 용량의 90%까지 atime 오래된 순으로 제거"""
+        entries = []
+        removed = 0
+        for entry in self._iter_entries():
+            stat = entry.stat()
+            if self._is_expired(stat.st_mtime):
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                    continue
+                except OSError:
+                    pass
+            entries.append((stat.st_atime, stat.st_size, entry.path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+
+        self._size = total
+        logger.info(f"   🗑️ 캐시 LRU 정리 ({self.namespace}): {removed}개 삭제, {total / 1024 / 1024:.1f}MB")
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 통계"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'namespace': self.namespace,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0
+        }
+
+
+# 네임스페이스별 공유 인스턴스
+_DEFAULT_CACHES: Dict[str, DiskCache] = {}
+
+
+def get_cache(namespace: str, ttl_seconds: Optional[float] = None) -> Optional[DiskCache]:
+    """
+    기본 캐시 인스턴스 (PRISM_CACHE_DISABLE=1이면 None)
+
+    Args:
+        namespace: pages, text, vlm 등
+        ttl_seconds: 항목 유효 기간 (네임스페이스 최초 생성 시에만 적용)
+
+    Returns:
+        DiskCache 또는 None
+    """
+    if os.getenv("PRISM_CACHE_DISABLE", "0") == "1":
+        return None
+
+    cache = _DEFAULT_CACHES.get(namespace)
+    if cache is None:
+        try:
+            cache = DiskCache(namespace=namespace, ttl_seconds=ttl_seconds)
+        except OSError as e:
+            logger.warning(f"⚠️ 캐시 디렉터리 생성 실패 - 캐시 비활성화: {e}")
+            return None
+        _DEFAULT_CACHES[namespace] = cache
+    return cache
@@ -14,7 +14,12 @@ Version: Phase 0.7.5 Annex Fallback
 
 import re
 import logging
-from typing import Dict, Any, Set, Literal
+from typing import Dict, Any, Optional, Set, Literal
+
+try:
+    from .text_layer import extract_text_layer
+except ImportError:
+    from core.text_layer import extract_text_layer
 
 logger = logging.getLogger(__name__)
 
@@ -208,27 +213,36 @@ class DualQAGate:
         return headers
 
 
-def extract_pdf_text_layer(pdf_path: str) -> str:
-    """PDF 텍스트 레이어 추출"""
+def extract_pdf_text_layer(
+    pdf_path: str,
+    use_cache: bool = True,
+    backend: Optional[str] = None
+) -> str:
+    """
+    PDF 텍스트 레이어 추출
+    
+    ✅ Phase 1.0: core.text_layer 위임
+    - 기본 pdfium 네이티브 추출 (대용량 문서 병렬), pypdf는 대체 백엔드
+    - (PDF SHA-256, 백엔드) 키 디스크 캐시
+    - 페이지별 텍스트/오프셋이 필요하면 extract_text_layer() 사용
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        use_cache: 디스크 캐시 사용 여부
+        backend: 'pdfium' | 'pypdf' (기본: PRISM_TEXT_BACKEND 또는 pdfium)
+    
+    Returns:
+        페이지 텍스트를 빈 줄로 연결한 전체 텍스트
+    """
     try:
-        from pypdf import PdfReader
-        
-        reader = PdfReader(pdf_path)
-        text_parts = []
-        
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_parts.append(page_text)
-        
-        full_text = '\n\n'.join(text_parts)
+        layer = extract_text_layer(pdf_path, backend=backend, use_cache=use_cache)
         
-        logger.info(f"✅ PDF 텍스트 추출 완료:")
-        logger.info(f"   페이지: {len(reader.pages)}개")
-        logger.info(f"   텍스트: {len(full_text)}자")
+        logger.info(f"✅ PDF 텍스트 추출 완료 ({layer.backend}):")
+        logger.info(f"   페이지: {layer.page_count}개")
+        logger.info(f"   텍스트: {len(layer.text)}자")
         
-        return full_text
+        return layer.text
     
     except Exception as e:
         logger.error(f"❌ PDF 텍스트 추출 실패: {e}")
-        return ""
\ No newline at end of file
+        return ""
@@ -6,85 +6,383 @@ PRISM Phase 0.3.4 P1 - GPT 핫픽스 반영
 1. quality_score → None 고정 (Golden 미연동)
 2. 로그에서 "품질=100/100" 제거
 3. 추출 길이와 source만 로깅
+
+✅ Phase 1.0:
+- extract_pages(): 스트리밍 페이지 이터레이터 소비 (메모리 일정)
+- RenderedPage 입력: 레이아웃 분석은 원시 픽셀, Base64는 VLM 호출 시에만
+- 이중 해상도: 저해상도 썸네일로 분석, VLM 전송 페이지만 역할별 DPI로 재렌더링
+- VLM 동시 호출: extract_pages()가 vlm_service.call_many()로 페이지를 묶어 병렬 전송
+- 텍스트 레이어 우선 라우팅: 품질 통과 + 일반 페이지는 텍스트 레이어 사용,
+  스캔/이미지/표 페이지만 VLM 호출 (페이지별 route 기록)
+- Fallback 체인: pypdfium2 텍스트 레이어 → 레이아웃 분석 OCR 재사용 → Tesseract OCR
+- 빈 페이지 VLM 생략 + dHash 중복 페이지 결과 재사용 (문서 내 / 캐시), 절약 호출 수 집계
+- 영역 크롭 VLM: 텍스트 레이어가 정상인 표 페이지는 표/그림 영역만 잘라 VLM 호출,
+  영역 사이 본문은 텍스트 레이어로 채워 위→아래 순서로 병합 (영역 실패 시 영역 텍스트 레이어)
+- 레이아웃 분석 OCR 우회: 텍스트 레이어가 있는 페이지는 분석 단계 OCR 생략, 절약한 OCR 시간 집계
+- 벡터 표 검출: 디지털 PDF는 경로 객체 괘선으로 표/그림 영역 검출 (스캔 페이지만 래스터 괘선)
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 import base64
 
+try:
+    from .page_dedup import has_words, page_fingerprint
+    from .vlm_service import MIN_RESPONSE_CHARS
+except ImportError:
+    from core.page_dedup import has_words, page_fingerprint
+    from core.vlm_service import MIN_RESPONSE_CHARS
+
 logger = logging.getLogger(__name__)
 
 
 class HybridExtractor:
     """Phase 0.3.4 P1 하이브리드 추출기"""
     
-    def __init__(self, vlm_service, pdf_path: str, allow_tables: bool = False):
+    # ✅ Phase 1.0: 페이지 역할별 VLM 전송 해상도
+    VLM_DPI_BY_ROLE = {
+        'revision_table': 300,
+        'table': 300,
+        'map': 300,
+        'general': 200,
+    }
+    
+    # ✅ Phase 1.0: 영역 크롭 조건 - 영역 면적 합계 상한 (페이지 대비),
+    # 영역 최소 너비 (좁은 영역 옆 본문은 밴드 텍스트에서 빠지므로 넓은 영역만)
+    REGION_MAX_AREA = 0.6
+    REGION_MIN_WIDTH = 0.5
+    
+    def __init__(
+        self,
+        vlm_service,
+        pdf_path: str,
+        allow_tables: bool = False,
+        pdf_processor=None,
+        text_layer=None,
+        text_first: bool = True,
+        dedup: bool = True,
+        crop_regions: bool = True
+    ):
+        """
+        초기화
+        
+        Args:
+            vlm_service: VLMServiceV50
+            pdf_path: PDF 경로
+            allow_tables: 표 허용 여부
+            pdf_processor: ✅ Phase 1.0: 공유 PDFProcessor
+            text_layer: ✅ Phase 1.0: PdfTextLayer (없으면 필요 시 1회 추출)
+            text_first: ✅ Phase 1.0: 텍스트 레이어 우선 라우팅 사용 여부
+            dedup: ✅ Phase 1.0: 빈 페이지 생략 + 중복 페이지 재사용 여부
+            crop_regions: ✅ Phase 1.0: 표 페이지 영역 크롭 VLM 요청 여부
+        """
         self.vlm_service = vlm_service
         self.pdf_path = pdf_path
         self.allow_tables = allow_tables
+        self.text_first = text_first
+        self.dedup = dedup
+        self.crop_regions = crop_regions
+        self._text_layer = text_layer
         
         # 필요한 하위 모듈들 (실제 구현에서 import)
         from core.quick_layout_analyzer import QuickLayoutAnalyzer
         from core.prompt_rules import PromptRules
         from core.post_merge_normalizer_safe import PostMergeNormalizer
-        from core.typo_normalizer_safe import TypoNormalizer
+        from core.pdf_processor import PDFProcessor
+        from core.page_quality import PageQualityScorer
+        from core.page_dedup import PageDeduplicator
+        from core.ocr_pool import OcrUsage
         
+        # ✅ Phase 1.0: 호출자의 PDFProcessor 공유 → 문서 핸들(파싱) 1회
+        self.pdf_processor = pdf_processor or PDFProcessor()
         self.layout_analyzer = QuickLayoutAnalyzer()
         self.prompt_rules = PromptRules()
         self.post_normalizer = PostMergeNormalizer()
-        self.typo_normalizer = TypoNormalizer()
+        self.quality_scorer = PageQualityScorer()
+        
+        # ✅ Phase 1.0: 레이아웃 분석 OCR 사용량 (텍스트 레이어 우회 페이지 = 절약한 OCR)
+        self.ocr_usage = OcrUsage()
+        
+        # ✅ Phase 1.0: 중복 페이지 (문서 간 재사용은 VLM 응답 캐시 공유)
+        self.page_dedup = PageDeduplicator(
+            cache=getattr(vlm_service, 'cache', None),
+            key_parts=(
+                getattr(vlm_service, 'provider', ''),
+                getattr(vlm_service, 'model', ''),
+                getattr(vlm_service, 'POST_VALIDATION_VERSION', '')
+            )
+        )
         
         logger.info("✅ HybridExtractor Phase 0.3.4 P1 초기화")
         logger.info(f"   - PDF: {pdf_path}")
         logger.info(f"   - 표 허용: {allow_tables}")
+        logger.info(f"   - 텍스트 레이어 우선: {text_first}")
     
-    def extract(self, image_data: str, page_num: int) -> Dict[str, Any]:
+    def extract(self, image_data: Union[str, Any], page_num: int) -> Dict[str, Any]:
         """
         페이지 추출
         
+        Args:
+            image_data: Base64 이미지 또는 RenderedPage
+                        (✅ Phase 1.0: 레이아웃 분석은 원시 픽셀, VLM 호출 시에만 인코딩)
+            page_num: 페이지 번호
+        
         Returns:
             {
                 'content': str,        # 추출된 텍스트
-                'source': str,         # 'vlm' or 'fallback'
+                'source': str,         # 'vlm' | 'text_layer' | 'fallback' | 'blank'
                 'quality_score': None, # GPT 핫픽스: 항상 None
                 'page_num': int,
-                'hints': dict
+                'hints': dict,
+                'page_role': str,      # ✅ Phase 1.0
+                'vlm_dpi': int | None, # ✅ Phase 1.0: VLM 전송 해상도
+                'route': dict,         # ✅ Phase 1.0: {'decision', 'reason', 'quality'(, 'regions', 'crop_area')}
+                'fallback': str | None,# ✅ Phase 1.0: Fallback 방식 ('text_layer' | 'ocr' | 'none')
+                'dedup': str | None,   # ✅ Phase 1.0: 'blank' | 'duplicate' | 'cache' (VLM 생략 사유)
+                'duplicate_of': int | None
             }
         """
+        request = self._prepare(image_data, page_num)
+        
+        # 3. VLM 호출 (텍스트 레이어/빈 페이지/중복 페이지는 생략)
+        content = request['error']
+        if self._needs_vlm(request):
+            try:
+                content = self._call_vlm(request)
+            except Exception as e:
+                content = e
+        
+        return self._finish(request, content)
+    
+    def _prepare(
+        self,
+        image_data: Union[str, Any],
+        page_num: int,
+        hints: Optional[Dict[str, Any]] = None,
+        fingerprint=None
+    ) -> Dict[str, Any]:
+        """
+        ✅ Phase 1.0: VLM 호출 전 단계 (레이아웃 분석 + 프롬프트 + 전송 이미지)
+        
+        Args:
+            image_data: Base64 이미지 또는 RenderedPage
+            page_num: 페이지 번호
+            hints: 이미 계산된 레이아웃 힌트 (PagePipeline 분석 워커 결과, None이면 분석 실행)
+            fingerprint: 렌더링 시 계산된 PageFingerprint (None이면 필요 시 계산)
+        
+        Returns:
+            {'page_num', 'hints', 'page_role', 'route', 'text', 'image', 'vlm_dpi', 'vlm_request', 'error',
+             'dedup', 'dedup_key', 'duplicate_of', 'cached', 'regions', 'region_requests', 'region_texts'}
+            (text: 텍스트 레이어 라우팅 시 페이지 텍스트 → VLM 호출 생략)
+            (region_requests: 영역 크롭 시 영역별 VLM 요청, region_texts: {'bands', 'regions'} 텍스트 레이어)
+            (dedup: 빈 페이지/중복 페이지 → VLM 호출 생략)
+            (error: 전송 이미지 준비 실패 시 예외 → VLM 호출 생략, Fallback)
+        """
         logger.info(f"   🔍 페이지 {page_num} 추출 시작")
         
-        # 1. 레이아웃 분석
-        hints = self.layout_analyzer.analyze(image_data)
+        # ✅ Phase 1.0: 빈 페이지 → 분석/VLM 생략 (텍스트 레이어에 글자가 없을 때만)
+        if self.dedup and fingerprint is None:
+            fingerprint = self._fingerprint(image_data)
+        page_text = self._page_text(page_num) if fingerprint is not None else ""
+        if fingerprint is not None and fingerprint.blank and not has_words(page_text):
+            logger.info(f"      ⬜ 빈 페이지 (잉크 {fingerprint.ink_ratio:.3%}) - VLM 생략")
+            self.page_dedup.count('blank')
+            return self._skip_request(page_num, hints, 'blank')
+        
+        # 1. 레이아웃 분석 (✅ Phase 1.0: 텍스트 레이어가 있으면 분석 OCR 생략, 표 영역은 벡터 괘선 우선)
+        if hints is None:
+            hints = self.layout_analyzer.analyze(
+                image_data,
+                text_layer=self._analysis_text(page_num),
+                vector_lines=self._vector_lines(page_num)
+            )
         hints['allow_tables'] = self.allow_tables
+        self.ocr_usage.record(hints)
         
         # 2. 프롬프트 생성
-        prompt = self.prompt_rules.build_prompt(hints)
+        prompt = self.prompt_rules.build_prompt(hints, page_num)
+        page_role = self._page_role(hints, page_num)
         
-        # 3. VLM 호출
-        try:
-            content = self.vlm_service.call_with_image(
-                image_data=image_data,
-                prompt=prompt,
-                page_num=page_num
-            )
-            
-            if content and len(content.strip()) >= 50:
-                source = 'vlm'
-                # GPT 핫픽스: 품질 점수 로그 제거, 길이와 source만
-                logger.info(f"      ✅ VLM 성공: {len(content)}자")
-            else:
-                content = self._fallback_extraction(page_num)
-                source = 'fallback'
-                logger.warning(f"      ⚠️ VLM 응답 부족 → Fallback")
+        # ✅ Phase 1.0: 텍스트 레이어 우선 라우팅 (표 페이지는 영역 크롭 가능 여부 포함)
+        regions = self._crop_candidates(hints, page_role, image_data)
+        route, text = self._route(page_num, page_role, regions, hints)
         
-        except Exception as e:
-            logger.warning(f"      ⚠️ VLM 실패: {e}")
-            content = self._fallback_extraction(page_num)
+        # ✅ Phase 1.0: 중복 페이지 (VLM 경로 페이지만)
+        dedup, dedup_key, duplicate_of, cached = None, None, None, None
+        if text is None and fingerprint is not None:
+            dedup_key = self.page_dedup.key(fingerprint, prompt, page_text)
+            dedup, duplicate_of, cached = self.page_dedup.match(dedup_key, page_num)
+            if dedup == 'duplicate':
+                logger.info(f"      ♻️ 중복 페이지: {duplicate_of}페이지 결과 재사용 - VLM 생략")
+            elif dedup == 'cache':
+                logger.info(f"      ♻️ 중복 페이지: 캐시 결과 재사용 - VLM 생략")
+        
+        # ✅ Phase 1.0: VLM 전송 이미지만 역할별 해상도로 렌더링
+        error = None
+        vlm_image, vlm_dpi = None, None
+        region_requests, region_texts = None, None
+        if text is None and dedup is None and route['decision'] == 'vlm_regions':
+            try:
+                region_requests, region_texts, vlm_dpi = self._region_requests(
+                    image_data, page_num, page_role, hints, regions
+                )
+            except Exception as e:
+                logger.warning(f"      ⚠️ 영역 크롭 실패 → 전체 페이지 VLM: {e}")
+                route = {**route, 'decision': 'vlm', 'reason': f"영역 크롭 실패: {e}"}
+        if text is None and dedup is None and region_requests is None:
+            try:
+                vlm_image, vlm_dpi = self._vlm_image(image_data, page_num, page_role)
+            except Exception as e:
+                error = e
+        
+        return {
+            'page_num': page_num,
+            'hints': hints,
+            'page_role': page_role,
+            'route': route,
+            'text': text,
+            'image': image_data if text is None else None,  # Fallback OCR용 (분석 OCR 없을 때만)
+            'vlm_dpi': vlm_dpi,
+            'error': error,
+            'dedup': dedup,
+            'dedup_key': dedup_key,
+            'duplicate_of': duplicate_of,
+            'cached': cached,
+            'regions': regions if region_requests is not None else None,
+            'region_requests': region_requests,
+            'region_texts': region_texts,
+            'vlm_request': {
+                'image_data': vlm_image,
+                'prompt': prompt,
+                'page_num': page_num,
+                'page_role': page_role
+            }
+        }
+    
+    def _skip_request(self, page_num: int, hints: Optional[Dict[str, Any]], dedup: str) -> Dict[str, Any]:
+        """✅ Phase 1.0: 분석/VLM 없이 끝나는 페이지 요청 (빈 페이지)"""
+        return {
+            'page_num': page_num,
+            'hints': hints or {},
+            'page_role': dedup,
+            'route': {'decision': 'skip', 'reason': '빈 페이지', 'quality': None},
+            'text': None,
+            'image': None,
+            'vlm_dpi': None,
+            'error': None,
+            'dedup': dedup,
+            'dedup_key': None,
+            'duplicate_of': None,
+            'cached': None,
+            'regions': None,
+            'region_requests': None,
+            'region_texts': None,
+            'vlm_request': None
+        }
+    
+    def _failed_request(self, page_num: int, error: BaseException, image_data: Any = None) -> Dict[str, Any]:
+        """
+        ✅ Phase 1.0: 렌더링/분석/준비 실패 페이지 요청 (VLM 생략 → _finish()에서 Fallback 체인)
+        
+        Args:
+            page_num: 페이지 번호
+            error: 실패 원인 (_finish()에 VLM 예외처럼 전달)
+            image_data: 렌더링까지 성공했으면 페이지 이미지 (Fallback OCR용)
+        """
+        request = self._skip_request(page_num, None, None)
+        request.update({
+            'page_role': 'failed',
+            'route': {'decision': 'fallback', 'reason': f"페이지 준비 실패: {error}", 'quality': None},
+            'image': image_data,
+            'error': error
+        })
+        return request
+    
+    @staticmethod
+    def _needs_vlm(request: Dict[str, Any]) -> bool:
+        """✅ Phase 1.0: VLM 호출 필요 여부 (텍스트 레이어/빈 페이지/중복/준비 실패 제외)"""
+        return request['text'] is None and request['dedup'] is None and request['error'] is None
+    
+    def _call_vlm(self, request: Dict[str, Any]) -> Union[str, List[Union[str, BaseException]]]:
+        """
+        ✅ Phase 1.0: 요청 1건의 VLM 호출
+        
+        Returns:
+            전체 페이지: 응답 텍스트
+            영역 크롭: 영역 순서의 응답 리스트 (실패 영역은 예외 객체)
+        """
+        region_requests = request.get('region_requests')
+        if not region_requests:
+            return self.vlm_service.call_with_image(**request['vlm_request'])
+        
+        call_many = getattr(self.vlm_service, 'call_many', None)
+        if call_many is not None:
+            return call_many(region_requests)
+        
+        contents = []
+        for region_request in region_requests:
+            try:
+                contents.append(self.vlm_service.call_with_image(**region_request))
+            except Exception as e:
+                contents.append(e)
+        return contents
+    
+    def dedup_stats(self) -> Dict[str, int]:
+        """✅ Phase 1.0: 빈 페이지/중복 페이지로 절약한 VLM 호출 수"""
+        return self.page_dedup.stats()
+    
+    def ocr_stats(self) -> Dict[str, Any]:
+        """✅ Phase 1.0: 레이아웃 분석 OCR 페이지/시간 + 텍스트 레이어 우회로 절약한 OCR 시간"""
+        return self.ocr_usage.stats()
+    
+    def _finish(self, request: Dict[str, Any], content: Union[str, BaseException]) -> Dict[str, Any]:
+        """
+        ✅ Phase 1.0: VLM 응답 이후 단계 (Fallback 판정 + 후처리)
+        
+        Args:
+            request: _prepare() 결과
+            content: VLM 응답 텍스트 또는 호출 예외
+        """
+        page_num = request['page_num']
+        fallback = None
+        dedup = request['dedup']
+        
+        # ✅ Phase 1.0: 중복 페이지 → 원본 결과 (원본이 VLM 실패했으면 이 페이지 Fallback)
+        if dedup == 'duplicate':
+            content = self.page_dedup.content_for(request['duplicate_of'])
+            if content is None:
+                content = RuntimeError(f"원본 {request['duplicate_of']}페이지 VLM 결과 없음")
+        elif dedup == 'cache':
+            content = request['cached']
+        
+        # ✅ Phase 1.0: 영역 크롭 응답 + 영역 사이 텍스트 레이어 병합
+        if isinstance(content, list):
+            content = self._merge_regions(request, content)
+        
+        if dedup == 'blank':
+            content = ""
+            source = 'blank'
+        elif request['text'] is not None:
+            content = request['text']
+            source = 'text_layer'
+            logger.info(f"      📄 텍스트 레이어 사용: {len(content)}자")
+        elif isinstance(content, BaseException):
+            logger.warning(f"      ⚠️ VLM 실패: {content}")
+            content, fallback = self._fallback_extraction(request)
+            source = 'fallback'
+        elif content and len(content.strip()) >= MIN_RESPONSE_CHARS:
+            source = 'vlm'
+            # GPT 핫픽스: 품질 점수 로그 제거, 길이와 source만
+            logger.info(f"      ✅ VLM 성공: {len(content)}자")
+            if dedup is None:
+                self.page_dedup.record(request['dedup_key'], page_num, content)
+        else:
+            logger.warning(f"      ⚠️ VLM 응답 부족 → Fallback")
+            content, fallback = self._fallback_extraction(request)
             source = 'fallback'
         
         # 4. 후처리
         content = self.post_normalizer.normalize(content)
-        content = self.typo_normalizer.normalize(content)
         
         # GPT 핫픽스: quality_score는 항상 None
         logger.info(f"      ✅ 추출 완료: {len(content)}자, source={source}")
@@ -94,10 +392,355 @@ class HybridExtractor:
             'source': source,
             'quality_score': None,  # Golden 미연동
             'page_num': page_num,
-            'hints': hints
+            'hints': request['hints'],
+            'page_role': request['page_role'],
+            'vlm_dpi': request['vlm_dpi'],
+            'route': request['route'],
+            'fallback': fallback,  # ✅ Phase 1.0: 'text_layer' | 'ocr' | 'none' | None
+            'dedup': dedup,
+            'duplicate_of': request['duplicate_of']
         }
     
-    def _fallback_extraction(self, page_num: int) -> str:
-        """Fallback 추출 (pypdf)"""
-        # 실제 구현에서는 pypdf 사용
-        return f"# 페이지 {page_num}\n[Fallback 추출]"
\ No newline at end of file
+    def extract_pages(
+        self,
+        pages: Iterable[Any],
+        concurrency: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        ✅ Phase 1.0: 페이지 스트림 추출
+        
+        PDFProcessor.iter_rendered_pages()의 RenderedPage (또는 iter_pages()의
+        (base64_image, page_num))를 소비하여 페이지 순서대로 결과를 반환.
+        vlm_service가 call_many()를 지원하면 concurrency개 페이지씩 묶어
+        VLM을 동시 호출 (메모리에는 한 묶음만 보관).
+        
+        Args:
+            pages: RenderedPage 또는 (base64_image, page_num) 이터러블
+            concurrency: 묶음 크기 (기본: vlm_service.max_concurrency)
+        
+        Yields:
+            extract()와 동일한 페이지 결과
+        """
+        if concurrency is None:
+            concurrency = getattr(self.vlm_service, 'max_concurrency', 1)
+        call_many = getattr(self.vlm_service, 'call_many', None)
+        
+        if concurrency <= 1 or call_many is None:
+            for page in pages:
+                yield self.extract(*self._unpack(page))
+            return
+        
+        batch: List[Dict[str, Any]] = []
+        for page in pages:
+            batch.append(self._prepare(*self._unpack(page)))
+            if len(batch) >= concurrency:
+                yield from self._run_batch(batch)
+                batch = []
+        
+        if batch:
+            yield from self._run_batch(batch)
+    
+    @staticmethod
+    def _unpack(page: Any) -> Tuple[Any, int]:
+        if isinstance(page, tuple):
+            image_data, page_num = page
+            return image_data, page_num
+        return page, page.page_num
+    
+    def _run_batch(self, batch: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """묶음 VLM 동시 호출 → 페이지 순서대로 후처리"""
+        ready = [r for r in batch if self._needs_vlm(r)]
+        
+        # ✅ Phase 1.0: 영역 크롭 페이지는 영역 요청을 펼쳐서 같은 묶음으로 전송
+        calls, spans = [], []
+        for request in ready:
+            start = len(calls)
+            calls.extend(request.get('region_requests') or [request['vlm_request']])
+            spans.append((start, len(calls)))
+        try:
+            results = self.vlm_service.call_many(calls)
+        except Exception as e:
+            results = [e] * len(calls)
+        
+        contents = [
+            results[start:end] if request.get('region_requests') else results[start]
+            for request, (start, end) in zip(ready, spans)
+        ]
+        responses = {id(r): content for r, content in zip(ready, contents)}
+        for request in batch:
+            yield self._finish(request, responses.get(id(request), request['error']))
+    
+    def _page_role(self, hints: Dict[str, Any], page_num: int) -> str:
+        """✅ Phase 1.0: 레이아웃 힌트 → 페이지 역할 (VLM 해상도/재시도 예산 결정)"""
+        if self.prompt_rules.has_revision_hints(hints, page_num):
+            return 'revision_table'
+        if hints.get('has_table'):
+            return 'table'
+        if hints.get('has_map'):
+            return 'map'
+        return 'general'
+    
+    def _needs_layout(self, page_role: str, hints: Optional[Dict[str, Any]]) -> bool:
+        """
+        ✅ Phase 1.0: 텍스트 레이어 품질과 무관하게 VLM 레이아웃 복원이 필요한 페이지
+        
+        표 페이지는 기하 근거 (표 영역 또는 괘선 교차 TABLE_MIN_CROSSINGS개 이상)가 있을 때만.
+        has_table은 표 키워드 ('원', '명', '개', '%' 등)로도 켜짐 → 한국어 본문 페이지 대부분이 해당
+        (직원/개정/명령 ...) → 키워드만으로는 텍스트 레이어 라우팅 유지.
+        """
+        if page_role == 'general':
+            return False
+        if page_role != 'table':
+            return True
+        hints = hints or {}
+        if any(r.get('kind') == 'table' for r in hints.get('regions') or []):
+            return True
+        return hints.get('grid_intersections', 0) >= self.layout_analyzer.TABLE_MIN_CROSSINGS
+    
+    @property
+    def text_layer(self):
+        """✅ Phase 1.0: PdfTextLayer (최초 접근 시 1회 추출, 실패 시 빈 레이어)"""
+        if self._text_layer is None:
+            from core.text_layer import PdfTextLayer, extract_text_layer
+            try:
+                self._text_layer = extract_text_layer(self.pdf_path)
+            except Exception as e:
+                logger.warning(f"   ⚠️ 텍스트 레이어 추출 실패 - VLM 전용: {e}")
+                self._text_layer = PdfTextLayer.from_pages([], backend='none')
+        return self._text_layer
+    
+    def _page_text(self, page_num: int) -> str:
+        """✅ Phase 1.0: 페이지 텍스트 레이어 (없으면 빈 문자열)"""
+        pages = self.text_layer.pages
+        return pages[page_num - 1] if 0 < page_num <= len(pages) else ""
+    
+    def _analysis_text(self, page_num: int) -> Optional[str]:
+        """
+        ✅ Phase 1.0: 레이아웃 분석 OCR 대신 쓸 텍스트 레이어
+        
+        글자가 있고 깨진 문자 비율이 품질 기준 이하일 때만 사용
+        (스캔 페이지/깨진 인코딩은 None → 분석 단계 OCR).
+        """
+        page_text = self._page_text(page_num)
+        if not has_words(page_text):
+            return None
+        if self.quality_scorer.score(page_text).garbage_ratio > self.quality_scorer.max_garbage_ratio:
+            return None
+        return page_text
+    
+    def _vector_lines(self, page_num: int):
+        """
+        ✅ Phase 1.0: 표 영역 검출용 PDF 벡터 괘선 (렌더링 없음)
+        
+        PDF 경로가 없거나 읽기 실패 시 None → 렌더링 이미지 래스터 검출.
+        """
+        if not getattr(self, 'pdf_path', None):
+            return None
+        return self.pdf_processor.extract_vector_lines(self.pdf_path, page_num)
+    
+    def _fingerprint(self, image_data: Union[str, Any]):
+        """✅ Phase 1.0: 페이지 지문 (실패 시 None → 빈 페이지/중복 판정 생략)"""
+        try:
+            return page_fingerprint(self.layout_analyzer._to_cv2(image_data))
+        except Exception as e:
+            logger.warning(f"      ⚠️ 페이지 지문 계산 실패: {e}")
+            return None
+    
+    def _route(
+        self,
+        page_num: int,
+        page_role: str,
+        regions: Optional[List[Dict[str, Any]]] = None,
+        hints: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        ✅ Phase 1.0: 페이지 라우팅 (텍스트 레이어 vs VLM)
+        
+        - 표 페이지 + 텍스트 레이어 품질 통과 + 크롭 가능 영역 → 영역만 VLM (vlm_regions)
+        - 표(괘선/표 영역 있음)/지도/개정이력 페이지 → VLM (레이아웃 복원 필요, _needs_layout)
+        - 텍스트 레이어 품질 통과 → 텍스트 레이어 (표 키워드만 있는 페이지 포함)
+        - 그 외 (스캔/이미지/깨진 인코딩) → VLM
+        
+        Args:
+            page_num: 페이지 번호
+            page_role: 페이지 역할
+            regions: _crop_candidates() 결과 (None이면 영역 크롭 없음)
+            hints: 레이아웃 힌트 (표 페이지의 기하 근거 확인용, None이면 근거 없음)
+        
+        Returns:
+            (route, text): route = {'decision', 'reason', 'quality'},
+                           text = 텍스트 레이어 라우팅 시 페이지 텍스트, 아니면 None
+        """
+        if not self.text_first:
+            return {'decision': 'vlm', 'reason': '텍스트 레이어 우선 비활성화', 'quality': None}, None
+        
+        page_text = self._page_text(page_num)
+        quality = self.quality_scorer.score(page_text)
+        
+        needs_layout = self._needs_layout(page_role, hints)
+        if needs_layout and regions and quality.passed:
+            decision, reason = 'vlm_regions', f"레이아웃: {page_role}, 영역 {len(regions)}개 크롭"
+        elif needs_layout:
+            decision, reason = 'vlm', f"레이아웃: {page_role}"
+        elif quality.passed:
+            decision, reason = 'text_layer', quality.reason
+        else:
+            decision, reason = 'vlm', quality.reason
+        
+        logger.info(f"      🧭 라우팅: {decision} ({reason}, 점수 {quality.score:.2f})")
+        route = {'decision': decision, 'reason': reason, 'quality': quality.to_dict()}
+        if decision == 'vlm_regions':
+            route['regions'] = len(regions)
+            route['crop_area'] = round(self._region_area(regions), 3)
+        return route, page_text if decision == 'text_layer' else None
+    
+    @staticmethod
+    def _region_area(regions: List[Dict[str, Any]]) -> float:
+        return sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in (r['bbox'] for r in regions))
+    
+    def _crop_candidates(
+        self,
+        hints: Dict[str, Any],
+        page_role: str,
+        image_data: Union[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        ✅ Phase 1.0: 영역 크롭 대상 (조건 미충족 시 None → 전체 페이지)
+        
+        - 표 페이지 + 표 영역 1개 이상 (그림 영역은 함께 크롭)
+        - 영역 면적 합계 ≤ REGION_MAX_AREA, 각 영역 너비 ≥ REGION_MIN_WIDTH
+        - RenderedPage 입력 (Base64 입력은 좌표 기준 해상도를 알 수 없음)
+        """
+        if not self.crop_regions or page_role != 'table' or isinstance(image_data, str):
+            return None
+        
+        regions = hints.get('regions') or []
+        if not any(r['kind'] == 'table' for r in regions):
+            return None
+        if self._region_area(regions) > self.REGION_MAX_AREA:
+            return None
+        if any(r['bbox'][2] - r['bbox'][0] < self.REGION_MIN_WIDTH for r in regions):
+            return None
+        return regions
+    
+    def _region_requests(
+        self,
+        image_data: Any,
+        page_num: int,
+        page_role: str,
+        hints: Dict[str, Any],
+        regions: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], int]:
+        """
+        ✅ Phase 1.0: 영역별 VLM 요청 + 영역 사이/영역 내부 텍스트 레이어
+        
+        밴드 i = 영역 i 위쪽 (이전 영역 아래 ~ 영역 i 위, 페이지 전체 너비),
+        마지막 밴드 = 마지막 영역 아래 ~ 페이지 끝.
+        
+        Returns:
+            (region_requests, {'bands': [n+1], 'regions': [n]}, dpi)
+        """
+        bands, bottom = [], 0.0
+        for region in regions:
+            x0, y0, x1, y1 = region['bbox']
+            bands.append((0.0, bottom, 1.0, y0))
+            bottom = max(bottom, y1)
+        bands.append((0.0, bottom, 1.0, 1.0))
+        
+        texts = self.pdf_processor.extract_text_boxes(
+            self.pdf_path, page_num, bands + [tuple(r['bbox']) for r in regions]
+        )
+        region_texts = {'bands': texts[:len(bands)], 'regions': texts[len(bands):]}
+        
+        target_dpi = self.VLM_DPI_BY_ROLE.get(page_role, self.VLM_DPI_BY_ROLE['general'])
+        page = image_data
+        if image_data.dpi < target_dpi:
+            page = self.pdf_processor.render_page(self.pdf_path, page_num, dpi=target_dpi)
+        
+        region_requests = [
+            {
+                'image_data': page.crop(region['bbox']).encode(self.pdf_processor.image_policy).base64,
+                'prompt': self.prompt_rules.build_region_prompt(hints, page_num, region['kind']),
+                'page_num': page_num,
+                'page_role': page_role
+            }
+            for region in regions
+        ]
+        logger.info(f"      ✂️ 영역 크롭: {len(regions)}개 (면적 {self._region_area(regions):.0%})")
+        return region_requests, region_texts, page.dpi
+    
+    def _merge_regions(self, request: Dict[str, Any], contents: List[Union[str, BaseException]]) -> str:
+        """✅ Phase 1.0: 밴드 텍스트 + 영역 VLM 응답을 위→아래 순서로 병합 (실패 영역은 영역 텍스트 레이어)"""
+        bands = request['region_texts']['bands']
+        region_texts = request['region_texts']['regions']
+        
+        parts = []
+        for i, content in enumerate(contents):
+            parts.append(bands[i])
+            if isinstance(content, BaseException) or not (content and content.strip()):
+                logger.warning(f"      ⚠️ 영역 {i + 1} VLM 실패 → 영역 텍스트 레이어: {content!r}")
+                content = region_texts[i]
+            parts.append(content.strip())
+        parts.append(bands[-1])
+        return '\n\n'.join(part for part in parts if part)
+    
+    def _vlm_image(
+        self,
+        image_data: Union[str, Any],
+        page_num: int,
+        page_role: str
+    ) -> Tuple[str, Optional[int]]:
+        """
+        ✅ Phase 1.0: VLM 전송용 Base64 이미지
+        
+        - Base64 문자열: 그대로 사용 (해상도 알 수 없음)
+        - RenderedPage: 역할별 DPI보다 낮으면 해당 페이지만 고해상도 재렌더링
+        - 인코딩은 pdf_processor.image_policy (포맷/품질/최대 크기/바이트 예산)
+        
+        Returns:
+            (base64_image, dpi)
+        """
+        if isinstance(image_data, str):
+            return image_data, None
+        
+        target_dpi = self.VLM_DPI_BY_ROLE.get(page_role, self.VLM_DPI_BY_ROLE['general'])
+        policy = self.pdf_processor.image_policy
+        if image_data.dpi >= target_dpi:
+            return image_data.encode(policy).base64, image_data.dpi
+        
+        page = self.pdf_processor.render_page(self.pdf_path, page_num, dpi=target_dpi)
+        return page.encode(policy).base64, target_dpi
+    
+    def _fallback_extraction(self, request: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        ✅ Phase 1.0: Fallback 체인 (VLM 실패/응답 부족 시)
+        
+        1. pypdfium2 텍스트 레이어 (품질 미달이어도 비어 있지 않으면 사용)
+        2. 레이아웃 분석 단계 OCR 텍스트 재사용 (OCR 재실행 없음)
+        3. 분석 OCR이 없을 때만 이미 렌더링된 이미지로 Tesseract 1회
+        
+        Args:
+            request: _prepare() 결과
+        
+        Returns:
+            (content, method): method = 'text_layer' | 'ocr' | 'none'
+        """
+        page_num = request['page_num']
+        
+        page_text = self._page_text(page_num)
+        if page_text.strip():
+            logger.info(f"      📄 Fallback: 텍스트 레이어 {len(page_text)}자")
+            return page_text, 'text_layer'
+        
+        ocr_text = request['hints'].get('ocr_page_text')
+        if ocr_text is None and request.get('image') is not None:
+            try:
+                ocr_text = self.layout_analyzer.extract_page_text(request['image'])
+            except Exception as e:
+                logger.warning(f"      ⚠️ Fallback OCR 실패: {e}")
+        if ocr_text and ocr_text.strip():
+            logger.info(f"      🔤 Fallback: OCR {len(ocr_text)}자")
+            return ocr_text, 'ocr'
+        
+        logger.error(f"      ❌ Fallback 실패: 텍스트 레이어/OCR 모두 비어 있음 (페이지 {page_num})")
+        return f"# 페이지 {page_num}\n[추출 실패]", 'none'
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+core/image_encoding.py
+PRISM Phase 1.0 - VLM Image Encoding Policy
+
+✅ 기능:
+1. 인코딩 정책: 포맷 (png | jpeg | webp), 품질, 최대 긴 변, 바이트 예산
+2. 바이트 예산 초과 시 자동 축소 (긴 변 min_long_edge 아래로는 줄이지 않음)
+3. 실제 포맷 기준 MIME 타입 (data URL 라벨과 인코딩 일치)
+4. Base64 이미지 MIME 판별 (매직 바이트)
+
+환경 변수 (ImageEncodingPolicy.from_env):
+- PRISM_VLM_IMAGE_FORMAT: png | jpeg | webp (기본 jpeg)
+- PRISM_VLM_IMAGE_QUALITY: JPEG/WebP 품질 1~100 (기본 90)
+- PRISM_VLM_IMAGE_MAX_EDGE: 최대 긴 변 px (기본 제한 없음)
+- PRISM_VLM_IMAGE_MAX_KB: 이미지 바이트 예산 KB (기본 제한 없음)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import math
+import base64
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+    'webp': 'image/webp',
+}
+
+# 포맷 → (OpenCV 확장자, 품질 파라미터)
+_CV2_FORMATS = {
+    'png': ('.png', None),
+    'jpeg': ('.jpg', cv2.IMWRITE_JPEG_QUALITY),
+    'webp': ('.webp', cv2.IMWRITE_WEBP_QUALITY),
+}
+
+# 예산 맞추기 최대 축소 횟수
+MAX_FIT_STEPS = 6
+
+
+@dataclass(frozen=True)
+class ImageEncodingPolicy:
+    """
+    VLM 전송 이미지 인코딩 정책
+
+    Attributes:
+        format: 'png' | 'jpeg' | 'webp'
+        quality: JPEG/WebP 품질 (PNG는 무시)
+        max_long_edge: 긴 변 상한 px (None이면 원본 크기)
+        max_bytes: 인코딩 결과 바이트 예산 (None이면 제한 없음)
+        min_long_edge: 예산 맞추기 축소 하한 px (작은 한글 판독 한계)
+    """
+    format: str = 'jpeg'
+    quality: int = 90
+    max_long_edge: Optional[int] = None
+    max_bytes: Optional[int] = None
+    min_long_edge: int = 1024
+
+    def __post_init__(self):
+        if self.format not in MIME_TYPES:
+            raise ValueError(f"지원하지 않는 이미지 포맷: {self.format} (png | jpeg | webp)")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"이미지 품질 범위 오류: {self.quality} (1~100)")
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.format]
+
+    @classmethod
+    def from_env(cls) -> "ImageEncodingPolicy":
+        """환경 변수 기반 정책"""
+        max_edge = os.getenv("PRISM_VLM_IMAGE_MAX_EDGE")
+        max_kb = os.getenv("PRISM_VLM_IMAGE_MAX_KB")
+        return cls(
+            format=os.getenv("PRISM_VLM_IMAGE_FORMAT", "jpeg").lower().replace('jpg', 'jpeg'),
+            quality=int(os.getenv("PRISM_VLM_IMAGE_QUALITY", "90")),
+            max_long_edge=int(max_edge) if max_edge else None,
+            max_bytes=int(float(max_kb) * 1024) if max_kb else None
+        )
+
+
+@dataclass
+class EncodedImage:
+    """
+    인코딩된 이미지
+
+    Attributes:
+        data: 인코딩 바이트
+        mime_type: 실제 포맷의 MIME 타입
+        width / height: 인코딩된 이미지 크기 (축소 반영)
+    """
+    data: bytes = field(repr=False)
+    mime_type: str
+    width: int
+    height: int
+    _base64: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def base64(self) -> str:
+        """Base64 (지연 + 캐시)"""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.data).decode('utf-8')
+        return self._base64
+
+    @property
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+
+def _resize_long_edge(pixels: np.ndarray, long_edge: int) -> np.ndarray:
+    height, width = pixels.shape[:2]
+    scale = long_edge / max(height, width)
+    if scale >= 1.0:
+        return pixels
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(pixels, size, interpolation=cv2.INTER_AREA)
+
+
+def _encode(pixels: np.ndarray, policy: ImageEncodingPolicy) -> bytes:
+    ext, quality_flag = _CV2_FORMATS[policy.format]
+    params = [quality_flag, policy.quality] if quality_flag is not None else []
+    ok, buf = cv2.imencode(ext, pixels, params)
+    if not ok:
+        raise ValueError(f"이미지 인코딩 실패 ({policy.format})")
+    return buf.tobytes()
+
+
+def encode_image(pixels: np.ndarray, policy: Optional[ImageEncodingPolicy] = None) -> EncodedImage:
+    """
+    픽셀 → 정책에 따른 인코딩
+
+    1. max_long_edge로 축소 (INTER_AREA)
+    2. max_bytes 초과 시 바이트 비율의 제곱근만큼 긴 변을 줄여 재인코딩
+       (min_long_edge에 도달하면 예산 초과여도 그 크기로 반환 + 경고)
+
+    Args:
+        pixels: BGR 또는 그레이스케일 배열
+        policy: 인코딩 정책 (None이면 from_env())
+
+    Returns:
+        EncodedImage
+    """
+    policy = policy or ImageEncodingPolicy.from_env()
+
+    if policy.max_long_edge:
+        pixels = _resize_long_edge(pixels, policy.max_long_edge)
+    data = _encode(pixels, policy)
+
+    if policy.max_bytes:
+        for _ in range(MAX_FIT_STEPS):
+            long_edge = max(pixels.shape[:2])
+            if len(data) <= policy.max_bytes or long_edge <= policy.min_long_edge:
+                break
+            # 바이트 ∝ 면적 → 긴 변은 제곱근 비율 (여유 5%)
+            target = int(long_edge * math.sqrt(policy.max_bytes / len(data)) * 0.95)
+            pixels = _resize_long_edge(pixels, max(policy.min_long_edge, target))
+            data = _encode(pixels, policy)
+
+        if len(data) > policy.max_bytes:
+            logger.warning(
+                f"   ⚠️ 이미지 예산 초과: {len(data) / 1024:.0f}KB > {policy.max_bytes / 1024:.0f}KB "
+                f"(긴 변 하한 {policy.min_long_edge}px)"
+            )
+
+    return EncodedImage(data=data, mime_type=policy.mime_type, width=int(pixels.shape[1]), height=int(pixels.shape[0]))
+
+
+def sniff_mime_type(image_base64: str, default: str = 'image/jpeg') -> str:
+    """
+    Base64 이미지의 실제 MIME 타입 (앞부분 매직 바이트)
+
+    Args:
+        image_base64: Base64 인코딩 이미지
+        default: 판별 불가 시 반환값 (기존 고정 라벨 image/jpeg)
+    """
+    try:
+        head = base64.b64decode(image_base64[:24])
+    except (ValueError, TypeError):
+        return default
+    if head.startswith(b'\x89PNG'):
+        return 'image/png'
+    if head.startswith(b'\xff\xd8'):
+        return 'image/jpeg'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return default
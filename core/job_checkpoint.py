@@ -0,0 +1,254 @@
+"""
+core/job_checkpoint.py
+PRISM Phase 1.0 - VLM Mode Job Checkpoint
+
+✅ 기능:
+1. 문서 해시(SHA-256) + 처리 설정 기준 작업 디렉터리
+   (같은 문서/설정 재실행 시 같은 디렉터리 → 완료 페이지 건너뛰고 재개)
+2. 페이지별 결과 체크포인트 (본문, source, hints, route, 단계별 시간)
+3. 원자적 쓰기 (임시 파일 + os.replace) → 중단 시점의 부분 파일 없음
+4. Fallback 페이지 (VLM 실패 → 텍스트 레이어/OCR/[추출 실패])는 재시도 대상으로 별도 저장
+   → 완료 페이지에서 제외 (다음 실행에서 다시 처리), 이번 실행 결과 조립에는 포함
+
+디렉터리 구조:
+    <root>/<문서 해시 16자>-<설정 해시 8자>/
+        manifest.json       # 문서/설정/페이지 수/완료 여부
+        pages/00001.json    # 페이지 결과
+        pages/00002.retry.json  # Fallback 페이지 결과 (재시도 대상)
+
+환경 변수:
+- PRISM_JOB_DIR: 작업 루트 (기본 .prism_jobs)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set
+
+try:
+    from .disk_cache import DiskCache, file_sha256
+except ImportError:
+    from core.disk_cache import DiskCache, file_sha256
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 형식 버전 (필드 변경 시 증가 → 새 작업 디렉터리)
+CHECKPOINT_VERSION = 1
+
+# 페이지 결과 중 저장하는 필드
+PAGE_FIELDS = (
+    'page_num', 'content', 'source', 'page_role', 'vlm_dpi', 'route', 'fallback',
+    'dedup', 'duplicate_of', 'hints', 'timings'
+)
+
+# 재시도 대상 결과 source (완료 페이지로 기록하지 않음)
+RETRYABLE_SOURCES = ('fallback',)
+
+
+def _json_default(value: Any) -> Any:
+    """numpy 스칼라/배열, to_dict() 객체 (TableGrid 등) 등 JSON 비호환 값 변환"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        try:
+            return value.item()
+        except (ValueError, TypeError):
+            pass
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
+    """JSON 원자적 쓰기"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_json_default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JobCheckpoint:
+    """
+    Phase 1.0 VLM Mode 작업 체크포인트
+
+    사용 예:
+        job = JobCheckpoint.for_document(pdf_path, {'provider': 'azure_openai'}, total_pages=300)
+        pending = [n for n in range(1, 301) if n not in job.completed_pages()]
+        for result in pipeline.run(pdf_path, pages=pending):
+            job.save_page(result)
+        job.mark_complete()
+    """
+
+    def __init__(self, directory: Path, manifest: Dict[str, Any]):
+        """
+        초기화 (for_document() 사용 권장)
+
+        Args:
+            directory: 작업 디렉터리
+            manifest: 작업 정보
+        """
+        self.directory = Path(directory)
+        self.pages_dir = self.directory / 'pages'
+        self.manifest = manifest
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def for_document(
+        cls,
+        pdf_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        total_pages: Optional[int] = None,
+        root: Optional[str] = None
+    ) -> "JobCheckpoint":
+        """
+        문서 + 설정에 해당하는 작업 열기 (없으면 생성)
+
+        Args:
+            pdf_path: PDF 경로
+            config: 결과에 영향을 주는 설정 (프로바이더, 모델 등)
+            total_pages: 전체 페이지 수 (manifest 기록용)
+            root: 작업 루트 (기본: PRISM_JOB_DIR 또는 .prism_jobs)
+
+        Returns:
+            JobCheckpoint
+        """
+        config = dict(config or {})
+        doc_hash = file_sha256(pdf_path)
+        config_hash = DiskCache.make_key(CHECKPOINT_VERSION, json.dumps(config, sort_keys=True, default=str))
+
+        root = root or os.getenv("PRISM_JOB_DIR", ".prism_jobs")
+        directory = Path(root) / f"{doc_hash[:16]}-{config_hash[:8]}"
+        manifest_path = directory / 'manifest.json'
+
+        manifest = None
+        if manifest_path.is_file():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"   ⚠️ 손상된 작업 정보 재생성: {e}")
+
+        if manifest is None:
+            manifest = {
+                'version': CHECKPOINT_VERSION,
+                'document_sha256': doc_hash,
+                'file_name': Path(pdf_path).name,
+                'config': config,
+                'total_pages': total_pages,
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'completed': False
+            }
+            _atomic_write_json(manifest_path, manifest)
+
+        job = cls(directory, manifest)
+        done = len(job.completed_pages())
+        logger.info(f"💾 작업 체크포인트: {directory} (완료 {done}/{total_pages or '?'}페이지)")
+        return job
+
+    def _page_path(self, page_num: int) -> Path:
+        return self.pages_dir / f"{page_num:05d}.json"
+
+    def _retry_path(self, page_num: int) -> Path:
+        return self.pages_dir / f"{page_num:05d}.retry.json"
+
+    def _page_numbers(self, pattern: str) -> Set[int]:
+        pages = set()
+        for path in self.pages_dir.glob(pattern):
+            try:
+                pages.add(int(path.name.split('.', 1)[0]))
+            except ValueError:
+                continue
+        return pages
+
+    def completed_pages(self) -> Set[int]:
+        """완료 체크포인트가 있는 페이지 번호 (Fallback 재시도 대상 제외)"""
+        return self._page_numbers('[0-9]*[0-9].json')
+
+    def retry_pages(self) -> Set[int]:
+        """✅ Phase 1.0: Fallback으로 끝나 다음 실행에서 다시 처리할 페이지 번호"""
+        return self._page_numbers('[0-9]*.retry.json') - self.completed_pages()
+
+    @staticmethod
+    def is_retryable(result: Dict[str, Any]) -> bool:
+        """Fallback 결과 (VLM 실패/응답 부족, [추출 실패] 포함) 여부"""
+        return result.get('source') in RETRYABLE_SOURCES
+
+    def save_page(self, result: Dict[str, Any]) -> None:
+        """
+        페이지 결과 저장 (Fallback 결과는 재시도 대상으로 저장 → completed_pages()에서 제외)
+
+        Args:
+            result: HybridExtractor/PagePipeline 페이지 결과
+        """
+        record = {key: result.get(key) for key in PAGE_FIELDS}
+        record['saved_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        page_num = result['page_num']
+        if self.is_retryable(result):
+            _atomic_write_json(self._retry_path(page_num), record)
+            return
+        _atomic_write_json(self._page_path(page_num), record)
+        try:
+            self._retry_path(page_num).unlink()
+        except FileNotFoundError:
+            pass
+
+    def load_page(self, page_num: int) -> Optional[Dict[str, Any]]:
+        """페이지 결과 (완료 결과 우선, 없으면 재시도 대상 결과, 없거나 손상 시 None)"""
+        record = self._load_record(self._page_path(page_num), page_num)
+        if record is None:
+            record = self._load_record(self._retry_path(page_num), page_num)
+        return record
+
+    def _load_record(self, path: Path, page_num: int) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"   ⚠️ 손상된 체크포인트 삭제 (페이지 {page_num}): {e}")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        """저장된 페이지 결과 (재시도 대상 포함, 페이지 순서, 한 번에 한 페이지씩 읽음)"""
+        for page_num in sorted(self.completed_pages() | self.retry_pages()):
+            record = self.load_page(page_num)
+            if record is not None:
+                yield record
+
+    def mark_complete(self) -> None:
+        """전체 처리 완료 기록"""
+        self.manifest['completed'] = True
+        self.manifest['completed_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        _atomic_write_json(self.directory / 'manifest.json', self.manifest)
+
+    @property
+    def is_complete(self) -> bool:
+        return bool(self.manifest.get('completed'))
+
+    def reset(self) -> None:
+        """작업 삭제 (처음부터 다시 처리)"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.pages_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest['completed'] = False
+        _atomic_write_json(self.directory / 'manifest.json', self.manifest)
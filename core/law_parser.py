@@ -17,6 +17,10 @@ Phase 0.9.5 수정사항 (미송님 가이드):
 - 🛑 DualQA 로직 변경 금지
 - 🛑 spacing 엔진 변경 금지
 
+Phase 1.0:
+- ✅ page_index(PageOffsetIndex) 전달 시 정제 단계 오프셋 변화를 추적하여
+  조문/장/Annex 청크에 page_start/page_end 기록
+
 Author: 마창수산팀 + GPT 미송님
 Date: 2025-11-25
 Version: Phase 0.9.7.7
@@ -24,9 +28,11 @@ Version: Phase 0.9.7.7
 
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from core.text_layer import PageOffsetIndex, removed_line_spans
+
 logger = logging.getLogger(__name__)
 
 # ============================================================
@@ -76,6 +82,8 @@ class Article:
     body: str
     chapter_number: str
     section_order: int
+    page_start: Optional[int] = None
+    page_end: Optional[int] = None
 
 
 @dataclass
@@ -105,10 +113,14 @@ class LawParser:
         pdf_text: str,
         document_title: str = "",
         clean_artifacts: bool = True,
-        normalize_linebreaks: bool = True
+        normalize_linebreaks: bool = True,
+        page_index: Optional[PageOffsetIndex] = None
     ) -> Dict[str, Any]:
         """
         PDF 텍스트 파싱
+        
+        ✅ Phase 1.0: page_index (pdf_text 기준 PageOffsetIndex, 선택)
+        - 전달 시 조문/장/Annex에 page_start/page_end 기록
         """
         logger.info(f"📜 LawParser 파싱 시작: {document_title}")
         
@@ -116,11 +128,17 @@ class LawParser:
         cleaned_text = pdf_text
         
         if clean_artifacts:
-            cleaned_text = self._clean_page_artifacts(cleaned_text)
+            removed_spans: List[Tuple[int, int]] = []
+            cleaned_text = self._clean_page_artifacts(cleaned_text, removed_spans)
+            if page_index is not None:
+                page_index = page_index.after_removals(removed_spans)
             logger.info("   ✅ 페이지 아티팩트 제거 완료")
         
         if normalize_linebreaks:
-            cleaned_text = self._normalize_linebreaks(cleaned_text)
+            removed_spans = []
+            cleaned_text = self._normalize_linebreaks(cleaned_text, removed_spans)
+            if page_index is not None:
+                page_index = page_index.after_removals(removed_spans)
             logger.info("   ✅ 개행 정규화 완료")
         
         # 2. 문서 타입 판별
@@ -129,38 +147,68 @@ class LawParser:
         
         if has_articles:
             logger.info("   📋 문서 타입: 법령/규정 (조문 포함)")
-            return self._parse_legal_document(cleaned_text, document_title)
+            return self._parse_legal_document(cleaned_text, document_title, page_index)
         elif has_annex_only:
             logger.info("   📋 문서 타입: Annex 전용")
-            return self._parse_annex_only_document(cleaned_text, document_title)
+            return self._parse_annex_only_document(cleaned_text, document_title, page_index)
         else:
             logger.warning("   ⚠️ 알 수 없는 문서 타입 - 기본 처리")
             return self._create_empty_result(document_title, cleaned_text)
     
-    def _clean_page_artifacts(self, text: str) -> str:
-        """페이지 아티팩트 제거 (Phase 0.8.6)"""
+    def _clean_page_artifacts(
+        self,
+        text: str,
+        removed_spans: Optional[List[Tuple[int, int]]] = None
+    ) -> str:
+        """
+        페이지 아티팩트 제거 (Phase 0.8.6)
+        
+        Args:
+            text: 입력 텍스트
+            removed_spans: ✅ Phase 1.0: 삭제된 [start, end) 구간을 추가할 리스트 (선택)
+        """
         
         # 패턴: "인사규정 402-2" 스타일
         artifact_pattern = r'^[가-힣]{2,10}\s*\d{1,5}-\d{1,3}\s*$'
         
         lines = text.split('\n')
         cleaned_lines = []
+        keep = []
         
         for line in lines:
             line_stripped = line.strip()
             
             if re.match(artifact_pattern, line_stripped):
                 logger.debug(f"      제거: {line_stripped}")
+                keep.append(False)
                 continue
             
             cleaned_lines.append(line)
+            keep.append(True)
+        
+        if removed_spans is not None and len(cleaned_lines) < len(lines):
+            removed_spans.extend(removed_line_spans(lines, keep))
         
         return '\n'.join(cleaned_lines)
     
-    def _normalize_linebreaks(self, text: str) -> str:
-        """개행 정규화"""
+    def _normalize_linebreaks(
+        self,
+        text: str,
+        removed_spans: Optional[List[Tuple[int, int]]] = None
+    ) -> str:
+        """
+        개행 정규화
+        
+        Args:
+            text: 입력 텍스트
+            removed_spans: ✅ Phase 1.0: 삭제된 [start, end) 구간을 추가할 리스트 (선택)
+        """
         
         # 3줄 이상 연속 개행 → 2줄로
+        if removed_spans is not None:
+            removed_spans.extend(
+                (m.start() + 2, m.end()) for m in re.finditer(r'\n{3,}', text)
+            )
         text = re.sub(r'\n{3,}', '\n\n', text)
         
         # 문장 끝 + 단일 개행 → 유지
@@ -168,7 +216,12 @@ class LawParser:
         
         return text
     
-    def _parse_legal_document(self, cleaned_text: str, document_title: str) -> Dict[str, Any]:
+    def _parse_legal_document(
+        self,
+        cleaned_text: str,
+        document_title: str,
+        page_index: Optional[PageOffsetIndex] = None
+    ) -> Dict[str, Any]:
         """
         법령/규정 문서 파싱
         
@@ -188,7 +241,8 @@ class LawParser:
         tree_builder = TreeBuilder()
         tree_doc = tree_builder.build(
             markdown=cleaned_text,
-            document_title=document_title
+            document_title=document_title,
+            page_index=page_index
         )
         
         # Tree → Article 변환
@@ -227,12 +281,17 @@ class LawParser:
                 # Chapter number 매핑
                 chapter_number = seen_chapters.get(chapter_info, '')
                 
+                # ✅ Phase 1.0: 페이지 범위 (page_index 전달 시)
+                pages = node.get('pages') or {}
+                
                 articles.append(Article(
                     number=article_no,
                     title=article_title,
                     body=article_body,
                     chapter_number=chapter_number,
-                    section_order=len(articles)
+                    section_order=len(articles),
+                    page_start=pages.get('start'),
+                    page_end=pages.get('end')
                 ))
         
         logger.info(f"   ✅ 조문 파싱: {len(articles)}개")
@@ -254,7 +313,7 @@ class LawParser:
             'total_articles': len(articles)
         }
         
-        self._apply_annex_extraction(cleaned_text, parsed_result)
+        self._apply_annex_extraction(cleaned_text, parsed_result, page_index)
         
         return parsed_result
     
@@ -316,7 +375,12 @@ class LawParser:
         
         return history_sorted
     
-    def _parse_annex_only_document(self, cleaned_text: str, document_title: str) -> Dict[str, Any]:
+    def _parse_annex_only_document(
+        self,
+        cleaned_text: str,
+        document_title: str,
+        page_index: Optional[PageOffsetIndex] = None
+    ) -> Dict[str, Any]:
         """Annex 전용 문서 파싱"""
         
         parsed_result = {
@@ -334,7 +398,7 @@ class LawParser:
             'total_articles': 0
         }
         
-        self._apply_annex_fallback(cleaned_text, parsed_result)
+        self._apply_annex_fallback(cleaned_text, parsed_result, page_index)
         
         return parsed_result
     
@@ -356,7 +420,12 @@ class LawParser:
             'total_articles': 0
         }
     
-    def _apply_annex_fallback(self, cleaned_text: str, parsed_result: dict):
+    def _apply_annex_fallback(
+        self,
+        cleaned_text: str,
+        parsed_result: dict,
+        page_index: Optional[PageOffsetIndex] = None
+    ):
         """Annex-only 문서 Fallback"""
         pattern = r'(\[별표\s*\d+\][\s\S]+)'
         match = re.search(pattern, cleaned_text)
@@ -364,6 +433,7 @@ class LawParser:
         if match:
             annex_text = match.group(1).strip()
             parsed_result['annex_content'] = annex_text
+            self._set_annex_pages(parsed_result, match, page_index)
             
             logger.info(f"   ✅ Fallback Annex 추출: {len(annex_text)}자")
             
@@ -376,7 +446,12 @@ class LawParser:
             if rel_match:
                 parsed_result['related_article'] = rel_match.group(1).strip()
     
-    def _apply_annex_extraction(self, cleaned_text: str, parsed_result: dict):
+    def _apply_annex_extraction(
+        self,
+        cleaned_text: str,
+        parsed_result: dict,
+        page_index: Optional[PageOffsetIndex] = None
+    ):
         """본문+Annex 혼합 문서에서 Annex 추출"""
         pattern = r'(\[별표\s*\d+\][\s\S]+)'
         match = re.search(pattern, cleaned_text)
@@ -384,6 +459,7 @@ class LawParser:
         if match:
             annex_text = match.group(1).strip()
             parsed_result['annex_content'] = annex_text
+            self._set_annex_pages(parsed_result, match, page_index)
             
             logger.info(f"   ✅ 혼합 문서 Annex 추출: {len(annex_text)}자")
             
@@ -396,6 +472,27 @@ class LawParser:
             if rel_match:
                 parsed_result['related_article'] = rel_match.group(1).strip()
     
+    def _set_annex_pages(
+        self,
+        parsed_result: dict,
+        match: "re.Match",
+        page_index: Optional[PageOffsetIndex]
+    ):
+        """✅ Phase 1.0: Annex 페이지 범위 기록"""
+        if page_index is None:
+            return
+        
+        page_start, page_end = page_index.page_span(match.start(1), match.end(1))
+        parsed_result['annex_page_start'] = page_start
+        parsed_result['annex_page_end'] = page_end
+    
+    @staticmethod
+    def _page_metadata(page_start: Optional[int], page_end: Optional[int]) -> Dict[str, int]:
+        """✅ Phase 1.0: 청크 메타데이터용 페이지 범위 (알 수 없으면 빈 dict)"""
+        if page_start is None:
+            return {}
+        return {'page_start': page_start, 'page_end': page_end}
+    
     def _clean_article_body(self, body: str) -> str:
         """
         조문 본문 정리
@@ -509,7 +606,8 @@ class LawParser:
                     'article_title': article.title,
                     'chapter_number': article.chapter_number,
                     'char_count': len(content),
-                    'section_order': article.section_order
+                    'section_order': article.section_order,
+                    **self._page_metadata(article.page_start, article.page_end)
                 }
             })
         
@@ -530,6 +628,8 @@ class LawParser:
                 insert_idx = chapter_positions.get(chapter_num)
                 
                 if insert_idx is not None:
+                    # ✅ Phase 1.0: 장 제목 = 첫 조문 페이지
+                    first_article = chunks[insert_idx]['metadata']
                     chapter_content = f"{chapter.number} {chapter.title}"
                     chapter_chunk = {
                         'content': chapter_content,
@@ -539,7 +639,11 @@ class LawParser:
                             'chapter_number': chapter.number,
                             'chapter_title': chapter.title,
                             'char_count': len(chapter_content),
-                            'section_order': chapter.section_order
+                            'section_order': chapter.section_order,
+                            **self._page_metadata(
+                                first_article.get('page_start'),
+                                first_article.get('page_start')
+                            )
                         }
                     }
                     
@@ -553,6 +657,12 @@ class LawParser:
             # ✅ Phase 0.9.5.1 Hotfix: RAW 그대로 전달 (정제는 SubChunker에서만)
             annex_text = annex_content  # 정제 제거!
             
+            # ✅ Phase 1.0: 서브청크는 Annex 전체 페이지 범위 상속
+            annex_pages = self._page_metadata(
+                parsed_result.get('annex_page_start'),
+                parsed_result.get('annex_page_end')
+            )
+            
             try:
                 if ANNEX_SUBCHUNKING_AVAILABLE:
                     subchunker = AnnexSubChunker()
@@ -576,7 +686,8 @@ class LawParser:
                                     'section_type': sub.section_type,
                                     'char_count': sub.char_count,
                                     'section_order': sub.order,
-                                    **sub.metadata
+                                    **sub.metadata,
+                                    **annex_pages
                                 }
                             })
                     else:
@@ -596,7 +707,8 @@ class LawParser:
                         'annex_no': parsed_result.get('annex_no', ''),
                         'annex_title': parsed_result.get('annex_title', ''),
                         'related_article': parsed_result.get('related_article', ''),
-                        'fallback': True
+                        'fallback': True,
+                        **annex_pages
                     }
                 })
         
@@ -0,0 +1,276 @@
+"""
+core/ocr_pool.py
+PRISM Phase 1.0 - Tesseract OCR Worker Pool
+
+✅ 기능:
+1. 상주 프로세스 풀 OCR (워커당 Tesseract 초기화 1회)
+   - tesserocr 설치 시 워커별 PyTessBaseAPI 1개 유지 (언어 모델 로드 1회)
+   - 없으면 pytesseract (호출마다 tesseract 실행, 워커 프로세스/임포트만 재사용)
+2. 비동기 제출 (submit → Future): QuickLayoutAnalyzer의 OpenCV 단계와 OCR을 겹쳐 실행
+3. 선택적 축소 / 영역 OCR (긴 변 상한, 페이지 대비 비율 좌표)
+4. OCR 사용량 집계 (OcrUsage): OCR 시간 + 텍스트 레이어 우회로 절약한 OCR 시간
+
+환경 변수:
+- PRISM_OCR_WORKERS: OCR 프로세스 수 (기본 1, 0이면 호출 스레드에서 실행)
+- PRISM_OCR_MAX_EDGE: OCR 입력 긴 변 상한 px (기본 제한 없음)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANG = 'kor+eng'
+
+# 텍스트 레이어 우회 페이지의 OCR 시간 추정값 (문서에 실측 OCR이 없을 때, 초/페이지)
+OCR_SEC_ESTIMATE = 1.5
+
+
+def default_ocr_workers() -> int:
+    return max(0, int(os.getenv("PRISM_OCR_WORKERS", "1")))
+
+
+def default_ocr_max_edge() -> Optional[int]:
+    value = os.getenv("PRISM_OCR_MAX_EDGE")
+    return int(value) if value else None
+
+
+def prepare_ocr_image(
+    gray: np.ndarray,
+    region: Optional[Sequence[float]] = None,
+    max_long_edge: Optional[int] = None
+) -> np.ndarray:
+    """
+    OCR 입력 준비 (영역 자르기 → 긴 변 축소)
+
+    Args:
+        gray: 그레이스케일 페이지
+        region: [x0, y0, x1, y1] 페이지 대비 비율 (None이면 전체)
+        max_long_edge: 긴 변 상한 px (None이면 원본 크기)
+
+    Returns:
+        C-연속 그레이스케일 배열
+    """
+    if region is not None:
+        height, width = gray.shape[:2]
+        x0, y0, x1, y1 = region
+        gray = gray[int(y0 * height):int(round(y1 * height)), int(x0 * width):int(round(x1 * width))]
+    if max_long_edge and max(gray.shape[:2]) > max_long_edge:
+        scale = max_long_edge / max(gray.shape[:2])
+        size = (max(1, round(gray.shape[1] * scale)), max(1, round(gray.shape[0] * scale)))
+        gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    return np.ascontiguousarray(gray)
+
+
+# ============================================================
+# Tesseract 엔진
+# ============================================================
+
+class TesserocrEngine:
+    """tesserocr API 1개 유지 (언어 모델 로드 1회)"""
+
+    def __init__(self, lang: str = DEFAULT_LANG):
+        import tesserocr
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def ocr(self, gray: np.ndarray) -> str:
+        height, width = gray.shape[:2]
+        self.api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+        return self.api.GetUTF8Text()
+
+
+class PytesseractEngine:
+    """pytesseract (호출마다 tesseract 프로세스 실행)"""
+
+    def __init__(self, lang: str = DEFAULT_LANG):
+        import pytesseract
+        self.pytesseract = pytesseract
+        self.lang = lang
+
+    def ocr(self, gray: np.ndarray) -> str:
+        return self.pytesseract.image_to_string(gray, lang=self.lang)
+
+
+def create_engine(lang: str = DEFAULT_LANG):
+    """Tesseract 엔진 (tesserocr 우선, 없으면 pytesseract)"""
+    try:
+        return TesserocrEngine(lang)
+    except ImportError:
+        return PytesseractEngine(lang)
+
+
+# ✅ Phase 1.0: OCR 워커 프로세스별 엔진 (initializer에서 1회 생성)
+_WORKER_ENGINE = None
+
+
+def _init_ocr_worker(lang: str, engine_factory: Callable[[str], Any]) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine_factory(lang)
+
+
+def _ocr_in_worker(gray: np.ndarray) -> Tuple[str, float]:
+    """프로세스 풀 워커 진입점 → (텍스트, OCR 초)"""
+    start = time.perf_counter()
+    text = _WORKER_ENGINE.ocr(gray)
+    return text.strip(), time.perf_counter() - start
+
+
+# ============================================================
+# 프로세스 풀
+# ============================================================
+
+class OcrPool:
+    """
+    Phase 1.0 상주 OCR 프로세스 풀
+
+    워커 프로세스는 첫 제출 시 시작되어 shutdown()까지 유지 (문서 간 재사용).
+
+    사용 예:
+        pool = get_ocr_pool()
+        future = pool.submit(gray)       # OpenCV 분석과 병행
+        text, ocr_sec = future.result()
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        lang: str = DEFAULT_LANG,
+        max_long_edge: Optional[int] = None,
+        engine_factory: Callable[[str], Any] = create_engine
+    ):
+        """
+        초기화
+
+        Args:
+            workers: OCR 프로세스 수 (최소 1)
+            lang: Tesseract 언어
+            max_long_edge: OCR 입력 긴 변 상한 px (None이면 원본 크기)
+            engine_factory: lang → 엔진 (ocr(gray) -> str, 워커당 1회 호출, pickle 가능해야 함)
+        """
+        self.workers = max(1, workers)
+        self.lang = lang
+        self.max_long_edge = max_long_edge
+        self.engine_factory = engine_factory
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(f"   🔤 OCR 프로세스 풀 시작: {self.workers}개 ({self.lang})")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_ocr_worker,
+                    initargs=(self.lang, self.engine_factory)
+                )
+            return self._executor
+
+    def submit(self, gray: np.ndarray, region: Optional[Sequence[float]] = None) -> "Future[Tuple[str, float]]":
+        """
+        OCR 제출
+
+        Args:
+            gray: 그레이스케일 페이지
+            region: [x0, y0, x1, y1] 페이지 대비 비율 (None이면 전체)
+
+        Returns:
+            Future → (텍스트, OCR 초)
+        """
+        return self._pool().submit(_ocr_in_worker, prepare_ocr_image(gray, region, self.max_long_edge))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+_POOLS: Dict[Tuple[int, str, Optional[int]], OcrPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_ocr_pool(
+    workers: Optional[int] = None,
+    lang: str = DEFAULT_LANG,
+    max_long_edge: Optional[int] = None
+) -> OcrPool:
+    """
+    프로세스 공용 OCR 풀 (설정별 1개, 분석기/문서 간 공유)
+
+    Args:
+        workers: OCR 프로세스 수 (기본: PRISM_OCR_WORKERS)
+        lang: Tesseract 언어
+        max_long_edge: OCR 입력 긴 변 상한 px
+    """
+    workers = max(1, default_ocr_workers() if workers is None else workers)
+    key = (workers, lang, max_long_edge)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = OcrPool(workers, lang, max_long_edge)
+        return pool
+
+
+def shutdown_ocr_pools() -> None:
+    """공용 OCR 풀 전체 종료"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+# ============================================================
+# 사용량 집계
+# ============================================================
+
+class OcrUsage:
+    """
+    Phase 1.0 문서 단위 OCR 사용량
+
+    - record(): 레이아웃 힌트의 text_source / ocr_sec 누적
+    - stats(): OCR 페이지/시간 + 텍스트 레이어 우회 페이지와 절약한 OCR 시간
+      (절약 시간 = 우회 페이지 × 이 문서의 페이지당 OCR 시간, 실측이 없으면 OCR_SEC_ESTIMATE)
+    """
+
+    def __init__(self, sec_estimate: float = OCR_SEC_ESTIMATE):
+        self.sec_estimate = sec_estimate
+        self._lock = threading.Lock()
+        self.counts = {'ocr_pages': 0, 'bypassed_pages': 0}
+        self.ocr_sec = 0.0
+
+    def record(self, hints: Dict[str, Any]) -> None:
+        source = hints.get('text_source')
+        with self._lock:
+            if source == 'text_layer':
+                self.counts['bypassed_pages'] += 1
+            elif source == 'ocr':
+                self.counts['ocr_pages'] += 1
+                self.ocr_sec += hints.get('ocr_sec') or 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self.counts)
+            ocr_sec = self.ocr_sec
+        measured = counts['ocr_pages'] > 0
+        per_page = ocr_sec / counts['ocr_pages'] if measured else self.sec_estimate
+        return {
+            **counts,
+            'ocr_sec': round(ocr_sec, 3),
+            'sec_per_page': round(per_page, 3),
+            'saved_sec': round(counts['bypassed_pages'] * per_page, 3),
+            'estimated': not measured
+        }
@@ -0,0 +1,242 @@
+"""
+core/page_dedup.py
+PRISM Phase 1.0 - Perceptual Page Dedup + Blank Page Detection
+
+✅ 기능:
+1. dHash (축소 그레이스케일 인접 픽셀 밝기 비교, 기본 16x16 = 256비트)
+2. 빈 페이지 감지 (머리말/쪽번호 여백 제외 잉크 비율)
+3. 중복 페이지 결과 재사용
+   - 문서 내: 먼저 처리된 같은 해시 페이지의 VLM 결과
+   - 문서 간: 디스크 캐시 (해시 + 프롬프트 + 모델 키)
+4. 절약한 VLM 호출 수 집계
+
+⚠️ 오탐 방지:
+- 해시 완전 일치만 중복으로 판정 (해밍 거리 허용 없음)
+- dHash는 레이아웃이 같은 본문 페이지끼리 충돌할 수 있으므로
+  글자 모양이 남는 썸네일(폭 256) 다이제스트까지 일치해야 중복
+- 텍스트 레이어에 글자가 있는 페이지는 텍스트까지 키에 포함 (같아야 중복)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    from .disk_cache import DiskCache
+except ImportError:
+    from core.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# dHash 한 변 크기 (비트 수 = HASH_SIZE²)
+HASH_SIZE = 16
+
+# 다이제스트용 썸네일 폭 / 밝기 양자화 (렌더링 미세 차이 흡수)
+DIGEST_WIDTH = 256
+DIGEST_SHIFT = 4
+
+# 빈 페이지 판정 (보수적: 글자 1~2개짜리 페이지도 빈 페이지로 보지 않도록)
+# - 상하 여백(머리말/쪽번호)과 좌우 여백 제외, 축소는 최대 폭까지만 (획이 흐려지지 않게)
+BLANK_SAMPLE_WIDTH = 1024
+BLANK_MARGIN_Y = 0.08
+BLANK_MARGIN_X = 0.05
+BLANK_INK_LEVEL = 128
+BLANK_MAX_INK_RATIO = 0.00005
+
+
+@dataclass(frozen=True)
+class PageFingerprint:
+    """
+    페이지 지문
+
+    Attributes:
+        dhash: dHash 16진수 문자열
+        digest: 양자화 썸네일 SHA-256 (앞 32자)
+        shape: 원본 (높이, 너비) - 판형이 다른 페이지 구분
+        ink_ratio: 여백 제외 잉크 픽셀 비율
+        blank: 빈 페이지 여부 (픽셀 기준)
+    """
+    dhash: str
+    digest: str
+    shape: Tuple[int, int]
+    ink_ratio: float
+    blank: bool
+
+
+def _to_gray(pixels: np.ndarray) -> np.ndarray:
+    if pixels.ndim == 2:
+        return pixels
+    return cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
+
+
+def dhash(gray: np.ndarray, hash_size: int = HASH_SIZE) -> str:
+    """
+    dHash: (hash_size+1) x hash_size로 축소 후 가로 인접 픽셀 비교
+
+    Args:
+        gray: 그레이스케일 이미지
+        hash_size: 한 변 크기
+
+    Returns:
+        16진수 해시 (hash_size² 비트)
+    """
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return np.packbits(bits).tobytes().hex()
+
+
+def thumbnail_digest(gray: np.ndarray) -> str:
+    """폭 DIGEST_WIDTH 썸네일을 양자화해 SHA-256 (글자 차이는 구분, 같은 렌더링은 일치)"""
+    height, width = gray.shape[:2]
+    size = (DIGEST_WIDTH, max(1, round(height * DIGEST_WIDTH / width)))
+    small = cv2.resize(gray, size, interpolation=cv2.INTER_AREA) >> DIGEST_SHIFT
+    return hashlib.sha256(np.ascontiguousarray(small).tobytes()).hexdigest()[:32]
+
+
+def ink_ratio(gray: np.ndarray) -> float:
+    """여백(머리말/쪽번호 영역)을 제외한 어두운 픽셀 비율"""
+    height, width = gray.shape[:2]
+    if width > BLANK_SAMPLE_WIDTH:
+        scale = BLANK_SAMPLE_WIDTH / width
+        gray = cv2.resize(gray, (BLANK_SAMPLE_WIDTH, max(1, int(height * scale))), interpolation=cv2.INTER_AREA)
+        height, width = gray.shape[:2]
+
+    dy, dx = int(height * BLANK_MARGIN_Y), int(width * BLANK_MARGIN_X)
+    body = gray[dy:height - dy, dx:width - dx]
+    if body.size == 0:
+        return 0.0
+    return float(np.count_nonzero(body < BLANK_INK_LEVEL)) / body.size
+
+
+def page_fingerprint(pixels: np.ndarray) -> PageFingerprint:
+    """
+    렌더링 픽셀 → 페이지 지문 (저해상도 썸네일로 충분)
+
+    Args:
+        pixels: BGR 또는 그레이스케일 배열
+
+    Returns:
+        PageFingerprint
+    """
+    gray = _to_gray(pixels)
+    ratio = ink_ratio(gray)
+    return PageFingerprint(
+        dhash=dhash(gray),
+        digest=thumbnail_digest(gray),
+        shape=(int(gray.shape[0]), int(gray.shape[1])),
+        ink_ratio=round(ratio, 5),
+        blank=ratio < BLANK_MAX_INK_RATIO
+    )
+
+
+def has_words(text: str) -> bool:
+    """텍스트 레이어에 글자(한글/영문)가 있는지 (쪽번호/구두점만 있는 페이지는 False)"""
+    return sum(1 for ch in text or "" if ch.isalpha()) >= 2
+
+
+class PageDeduplicator:
+    """
+    Phase 1.0 문서 단위 중복 페이지 관리
+
+    - match(): 지문 + 프롬프트 → 문서 내 원본 페이지 번호 또는 캐시된 결과
+    - record(): VLM 성공 결과 등록 (문서 내 표 + 디스크 캐시)
+    - stats(): 절약한 VLM 호출 수
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, key_parts: Tuple[Any, ...] = ()):
+        """
+        초기화
+
+        Args:
+            cache: 문서 간 재사용용 디스크 캐시 (None이면 문서 내만)
+            key_parts: 캐시 키 추가 구성요소 (프로바이더, 모델, 검증 버전)
+        """
+        self.cache = cache
+        self.key_parts = key_parts
+        self._lock = threading.Lock()
+        self._first_page: Dict[str, int] = {}  # key → 원본 페이지
+        self._contents: Dict[int, str] = {}
+        self.counts = {'blank': 0, 'duplicate': 0, 'cache': 0}
+
+    def key(self, fingerprint: PageFingerprint, prompt: str, page_text: str = "") -> str:
+        """중복 판정 키 (지문 + 판형 + 프롬프트 + 텍스트 레이어 + 모델)"""
+        text = page_text.strip() if has_words(page_text) else ""
+        return DiskCache.make_key(
+            'phash',
+            fingerprint.dhash,
+            fingerprint.digest,
+            fingerprint.shape,
+            hashlib.sha256(prompt.encode('utf-8')).hexdigest(),
+            hashlib.sha256(text.encode('utf-8')).hexdigest(),
+            *self.key_parts
+        )
+
+    def count(self, kind: str) -> None:
+        with self._lock:
+            self.counts[kind] += 1
+
+    def match(self, key: str, page_num: int) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+        """
+        중복 조회 (처음 보는 키면 이 페이지를 원본으로 등록)
+
+        Args:
+            key: key() 결과
+            page_num: 현재 페이지
+
+        Returns:
+            (kind, original_page, cached_content)
+            kind: 'duplicate' | 'cache' | None
+        """
+        with self._lock:
+            original = self._first_page.get(key)
+            if original is not None:
+                self.counts['duplicate'] += 1
+                return 'duplicate', original, None
+            self._first_page[key] = page_num
+
+        if self.cache is not None:
+            data = self.cache.get(key)
+            if data is not None:
+                content = data.decode('utf-8')
+                with self._lock:
+                    self.counts['cache'] += 1
+                    self._contents[page_num] = content  # 이후 문서 내 중복의 원본
+                return 'cache', None, content
+        return None, None, None
+
+    def record(self, key: Optional[str], page_num: int, content: str) -> None:
+        """
+        VLM 성공 결과 등록
+
+        Args:
+            key: key() 결과 (None이면 무시)
+            page_num: 페이지 번호
+            content: VLM 결과 (후처리 전)
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._contents[page_num] = content
+        if self.cache is not None:
+            self.cache.put(key, content.encode('utf-8'))
+
+    def content_for(self, page_num: int) -> Optional[str]:
+        """원본 페이지의 VLM 결과 (원본이 VLM 실패했으면 None)"""
+        with self._lock:
+            return self._contents.get(page_num)
+
+    def stats(self) -> Dict[str, int]:
+        """절약한 VLM 호출 수"""
+        with self._lock:
+            counts = dict(self.counts)
+        counts['saved_calls'] = sum(counts.values())
+        return counts
@@ -0,0 +1,470 @@
+"""
+core/page_pipeline.py
+PRISM Phase 1.0 - VLM Mode Page Pipeline (Producer/Consumer)
+
+✅ 기능:
+1. 3단계 파이프라인 (단계 사이 bounded queue)
+   - 분석: 렌더링 + 페이지 지문 + QuickLayoutAnalyzer (프로세스 풀, CPU, 빈 페이지는 분석 생략)
+   - 준비/전송: 프롬프트·라우팅·VLM 이미지 → VLM 호출 (스레드 풀, 네트워크)
+   - 완료: 페이지 순서대로 후처리 (호출자 스레드)
+2. 백프레셔: 단계별 대기 페이지 수 상한 → 문서 크기와 무관한 메모리 사용량
+3. 단계별 시간 측정 (stats) + 페이지별 시간 (result['timings'])
+4. 처리 페이지 지정 (체크포인트 재개 시 완료 페이지 제외)
+5. 텍스트 레이어가 있는 페이지는 분석 워커에 페이지 텍스트 전달 → 분석 OCR 생략
+6. 렌더링/분석/준비 실패 페이지도 결과에서 빠지지 않음 → _finish()의 Fallback 체인 (텍스트 레이어/OCR)
+
+환경 변수:
+- PRISM_PIPELINE_WORKERS: 분석 프로세스 수 (기본 CPU 수 - 1, 0이면 스레드 내 실행)
+- PRISM_PIPELINE_BUFFER: 단계 사이 최대 대기 페이지 수 (기본 8)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from .page_dedup import page_fingerprint
+    from .pdf_processor import PDFProcessor
+    from .quick_layout_analyzer import QuickLayoutAnalyzer
+except ImportError:
+    from core.page_dedup import page_fingerprint
+    from core.pdf_processor import PDFProcessor
+    from core.quick_layout_analyzer import QuickLayoutAnalyzer
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+STAGES = ('render', 'analyze', 'prepare', 'vlm', 'finish')
+
+
+# ✅ Phase 1.0: 분석 워커 프로세스별 렌더러/분석기 (initializer에서 1회 생성)
+_WORKER_PROCESSOR: Optional[PDFProcessor] = None
+_WORKER_ANALYZER: Optional[QuickLayoutAnalyzer] = None
+
+
+def _init_analyze_worker(use_cache: bool) -> None:
+    """분석 워커 초기화 (문서 핸들은 PDFProcessor 풀이 워커별로 유지)"""
+    global _WORKER_PROCESSOR, _WORKER_ANALYZER
+    _WORKER_PROCESSOR = PDFProcessor(use_cache=use_cache)
+    # 분석 워커 자체가 프로세스 풀 → OCR은 워커 안에서 직접 실행 (OCR 풀 중첩 없음)
+    _WORKER_ANALYZER = QuickLayoutAnalyzer(ocr_workers=0)
+
+
+def _render_and_analyze(
+    processor: PDFProcessor,
+    analyzer: QuickLayoutAnalyzer,
+    pdf_path: str,
+    page_num: int,
+    dpi: int,
+    text_layer: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    페이지 1장 렌더링 + 지문 + 레이아웃 분석 (빈 페이지는 분석 생략, text_layer가 있으면 OCR 생략,
+    표 영역은 같은 문서 핸들의 벡터 괘선 우선)
+
+    Returns:
+        {'page_num', 'page', 'fingerprint', 'hints', 'render_sec', 'analyze_sec', 'error'}
+    """
+    result = {'page_num': page_num, 'page': None, 'fingerprint': None, 'hints': None,
+              'render_sec': 0.0, 'analyze_sec': 0.0, 'error': None}
+    try:
+        start = time.perf_counter()
+        result['page'] = processor.render_page(pdf_path, page_num, dpi=dpi)
+        result['fingerprint'] = page_fingerprint(result['page'].pixels)
+        mid = time.perf_counter()
+        if not result['fingerprint'].blank:
+            result['hints'] = analyzer.analyze(
+                result['page'], text_layer=text_layer,
+                vector_lines=processor.extract_vector_lines(pdf_path, page_num)
+            )
+        result['render_sec'] = mid - start
+        result['analyze_sec'] = time.perf_counter() - mid
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def _analyze_in_worker(pdf_path: str, page_num: int, dpi: int, text_layer: Optional[str] = None) -> Dict[str, Any]:
+    """프로세스 풀 워커 진입점"""
+    return _render_and_analyze(_WORKER_PROCESSOR, _WORKER_ANALYZER, pdf_path, page_num, dpi, text_layer)
+
+
+class PagePipeline:
+    """
+    Phase 1.0 VLM Mode 페이지 파이프라인
+
+    HybridExtractor의 단계(_prepare → VLM 호출 → _finish)를 나누어
+    CPU 작업(렌더링/레이아웃 분석)과 네트워크 작업(VLM)을 겹쳐 실행.
+    결과는 페이지 순서대로 반환 (extract_pages()와 동일한 페이지 결과).
+
+    사용 예:
+        pipeline = PagePipeline(extractor, processor)
+        for result in pipeline.run(pdf_path):
+            ...
+        logger.info(pipeline.stats())
+    """
+
+    def __init__(
+        self,
+        extractor,
+        pdf_processor: Optional[PDFProcessor] = None,
+        analyze_workers: Optional[int] = None,
+        vlm_workers: Optional[int] = None,
+        max_buffered: Optional[int] = None,
+        layout_dpi: int = PDFProcessor.LAYOUT_DPI
+    ):
+        """
+        초기화
+
+        Args:
+            extractor: HybridExtractor
+            pdf_processor: 인라인 분석(analyze_workers=0)용 렌더러 (기본: extractor.pdf_processor)
+            analyze_workers: 분석 프로세스 수 (기본: PRISM_PIPELINE_WORKERS 또는 CPU 수 - 1)
+            vlm_workers: VLM 동시 호출 수 (기본: vlm_service.max_concurrency)
+            max_buffered: 단계 사이 최대 대기 페이지 수 (기본: PRISM_PIPELINE_BUFFER 또는 8)
+            layout_dpi: 분석용 렌더링 해상도
+        """
+        self.extractor = extractor
+        self.pdf_processor = pdf_processor or getattr(extractor, 'pdf_processor', None) or PDFProcessor()
+
+        if analyze_workers is None:
+            default = max(1, (os.cpu_count() or 2) - 1)
+            analyze_workers = int(os.getenv("PRISM_PIPELINE_WORKERS", str(default)))
+        self.analyze_workers = max(0, analyze_workers)
+
+        if vlm_workers is None:
+            vlm_workers = getattr(extractor.vlm_service, 'max_concurrency', 1)
+        self.vlm_workers = max(1, vlm_workers)
+
+        if max_buffered is None:
+            max_buffered = int(os.getenv("PRISM_PIPELINE_BUFFER", "8"))
+        self.max_buffered = max(1, max_buffered)
+        self.layout_dpi = layout_dpi
+
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+        logger.info("✅ PagePipeline 초기화")
+        logger.info(f"   - 분석 프로세스: {self.analyze_workers or '인라인'}")
+        logger.info(f"   - VLM 동시 호출: {self.vlm_workers}")
+        logger.info(f"   - 단계별 최대 대기: {self.max_buffered}페이지")
+
+    # ============================================================
+    # 통계
+    # ============================================================
+
+    def _reset_stats(self) -> None:
+        with self._lock:
+            self._times = {stage: 0.0 for stage in STAGES}
+            self._waits = {'prepare': 0.0, 'finish': 0.0}
+            self._pages = 0
+            self._vlm_pages = 0
+            self._failed = 0
+            self._wall = 0.0
+
+    def _add_time(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._times[stage] += seconds
+
+    def _add_wait(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._waits[stage] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        단계별 누적 시간 (마지막 run 기준)
+
+        Returns:
+            {
+                'pages', 'vlm_pages', 'failed_pages', 'wall_sec',  # failed_pages: Fallback으로 넘긴 실패 페이지
+                'stage_sec': {render, analyze, prepare, vlm, finish},  # 단계 작업 시간 합
+                'wait_sec': {prepare, finish},  # 이전 단계 결과를 기다린 시간
+                'pages_per_sec',
+                'dedup': {blank, duplicate, cache, saved_calls},  # extractor 지원 시
+                'ocr': {ocr_pages, bypassed_pages, ocr_sec, saved_sec, ...}  # extractor 지원 시
+            }
+        """
+        dedup_stats = getattr(self.extractor, 'dedup_stats', None)
+        ocr_stats = getattr(self.extractor, 'ocr_stats', None)
+        with self._lock:
+            return {
+                'pages': self._pages,
+                'vlm_pages': self._vlm_pages,
+                'failed_pages': self._failed,
+                'wall_sec': round(self._wall, 3),
+                'stage_sec': {k: round(v, 3) for k, v in self._times.items()},
+                'wait_sec': {k: round(v, 3) for k, v in self._waits.items()},
+                'pages_per_sec': round(self._pages / self._wall, 2) if self._wall else 0.0,
+                'dedup': dedup_stats() if dedup_stats else None,
+                'ocr': ocr_stats() if ocr_stats else None
+            }
+
+    # ============================================================
+    # 실행
+    # ============================================================
+
+    def run(
+        self,
+        pdf_path: str,
+        max_pages: Optional[int] = None,
+        pages: Optional[Iterable[int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        파이프라인 실행
+
+        Args:
+            pdf_path: PDF 경로
+            max_pages: 최대 페이지 수 (None이면 전체)
+            pages: 처리할 페이지 번호 (1-based, None이면 1..max_pages 전체)
+
+        Yields:
+            HybridExtractor 페이지 결과 + 'timings' (페이지 순서, 렌더링/분석/준비 실패 페이지는 Fallback 결과)
+        """
+        total = self.pdf_processor.get_page_count(pdf_path)
+        if max_pages is not None:
+            total = min(total, max_pages)
+        if pages is None:
+            page_nums = list(range(1, total + 1))
+        else:
+            page_nums = sorted(n for n in set(pages) if 1 <= n <= total)
+
+        self._reset_stats()
+        started = time.perf_counter()
+
+        analyzed: "queue.Queue" = queue.Queue(maxsize=self.max_buffered)
+        submitted: "queue.Queue" = queue.Queue(maxsize=self.max_buffered)
+        stop = threading.Event()
+
+        vlm_pool = ThreadPoolExecutor(max_workers=self.vlm_workers, thread_name_prefix='prism-vlm')
+        threads = [
+            threading.Thread(
+                target=self._stage_analyze, args=(pdf_path, page_nums, analyzed, stop),
+                name='prism-analyze', daemon=True
+            ),
+            threading.Thread(
+                target=self._stage_prepare, args=(analyzed, submitted, vlm_pool, stop),
+                name='prism-prepare', daemon=True
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                wait_start = time.perf_counter()
+                item = submitted.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                request, content, timings = item
+                if isinstance(content, Future):
+                    try:
+                        content = content.result()
+                    except Exception as e:
+                        content = e
+                self._add_wait('finish', time.perf_counter() - wait_start)
+
+                start = time.perf_counter()
+                result = self.extractor._finish(request, content)
+                timings['finish'] = time.perf_counter() - start
+                self._add_time('finish', timings['finish'])
+                result['timings'] = {k: round(v, 4) for k, v in timings.items()}
+
+                with self._lock:
+                    self._pages += 1
+                    self._wall = time.perf_counter() - started
+                yield result
+        finally:
+            stop.set()
+            for q in (analyzed, submitted):
+                self._drain(q)
+            for thread in threads:
+                thread.join()
+            vlm_pool.shutdown(wait=True, cancel_futures=True)
+            with self._lock:
+                self._wall = time.perf_counter() - started
+            logger.info(f"   ⏱️ PagePipeline: {self.stats()}")
+
+    @staticmethod
+    def _put(q: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+        """stop 신호를 확인하며 bounded queue에 넣기 (백프레셔 대기)"""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @staticmethod
+    def _get(q: "queue.Queue", stop: threading.Event) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    @staticmethod
+    def _drain(q: "queue.Queue") -> None:
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _stage_analyze(
+        self,
+        pdf_path: str,
+        page_nums: List[int],
+        out: "queue.Queue",
+        stop: threading.Event
+    ) -> None:
+        """1단계: 렌더링 + 레이아웃 분석 (페이지 순서대로 out에 전달)"""
+        try:
+            if self.analyze_workers == 0:
+                # 준비 스레드와 같은 문서 핸들 공유 → pdfium 호출은 PDFProcessor 내부 락으로 직렬화
+                analyzer = getattr(self.extractor, 'layout_analyzer', None) or QuickLayoutAnalyzer()
+                for page_num in page_nums:
+                    result = _render_and_analyze(
+                        self.pdf_processor, analyzer, pdf_path, page_num, self.layout_dpi,
+                        self._analysis_text(page_num)
+                    )
+                    if not self._emit_analyzed(result, out, stop):
+                        return
+            else:
+                self._analyze_parallel(pdf_path, page_nums, out, stop)
+        except Exception as e:
+            logger.error(f"❌ 분석 단계 실패: {e}")
+            self._put(out, e, stop)
+            return
+        self._put(out, _DONE, stop)
+
+    def _analyze_parallel(
+        self,
+        pdf_path: str,
+        page_nums: List[int],
+        out: "queue.Queue",
+        stop: threading.Event
+    ) -> None:
+        """프로세스 풀 분석 (진행 중 작업은 workers * 2로 제한)"""
+        workers = min(self.analyze_workers, max(1, len(page_nums)))
+        window = workers * 2
+        ctx = multiprocessing.get_context('spawn')
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_analyze_worker,
+            initargs=(self.pdf_processor.cache is not None,)
+        ) as executor:
+            pending = deque()
+            remaining = deque(page_nums)
+            try:
+                while pending or remaining:
+                    while remaining and len(pending) < window:
+                        page_num = remaining.popleft()
+                        pending.append((page_num, executor.submit(
+                            _analyze_in_worker, pdf_path, page_num, self.layout_dpi,
+                            self._analysis_text(page_num)
+                        )))
+
+                    page_num, future = pending.popleft()
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'page_num': page_num, 'page': None, 'fingerprint': None, 'hints': None,
+                                  'render_sec': 0.0, 'analyze_sec': 0.0, 'error': str(e)}
+                    if not self._emit_analyzed(result, out, stop):
+                        return
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _analysis_text(self, page_num: int) -> Optional[str]:
+        """분석 OCR 대신 쓸 페이지 텍스트 레이어 (extractor 미지원/실패 시 None → OCR)"""
+        analysis_text = getattr(self.extractor, '_analysis_text', None)
+        if analysis_text is None:
+            return None
+        try:
+            return analysis_text(page_num)
+        except Exception as e:
+            logger.warning(f"   ⚠️ 페이지 {page_num} 텍스트 레이어 조회 실패 - 분석 OCR 사용: {e}")
+            return None
+
+    def _emit_analyzed(self, result: Dict[str, Any], out: "queue.Queue", stop: threading.Event) -> bool:
+        self._add_time('render', result['render_sec'])
+        self._add_time('analyze', result['analyze_sec'])
+        if result['error'] is not None:
+            logger.error(f"   ❌ 페이지 {result['page_num']} 렌더링/분석 실패 → Fallback: {result['error']}")
+        return self._put(out, result, stop)
+
+    def _stage_prepare(
+        self,
+        analyzed: "queue.Queue",
+        out: "queue.Queue",
+        vlm_pool: ThreadPoolExecutor,
+        stop: threading.Event
+    ) -> None:
+        """2단계: 프롬프트/라우팅/VLM 이미지 준비 → VLM 호출 제출 (페이지 순서대로 out에 전달)"""
+        while True:
+            wait_start = time.perf_counter()
+            item = self._get(analyzed, stop)
+            self._add_wait('prepare', time.perf_counter() - wait_start)
+            if item is _DONE or isinstance(item, BaseException):
+                self._put(out, item, stop)
+                return
+
+            timings = {'render': item['render_sec'], 'analyze': item['analyze_sec']}
+            start = time.perf_counter()
+            if item['error'] is not None:
+                request = self._failed_request(item, RuntimeError(item['error']))
+            else:
+                try:
+                    request = self.extractor._prepare(
+                        item['page'],
+                        item['page_num'],
+                        hints=item['hints'],
+                        fingerprint=item['fingerprint']
+                    )
+                except Exception as e:
+                    logger.error(f"   ❌ 페이지 {item['page_num']} 준비 실패 → Fallback: {e}")
+                    request = self._failed_request(item, e)
+            timings['prepare'] = time.perf_counter() - start
+            self._add_time('prepare', timings['prepare'])
+
+            content: Any = request['error']
+            if self.extractor._needs_vlm(request):
+                content = vlm_pool.submit(self._call_vlm, request, timings)
+                with self._lock:
+                    self._vlm_pages += 1
+
+            if not self._put(out, (request, content, timings), stop):
+                return
+
+    def _failed_request(self, item: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+        """실패 페이지 → VLM 생략 요청 (_finish()가 error를 받아 Fallback)"""
+        with self._lock:
+            self._failed += 1
+        return self.extractor._failed_request(item['page_num'], error, item['page'])
+
+    def _call_vlm(self, request: Dict[str, Any], timings: Dict[str, float]) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.extractor._call_vlm(request)
+        finally:
+            timings['vlm'] = time.perf_counter() - start
+            self._add_time('vlm', timings['vlm'])
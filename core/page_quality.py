@@ -0,0 +1,143 @@
+"""
+core/page_quality.py
+PRISM Phase 1.0 - Text Layer Page Quality Scorer
+
+✅ 기능:
+1. 페이지 텍스트 레이어 품질 지표
+   - 문자 밀도 (공백 제외 문자 수)
+   - 한글 비율 (문자 중 완성형 한글 음절)
+   - 조문 패턴 적중 수 (제N조)
+   - 깨진 문자 비율 (PUA, U+FFFD, 제어 문자, (cid:N))
+2. 통과 판정 + 사유 (HybridExtractor 페이지 라우팅 근거로 기록)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import re
+import logging
+from dataclasses import dataclass, asdict
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_PATTERN = re.compile(r'제\s?\d+\s?조')
+CID_PATTERN = re.compile(r'\(cid:\d+\)')
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _is_garbage(ch: str) -> bool:
+    """PUA / 대체 문자 / 제어 문자 (추출 실패·폰트 매핑 누락 흔적)"""
+    code = ord(ch)
+    if 0xE000 <= code <= 0xF8FF or code == 0xFFFD:
+        return True
+    return code < 0x20 and ch not in '\n\r\t'
+
+
+@dataclass
+class PageQuality:
+    """
+    페이지 텍스트 레이어 품질
+
+    Attributes:
+        char_count: 공백 제외 문자 수
+        hangul_ratio: 문자(isalpha) 중 한글 음절 비율
+        article_hits: 조문 패턴(제N조) 적중 수
+        garbage_ratio: 깨진 문자 비율 (공백 제외 문자 기준)
+        score: 0~1 종합 점수 (로깅/정렬용)
+        passed: 텍스트 레이어 그대로 사용 가능 여부
+        reason: 판정 사유
+    """
+    char_count: int
+    hangul_ratio: float
+    article_hits: int
+    garbage_ratio: float
+    score: float
+    passed: bool
+    reason: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class PageQualityScorer:
+    """
+    Phase 1.0 텍스트 레이어 품질 평가기
+
+    판정 (모두 만족 시 통과):
+    - 문자 수 ≥ min_chars (스캔/이미지 페이지는 텍스트가 거의 없음)
+    - 깨진 문자 비율 ≤ max_garbage_ratio
+    - 한글 비율 ≥ min_hangul_ratio 또는 조문 패턴 1개 이상
+    """
+
+    def __init__(
+        self,
+        min_chars: int = 80,
+        min_hangul_ratio: float = 0.3,
+        max_garbage_ratio: float = 0.02
+    ):
+        """
+        초기화
+
+        Args:
+            min_chars: 최소 문자 수
+            min_hangul_ratio: 최소 한글 비율
+            max_garbage_ratio: 최대 깨진 문자 비율
+        """
+        self.min_chars = min_chars
+        self.min_hangul_ratio = min_hangul_ratio
+        self.max_garbage_ratio = max_garbage_ratio
+
+    def score(self, text: str) -> PageQuality:
+        """
+        페이지 텍스트 평가
+
+        Args:
+            text: 페이지 텍스트 레이어
+
+        Returns:
+            PageQuality
+        """
+        text = text or ""
+        cid_count = len(CID_PATTERN.findall(text))
+        text_wo_cid = CID_PATTERN.sub('', text)
+
+        visible = [ch for ch in text_wo_cid if not ch.isspace()]
+        char_count = len(visible) + cid_count
+        letters = [ch for ch in visible if ch.isalpha()]
+        hangul = sum(1 for ch in letters if _is_hangul(ch))
+        garbage = sum(1 for ch in visible if _is_garbage(ch)) + cid_count
+
+        hangul_ratio = hangul / len(letters) if letters else 0.0
+        garbage_ratio = garbage / char_count if char_count else 0.0
+        article_hits = len(ARTICLE_PATTERN.findall(text_wo_cid))
+
+        if char_count < self.min_chars:
+            passed, reason = False, f"문자 수 부족 ({char_count} < {self.min_chars})"
+        elif garbage_ratio > self.max_garbage_ratio:
+            passed, reason = False, f"깨진 문자 과다 ({garbage_ratio:.1%})"
+        elif hangul_ratio < self.min_hangul_ratio and article_hits == 0:
+            passed, reason = False, f"한글 비율 낮음 ({hangul_ratio:.0%}), 조문 없음"
+        else:
+            passed, reason = True, "텍스트 레이어 양호"
+
+        score = (
+            0.3 * min(1.0, char_count / (self.min_chars * 4))
+            + 0.3 * min(1.0, hangul_ratio / max(self.min_hangul_ratio, 1e-6))
+            + 0.2 * (1.0 if article_hits else 0.0)
+            + 0.2 * max(0.0, 1.0 - garbage_ratio / max(self.max_garbage_ratio, 1e-6))
+        )
+
+        return PageQuality(
+            char_count=char_count,
+            hangul_ratio=round(hangul_ratio, 3),
+            article_hits=article_hits,
+            garbage_ratio=round(garbage_ratio, 4),
+            score=round(score, 3),
+            passed=passed,
+            reason=reason
+        )
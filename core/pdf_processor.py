@@ -8,23 +8,375 @@ PRISM Phase 5.7.6 - PDF Processor (License-Safe Edition)
 3. 성능 최적화 (멀티스레딩)
 4. 색상 보정 (RGBA → RGB)
 
+✅ Phase 1.0 성능 개선:
+- 프로세스 풀 병렬 렌더링 (워커별 PdfDocument 핸들, 페이지 순서 보장)
+- iter_pages(): 스트리밍 렌더링 (bounded look-ahead, 메모리 일정)
+- RenderedPage: 원시 BGR 버퍼 전달 + PNG/base64 지연 인코딩
+- 이중 해상도: 레이아웃 분석은 LAYOUT_DPI 썸네일, 고해상도는 VLM 전송 페이지만
+- 디스크 캐시 (선택, PRISM_PAGE_CACHE=1): (PDF SHA-256, 페이지, DPI, 포맷) 키로 렌더링 결과 재사용
+  (PNG 인코딩/디코딩이 일반 페이지 렌더링보다 느림 → 기본 OFF, 스캔/복잡한 벡터 페이지용,
+  CACHE_MIN_DPI 미만 썸네일은 저장하지 않음)
+- PdfDocumentPool: (경로, mtime) 키 문서 핸들 재사용 → 텍스트/렌더링이 1회 파싱 공유
+- 영역 단위: RenderedPage.crop() / extract_text_boxes() (비율 좌표, 표 영역 크롭 VLM 요청용)
+- VLM 전송 인코딩 정책: RenderedPage.encode(policy), iter_pages()/pdf_to_images()는
+  image_policy (기본 PRISM_VLM_IMAGE_* 환경 변수, JPEG) 적용 - 캐시/base64 속성은 무손실 PNG 유지
+- extract_vector_lines(): 페이지 경로 객체의 표 괘선 (렌더링 없음, 벡터 표 검출 입력)
+- extract_words(): 글자 상자 기반 단어 + 경계 상자 (줄/열 클러스터링, 표 셀 배정 입력)
+
 Author: 이서영 (Backend Lead) + 미송 보강안
 Date: 2025-11-02
 Version: 5.7.6 License-Safe
 """
 
+import os
 import logging
-from typing import List, Tuple
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 import base64
-from io import BytesIO
+
+import cv2
+import numpy as np
 
 # ✅ Phase 5.7.6: pypdfium2 (BSD-3)
 import pypdfium2 as pdfium
-from PIL import Image
+
+try:
+    from .disk_cache import DiskCache, file_sha256, get_cache
+    from .image_encoding import EncodedImage, ImageEncodingPolicy, encode_image
+    from .table_grid import VectorLines, extract_vector_lines
+    from .text_geometry import PageWords, extract_page_words
+except ImportError:
+    from core.disk_cache import DiskCache, file_sha256, get_cache
+    from core.image_encoding import EncodedImage, ImageEncodingPolicy, encode_image
+    from core.table_grid import VectorLines, extract_vector_lines
+    from core.text_geometry import PageWords, extract_page_words
 
 logger = logging.getLogger(__name__)
 
+# ✅ Phase 1.0: pdfium은 스레드 안전하지 않음 (문서가 달라도 라이브러리 전역 상태 공유)
+# → 프로세스 내 모든 pdfium 호출 (열기/닫기/렌더링/텍스트/경로 객체)을 하나의 락으로 직렬화
+_PDFIUM_LOCK = threading.RLock()
+
+
+@dataclass
+class RenderedPage:
+    """
+    ✅ Phase 1.0: 렌더링된 페이지 (원시 픽셀 버퍼 + 지연 인코딩)
+    
+    pypdfium2 비트맵의 BGR 버퍼를 그대로 보관하여 QuickLayoutAnalyzer에
+    코덱 왕복(PNG → base64 → imdecode) 없이 전달.
+    PNG/base64는 VLM 호출 등 실제로 필요할 때 1회만 인코딩.
+    
+    Attributes:
+        page_num: 페이지 번호 (1-based)
+        pixels: BGR uint8 배열 (H, W, 3) - OpenCV 채널 순서
+        dpi: 렌더링 해상도
+    """
+    page_num: int
+    pixels: np.ndarray = field(repr=False)
+    dpi: int = 300
+    _png: Optional[bytes] = field(default=None, repr=False, compare=False)
+    _base64: Optional[str] = field(default=None, repr=False, compare=False)
+    _encoded: Optional[Tuple[ImageEncodingPolicy, EncodedImage]] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def width(self) -> int:
+        return int(self.pixels.shape[1])
+    
+    @property
+    def height(self) -> int:
+        return int(self.pixels.shape[0])
+    
+    def to_png_bytes(self) -> bytes:
+        """PNG 인코딩 (지연 + 캐시)"""
+        if self._png is None:
+            ok, buf = cv2.imencode('.png', self.pixels)
+            if not ok:
+                raise ValueError(f"PNG 인코딩 실패 (page {self.page_num})")
+            self._png = buf.tobytes()
+        return self._png
+    
+    @property
+    def base64(self) -> str:
+        """Base64 PNG (지연 + 캐시) - VLM 호출용"""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.to_png_bytes()).decode('utf-8')
+        return self._base64
+    
+    def encode(self, policy: Optional[ImageEncodingPolicy] = None) -> EncodedImage:
+        """
+        ✅ Phase 1.0: VLM 전송용 인코딩 (정책별 1회, 마지막 정책 결과 캐시)
+        
+        Args:
+            policy: 인코딩 정책 (None이면 ImageEncodingPolicy.from_env())
+        """
+        policy = policy or ImageEncodingPolicy.from_env()
+        if self._encoded is None or self._encoded[0] != policy:
+            self._encoded = (policy, encode_image(self.pixels, policy))
+        return self._encoded[1]
+    
+    def crop(self, bbox: Tuple[float, float, float, float]) -> "RenderedPage":
+        """
+        ✅ Phase 1.0: 영역 잘라내기 (같은 DPI, 인코딩은 잘라낸 영역만)
+        
+        Args:
+            bbox: (x0, y0, x1, y1) 페이지 너비/높이 대비 비율 (왼쪽 위 원점)
+        """
+        x0, y0, x1, y1 = bbox
+        left, right = int(x0 * self.width), int(np.ceil(x1 * self.width))
+        top, bottom = int(y0 * self.height), int(np.ceil(y1 * self.height))
+        if right <= left or bottom <= top:
+            raise ValueError(f"빈 영역 (page {self.page_num}): {bbox}")
+        pixels = np.ascontiguousarray(self.pixels[top:bottom, left:right])
+        return RenderedPage(page_num=self.page_num, pixels=pixels, dpi=self.dpi)
+
+
+def _render_page(pdf: "pdfium.PdfDocument", index: int, dpi: int) -> RenderedPage:
+    """단일 페이지 렌더링 → RenderedPage (인코딩 없음)"""
+    # DPI 변환: 72 기준
+    scale = dpi / 72.0
+    
+    with _PDFIUM_LOCK:
+        page = pdf[index]
+        try:
+            # ✅ 흰 배경(fill_color 기본값)으로 렌더링 → 알파 없는 BGR 비트맵
+            bitmap = page.render(
+                scale=scale,
+                rotation=0,
+                crop=(0, 0, 0, 0)  # 전체 페이지
+            )
+            pixels = bitmap.to_numpy()
+            
+            # ✅ 미송 제안: RGB 3채널 보장 (BGRA/BGRX/그레이스케일 대응)
+            if bitmap.mode in ('BGRA', 'BGRX'):
+                pixels = np.ascontiguousarray(pixels[:, :, :3])
+            elif bitmap.mode == 'L':
+                pixels = cv2.cvtColor(pixels, cv2.COLOR_GRAY2BGR)
+            elif bitmap.mode in ('RGB', 'RGBA', 'RGBX'):
+                pixels = cv2.cvtColor(np.ascontiguousarray(pixels[:, :, :3]), cv2.COLOR_RGB2BGR)
+            
+            # ✅ Phase 1.0: 비트맵 버퍼 복사 후 락 안에서 해제 (GC가 다른 스레드에서 pdfium 해제 호출 방지)
+            if pixels.base is not None:
+                pixels = pixels.copy()
+            bitmap.close()
+        finally:
+            page.close()
+    
+    return RenderedPage(page_num=index + 1, pixels=pixels, dpi=dpi)
+
+
+def _render_pages(
+    pdf: "pdfium.PdfDocument",
+    start: int,
+    end: int,
+    dpi: int
+) -> List[Tuple[int, Optional[RenderedPage], Optional[str]]]:
+    """
+    페이지 구간 렌더링 (0-based [start, end))
+    
+    Returns:
+        [(page_num, RenderedPage | None, error | None), ...]
+    """
+    results = []
+    for i in range(start, end):
+        try:
+            results.append((i + 1, _render_page(pdf, i, dpi), None))
+        except Exception as e:
+            results.append((i + 1, None, str(e)))
+    return results
+
+
+def _page_text(pdf: "pdfium.PdfDocument", index: int) -> str:
+    """단일 페이지 텍스트 레이어 (TextPage 즉시 해제)"""
+    with _PDFIUM_LOCK:
+        page = pdf[index]
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range(0, textpage.count_chars())
+        finally:
+            textpage.close()
+            page.close()
+
+
+def _page_text_boxes(
+    pdf: "pdfium.PdfDocument",
+    index: int,
+    boxes: Iterable[Tuple[float, float, float, float]]
+) -> List[str]:
+    """✅ Phase 1.0: 페이지 영역별 텍스트 레이어 (비율 좌표 → CropBox 기준 PDF 좌표)"""
+    with _PDFIUM_LOCK:
+        page = pdf[index]
+        textpage = page.get_textpage()
+        try:
+            if page.get_rotation():
+                raise ValueError(f"회전된 페이지는 영역 텍스트 미지원 (page {index + 1})")
+            left, bottom, right, top = page.get_cropbox()
+            width, height = right - left, top - bottom
+            
+            texts = []
+            for x0, y0, x1, y1 in boxes:
+                if x1 <= x0 or y1 <= y0:
+                    texts.append("")
+                    continue
+                text = textpage.get_text_bounded(
+                    left=left + x0 * width,
+                    bottom=top - y1 * height,
+                    right=left + x1 * width,
+                    top=top - y0 * height
+                )
+                texts.append(text.replace('\r\n', '\n').strip())
+            return texts
+        finally:
+            textpage.close()
+            page.close()
+
+
+def _page_vector_lines(pdf: "pdfium.PdfDocument", index: int) -> Optional[VectorLines]:
+    """✅ Phase 1.0: 단일 페이지 벡터 괘선 (페이지 즉시 해제)"""
+    with _PDFIUM_LOCK:
+        page = pdf[index]
+        try:
+            return extract_vector_lines(page)
+        finally:
+            page.close()
+
+
+def _page_words(pdf: "pdfium.PdfDocument", index: int) -> Optional[PageWords]:
+    """✅ Phase 1.0: 단일 페이지 단어 + 경계 상자 (페이지 즉시 해제)"""
+    with _PDFIUM_LOCK:
+        page = pdf[index]
+        try:
+            return extract_page_words(page)
+        finally:
+            page.close()
+
+
+# ✅ Phase 1.0: 워커 프로세스별 PdfDocument 핸들 (initializer에서 1회 오픈)
+_WORKER_PDF = None
+
+
+def _init_render_worker(pdf_path: str) -> None:
+    """
+    ✅ Phase 1.0: 프로세스 풀 워커 초기화
+    
+    워커마다 자체 PdfDocument 핸들을 1회 열어 재사용.
+    (pdfium 핸들은 프로세스 간 공유 불가)
+    """
+    global _WORKER_PDF
+    _WORKER_PDF = pdfium.PdfDocument(pdf_path)
+
+
+def _render_page_range(
+    start: int,
+    end: int,
+    dpi: int
+) -> List[Tuple[int, Optional[RenderedPage], Optional[str]]]:
+    """✅ Phase 1.0: 프로세스 풀 워커 진입점 (구간 렌더링)"""
+    return _render_pages(_WORKER_PDF, start, end, dpi)
+
+
+class PdfDocumentPool:
+    """
+    ✅ Phase 1.0: PdfDocument 핸들 풀
+    
+    (절대경로, mtime) 키로 열린 문서를 재사용하여 페이지별 텍스트 추출/렌더링이
+    PDF를 매번 다시 파싱하지 않도록 함.
+    - 파일이 바뀌면(mtime 변경) 기존 핸들을 닫고 새로 오픈
+    - max_open 초과 시 가장 오래 사용하지 않은 핸들부터 닫음
+    - close() / with 블록 종료 시 모든 핸들을 즉시 닫음
+    - 열기/닫기는 pdfium 전역 락 안에서 수행 (다른 스레드의 렌더링/텍스트 추출과 직렬화)
+    """
+    
+    def __init__(self, max_open: int = 4):
+        """
+        초기화
+        
+        Args:
+            max_open: 동시에 열어둘 최대 문서 수
+        """
+        self.max_open = max(1, max_open)
+        self._documents: "OrderedDict[Tuple[str, int], pdfium.PdfDocument]" = OrderedDict()
+        self._lock = _PDFIUM_LOCK
+    
+    @staticmethod
+    def _key(pdf_path: str) -> Tuple[str, int]:
+        abs_path = os.path.abspath(pdf_path)
+        return abs_path, os.stat(abs_path).st_mtime_ns
+    
+    def get(self, pdf_path: str) -> "pdfium.PdfDocument":
+        """
+        열린 문서 핸들 반환 (없으면 오픈)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+        
+        Returns:
+            pdfium.PdfDocument (풀 소유 - 호출자가 닫지 않음)
+        """
+        key = self._key(pdf_path)
+        
+        with self._lock:
+            pdf = self._documents.get(key)
+            if pdf is not None:
+                self._documents.move_to_end(key)
+                return pdf
+            
+            # 같은 경로의 이전 버전(mtime 변경) 정리
+            for stale in [k for k in self._documents if k[0] == key[0]]:
+                self._close_key(stale)
+            
+            pdf = pdfium.PdfDocument(key[0])
+            self._documents[key] = pdf
+            
+            while len(self._documents) > self.max_open:
+                self._close_key(next(iter(self._documents)))
+            
+            return pdf
+    
+    def page_count(self, pdf_path: str) -> int:
+        """페이지 수 (pdfium 락 안에서 조회)"""
+        with self._lock:
+            return len(self.get(pdf_path))
+    
+    def _close_key(self, key: Tuple[str, int]) -> None:
+        pdf = self._documents.pop(key, None)
+        if pdf is not None:
+            try:
+                pdf.close()
+            except Exception as e:
+                logger.warning(f"   ⚠️ 문서 핸들 닫기 실패 ({key[0]}): {e}")
+    
+    def close(self, pdf_path: Optional[str] = None) -> None:
+        """
+        핸들 닫기
+        
+        Args:
+            pdf_path: 지정 시 해당 문서만, None이면 전체
+        """
+        with self._lock:
+            if pdf_path is None:
+                keys = list(self._documents)
+            else:
+                abs_path = os.path.abspath(pdf_path)
+                keys = [k for k in self._documents if k[0] == abs_path]
+            
+            for key in keys:
+                self._close_key(key)
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def __enter__(self) -> "PdfDocumentPool":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+
 
 class PDFProcessor:
     """
@@ -38,19 +390,74 @@ class PDFProcessor:
     라이선스:
     - pypdfium2: BSD-3
     - Pillow: HPND
+    
+    ✅ Phase 1.0:
+    - 프로세스 풀 병렬 렌더링 (workers 설정)
+    - iter_pages() / iter_rendered_pages() 스트리밍 API
+    - 이중 해상도: 레이아웃 분석용 저해상도(LAYOUT_DPI) + VLM 전송 페이지만 고해상도
+    - 디스크 캐시 (선택): 변경 없는 문서 재처리 시 렌더링 생략 (PNG 저장, 고해상도 페이지만)
+    - 문서 핸들 풀: 텍스트 추출/렌더링/페이지 수 조회가 한 번 연 문서 공유
+      (with PDFProcessor() as p: ... 또는 close()로 핸들 정리)
     """
     
-    def __init__(self):
-        """초기화"""
+    # ✅ Phase 1.0: 레이아웃/표/OCR 힌트용 썸네일 해상도
+    LAYOUT_DPI = 100
+    
+    # ✅ Phase 1.0: 캐시 저장 포맷 (키 구성요소)
+    CACHE_FORMAT = 'png'
+    
+    # ✅ Phase 1.0: 캐시 대상 최소 해상도 (썸네일은 다시 렌더링이 PNG 인코딩/디코딩보다 빠름)
+    CACHE_MIN_DPI = 150
+    
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        cache: Optional[DiskCache] = None,
+        image_policy: Optional[ImageEncodingPolicy] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            workers: 렌더링 프로세스 수 (기본: PRISM_RENDER_WORKERS 또는 1)
+            use_cache: 렌더링 디스크 캐시 사용 여부
+                       (기본: cache를 넘기면 ON, 아니면 PRISM_PAGE_CACHE=1일 때만 ON)
+            cache: 캐시 인스턴스 (기본: get_cache('pages'))
+            image_policy: ✅ Phase 1.0: VLM 전송 이미지 인코딩 정책 (기본: 환경 변수)
+        """
+        if workers is None:
+            workers = int(os.getenv("PRISM_RENDER_WORKERS", "1"))
+        self.workers = max(1, workers)
+        if use_cache is None:
+            use_cache = cache is not None or os.getenv("PRISM_PAGE_CACHE", "0") == "1"
+        self.cache = (cache or get_cache('pages')) if use_cache else None
+        self.documents = PdfDocumentPool()
+        self.image_policy = image_policy or ImageEncodingPolicy.from_env()
+        
         logger.info("✅ PDFProcessor v5.7.6 초기화 완료 (License-Safe)")
         logger.info("   - pypdfium2 (BSD-3)")
         logger.info("   - AGPL/GPL 완전 제거")
+        logger.info(f"   - 렌더링 워커: {self.workers}")
+        logger.info(f"   - 렌더링 캐시: {'ON' if self.cache else 'OFF'}")
+        logger.info(f"   - 전송 인코딩: {self.image_policy.format} (품질 {self.image_policy.quality})")
+    
+    def close(self) -> None:
+        """✅ Phase 1.0: 열린 문서 핸들 모두 닫기"""
+        self.documents.close()
+    
+    def __enter__(self) -> "PDFProcessor":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
     
     def pdf_to_images(
         self,
         pdf_path: str,
         max_pages: int = 20,
-        dpi: int = 300
+        dpi: int = 300,
+        workers: Optional[int] = None
     ) -> List[Tuple[str, int]]:
         """
         ✅ Phase 5.7.6: pypdfium2 기반 PDF → 이미지 변환
@@ -59,78 +466,290 @@ class PDFProcessor:
         - PyMuPDF 대비 동등/우수 성능
         - RGBA → RGB 자동 변환 (미송 제안)
         - 에러 처리 강화
+        - ✅ Phase 1.0: 프로세스 풀 병렬 렌더링 (workers > 1)
+        
+        ⚠️ 전체 페이지를 메모리에 보관 - 대용량 문서는 iter_pages() 사용
         
         Args:
             pdf_path: PDF 파일 경로
             max_pages: 최대 페이지 수
             dpi: 해상도 (기본 300)
+            workers: 렌더링 프로세스 수 (None이면 생성자 설정)
         
         Returns:
-            [(base64_image, page_num), ...]
+            [(base64_image, page_num), ...] (✅ Phase 1.0: image_policy 포맷, 기본 JPEG)
+        """
+        images = list(self.iter_pages(
+            pdf_path,
+            max_pages=max_pages,
+            dpi=dpi,
+            workers=workers,
+            lookahead=max_pages
+        ))
+        
+        logger.info(f"✅ {len(images)}개 페이지 변환 완료")
+        
+        return images
+    
+    def iter_pages(
+        self,
+        pdf_path: str,
+        max_pages: int = 20,
+        dpi: int = 300,
+        workers: Optional[int] = None,
+        lookahead: Optional[int] = None
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        ✅ Phase 1.0: 스트리밍 페이지 렌더링 (Base64 호환 API)
+        
+        한 번에 한 페이지씩 (base64_image, page_num)을 페이지 순서대로 반환.
+        원시 픽셀이 필요하면 iter_rendered_pages() 사용.
+        이미지는 image_policy로 인코딩 (포맷은 sniff_mime_type()으로 판별 가능).
+        
+        Args:
+            iter_rendered_pages()와 동일
+        
+        Yields:
+            (base64_image, page_num)
+        """
+        for page in self.iter_rendered_pages(pdf_path, max_pages, dpi, workers, lookahead):
+            encoded = page.encode(self.image_policy)
+            img_base64 = encoded.base64
+            
+            # 로그 (글자 수로 품질 추정)
+            logger.info(
+                f"   페이지 {page.page_num}: {len(img_base64)} 글자 "
+                f"({encoded.mime_type}, {encoded.width}x{encoded.height})"
+            )
+            
+            yield img_base64, page.page_num
+    
+    def iter_rendered_pages(
+        self,
+        pdf_path: str,
+        max_pages: int = 20,
+        dpi: int = 300,
+        workers: Optional[int] = None,
+        lookahead: Optional[int] = None
+    ) -> Iterator[RenderedPage]:
+        """
+        ✅ Phase 1.0: 스트리밍 페이지 렌더링 (원시 픽셀)
+        
+        한 번에 한 페이지씩 RenderedPage를 페이지 순서대로 반환.
+        병렬 모드에서도 미리 렌더링하는 페이지 수를 lookahead로 제한하여
+        문서 페이지 수와 무관하게 메모리 사용량을 일정하게 유지.
+        PNG/base64 인코딩은 수행하지 않음 (RenderedPage.base64 접근 시 지연 인코딩).
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            max_pages: 최대 페이지 수
+            dpi: 해상도 (기본 300)
+            workers: 렌더링 프로세스 수 (None이면 생성자 설정)
+            lookahead: 미리 렌더링할 최대 페이지 수 (기본: workers * 2)
+        
+        Yields:
+            RenderedPage
         """
+        workers = self.workers if workers is None else max(1, int(workers))
+        
         logger.info(f"📄 PDF 변환 시작: {pdf_path}")
         logger.info(f"   - 최대 페이지: {max_pages}")
         logger.info(f"   - DPI: {dpi}")
         
         try:
-            # ✅ pypdfium2로 PDF 열기
-            pdf = pdfium.PdfDocument(pdf_path)
-            total_pages = len(pdf)
+            doc_hash = self._document_hash(pdf_path)
+            total_pages = self._page_count(pdf_path, doc_hash)
+        except Exception as e:
+            logger.error(f"❌ PDF 처리 실패: {e}")
+            raise
+        
+        logger.info(f"   - 전체 페이지: {total_pages}")
+        
+        # 페이지 제한
+        pages_to_process = min(total_pages, max_pages)
+        
+        # ✅ 캐시 미스 페이지만 렌더링 대상
+        missing = [
+            i for i in range(pages_to_process)
+            if not self._is_page_cached(doc_hash, i, dpi)
+        ]
+        if pages_to_process and doc_hash:
+            logger.info(f"   - 캐시 적중: {pages_to_process - len(missing)}/{pages_to_process}페이지")
+        
+        if workers > 1 and len(missing) > 1:
+            rendered = self._iter_parallel(pdf_path, pages_to_process, dpi, workers, lookahead, doc_hash)
+        else:
+            rendered = self._iter_serial(pdf_path, pages_to_process, dpi, doc_hash)
+        
+        for page_num, page, error in rendered:
+            # ✅ 페이지 단위 실패 격리 (기존 try/except 동작 유지)
+            if error is not None:
+                logger.error(f"   ❌ 페이지 {page_num} 변환 실패: {error}")
+                continue
             
-            logger.info(f"   - 전체 페이지: {total_pages}")
+            yield page
+    
+    def _document_hash(self, pdf_path: str) -> Optional[str]:
+        """캐시 키용 PDF SHA-256 (캐시 OFF면 None)"""
+        if self.cache is None:
+            return None
+        return file_sha256(pdf_path)
+    
+    def _page_count(self, pdf_path: str, doc_hash: Optional[str]) -> int:
+        """페이지 수 (캐시 적중 시 PDF를 열지 않음)"""
+        key = DiskCache.make_key('page_count', doc_hash)
+        if doc_hash:
+            data = self.cache.get(key)
+            if data is not None:
+                return int(data)
+        
+        total_pages = self.documents.page_count(pdf_path)
+        
+        if doc_hash:
+            self.cache.put(key, str(total_pages).encode('ascii'))
+        return total_pages
+    
+    def _page_key(self, doc_hash: str, index: int, dpi: int) -> str:
+        return DiskCache.make_key('page', doc_hash, index, dpi, self.CACHE_FORMAT)
+    
+    def _cacheable(self, doc_hash: Optional[str], dpi: int) -> bool:
+        return bool(doc_hash) and dpi >= self.CACHE_MIN_DPI
+    
+    def _is_page_cached(self, doc_hash: Optional[str], index: int, dpi: int) -> bool:
+        return self._cacheable(doc_hash, dpi) and self.cache.contains(self._page_key(doc_hash, index, dpi))
+    
+    def _load_cached_page(self, doc_hash: Optional[str], index: int, dpi: int) -> Optional[RenderedPage]:
+        """캐시된 PNG → RenderedPage (PNG 바이트 재사용, 재인코딩 없음)"""
+        if not self._cacheable(doc_hash, dpi):
+            return None
+        
+        data = self.cache.get(self._page_key(doc_hash, index, dpi))
+        if data is None:
+            return None
+        
+        pixels = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        if pixels is None:
+            logger.warning(f"   ⚠️ 손상된 캐시 항목 무시 (page {index + 1})")
+            return None
+        
+        return RenderedPage(page_num=index + 1, pixels=pixels, dpi=dpi, _png=data)
+    
+    def _store_cached_page(self, doc_hash: Optional[str], page: Optional[RenderedPage]) -> None:
+        if page is not None and self._cacheable(doc_hash, page.dpi):
+            self.cache.put(self._page_key(doc_hash, page.page_num - 1, page.dpi), page.to_png_bytes())
+    
+    def _iter_serial(
+        self,
+        pdf_path: str,
+        page_count: int,
+        dpi: int,
+        doc_hash: Optional[str] = None
+    ) -> Iterator[Tuple[int, Optional[RenderedPage], Optional[str]]]:
+        """순차 렌더링 (페이지 단위 지연 생성, 캐시 미스 시에만 PDF 오픈)"""
+        for i in range(page_count):
+            cached = self._load_cached_page(doc_hash, i, dpi)
+            if cached is not None:
+                yield i + 1, cached, None
+                continue
             
-            # 페이지 제한
-            pages_to_process = min(total_pages, max_pages)
+            # 풀 핸들: 페이지마다 조회 (다른 호출이 핸들을 교체해도 안전)
+            try:
+                pdf = self.documents.get(pdf_path)
+            except Exception as e:
+                yield i + 1, None, str(e)
+                continue
             
-            images = []
+            for result in _render_pages(pdf, i, i + 1, dpi):
+                self._store_cached_page(doc_hash, result[1])
+                yield result
+    
+    def _iter_parallel(
+        self,
+        pdf_path: str,
+        page_count: int,
+        dpi: int,
+        workers: int,
+        lookahead: Optional[int],
+        doc_hash: Optional[str] = None
+    ) -> Iterator[Tuple[int, Optional[RenderedPage], Optional[str]]]:
+        """
+        ✅ Phase 1.0: 프로세스 풀 렌더링 (bounded look-ahead)
+        
+        각 워커가 자체 PdfDocument 핸들로 페이지를 렌더링.
+        제출 순서대로 결과를 꺼내 페이지 순서를 보장하고,
+        진행 중인 작업은 lookahead개로 제한.
+        캐시 적중 페이지는 워커에 제출하지 않음.
+        """
+        workers = min(workers, page_count)
+        lookahead = max(workers, lookahead or workers * 2)
+        
+        logger.info(f"   - 병렬 렌더링: {workers}개 프로세스, look-ahead {lookahead}페이지")
+        
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_render_worker,
+            initargs=(pdf_path,)
+        ) as executor:
+            pending = deque()
+            next_index = 0
             
-            for i in range(pages_to_process):
-                page_num = i + 1
-                
-                try:
-                    # ✅ 페이지 렌더링
-                    page = pdf[i]
-                    
-                    # DPI 변환: 72 기준
-                    scale = dpi / 72.0
-                    
-                    # Render to PIL Image
-                    pil_image = page.render(
-                        scale=scale,
-                        rotation=0,
-                        crop=(0, 0, 0, 0)  # 전체 페이지
-                    ).to_pil()
-                    
-                    # ✅ 미송 제안: RGBA → RGB 변환
-                    if pil_image.mode == 'RGBA':
-                        # 흰 배경으로 변환
-                        rgb_image = Image.new('RGB', pil_image.size, (255, 255, 255))
-                        rgb_image.paste(pil_image, mask=pil_image.split()[3])  # Alpha channel
-                        pil_image = rgb_image
-                    elif pil_image.mode != 'RGB':
-                        pil_image = pil_image.convert('RGB')
+            try:
+                while pending or next_index < page_count:
+                    while next_index < page_count and len(pending) < lookahead:
+                        cached = self._load_cached_page(doc_hash, next_index, dpi)
+                        if cached is not None:
+                            pending.append((next_index, None, cached))
+                        else:
+                            future = executor.submit(_render_page_range, next_index, next_index + 1, dpi)
+                            pending.append((next_index, future, None))
+                        next_index += 1
                     
-                    # Base64 인코딩
-                    buffered = BytesIO()
-                    pil_image.save(buffered, format='PNG')
-                    img_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
+                    index, future, cached = pending.popleft()
+                    if cached is not None:
+                        yield index + 1, cached, None
+                        continue
                     
-                    images.append((img_base64, page_num))
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        # 워커 자체 실패 → 해당 페이지만 실패 처리
+                        yield index + 1, None, str(e)
+                        continue
                     
-                    # 로그 (글자 수로 품질 추정)
-                    logger.info(f"   페이지 {page_num}: {len(img_base64)} 글자")
-                
-                except Exception as e:
-                    logger.error(f"   ❌ 페이지 {page_num} 변환 실패: {e}")
-                    continue
-            
-            logger.info(f"✅ {len(images)}개 페이지 변환 완료")
-            
-            return images
+                    for result in results:
+                        self._store_cached_page(doc_hash, result[1])
+                        yield result
+            finally:
+                # 소비자가 중간에 멈추면 남은 작업 취소
+                for _, future, _ in pending:
+                    if future is not None:
+                        future.cancel()
+    
+    def render_page(self, pdf_path: str, page_num: int, dpi: int = 300) -> RenderedPage:
+        """
+        ✅ Phase 1.0: 단일 페이지 렌더링 (VLM 전송용 고해상도 등)
         
-        except Exception as e:
-            logger.error(f"❌ PDF 처리 실패: {e}")
-            raise
+        Args:
+            pdf_path: PDF 파일 경로
+            page_num: 페이지 번호 (1-based)
+            dpi: 해상도
+        
+        Returns:
+            RenderedPage
+        """
+        doc_hash = self._document_hash(pdf_path)
+        cached = self._load_cached_page(doc_hash, page_num - 1, dpi)
+        if cached is not None:
+            logger.info(f"   🖼️ 페이지 {page_num} 캐시 적중: {dpi} DPI")
+            return cached
+        
+        page = _render_page(self.documents.get(pdf_path), page_num - 1, dpi)
+        
+        self._store_cached_page(doc_hash, page)
+        logger.info(f"   🖼️ 페이지 {page_num} 렌더링: {dpi} DPI ({page.width}x{page.height})")
+        return page
     
     def get_page_count(self, pdf_path: str) -> int:
         """
@@ -143,8 +762,7 @@ class PDFProcessor:
             페이지 수
         """
         try:
-            pdf = pdfium.PdfDocument(pdf_path)
-            return len(pdf)
+            return self.documents.page_count(pdf_path)
         except Exception as e:
             logger.error(f"❌ 페이지 수 조회 실패: {e}")
             return 0
@@ -161,18 +779,100 @@ class PDFProcessor:
             추출된 텍스트
         """
         try:
-            pdf = pdfium.PdfDocument(pdf_path)
-            page = pdf[page_num - 1]
-            
-            # TextPage 추출
-            textpage = page.get_textpage()
-            text = textpage.get_text_range()
-            
-            return text
+            return _page_text(self.documents.get(pdf_path), page_num - 1)
         
         except Exception as e:
             logger.error(f"❌ 텍스트 추출 실패 (page {page_num}): {e}")
             return ""
+    
+    def extract_text_boxes(
+        self,
+        pdf_path: str,
+        page_num: int,
+        boxes: Iterable[Tuple[float, float, float, float]]
+    ) -> List[str]:
+        """
+        ✅ Phase 1.0: 페이지 영역별 텍스트 레이어
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            page_num: 페이지 번호 (1-based)
+            boxes: (x0, y0, x1, y1) 페이지 대비 비율 (왼쪽 위 원점, 렌더링 이미지와 같은 좌표계)
+        
+        Returns:
+            boxes 순서의 텍스트 리스트
+        
+        Raises:
+            ValueError: 회전된 페이지 (렌더링 좌표와 텍스트 좌표 불일치)
+        """
+        return _page_text_boxes(self.documents.get(pdf_path), page_num - 1, boxes)
+    
+    def extract_vector_lines(self, pdf_path: str, page_num: int) -> Optional[VectorLines]:
+        """
+        ✅ Phase 1.0: 페이지 벡터 괘선 (경로 객체, 렌더링 없음)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            page_num: 페이지 번호 (1-based)
+        
+        Returns:
+            VectorLines (회전 페이지 / 읽기 실패 시 None → 래스터 검출)
+        """
+        try:
+            return _page_vector_lines(self.documents.get(pdf_path), page_num - 1)
+        except Exception as e:
+            logger.warning(f"   ⚠️ 벡터 괘선 추출 실패 (page {page_num}): {e}")
+            return None
+    
+    def extract_words(self, pdf_path: str, page_num: int) -> Optional[PageWords]:
+        """
+        ✅ Phase 1.0: 페이지 단어 + 경계 상자 (TextPage 글자 상자, content stream 순서와 무관)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            page_num: 페이지 번호 (1-based)
+        
+        Returns:
+            PageWords (회전 페이지 / 읽기 실패 시 None)
+        """
+        try:
+            return _page_words(self.documents.get(pdf_path), page_num - 1)
+        except Exception as e:
+            logger.warning(f"   ⚠️ 단어 상자 추출 실패 (page {page_num}): {e}")
+            return None
+    
+    def extract_texts(
+        self,
+        pdf_path: str,
+        page_range: Optional[Iterable[int]] = None
+    ) -> List[str]:
+        """
+        ✅ Phase 1.0: 여러 페이지 텍스트 일괄 추출 (문서 1회 오픈)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            page_range: 페이지 번호들 (1-based, 기본: 전체)
+        
+        Returns:
+            page_range 순서의 텍스트 리스트 (실패 페이지는 빈 문자열)
+        """
+        try:
+            pdf = self.documents.get(pdf_path)
+            if page_range is None:
+                page_range = range(1, self.documents.page_count(pdf_path) + 1)
+        except Exception as e:
+            logger.error(f"❌ 텍스트 추출 실패: {e}")
+            return []
+        
+        texts = []
+        for page_num in page_range:
+            try:
+                texts.append(_page_text(pdf, page_num - 1))
+            except Exception as e:
+                logger.error(f"❌ 텍스트 추출 실패 (page {page_num}): {e}")
+                texts.append("")
+        
+        return texts
 
 
 # ✅ 하위 호환성: 기존 import 유지
@@ -6,6 +6,9 @@ PRISM Phase 0.3.4 P2 - 개정이력 표 화이트리스트
 1. 개정이력 힌트 감지 로직 추가
 2. 페이지 1 + 개정 키워드 → 표 허용
 3. 로그 개선
+
+✅ Phase 1.0:
+- build_region_prompt(): 표/그림 영역 크롭 이미지용 프롬프트 (영역 밖 본문은 텍스트 레이어)
 """
 
 import re
@@ -91,4 +94,32 @@ class PromptRules:
         logger.info(f"✅ 프롬프트 생성 완료 ({len(prompt)}자)")
         logger.info(f"   📋 표 허용: {allow_tables}")
         
-        return prompt
\ No newline at end of file
+        return prompt
+    
+    def build_region_prompt(self, hints: Dict[str, Any], page_num: int = 1, kind: str = 'table') -> str:
+        """
+        ✅ Phase 1.0: 영역 크롭 이미지 프롬프트
+        
+        Args:
+            hints: 레이아웃 힌트 (개정이력 판정용)
+            page_num: 페이지 번호
+            kind: 'table' | 'figure'
+        """
+        allow_tables = self.has_revision_hints(hints, page_num)
+        subject = "표" if kind == 'table' else "그림/상자"
+        
+        prompt = f"""이 이미지는 한국어 법규 문서 페이지에서 잘라낸 {subject} 영역입니다.
+다음 규칙을 엄격히 따라 Markdown으로 변환하세요:
+
+1. 이미지 안의 내용만 정확히 추출하세요 (해석/요약 금지, 앞뒤 본문 추측 금지)
+2. 조문 번호, 날짜, 숫자를 원문 그대로 유지하세요"""
+        
+        if allow_tables:
+            prompt += """
+3. 표는 Markdown 표 형식으로 변환하세요 (행/열 순서 유지)"""
+        else:
+            prompt += """
+3. 표는 텍스트 목록으로 변환하세요 (행 순서 유지, 한 행은 한 항목)"""
+        
+        logger.info(f"✅ 영역 프롬프트 생성 완료 ({subject}, {len(prompt)}자)")
+        return prompt
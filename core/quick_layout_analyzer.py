@@ -13,6 +13,27 @@ PRISM Phase 5.5.1 - Quick Layout Analyzer (Hotfix)
 - 번호 목록 밀도 계산
 - 버스 키워드 검출
 
+✅ Phase 1.0:
+- RenderedPage/ndarray 입력 지원 (PNG/base64 왕복 제거)
+- DPI 비례 커널/임계값 (300 DPI 기준) → 저해상도 썸네일에서도 동일한 힌트 기준
+  (커널 길이 ∝ scale, 컨투어 면적 ∝ scale², 1px 엣지 밀도는 scale로 환산,
+   괘선 교차/다이어그램은 픽셀 수가 아닌 연결 요소 개수로 셈)
+- hints['ocr_page_text']: 줄 구조를 유지한 전체 OCR (HybridExtractor Fallback이 재사용)
+- hints['regions']: 표/그림 영역 경계 상자 (교차점 계산의 가로/세로선 마스크에서 추출,
+  페이지 대비 비율 좌표 → 해상도 무관, HybridExtractor 영역 크롭 VLM 요청용)
+- LayoutMasks: 그레이/이진화/엣지/가로·세로선 마스크를 페이지당 1회 계산해 모든 힌트가 공유
+  (교차점/선밀도 중복 계산, 표 키워드용 2번째 Tesseract 호출 제거 → 300 DPI 0.5초 예산,
+  tests/benchmark_layout_analyzer.py)
+- 텍스트 레이어 우회: analyze(text_layer=...)로 페이지 텍스트가 오면 OCR 생략 (키워드/비율은 텍스트 레이어 기준,
+  표 판정은 괘선 교차만 - 전체 페이지 텍스트에 '원'/'명'/'개'/'%' 키워드가 거의 항상 있음)
+- OCR 프로세스 풀 (core/ocr_pool.py): 워커당 Tesseract 초기화 1회, OpenCV 분석과 병행
+  (PRISM_OCR_WORKERS=0이면 기존처럼 호출 스레드에서 실행)
+- hints['tables']: 표 영역별 TableGrid (행/열 구분선, 셀 사각형, 격자→셀 인덱스 NumPy 배열,
+  병합 셀 포함) → 셀 단위 크롭/OCR/행 재구성이 페이지 전체 처리 없이 가능
+- 벡터 표 검출: analyze(vector_lines=...)로 PDF 경로 객체 괘선이 오면 표/그림 영역을 렌더링 없이 검출
+  (detect_vector_regions, source='vector'), 스캔 페이지(needs_raster)만 래스터 괘선 검출
+  표 힌트 (has_table CV / grid_intersections / h_v_line_density)도 벡터 괘선 기준 → 래스터 선 마스크 생략
+
 Author: 박준호 (AI/ML Lead)
 Date: 2025-10-27
 Version: 5.5.1
@@ -23,7 +44,17 @@ import numpy as np
 import logging
 import base64
 import re
-from typing import Dict, Any, List
+import time
+from concurrent.futures import Future
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .ocr_pool import default_ocr_max_edge, default_ocr_workers, get_ocr_pool, prepare_ocr_image
+    from .table_grid import TableGrid, VectorLines, grid_from_line_masks
+except ImportError:
+    from core.ocr_pool import default_ocr_max_edge, default_ocr_workers, get_ocr_pool, prepare_ocr_image
+    from core.table_grid import TableGrid, VectorLines, grid_from_line_masks
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +67,192 @@ except ImportError:
     logger.warning("⚠️ pytesseract 없음 - OCR 기능 비활성화")
 
 
+def _kernel_len(length: int, scale: float) -> int:
+    """✅ Phase 1.0: 300 DPI 기준 커널 길이 → 입력 해상도 기준 (최소 1px)"""
+    return max(1, int(round(length * scale)))
+
+
+def _block_size(scale: float) -> int:
+    """✅ Phase 1.0: 적응 이진화 블록 크기 (홀수, 최소 3)"""
+    size = max(3, int(round(11 * scale)))
+    return size if size % 2 == 1 else size + 1
+
+
+def _contour_areas(mask: np.ndarray) -> np.ndarray:
+    """외곽 컨투어 면적 배열 (float64)"""
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return np.array([cv2.contourArea(c) for c in contours], dtype=np.float64)
+
+
+def _contour_stats(mask: np.ndarray) -> np.ndarray:
+    """✅ Phase 1.0: 외곽 컨투어별 [면적, x, y, w, h] (float64, N x 5)"""
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return np.array(
+        [(cv2.contourArea(c), *cv2.boundingRect(c)) for c in contours], dtype=np.float64
+    ).reshape(-1, 5)
+
+
+def _count_blobs(mask: np.ndarray) -> int:
+    """✅ Phase 1.0: 연결 요소 개수 (외곽 컨투어 수 - 희소 마스크에서 connectedComponents보다 빠름)"""
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return len(contours)
+
+
+def _crossings(horizontal: np.ndarray, vertical: np.ndarray, join: int) -> np.ndarray:
+    """
+    ✅ Phase 1.0: 가로선 ∩ 세로선 교차 마스크 (교차 1곳 = 연결 요소 1개)
+    
+    선 하나의 양쪽 엣지와 선 두께를 join px 팽창으로 묶은 뒤 교집합 → 교차점 픽셀 수
+    (해상도/선 두께/안티앨리어싱에 따라 들쭉날쭉)가 아닌 교차 개수를 셀 수 있음.
+    """
+    kernel = np.ones((join, join), np.uint8)
+    return cv2.bitwise_and(cv2.dilate(horizontal, kernel), cv2.dilate(vertical, kernel))
+
+
+class LayoutMasks:
+    """
+    ✅ Phase 1.0: 페이지당 1회 계산하는 레이아웃 마스크 (모든 힌트가 공유)
+    
+    그레이스케일 변환은 생성 시 1회, 나머지는 처음 접근할 때 1회 계산 후 재사용.
+    (교차점 수 / 선밀도 / 영역 검출이 같은 이진화 → Canny → 가로/세로선 마스크를 사용)
+    
+    보수적 선 마스크 (교차점 / 선밀도 / 영역):
+        binary: 적응 이진화 (반전)
+        edges: binary의 Canny 엣지
+        horizontal / vertical: 최소 40px 가로/세로선 (300 DPI 기준)
+        intersections: 가로선 ∩ 세로선 교차 마스크 (CROSSING_JOIN px로 묶어 교차 1곳 = 연결 요소 1개)
+    
+    그레이스케일 엣지 (텍스트 / 지도 / 다이어그램 / 표):
+        gray_edges: Canny(50, 150), gray_horizontal: 그 가로선
+        edge_contour_stats / edge_contour_areas: gray_edges 외곽 컨투어 [면적, 경계 상자] / 면적
+        table_edges: Canny(30, 100), table_intersections: 그 가로선 ∩ 세로선 교차 마스크
+    
+    기타:
+        gray_std: 밝기 표준편차, otsu_contour_areas: Otsu 이진화 외곽 컨투어 면적
+    
+    Attributes:
+        image: BGR 이미지
+        gray: 그레이스케일 이미지
+        scale: 해상도 / REFERENCE_DPI (커널 길이 ∝ scale)
+    """
+    
+    # ✅ Phase 1.0: 교차 묶음 거리 (300 DPI px, 선 두께 + 양쪽 엣지 간격 이상, 표 칸 크기 미만)
+    CROSSING_JOIN = 15
+    
+    # ✅ Phase 1.0: 선밀도 환산 - 선 마스크 픽셀은 Canny 엣지 (괘선 1개 = 양쪽 엣지 2줄)
+    LINE_PIXEL_WEIGHT = 1.0
+    
+    def __init__(self, image: np.ndarray, scale: float = 1.0):
+        self.image = image
+        self.gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        self.scale = scale
+    
+    def _line_kernels(self, length: int = 40) -> Tuple[np.ndarray, np.ndarray]:
+        """가로/세로 선 커널 (300 DPI 기준 length px)"""
+        size = _kernel_len(length, self.scale)
+        return (
+            cv2.getStructuringElement(cv2.MORPH_RECT, (size, 1)),
+            cv2.getStructuringElement(cv2.MORPH_RECT, (1, size))
+        )
+    
+    # ========== 보수적 선 마스크 ==========
+    
+    @cached_property
+    def binary(self) -> np.ndarray:
+        return cv2.adaptiveThreshold(
+            self.gray, 255,
+            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY_INV,
+            _block_size(self.scale), 2
+        )
+    
+    @cached_property
+    def edges(self) -> np.ndarray:
+        return cv2.Canny(self.binary, 30, 100)
+    
+    @cached_property
+    def horizontal(self) -> np.ndarray:
+        # 40px 열기 결과는 이미 3px 열기에 불변 → 기존 3px 후처리는 생략 (결과 동일)
+        return cv2.morphologyEx(self.edges, cv2.MORPH_OPEN, self._line_kernels()[0])
+    
+    @cached_property
+    def vertical(self) -> np.ndarray:
+        return cv2.morphologyEx(self.edges, cv2.MORPH_OPEN, self._line_kernels()[1])
+    
+    @cached_property
+    def intersections(self) -> np.ndarray:
+        # 40px 미만 선은 horizontal/vertical에서 이미 제거 → 교차 덩어리는 노이즈 열기 불필요
+        return _crossings(self.horizontal, self.vertical, _kernel_len(self.CROSSING_JOIN, self.scale))
+    
+    # ========== 그레이스케일 엣지 ==========
+    
+    @cached_property
+    def gray_edges(self) -> np.ndarray:
+        return cv2.Canny(self.gray, 50, 150)
+    
+    @cached_property
+    def gray_horizontal(self) -> np.ndarray:
+        return cv2.morphologyEx(self.gray_edges, cv2.MORPH_OPEN, self._line_kernels()[0])
+    
+    @cached_property
+    def edge_contour_stats(self) -> np.ndarray:
+        return _contour_stats(self.gray_edges)
+    
+    @cached_property
+    def edge_contour_areas(self) -> np.ndarray:
+        return self.edge_contour_stats[:, 0]
+    
+    @cached_property
+    def table_edges(self) -> np.ndarray:
+        return cv2.Canny(self.gray, 30, 100)
+    
+    @cached_property
+    def table_intersections(self) -> np.ndarray:
+        horizontal_kernel, vertical_kernel = self._line_kernels()
+        return _crossings(
+            cv2.morphologyEx(self.table_edges, cv2.MORPH_OPEN, horizontal_kernel),
+            cv2.morphologyEx(self.table_edges, cv2.MORPH_OPEN, vertical_kernel),
+            _kernel_len(self.CROSSING_JOIN, self.scale)
+        )
+    
+    # ========== 기타 ==========
+    
+    @cached_property
+    def gray_std(self) -> float:
+        return float(cv2.meanStdDev(self.gray)[1][0][0])
+    
+    @cached_property
+    def otsu_contour_areas(self) -> np.ndarray:
+        _, otsu = cv2.threshold(self.gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        return _contour_areas(otsu)
+
+
+class RulingMasks:
+    """
+    ✅ Phase 1.0: 벡터 괘선으로 그린 가로/세로선 마스크 (LayoutMasks와 같은 속성)
+    
+    디지털 페이지의 영역 검출 (_detect_regions) + 표 힌트 (교차 개수 / 선밀도 / CV 표 판정) 입력
+    → 래스터 이진화/Canny/선 열기 없이 괘선 목록만으로 계산.
+    """
+    
+    # ✅ Phase 1.0: 괘선 1개 = 1px 선 → 래스터 선 마스크 (양쪽 엣지 2줄)와 같은 선밀도 기준
+    LINE_PIXEL_WEIGHT = 2.0
+    
+    def __init__(self, horizontal: np.ndarray, vertical: np.ndarray, scale: float):
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.scale = scale
+    
+    @cached_property
+    def intersections(self) -> np.ndarray:
+        return _crossings(self.horizontal, self.vertical, _kernel_len(LayoutMasks.CROSSING_JOIN, self.scale))
+    
+    @property
+    def table_intersections(self) -> np.ndarray:
+        # 벡터 괘선 = 표 괘선 (래스터의 보수적/표용 엣지 구분 없음)
+        return self.intersections
+
+
 class QuickLayoutAnalyzer:
     """
     Phase 5.5.1 OpenCV + OCR 기반 빠른 레이아웃 분석기 (Hotfix)
@@ -49,23 +266,62 @@ class QuickLayoutAnalyzer:
     - VLM 호출 전 0.5초 이내 구조 힌트 생성
     - 프롬프트 최적화 및 검증 기준 제공
     - 표 과검출 방지 (보수적 계산)
+    
+    ✅ Phase 1.0: 커널 크기/면적 임계값은 REFERENCE_DPI 기준값을 입력 DPI에 비례 조정
     """
     
-    def __init__(self):
-        """초기화"""
+    # ✅ Phase 1.0: 커널/임계값 튜닝 기준 해상도
+    REFERENCE_DPI = 300
+    
+    # ✅ Phase 1.0: 영역 검출 기준 (300 DPI px) - 최소 너비/높이, 선 연결 거리, 크롭 여백
+    REGION_MIN_WIDTH = 200
+    REGION_MIN_HEIGHT = 60
+    REGION_JOIN = 15
+    REGION_PADDING = 12
+    
+    # ✅ Phase 1.0: 괘선으로 나뉜 칸이 이 개수 이상이면 표, 미만이면 테두리 그림/박스
+    REGION_TABLE_MIN_CELLS = 2
+    
+    # ✅ Phase 1.0: 괘선 교차가 이 개수 이상이면 CV 표 (해상도 무관, 약 4x3칸 표 / 모서리 4개 상자 5개)
+    TABLE_MIN_CROSSINGS = 20
+    
+    # ✅ Phase 1.0: 벡터 괘선 마스크 해상도 (영역 검출 임계값은 REFERENCE_DPI 기준으로 비례 조정)
+    VECTOR_DPI = 96
+    
+    def __init__(self, ocr_workers: Optional[int] = None, ocr_max_edge: Optional[int] = None):
+        """
+        초기화
+        
+        Args:
+            ocr_workers: ✅ Phase 1.0: OCR 프로세스 수 (기본 PRISM_OCR_WORKERS, 0이면 호출 스레드에서 실행)
+            ocr_max_edge: ✅ Phase 1.0: OCR 입력 긴 변 상한 px (기본 PRISM_OCR_MAX_EDGE, None이면 원본)
+        """
         self.tesseract_available = TESSERACT_AVAILABLE
+        self.ocr_workers = default_ocr_workers() if ocr_workers is None else max(0, ocr_workers)
+        self.ocr_max_edge = default_ocr_max_edge() if ocr_max_edge is None else ocr_max_edge
         logger.info("✅ QuickLayoutAnalyzer v5.5.1 초기화 완료 (Hotfix)")
         if self.tesseract_available:
             logger.info("   📊 Tesseract OCR 활성화 (표 + 버스 + 규정 키워드)")
+            logger.info(f"   🔤 OCR 실행: {f'프로세스 풀 {self.ocr_workers}개' if self.ocr_workers else '인라인'}")
         else:
             logger.warning("   ⚠️ Tesseract OCR 비활성화 (일부 기능 제한)")
     
-    def analyze(self, image_data: str) -> Dict[str, Any]:
+    def analyze(
+        self,
+        image_data: Union[str, np.ndarray, Any],
+        dpi: Optional[int] = None,
+        text_layer: Optional[str] = None,
+        vector_lines: Optional[VectorLines] = None
+    ) -> Dict[str, Any]:
         """
         이미지 구조 분석 (0.5초 이내)
         
         Args:
-            image_data: Base64 인코딩된 이미지
+            image_data: Base64 인코딩된 이미지, BGR 배열, 또는
+                        RenderedPage (✅ Phase 1.0: 코덱 왕복 없이 픽셀 직접 사용)
+            dpi: 이미지 해상도 (None이면 RenderedPage.dpi 또는 REFERENCE_DPI)
+            text_layer: ✅ Phase 1.0: 페이지 텍스트 레이어 (있으면 OCR 생략, 키워드/비율 계산에 사용)
+            vector_lines: ✅ Phase 1.0: PDF 벡터 괘선 (있고 스캔 페이지가 아니면 영역/표 격자/표 힌트를 벡터로 검출)
         
         Returns:
             {
@@ -79,29 +335,74 @@ class QuickLayoutAnalyzer:
                 'ocr_text': str,
                 'article_token_ratio': float,
                 'numbered_list_density': float,
-                'bus_keywords': List[str]
+                'bus_keywords': List[str],
+                'layout_dpi': int,
+                'ocr_page_text': str | None,  # ✅ Phase 1.0: 줄 구조 유지 전체 OCR (Fallback 재사용)
+                'text_source': str | None,    # ✅ Phase 1.0: 'text_layer' | 'ocr' | None (OCR 불가)
+                'ocr_sec': float,             # ✅ Phase 1.0: OCR 소요 시간 (우회/미실행 시 0)
+                'regions': List[dict],        # ✅ Phase 1.0: [{'kind': 'table'|'figure',
+                                              #   'bbox': [x0, y0, x1, y1] (0~1 비율), 'cells': int}]
+                'tables': List[TableGrid]     # ✅ Phase 1.0: kind='table' 영역의 격자 (같은 순서)
             }
         """
         logger.info("   🔍 QuickLayoutAnalyzer v5.5.1 시작 (Hotfix)")
         
-        # Base64 → OpenCV 이미지
-        image = self._base64_to_cv2(image_data)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Base64/RenderedPage → OpenCV 이미지
+        image = self._to_cv2(image_data)
+        
+        # ✅ Phase 1.0: 해상도 비례 스케일 (커널 길이 ∝ scale, 면적 ∝ scale²)
+        if dpi is None:
+            dpi = getattr(image_data, 'dpi', None) or self.REFERENCE_DPI
+        scale = dpi / self.REFERENCE_DPI
+        
+        # ✅ Phase 1.0: 페이지 공용 마스크 (그레이/이진화/엣지/선 마스크 1회 계산 → 모든 힌트 공유)
+        masks = LayoutMasks(image, scale)
         
         # OCR 텍스트 추출 (핵심!)
-        ocr_text = self._extract_ocr_text(gray) if self.tesseract_available else ""
+        # ✅ Phase 1.0: 텍스트 레이어가 있으면 OCR 생략, 없으면 OCR 풀에 먼저 제출 → OpenCV 분석과 병행
+        ocr_future = None
+        if text_layer and text_layer.strip():
+            text_source = 'text_layer'
+        elif self.tesseract_available:
+            text_source = 'ocr'
+            ocr_future = self._start_ocr(masks.gray)
+        else:
+            text_source = None
+        
+        # 구조 감지 (OpenCV)
+        has_text = self._detect_text(masks)
+        has_map = self._detect_map(masks)
+        has_numbers = self._detect_numbers(masks)
+        diagram_count = self._count_diagrams(masks)
+        
+        # ✅ Phase 1.0: 표/그림 영역 + 표 힌트 - 디지털 페이지는 벡터 괘선, 스캔 페이지는 래스터 괘선
+        # (벡터 경로는 래스터 이진화/선 마스크를 만들지 않음 → 남는 래스터 작업은 텍스트/지도/숫자/다이어그램 엣지)
+        if vector_lines is not None and not vector_lines.needs_raster:
+            line_masks = self._ruling_masks(vector_lines)
+            regions, tables = self._detect_vector_regions(line_masks)
+            table_source = 'vector'
+        else:
+            line_masks = masks
+            regions, tables = self._detect_regions(masks)
+            table_source = 'raster'
+        
+        # ✅ Phase 1.0: 원문 1회 OCR (또는 텍스트 레이어) → 지표용 요약 + Fallback용 전체 텍스트
+        # (표 키워드는 OCR 텍스트만 - 텍스트 레이어 페이지의 표 판정은 CV/벡터 괘선 교차 기준)
+        ocr_page_text, ocr_sec = self._finish_ocr(ocr_future) if ocr_future is not None else (None, 0.0)
+        page_text = text_layer if text_source == 'text_layer' else ocr_page_text
+        ocr_text = self._compact_ocr_text(page_text or "")
         
         # 구조 감지
         hints = {
-            'has_text': self._detect_text(image),
-            'has_map': self._detect_map(image),
-            'has_table': self._detect_tables(image, image_data),
-            'has_numbers': self._detect_numbers(image),
-            'diagram_count': self._count_diagrams(image),
+            'has_text': has_text,
+            'has_map': has_map,
+            'has_table': self._detect_tables(line_masks, ocr_page_text),
+            'has_numbers': has_numbers,
+            'diagram_count': diagram_count,
             
             # ✅ Phase 5.5.1: 보수적 표 신뢰도 계산용 필드
-            'grid_intersections': self._count_grid_intersections_conservative(gray),
-            'h_v_line_density': self._calculate_line_density_conservative(gray),
+            'grid_intersections': self._count_grid_intersections_conservative(line_masks),
+            'h_v_line_density': self._calculate_line_density_conservative(line_masks),
             
             # Phase 5.5.0: OCR 기반 필드
             'ocr_text': ocr_text[:500],  # 짧게 (500자)
@@ -109,18 +410,55 @@ class QuickLayoutAnalyzer:
             'numbered_list_density': self._calculate_numbered_density(ocr_text),
             
             # Phase 5.4.0: 버스 키워드
-            'bus_keywords': self._detect_bus_keywords(ocr_text)
+            'bus_keywords': self._detect_bus_keywords(ocr_text),
+            
+            # ✅ Phase 1.0: 분석 해상도
+            'layout_dpi': int(dpi),
+            
+            # ✅ Phase 1.0: 전체 OCR 텍스트 (OCR 미실행/텍스트 레이어 우회 시 None)
+            'ocr_page_text': ocr_page_text,
+            
+            # ✅ Phase 1.0: 지표 텍스트 출처 + OCR 시간 (문서 단위 OCR 절약 집계용)
+            'text_source': text_source,
+            'ocr_sec': round(ocr_sec, 3),
+            
+            # ✅ Phase 1.0: 표/그림 영역 (비율 좌표) + 표 격자 (구분선/셀 배열)
+            'regions': regions,
+            'tables': tables
         }
         
         logger.info(f"   ✅ 힌트 생성 완료:")
         logger.info(f"      - 텍스트: {hints['has_text']}, 지도: {hints['has_map']}, 표: {hints['has_table']}")
-        logger.info(f"      - 교차점: {hints['grid_intersections']}, 선밀도: {hints['h_v_line_density']:.6f}")
+        logger.info(f"      - 교차점: {hints['grid_intersections']}, 선밀도: {hints['h_v_line_density']:.6f} ({table_source})")
         logger.info(f"      - 조항비율: {hints['article_token_ratio']:.2f}, 번호밀도: {hints['numbered_list_density']:.2f}")
+        logger.info(f"      - 텍스트 출처: {text_source or '없음'} (OCR {ocr_sec:.2f}초)")
+        if hints['regions']:
+            logger.info(f"      - 영역: {[r['kind'] for r in hints['regions']]}")
+        if tables:
+            logger.info(f"      - 표 격자 ({table_source}): {[grid.shape for grid in tables]}")
         if hints['bus_keywords']:
             logger.info(f"      - 버스 키워드: {hints['bus_keywords']}")
         
         return hints
     
+    # ✅ Phase 1.0: 해상도 비례 커널 (모듈 함수 공용)
+    _kernel_len = staticmethod(_kernel_len)
+    _block_size = staticmethod(_block_size)
+    
+    def _to_cv2(self, image_data: Union[str, np.ndarray, Any]) -> np.ndarray:
+        """
+        ✅ Phase 1.0: 입력 → OpenCV BGR 이미지
+        
+        RenderedPage/ndarray는 픽셀 버퍼를 그대로 사용 (디코딩 없음),
+        Base64 문자열만 기존 경로로 디코딩.
+        """
+        pixels = getattr(image_data, 'pixels', None)
+        if pixels is not None:
+            return pixels
+        if isinstance(image_data, np.ndarray):
+            return image_data
+        return self._base64_to_cv2(image_data)
+    
     def _base64_to_cv2(self, image_data: str) -> np.ndarray:
         """Base64 → OpenCV 이미지 변환"""
         img_bytes = base64.b64decode(image_data)
@@ -138,22 +476,87 @@ class QuickLayoutAnalyzer:
         Returns:
             OCR 추출 텍스트 (최대 1000자)
         """
+        return self._compact_ocr_text(self._extract_ocr_raw(gray))
+    
+    @staticmethod
+    def _compact_ocr_text(text: str) -> str:
+        """✅ Phase 1.0: 지표 계산용 요약 (공백 정리, 최대 1000자)"""
+        return re.sub(r'\s+', ' ', text).strip()[:1000]
+    
+    def _extract_ocr_raw(self, gray: np.ndarray) -> str:
+        """
+        ✅ Phase 1.0: Tesseract 원문 (줄 구조 유지, 길이 제한 없음)
+        
+        Args:
+            gray: Grayscale 이미지
+        
+        Returns:
+            OCR 텍스트 (실패 시 빈 문자열)
+        """
         if not self.tesseract_available:
             return ""
         
         try:
             # Tesseract 실행 (한글 + 영어)
             text = pytesseract.image_to_string(gray, lang='kor+eng')
-            
-            # 공백 정리
-            text = re.sub(r'\s+', ' ', text).strip()
-            
             logger.debug(f"      OCR 텍스트: {len(text)}자 추출")
-            return text[:1000]  # 최대 1000자
+            return text.strip()
+        
+        except Exception as e:
+            logger.debug(f"      OCR 실패: {e}")
+            return ""
+    
+    def _start_ocr(self, gray: np.ndarray, region: Optional[Sequence[float]] = None) -> Future:
+        """
+        ✅ Phase 1.0: OCR 시작 (OCR 풀 제출, ocr_workers=0이면 호출 스레드에서 실행한 완료 Future)
+        
+        Args:
+            gray: Grayscale 이미지
+            region: [x0, y0, x1, y1] 페이지 대비 비율 (None이면 전체)
         
+        Returns:
+            Future → (텍스트, OCR 초)
+        """
+        if self.ocr_workers > 0:
+            try:
+                return get_ocr_pool(self.ocr_workers, max_long_edge=self.ocr_max_edge).submit(gray, region)
+            except Exception as e:
+                logger.warning(f"      ⚠️ OCR 풀 제출 실패 → 인라인 OCR: {e}")
+        
+        future = Future()
+        start = time.perf_counter()
+        text = self._extract_ocr_raw(prepare_ocr_image(gray, region, self.ocr_max_edge))
+        future.set_result((text, time.perf_counter() - start))
+        return future
+    
+    @staticmethod
+    def _finish_ocr(future: Future) -> Tuple[str, float]:
+        """✅ Phase 1.0: OCR 결과 (실패 시 빈 문자열)"""
+        try:
+            return future.result()
         except Exception as e:
             logger.debug(f"      OCR 실패: {e}")
+            return "", 0.0
+    
+    def extract_page_text(
+        self,
+        image_data: Union[str, np.ndarray, Any],
+        region: Optional[Sequence[float]] = None
+    ) -> str:
+        """
+        ✅ Phase 1.0: 페이지 OCR (analyze()를 거치지 않은 이미지용 Fallback)
+        
+        Args:
+            image_data: Base64 / BGR 배열 / RenderedPage
+            region: [x0, y0, x1, y1] 페이지 대비 비율 (None이면 전체 페이지)
+        
+        Returns:
+            OCR 텍스트 (Tesseract 없으면 빈 문자열)
+        """
+        if not self.tesseract_available:
             return ""
+        gray = cv2.cvtColor(self._to_cv2(image_data), cv2.COLOR_BGR2GRAY)
+        return self._finish_ocr(self._start_ocr(gray, region))[0]
     
     def _calculate_article_ratio(self, ocr_text: str) -> float:
         """
@@ -234,7 +637,7 @@ class QuickLayoutAnalyzer:
         logger.debug(f"      번호 목록: {numbered_lines}/{len(lines)} 줄 = {density:.2f}")
         return density
     
-    def _count_grid_intersections_conservative(self, gray: np.ndarray) -> int:
+    def _count_grid_intersections_conservative(self, masks: Union["LayoutMasks", RulingMasks]) -> int:
         """
         ✅ Phase 5.5.1: 보수적 격자 교차점 계산
         
@@ -244,51 +647,103 @@ class QuickLayoutAnalyzer:
         - 최소 선 길이 필터링 (40px)
         
         Args:
-            gray: Grayscale 이미지
+            masks: ✅ Phase 1.0: 페이지 공용 마스크 (LayoutMasks) 또는 벡터 괘선 마스크 (RulingMasks)
         
         Returns:
             교차점 개수 (보수적)
-        """
-        # ✅ 1단계: 적응 이진화
-        # - 조명 변화에 강함
-        # - 가는 선 (조항 번호) 제거 효과
-        binary = cv2.adaptiveThreshold(
-            gray, 255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY_INV,
-            11, 2
-        )
         
-        # ✅ 2단계: Canny 엣지 검출
-        edges = cv2.Canny(binary, 30, 100)
+        ✅ Phase 1.0: 교차점 픽셀 수가 아닌 교차 개수 (연결 요소) → 해상도 무관
+        (픽셀 수는 선 두께/안티앨리어싱에 따라 DPI별로 비례하지 않음)
+        """
+        intersections_count = _count_blobs(masks.intersections)
         
-        # ✅ 3단계: 가로선 검출 (최소 길이 40px)
-        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-        horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
+        logger.debug(f"      격자 교차점(보수적): {intersections_count}개")
+        return int(intersections_count)
+    
+    def _detect_regions(self, masks: Union["LayoutMasks", RulingMasks]) -> Tuple[List[Dict[str, Any]], List[TableGrid]]:
+        """
+        ✅ Phase 1.0: 표/그림 영역 경계 상자 + 표 격자
         
-        # morphology open으로 가는 선 제거
-        horizontal_lines = cv2.morphologyEx(horizontal_lines, cv2.MORPH_OPEN, np.ones((1, 3), np.uint8))
+        가로/세로선 마스크를 합쳐 가까운 선끼리 연결한 뒤 연결 요소별 경계 상자를 구하고,
+        상자 안 투영 프로파일로 행/열 구분선, 구분선 사이 선분별 괘선 유무로 (병합) 셀을 구해
+        셀이 REGION_TABLE_MIN_CELLS개 이상이면 표(격자), 미만이면 그림(테두리 박스)으로 구분.
+        (선 하나의 양쪽 엣지와 끊긴 선 조각은 연결 거리 안에서 한 개로 셈)
+        구분선 한 줄처럼 낮거나 좁은 요소는 제외.
         
-        # ✅ 4단계: 세로선 검출 (최소 길이 40px)
-        vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
-        vertical_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, vertical_kernel)
+        Args:
+            masks: 페이지 공용 마스크 (LayoutMasks) 또는 벡터 괘선 마스크 (RulingMasks)
         
-        # morphology open으로 가는 선 제거
-        vertical_lines = cv2.morphologyEx(vertical_lines, cv2.MORPH_OPEN, np.ones((3, 1), np.uint8))
+        Returns:
+            (regions, tables)
+            regions: [{'kind': 'table'|'figure', 'bbox': [x0, y0, x1, y1], 'cells': int}]
+                     (bbox는 페이지 너비/높이 대비 비율 + 크롭 여백, 위쪽부터 정렬)
+            tables: kind='table' 영역의 TableGrid (regions와 같은 순서)
+        """
+        scale = masks.scale
+        height, width = masks.horizontal.shape[:2]
+        
+        join = self._kernel_len(self.REGION_JOIN, scale)
+        kernel = np.ones((join, join), np.uint8)
+        horizontal = cv2.dilate(masks.horizontal, kernel)
+        vertical = cv2.dilate(masks.vertical, kernel)
+        
+        # 연결 요소 경계 상자 = 2단계 컨투어의 바깥 경계 (connectedComponentsWithStats와 동일, 희소 마스크에서 더 빠름)
+        contours, hierarchy = cv2.findContours(cv2.bitwise_or(horizontal, vertical), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+        boxes = [cv2.boundingRect(c) for c, link in zip(contours, hierarchy[0] if contours else []) if link[3] < 0]
+        
+        min_w = self._kernel_len(self.REGION_MIN_WIDTH, scale)
+        min_h = self._kernel_len(self.REGION_MIN_HEIGHT, scale)
+        pad = self._kernel_len(self.REGION_PADDING, scale)
+        
+        found = []
+        for x, y, w, h in boxes:
+            if w < min_w or h < min_h:
+                continue
+            grid = grid_from_line_masks(horizontal, vertical, (x, y, w, h), join)
+            cells = len(grid.cells) if grid is not None else 0
+            x0, y0 = max(0, x - pad), max(0, y - pad)
+            x1, y1 = min(width, x + w + pad), min(height, y + h + pad)
+            region = {
+                'kind': 'table' if cells >= self.REGION_TABLE_MIN_CELLS else 'figure',
+                'bbox': [round(x0 / width, 4), round(y0 / height, 4), round(x1 / width, 4), round(y1 / height, 4)],
+                'cells': cells
+            }
+            found.append((region, grid))
         
-        # ✅ 5단계: 교차점 검출 (보수적)
-        intersections = cv2.bitwise_and(horizontal_lines, vertical_lines)
+        found.sort(key=lambda item: (item[0]['bbox'][1], item[0]['bbox'][0]))
+        regions = [region for region, _ in found]
+        tables = [grid for region, grid in found if region['kind'] == 'table']
+        logger.debug(f"      영역: {len(regions)}개 (표 격자 {len(tables)}개)")
+        return regions, tables
+    
+    def detect_vector_regions(self, vector_lines: VectorLines) -> Tuple[List[Dict[str, Any]], List[TableGrid]]:
+        """
+        ✅ Phase 1.0: PDF 벡터 괘선 → 표/그림 영역 + 표 격자 (렌더링 없음)
         
-        # ✅ 6단계: 작은 노이즈 제거 (5x5 커널)
-        kernel_denoise = np.ones((5, 5), np.uint8)
-        intersections = cv2.morphologyEx(intersections, cv2.MORPH_OPEN, kernel_denoise)
+        괘선 목록을 VECTOR_DPI 해상도의 1px 선 마스크로 그린 뒤 래스터와 같은 영역 검출
+        (_detect_regions)을 적용 → 영역 기준/병합 셀 판정이 래스터 경로와 동일.
         
-        intersections_count = np.sum(intersections > 0)
+        Args:
+            vector_lines: extract_vector_lines() 결과
         
-        logger.debug(f"      격자 교차점(보수적): {intersections_count}개")
-        return int(intersections_count)
+        Returns:
+            (regions, tables) - _detect_regions()와 같은 형식, TableGrid.source = 'vector'
+        """
+        return self._detect_vector_regions(self._ruling_masks(vector_lines))
+    
+    def _ruling_masks(self, vector_lines: VectorLines) -> RulingMasks:
+        """✅ Phase 1.0: 벡터 괘선 → VECTOR_DPI 해상도 1px 선 마스크"""
+        horizontal, vertical = vector_lines.to_masks(self.VECTOR_DPI / 72.0)
+        return RulingMasks(horizontal, vertical, self.VECTOR_DPI / self.REFERENCE_DPI)
+    
+    def _detect_vector_regions(self, rulings: RulingMasks) -> Tuple[List[Dict[str, Any]], List[TableGrid]]:
+        """✅ Phase 1.0: 벡터 괘선 마스크 → 영역 + 표 격자 (source='vector')"""
+        regions, tables = self._detect_regions(rulings)
+        for grid in tables:
+            grid.source = 'vector'
+        return regions, tables
     
-    def _calculate_line_density_conservative(self, gray: np.ndarray) -> float:
+    def _calculate_line_density_conservative(self, masks: Union["LayoutMasks", RulingMasks]) -> float:
         """
         ✅ Phase 5.5.1: 보수적 가로/세로선 밀도 계산
         
@@ -297,71 +752,50 @@ class QuickLayoutAnalyzer:
         - morphology open으로 가는 선 제거
         - 최소 선 길이 필터링
         
+        ✅ Phase 1.0: 교차점 계산과 같은 가로/세로선 마스크 사용 (재계산 없음)
+        ✅ Phase 1.0: 벡터 괘선 마스크는 괘선 1개 = 1px → LINE_PIXEL_WEIGHT로 래스터 엣지 기준 환산
+        
         Args:
-            gray: Grayscale 이미지
+            masks: 페이지 공용 마스크 (LayoutMasks) 또는 벡터 괘선 마스크 (RulingMasks)
         
         Returns:
             선 밀도 (0.0 ~ 1.0, 보수적)
         """
-        # ✅ 1단계: 적응 이진화
-        binary = cv2.adaptiveThreshold(
-            gray, 255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY_INV,
-            11, 2
-        )
-        
-        # ✅ 2단계: Canny 엣지 검출
-        edges = cv2.Canny(binary, 30, 100)
-        
-        # ✅ 3단계: 가로선 검출 (최소 40px)
-        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-        horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
-        horizontal_lines = cv2.morphologyEx(horizontal_lines, cv2.MORPH_OPEN, np.ones((1, 3), np.uint8))
-        
-        # ✅ 4단계: 세로선 검출 (최소 40px)
-        vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
-        vertical_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, vertical_kernel)
-        vertical_lines = cv2.morphologyEx(vertical_lines, cv2.MORPH_OPEN, np.ones((3, 1), np.uint8))
-        
-        # ✅ 5단계: 선 픽셀 합계
-        h_pixels = np.sum(horizontal_lines > 0)
-        v_pixels = np.sum(vertical_lines > 0)
+        # 선 픽셀 합계
+        h_pixels = cv2.countNonZero(masks.horizontal)
+        v_pixels = cv2.countNonZero(masks.vertical)
         
         # 전체 픽셀
-        total_pixels = gray.shape[0] * gray.shape[1]
+        total_pixels = masks.horizontal.size
         
         # 밀도 계산 (보수적)
-        density = (h_pixels + v_pixels) / max(1, total_pixels)
+        # ✅ Phase 1.0: 1px 엣지 선 픽셀 ∝ scale, 전체 픽셀 ∝ scale² → scale 곱해 300 DPI 환산
+        density = (h_pixels + v_pixels) * masks.LINE_PIXEL_WEIGHT * masks.scale / max(1, total_pixels)
         
         logger.debug(f"      선 밀도(보수적): {density:.6f}")
         return float(density)
     
-    def _detect_text(self, image: np.ndarray) -> bool:
+    def _detect_text(self, masks: "LayoutMasks") -> bool:
         """텍스트 영역 검출"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        
-        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-        horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
+        horizontal_lines = masks.gray_horizontal
         
-        h_ratio = np.sum(horizontal_lines > 0) / horizontal_lines.size
+        # ✅ Phase 1.0: 1px 엣지 비율 → 300 DPI 환산
+        h_ratio = cv2.countNonZero(horizontal_lines) * masks.scale / horizontal_lines.size
         has_text = h_ratio > 0.01
         logger.debug(f"      텍스트 영역: {has_text} (가로선 비율: {h_ratio:.4f})")
         return has_text
     
-    def _detect_map(self, image: np.ndarray) -> bool:
+    def _detect_map(self, masks: "LayoutMasks") -> bool:
         """지도/노선도 검출"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        std_dev = np.std(gray)
+        std_dev = masks.gray_std
         
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        areas = masks.edge_contour_areas
+        scale = masks.scale
+        large = areas[areas > 1000 * scale * scale]
+        large_contours = int(large.size)
         
-        large_contours = sum(1 for c in contours if cv2.contourArea(c) > 1000)
-        
-        total_area = image.shape[0] * image.shape[1]
-        contour_area = sum(cv2.contourArea(c) for c in contours if cv2.contourArea(c) > 1000)
+        total_area = masks.gray.size
+        contour_area = float(large.sum())
         area_ratio = contour_area / total_area if total_area > 0 else 0
         
         has_map = std_dev > 60 and large_contours > 10 and area_ratio > 0.3
@@ -372,34 +806,30 @@ class QuickLayoutAnalyzer:
         )
         return has_map
     
-    def _detect_tables(self, image: np.ndarray, image_data: str = None) -> bool:
-        """표 검출"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 30, 100)
-        
-        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-        horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
+    def _detect_tables(self, masks: Union["LayoutMasks", RulingMasks], ocr_text: Optional[str] = None) -> bool:
+        """
+        표 검출
         
-        vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 40))
-        vertical_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, vertical_kernel)
+        ✅ Phase 1.0: 표 키워드는 analyze()의 OCR 결과 재사용 (페이지당 Tesseract 최대 1회)
+        ✅ Phase 1.0: 텍스트 레이어는 키워드 검사에 쓰지 않음 (analyze()가 None 전달)
         
-        intersections = cv2.bitwise_and(horizontal_lines, vertical_lines)
-        intersections_sum = np.sum(intersections > 0)
+        Args:
+            masks: 페이지 공용 마스크 (LayoutMasks) 또는 벡터 괘선 마스크 (RulingMasks)
+            ocr_text: 페이지 OCR 텍스트 (None이면 키워드 검사 생략)
+        """
+        # ✅ Phase 1.0: 교차 개수 기준 (기존 교차점 픽셀 50개 기준은 해상도별로 표 판정이 뒤집힘)
+        intersections_sum = _count_blobs(masks.table_intersections)
         
-        has_table_cv = intersections_sum > 50
+        has_table_cv = intersections_sum >= self.TABLE_MIN_CROSSINGS
         
         has_table_text = False
-        if self.tesseract_available and image_data:
-            try:
-                text = pytesseract.image_to_string(gray, lang='kor+eng')
-                table_keywords = ['단위', '사례수', '비율', '합계', '%', '명', '원', '개']
-                for keyword in table_keywords:
-                    if keyword in text:
-                        has_table_text = True
-                        logger.debug(f"      Tesseract 표 키워드 감지: '{keyword}'")
-                        break
-            except Exception as e:
-                logger.debug(f"      Tesseract OCR 실패: {e}")
+        if ocr_text:
+            table_keywords = ['단위', '사례수', '비율', '합계', '%', '명', '원', '개']
+            for keyword in table_keywords:
+                if keyword in ocr_text:
+                    has_table_text = True
+                    logger.debug(f"      Tesseract 표 키워드 감지: '{keyword}'")
+                    break
         
         has_table = has_table_cv or has_table_text
         
@@ -409,26 +839,35 @@ class QuickLayoutAnalyzer:
         )
         return has_table
     
-    def _detect_numbers(self, image: np.ndarray) -> bool:
+    def _detect_numbers(self, masks: "LayoutMasks") -> bool:
         """숫자 데이터 검출"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        small_boxes = sum(1 for c in contours if 10 < cv2.contourArea(c) < 500)
+        areas = masks.otsu_contour_areas
+        area_scale = masks.scale * masks.scale
+        small_boxes = int(np.count_nonzero((areas > 10 * area_scale) & (areas < 500 * area_scale)))
         has_numbers = small_boxes > 20
         logger.debug(f"      숫자 데이터: {has_numbers} (작은 박스: {small_boxes})")
         return has_numbers
     
-    def _count_diagrams(self, image: np.ndarray) -> int:
-        """다이어그램 개수 추정"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        large_regions = sum(1 for c in contours if cv2.contourArea(c) > 5000)
+    def _count_diagrams(self, masks: "LayoutMasks") -> int:
+        """
+        다이어그램 개수 추정
+        
+        ✅ Phase 1.0: 맞닿은 큰 컨투어 (저해상도에서 끊긴 표 테두리 → 칸별 컨투어) 는 한 개로 셈
+        (경계 상자를 REGION_JOIN 거리 안에서 묶은 그룹 수)
+        """
+        stats = masks.edge_contour_stats
+        large = stats[stats[:, 0] > 5000 * masks.scale * masks.scale, 1:].astype(np.int32)
+        large_regions = len(large)
+        if large_regions > 1:
+            join = self._kernel_len(self.REGION_JOIN, masks.scale)
+            canvas = np.zeros(masks.gray.shape[:2], np.uint8)
+            for x, y, w, h in large:
+                cv2.rectangle(canvas, (x - join, y - join), (x + w + join, y + h + join), 255, -1)
+            large_regions = _count_blobs(canvas)
         diagram_count = min(5, large_regions)
         logger.debug(f"      다이어그램: {diagram_count}개 (큰 영역: {large_regions})")
         return diagram_count
-    
+
     def _detect_bus_keywords(self, ocr_text: str) -> List[str]:
         """버스 키워드 검출"""
         if not ocr_text:
@@ -0,0 +1,318 @@
+"""
+core/rate_limiter.py
+PRISM Phase 1.0 - VLM Rate Limiter
+
+✅ 기능:
+1. 토큰 버킷: 프로바이더/배포별 분당 요청 수(RPM) + 분당 토큰 수(TPM)
+2. 프로세스 전역 공유 (같은 배포를 쓰는 모든 호출자가 한 버킷 사용)
+3. 서버 Retry-After / x-ratelimit-reset-* 헤더 반영 (전체 호출자 일시 정지)
+4. Decorrelated jitter 백오프
+5. 대기 시간 메트릭 (queue wait)
+6. 동시 요청 수 제한: 프로바이더/배포별 프로세스 전역 세마포어 (이벤트 루프/스레드/인스턴스 공유)
+
+환경 변수:
+- PRISM_VLM_RPM: 분당 요청 수 (미설정 시 제한 없음)
+- PRISM_VLM_TPM: 분당 토큰 수 (미설정 시 제한 없음)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import re
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 (예약 방식)
+
+    reserve()는 토큰을 즉시 차감(음수 허용)하고 필요한 대기 시간을 반환하므로
+    동시 호출자들이 도착 순서대로 공정하게 간격을 두고 실행됨.
+    """
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            per_minute: 분당 보충량
+            burst: 최대 적립량 (기본: per_minute)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        토큰 예약
+
+        Args:
+            amount: 필요한 토큰 수 (capacity 초과 시 capacity로 제한)
+
+        Returns:
+            실행 전 대기해야 할 시간(초)
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class DecorrelatedJitter:
+    """
+    Decorrelated jitter 백오프
+
+    sleep = min(cap, uniform(base, prev * 3))
+    고정 지수 백오프와 달리 동시 재시도가 같은 순간에 몰리지 않음.
+    """
+
+    def __init__(self, base: float = 1.0, cap: float = 60.0):
+        self.base = base
+        self.cap = cap
+        self.prev = base
+
+    def next(self) -> float:
+        self.prev = min(self.cap, random.uniform(self.base, self.prev * 3))
+        return self.prev
+
+
+class RateLimiter:
+    """
+    Phase 1.0 프로바이더/배포별 VLM 요청 제한기
+
+    - acquire(): RPM/TPM 버킷 + 서버 지정 정지 시각까지 대기 (대기 시간 기록)
+    - penalize(): 429 응답의 Retry-After를 모든 호출자에게 적용
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """
+        초기화
+
+        Args:
+            name: 식별자 (provider:deployment)
+            requests_per_minute: RPM (None이면 제한 없음)
+            tokens_per_minute: TPM (None이면 제한 없음)
+        """
+        self.name = name
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self, tokens: float = 0) -> float:
+        """
+        요청 1건 실행 허가 대기
+
+        Args:
+            tokens: 예상 토큰 수 (TPM 버킷)
+
+        Returns:
+            대기한 시간(초)
+        """
+        wait = 0.0
+        if self.request_bucket:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket and tokens:
+            wait = max(wait, self.token_bucket.reserve(tokens))
+
+        with self._lock:
+            wait = max(wait, self._blocked_until - time.monotonic())
+
+        if wait > 0:
+            logger.info(f"      ⏳ Rate limiter 대기 ({self.name}): {wait:.2f}초")
+            time.sleep(wait)
+
+        with self._lock:
+            self.requests += 1
+            self.total_wait += max(0.0, wait)
+            self.max_wait = max(self.max_wait, wait)
+
+        return max(0.0, wait)
+
+    def penalize(self, delay: float) -> None:
+        """
+        서버 제한 응답 반영: delay초 동안 모든 호출자 정지
+
+        Args:
+            delay: 정지 시간(초)
+        """
+        with self._lock:
+            self.throttled += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기 시간 메트릭"""
+        with self._lock:
+            return {
+                'name': self.name,
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'total_wait_sec': round(self.total_wait, 3),
+                'avg_wait_sec': round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+                'max_wait_sec': round(self.max_wait, 3)
+            }
+
+
+# 프로세스 전역: (provider, deployment) → RateLimiter
+_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def get_rate_limiter(
+    provider: str,
+    deployment: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None
+) -> RateLimiter:
+    """
+    프로바이더/배포별 공유 제한기 (최초 생성 시 설정 적용)
+
+    Args:
+        provider: 'azure_openai' | 'openai' | 'local_sllm'
+        deployment: 모델/배포 이름
+        requests_per_minute: RPM (기본: PRISM_VLM_RPM)
+        tokens_per_minute: TPM (기본: PRISM_VLM_TPM)
+    """
+    key = (provider, deployment)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                f"{provider}:{deployment}",
+                requests_per_minute or _env_float("PRISM_VLM_RPM"),
+                tokens_per_minute or _env_float("PRISM_VLM_TPM")
+            )
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+# 프로세스 전역: (provider, deployment) → (동시 요청 세마포어, 한도)
+_CONCURRENCY: Dict[Tuple[str, str], Tuple[threading.BoundedSemaphore, int]] = {}
+
+
+def get_concurrency_limit(
+    provider: str,
+    deployment: str,
+    limit: int
+) -> Tuple[threading.BoundedSemaphore, int]:
+    """
+    프로바이더/배포별 공유 동시 요청 세마포어 (최초 생성 시 한도 적용)
+
+    Args:
+        provider: 'azure_openai' | 'openai' | 'local_sllm'
+        deployment: 모델/배포 이름
+        limit: 동시 요청 수 (이미 생성된 배포면 기존 한도 유지)
+
+    Returns:
+        (BoundedSemaphore, 적용된 한도)
+    """
+    key = (provider, deployment)
+    limit = max(1, int(limit))
+    with _LIMITERS_LOCK:
+        entry = _CONCURRENCY.get(key)
+        if entry is None:
+            entry = (threading.BoundedSemaphore(limit), limit)
+            _CONCURRENCY[key] = entry
+        elif entry[1] != limit:
+            logger.warning(f"⚠️ {provider}:{deployment} 동시 요청 한도는 공유값 {entry[1]} 유지 (요청 {limit})")
+        return entry
+
+
+# "1s", "6m0s", "20ms", "1h2m3.5s" (OpenAI x-ratelimit-reset-* 형식)
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and ''.join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    # HTTP-date 형식 Retry-After
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    예외의 HTTP 응답 헤더에서 재시도 대기 시간 추출
+
+    우선순위: retry-after-ms → retry-after → x-ratelimit-reset-requests/tokens (큰 값)
+
+    Args:
+        error: SDK 예외 (openai.APIStatusError 등, response.headers 보유)
+
+    Returns:
+        대기 시간(초) 또는 None
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+
+    retry_ms = headers.get('retry-after-ms')
+    if retry_ms:
+        try:
+            return float(retry_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        seconds = _parse_duration(retry_after)
+        if seconds is not None:
+            return seconds
+
+    resets = [
+        _parse_duration(headers[name])
+        for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+        if headers.get(name)
+    ]
+    resets = [r for r in resets if r is not None]
+    return max(resets) if resets else None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """429 / rate limit 오류 여부"""
+    if getattr(error, 'status_code', None) == 429:
+        return True
+    error_str = str(error).lower()
+    return "rate" in error_str or "429" in error_str
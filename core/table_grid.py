@@ -0,0 +1,416 @@
+"""
+core/table_grid.py
+PRISM Phase 1.0 - Table Grid (Row/Column Separators + Cell Rectangles)
+
+✅ 기능:
+1. TableGrid: 표 1개의 경계 상자 / 행·열 구분선 / 셀 사각형 / 격자→셀 인덱스 (NumPy 배열)
+   - 좌표는 페이지 너비/높이 대비 비율 (해상도 무관, QuickLayoutAnalyzer regions와 동일 기준)
+2. 래스터 검출 (grid_from_line_masks): 가로/세로선 마스크의 상자 안 투영 프로파일 → 구분선,
+   구분선 사이 선분별 괘선 유무 → 병합 셀 (격자 그래프 연결 요소)
+3. 괘선 없는 바깥 테두리 (좌우 테두리 없는 표) → 상자 경계를 구분선으로 보완
+4. 벡터 괘선 (extract_vector_lines): 디지털 PDF의 경로 객체(선/얇은 사각형)를 pypdfium2로 직접 읽어
+   렌더링 없이 가로/세로 괘선 목록 → 저해상도 괘선 마스크 → 래스터와 같은 격자 로직 (source='vector')
+   - 페이지 대부분이 이미지(스캔)이면 needs_raster → 렌더링 이미지 래스터 검출로 Fallback
+
+사용 예:
+    grid = hints['tables'][0]
+    px = grid.to_pixels(width, height)         # (N, 4) 셀 픽셀 좌표
+    for x0, y0, x1, y1 in px: ...              # 셀별 크롭 / OCR
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import ctypes
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pypdfium2.raw as pdfium_c
+
+logger = logging.getLogger(__name__)
+
+# 구분선 판정: 상자 폭/높이 대비 괘선 픽셀 비율 (부분 괘선도 구분선 후보, 병합 여부는 선분별 판정)
+SEPARATOR_MIN_COVERAGE = 0.25
+
+# 셀 경계 선분에 괘선이 있다고 볼 최소 비율 (미만이면 양쪽 셀 병합)
+SEGMENT_MIN_COVERAGE = 0.5
+
+# 벡터 괘선: 축 정렬 허용 오차 / 괘선으로 볼 채움 사각형 최대 두께 / 최소 길이 (pt)
+VECTOR_AXIS_TOLERANCE = 0.5
+VECTOR_MAX_THICKNESS = 2.5
+VECTOR_MIN_LENGTH = 3.0
+
+# 이미지 객체가 페이지의 이 비율 이상을 덮으면 스캔(래스터) 페이지로 보고 래스터 검출 사용
+RASTER_IMAGE_MIN_COVERAGE = 0.25
+
+# Form XObject 재귀 깊이 (pypdfium2 get_objects 기본값과 동일)
+VECTOR_MAX_DEPTH = 2
+
+
+@dataclass
+class TableGrid:
+    """
+    표 격자 (좌표는 페이지 대비 0~1 비율)
+
+    Attributes:
+        bbox: (4,) [x0, y0, x1, y1] 표 바깥 구분선 기준 경계 상자
+        rows: (R+1,) 가로 구분선 y (위→아래, 바깥 테두리 포함)
+        cols: (C+1,) 세로 구분선 x (왼쪽→오른쪽, 바깥 테두리 포함)
+        cells: (N, 4) 셀 사각형 [x0, y0, x1, y1] (병합 셀은 1개, 행 우선 순서)
+        cell_index: (R, C) 격자 칸 → cells 행 번호 (병합된 칸은 같은 번호)
+        source: 'raster' (괘선 마스크) | 'vector' (PDF 경로 객체)
+    """
+    bbox: np.ndarray
+    rows: np.ndarray
+    cols: np.ndarray
+    cells: np.ndarray
+    cell_index: np.ndarray
+    source: str = 'raster'
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(행 수, 열 수)"""
+        return self.cell_index.shape
+
+    @property
+    def merged_cells(self) -> int:
+        """2칸 이상 병합된 셀 수"""
+        return int(np.count_nonzero(np.bincount(self.cell_index.ravel()) > 1))
+
+    def to_pixels(self, width: int, height: int) -> np.ndarray:
+        """셀 사각형 → 픽셀 좌표 (N, 4) int32 (해당 해상도 이미지 크롭용)"""
+        scale = np.array([width, height, width, height], dtype=np.float64)
+        return np.rint(self.cells * scale).astype(np.int32)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 (체크포인트)"""
+        return {
+            'bbox': self.bbox.round(4).tolist(),
+            'rows': self.rows.round(4).tolist(),
+            'cols': self.cols.round(4).tolist(),
+            'cells': self.cells.round(4).tolist(),
+            'cell_index': self.cell_index.tolist(),
+            'source': self.source
+        }
+
+
+def ruling_positions(coverage: np.ndarray, join: int, min_coverage: float) -> np.ndarray:
+    """
+    투영 프로파일 → 괘선 중심 위치 (join px 이내 연속 구간은 괘선 1개: 선 양쪽 엣지 / 끊긴 조각)
+
+    Args:
+        coverage: 행(또는 열)별 괘선 픽셀 비율
+        join: 같은 괘선으로 볼 최대 간격 px
+        min_coverage: 괘선으로 볼 최소 비율
+
+    Returns:
+        (K,) float64 중심 좌표
+    """
+    positions = np.flatnonzero(coverage >= min_coverage)
+    if positions.size == 0:
+        return np.empty(0, dtype=np.float64)
+    breaks = np.flatnonzero(np.diff(positions) > join)
+    starts = np.concatenate(([positions[0]], positions[breaks + 1]))
+    ends = np.concatenate((positions[breaks], [positions[-1]]))
+    return (starts + ends) / 2.0
+
+
+def _with_borders(positions: np.ndarray, length: int, join: int) -> np.ndarray:
+    """바깥 테두리 괘선이 없으면 상자 경계를 구분선으로 추가"""
+    if positions.size == 0 or positions[0] > join:
+        positions = np.concatenate(([0.0], positions))
+    if positions[-1] < length - 1 - join:
+        positions = np.concatenate((positions, [float(length - 1)]))
+    return positions
+
+
+def _segment_coverage(lines: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """
+    괘선 밴드 (K, L) bool → 구간 [bounds[i], bounds[i+1]) 별 괘선 비율 (K, len(bounds)-1)
+    """
+    cumulative = np.concatenate((np.zeros((lines.shape[0], 1)), np.cumsum(lines, axis=1)), axis=1)
+    edges = np.clip(np.rint(bounds).astype(np.intp), 0, lines.shape[1])
+    lengths = np.maximum(1, np.diff(edges))
+    return (cumulative[:, edges[1:]] - cumulative[:, edges[:-1]]) / lengths
+
+
+def _bands(mask: np.ndarray, centers: np.ndarray, half: int) -> np.ndarray:
+    """구분선 중심 ± half px 밴드 안에 괘선 픽셀이 있는지 (K, 길이) bool (mask 행 방향)"""
+    limit = mask.shape[0]
+    return np.stack([
+        mask[max(0, int(c) - half):min(limit, int(c) + half + 1)].any(axis=0)
+        for c in centers
+    ]) if centers.size else np.zeros((0, mask.shape[1]), dtype=bool)
+
+
+def merge_cells(h_walls: np.ndarray, v_walls: np.ndarray) -> np.ndarray:
+    """
+    내부 괘선 유무 → 병합 셀 라벨
+
+    격자 칸을 노드, 괘선 없는 경계를 간선으로 보는 (2R-1)x(2C-1) 격자 이미지의 4-연결 요소.
+
+    Args:
+        h_walls: (R-1, C) 행 사이 가로 괘선 존재 여부
+        v_walls: (R, C-1) 열 사이 세로 괘선 존재 여부
+
+    Returns:
+        (R, C) int32 셀 번호 (0부터, 행 우선 첫 등장 순서)
+    """
+    n_rows, n_cols = v_walls.shape[0], h_walls.shape[1]
+    lattice = np.zeros((2 * n_rows - 1, 2 * n_cols - 1), dtype=np.uint8)
+    lattice[::2, ::2] = 1
+    lattice[::2, 1::2] = ~v_walls
+    lattice[1::2, ::2] = ~h_walls
+    _, labels = cv2.connectedComponents(lattice, connectivity=4)
+    return (labels[::2, ::2] - 1).astype(np.int32)
+
+
+def cell_rectangles(cell_index: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """셀 번호 격자 → 셀 사각형 (N, 4) [x0, y0, x1, y1] (병합 셀은 칸들의 경계 상자)"""
+    count = int(cell_index.max()) + 1
+    row_idx, col_idx = np.indices(cell_index.shape)
+    labels = cell_index.ravel()
+
+    top = np.full(count, cell_index.shape[0], dtype=np.intp)
+    left = np.full(count, cell_index.shape[1], dtype=np.intp)
+    bottom = np.zeros(count, dtype=np.intp)
+    right = np.zeros(count, dtype=np.intp)
+    np.minimum.at(top, labels, row_idx.ravel())
+    np.minimum.at(left, labels, col_idx.ravel())
+    np.maximum.at(bottom, labels, row_idx.ravel() + 1)
+    np.maximum.at(right, labels, col_idx.ravel() + 1)
+
+    return np.stack([cols[left], rows[top], cols[right], rows[bottom]], axis=1)
+
+
+def grid_from_line_masks(
+    horizontal: np.ndarray,
+    vertical: np.ndarray,
+    box: Tuple[int, int, int, int],
+    join: int
+) -> Optional[TableGrid]:
+    """
+    래스터 표 격자 (상자 1개)
+
+    Args:
+        horizontal / vertical: 연결 거리만큼 팽창한 가로/세로선 마스크 (페이지 전체)
+        box: (x, y, w, h) 표 후보 연결 요소 px
+        join: 연결 거리 px (같은 괘선으로 볼 간격, 구분선 밴드 폭)
+
+    Returns:
+        TableGrid (구분선이 2개 미만이면 None)
+    """
+    height, width = horizontal.shape[:2]
+    x, y, w, h = box
+    h_box = horizontal[y:y + h, x:x + w] > 0
+    v_box = vertical[y:y + h, x:x + w] > 0
+
+    rows = _with_borders(ruling_positions(h_box.mean(axis=1), join, SEPARATOR_MIN_COVERAGE), h, join)
+    cols = _with_borders(ruling_positions(v_box.mean(axis=0), join, SEPARATOR_MIN_COVERAGE), w, join)
+    if rows.size < 2 or cols.size < 2:
+        return None
+
+    # 내부 구분선의 칸 경계 선분별 괘선 유무 → 병합 셀
+    half = max(1, join // 2)
+    h_walls = _segment_coverage(_bands(h_box, rows[1:-1], half), cols) >= SEGMENT_MIN_COVERAGE
+    v_walls = (_segment_coverage(_bands(v_box.T, cols[1:-1], half), rows) >= SEGMENT_MIN_COVERAGE).T
+    cell_index = merge_cells(h_walls, v_walls)
+
+    # 상자 px → 페이지 비율
+    rows_abs = (rows + y) / height
+    cols_abs = (cols + x) / width
+    cells = cell_rectangles(cell_index, rows_abs, cols_abs)
+
+    return TableGrid(
+        bbox=np.array([cols_abs[0], rows_abs[0], cols_abs[-1], rows_abs[-1]]),
+        rows=rows_abs,
+        cols=cols_abs,
+        cells=cells,
+        cell_index=cell_index
+    )
+
+
+# ============================================================
+# 벡터 괘선 (PDF 경로 객체)
+# ============================================================
+
+@dataclass
+class VectorLines:
+    """
+    페이지 벡터 괘선 (좌표는 페이지 대비 0~1 비율, 왼쪽 위 원점 = 렌더링 이미지와 같은 기준)
+
+    Attributes:
+        horizontal: (N, 3) [y, x0, x1] 가로 괘선
+        vertical: (M, 3) [x, y0, y1] 세로 괘선
+        page_size: (너비, 높이) pt
+        image_coverage: 이미지 객체 경계 상자 면적 합 / 페이지 면적 (최대 1)
+    """
+    horizontal: np.ndarray
+    vertical: np.ndarray
+    page_size: Tuple[float, float]
+    image_coverage: float = 0.0
+
+    @property
+    def needs_raster(self) -> bool:
+        """스캔 페이지 (페이지 대부분이 이미지) → 벡터 괘선 대신 래스터 검출"""
+        return self.image_coverage >= RASTER_IMAGE_MIN_COVERAGE
+
+    def to_masks(self, px_per_pt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        괘선 → (horizontal, vertical) uint8 마스크 (선 폭 1px, 해상도 px_per_pt)
+
+        래스터 검출의 가로/세로선 마스크와 같은 형식 (QuickLayoutAnalyzer._detect_regions 입력).
+        """
+        width = max(1, int(round(self.page_size[0] * px_per_pt)))
+        height = max(1, int(round(self.page_size[1] * px_per_pt)))
+        size = np.array([width - 1, height - 1, width - 1], dtype=np.float64)
+        horizontal = np.zeros((height, width), dtype=np.uint8)
+        vertical = np.zeros((height, width), dtype=np.uint8)
+        for y, x0, x1 in np.rint(self.horizontal * size[[1, 0, 0]]).astype(np.intp):
+            horizontal[y, x0:x1 + 1] = 255
+        for x, y0, y1 in np.rint(self.vertical * size[[0, 1, 1]]).astype(np.intp):
+            vertical[y0:y1 + 1, x] = 255
+        return horizontal, vertical
+
+
+def _object_matrix(obj) -> np.ndarray:
+    """페이지 객체 변환 행렬 (3x3, 열벡터 [x, y, 1])"""
+    m = pdfium_c.FS_MATRIX()
+    if not pdfium_c.FPDFPageObj_GetMatrix(obj, m):
+        return np.eye(3)
+    return np.array([[m.a, m.c, m.e], [m.b, m.d, m.f], [0.0, 0.0, 1.0]])
+
+
+def _object_bounds(obj, matrix: np.ndarray) -> Optional[np.ndarray]:
+    """객체 경계 상자 → 페이지 좌표 모서리 (4, 2) (matrix: 상위 Form 변환)"""
+    left, bottom, right, top = (ctypes.c_float() for _ in range(4))
+    if not pdfium_c.FPDFPageObj_GetBounds(obj, left, bottom, right, top):
+        return None
+    corners = np.array([[left.value, bottom.value, 1.0], [right.value, bottom.value, 1.0],
+                        [right.value, top.value, 1.0], [left.value, top.value, 1.0]])
+    return (corners @ matrix.T)[:, :2]
+
+
+def _path_segments(path) -> List[np.ndarray]:
+    """
+    경로 객체 → 직선 구간 [(x0, y0, x1, y1)] (경로 좌표, 베지어 제외, closepath 포함)
+    """
+    segments = []
+    start = current = None
+    x, y = ctypes.c_float(), ctypes.c_float()
+    for i in range(pdfium_c.FPDFPath_CountSegments(path)):
+        segment = pdfium_c.FPDFPath_GetPathSegment(path, i)
+        if not pdfium_c.FPDFPathSegment_GetPoint(segment, x, y):
+            continue
+        point = (x.value, y.value)
+        kind = pdfium_c.FPDFPathSegment_GetType(segment)
+        if kind == pdfium_c.FPDF_SEGMENT_LINETO and current is not None:
+            segments.append(current + point)
+        elif kind == pdfium_c.FPDF_SEGMENT_MOVETO:
+            start = point
+        current = point
+        if pdfium_c.FPDFPathSegment_GetClose(segment) and start is not None and start != current:
+            segments.append(current + start)
+            current = start
+    return segments
+
+
+def _iter_objects(parent, count, get, matrix: np.ndarray, depth: int):
+    """페이지/Form 객체 재귀 → (객체, 종류, 페이지 좌표 변환 행렬)"""
+    for i in range(count(parent)):
+        obj = get(parent, i)
+        if obj is None:
+            continue
+        kind = pdfium_c.FPDFPageObj_GetType(obj)
+        if kind == pdfium_c.FPDF_PAGEOBJ_FORM:
+            if depth < VECTOR_MAX_DEPTH - 1:
+                yield from _iter_objects(
+                    obj, pdfium_c.FPDFFormObj_CountObjects, pdfium_c.FPDFFormObj_GetObject,
+                    matrix @ _object_matrix(obj), depth + 1
+                )
+            continue
+        yield obj, kind, matrix
+
+
+def extract_vector_lines(page) -> Optional[VectorLines]:
+    """
+    pypdfium2 페이지 → 벡터 괘선 (렌더링 없음)
+
+    - 그리기(stroke) 경로: 축 정렬 직선 구간 (선, 사각형 테두리)
+    - 채우기만 하는 경로: 얇은 사각형 (두께 VECTOR_MAX_THICKNESS pt 이하)만 괘선 (셀 배경 제외)
+    - 이미지 객체: 면적 비율만 집계 (스캔 페이지 판정)
+
+    Args:
+        page: pypdfium2.PdfPage
+
+    Returns:
+        VectorLines (회전된 페이지는 None → 래스터 검출)
+    """
+    if page.get_rotation():
+        return None
+    left, bottom, right, top = page.get_cropbox()
+    width, height = right - left, top - bottom
+    if width <= 0 or height <= 0:
+        return None
+
+    horizontal, vertical = [], []
+    image_area = 0.0
+    fill, stroke = ctypes.c_int(), ctypes.c_int()
+    for obj, kind, matrix in _iter_objects(
+        page, pdfium_c.FPDFPage_CountObjects, pdfium_c.FPDFPage_GetObject, np.eye(3), 0
+    ):
+        if kind == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+            corners = _object_bounds(obj, matrix)
+            if corners is not None:
+                extent = corners.max(axis=0) - corners.min(axis=0)
+                image_area += float(extent[0] * extent[1])
+            continue
+        if kind != pdfium_c.FPDF_PAGEOBJ_PATH or not pdfium_c.FPDFPath_GetDrawMode(obj, fill, stroke):
+            continue
+
+        transform = matrix @ _object_matrix(obj)
+        if stroke.value:
+            segments = _path_segments(obj)
+            if not segments:
+                continue
+            points = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        elif fill.value:
+            corners = _object_bounds(obj, matrix)
+            if corners is None:
+                continue
+            (x0, y0), (x1, y1) = corners.min(axis=0), corners.max(axis=0)
+            if min(x1 - x0, y1 - y0) > VECTOR_MAX_THICKNESS:
+                continue
+            # 얇은 채움 사각형 → 중심선 1개 (경계 상자가 이미 페이지 좌표)
+            transform = np.eye(3)
+            if x1 - x0 >= y1 - y0:
+                points = np.array([[x0, (y0 + y1) / 2], [x1, (y0 + y1) / 2]])
+            else:
+                points = np.array([[(x0 + x1) / 2, y0], [(x0 + x1) / 2, y1]])
+        else:
+            continue
+
+        # 경로 좌표 → 페이지 좌표 → 왼쪽 위 원점 pt
+        page_points = np.c_[points, np.ones(len(points))] @ transform.T
+        xs = page_points[:, 0] - left
+        ys = top - page_points[:, 1]
+        x_a, y_a, x_b, y_b = xs[0::2], ys[0::2], xs[1::2], ys[1::2]
+        dx, dy = np.abs(x_b - x_a), np.abs(y_b - y_a)
+
+        is_h = (dy <= VECTOR_AXIS_TOLERANCE) & (dx >= VECTOR_MIN_LENGTH)
+        is_v = (dx <= VECTOR_AXIS_TOLERANCE) & (dy >= VECTOR_MIN_LENGTH)
+        horizontal.append(np.c_[(y_a + y_b)[is_h] / 2, np.minimum(x_a, x_b)[is_h], np.maximum(x_a, x_b)[is_h]])
+        vertical.append(np.c_[(x_a + x_b)[is_v] / 2, np.minimum(y_a, y_b)[is_v], np.maximum(y_a, y_b)[is_v]])
+
+    scale_h = np.array([height, width, width])
+    scale_v = np.array([width, height, height])
+    return VectorLines(
+        horizontal=np.clip(np.concatenate(horizontal) / scale_h, 0.0, 1.0) if horizontal else np.empty((0, 3)),
+        vertical=np.clip(np.concatenate(vertical) / scale_v, 0.0, 1.0) if vertical else np.empty((0, 3)),
+        page_size=(float(width), float(height)),
+        image_coverage=min(1.0, image_area / (width * height))
+    )
@@ -0,0 +1,287 @@
+"""
+core/text_geometry.py
+PRISM Phase 1.0 - Geometry-Aware Text Layer (Character/Word Boxes → Lines / Columns / Table Cells)
+
+✅ 기능:
+1. extract_page_words: pypdfium2 TextPage 글자 상자 → 단어 (텍스트 + 경계 상자 NumPy 배열)
+   - 공백/줄바꿈 문자, 글자 간격, 기준선 변화로 단어 분리 (content stream 순서와 무관)
+2. 줄 클러스터링 (PageWords.line_labels): 세로 중심이 줄 높이의 절반 이내인 단어 = 같은 줄
+3. 열 클러스터링 (column_separators): 줄들의 x 점유 프로파일에서 빈 구간 → 열 구분선
+4. 표 셀 배정 (table_rows): TableGrid (벡터/래스터 괘선 또는 text_grid) 셀에 단어 중심을 배정
+   → 행 x 열 셀 텍스트 (병합 셀은 덮는 칸마다 반복)
+5. text_grid: 괘선 없는 표 → 줄/열 클러스터로 격자 생성 (source='text')
+
+좌표는 페이지 너비/높이 대비 0~1 비율, 왼쪽 위 원점 (TableGrid / 렌더링 이미지와 같은 기준).
+
+사용 예:
+    words = processor.extract_words(pdf_path, page_num)
+    _, grids = analyzer.detect_vector_regions(processor.extract_vector_lines(pdf_path, page_num))
+    rows = table_rows(words, grids[0])          # [['구분', '인원'], ['1', '5번까지'], ...]
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pypdfium2.raw as pdfium_c
+
+try:
+    from .table_grid import TableGrid
+except ImportError:
+    from core.table_grid import TableGrid
+
+logger = logging.getLogger(__name__)
+
+# 단어 분리: 글자 간격 > 글자 높이 x 비율
+WORD_GAP_RATIO = 0.25
+
+# 같은 줄: 세로 중심 차이 ≤ 줄 높이 x 비율
+LINE_OVERLAP_RATIO = 0.5
+
+# 열 구분: 빈 구간 최소 폭 (pt), 스팬 제목 등 허용 점유 비율 (구간을 덮는 줄 수 / 전체 줄 수)
+COLUMN_MIN_GAP = 8.0
+COLUMN_MAX_OCCUPANCY = 0.1
+
+_WHITESPACE = {0x20, 0x09, 0x0A, 0x0D, 0xA0, 0x3000, 0xFFFE}
+
+
+@dataclass
+class PageWords:
+    """
+    페이지 단어 (좌표는 페이지 대비 0~1 비율, 왼쪽 위 원점)
+
+    Attributes:
+        text: 단어 문자열 (N개, 텍스트 레이어 순서)
+        boxes: (N, 4) [x0, y0, x1, y1] 단어 경계 상자
+        page_size: (너비, 높이) pt
+    """
+    text: List[str]
+    boxes: np.ndarray
+    page_size: Tuple[float, float]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def subset(self, mask: np.ndarray) -> "PageWords":
+        """불리언 마스크 / 인덱스 배열로 단어 선택"""
+        index = np.flatnonzero(mask) if mask.dtype == bool else mask
+        return PageWords([self.text[i] for i in index], self.boxes[index], self.page_size)
+
+    def within(self, bbox: Sequence[float]) -> "PageWords":
+        """중심이 bbox [x0, y0, x1, y1] 안에 있는 단어"""
+        x0, y0, x1, y1 = bbox
+        cx = (self.boxes[:, 0] + self.boxes[:, 2]) / 2
+        cy = (self.boxes[:, 1] + self.boxes[:, 3]) / 2
+        return self.subset((cx >= x0) & (cx <= x1) & (cy >= y0) & (cy <= y1))
+
+    def line_labels(self) -> np.ndarray:
+        """
+        줄 번호 (N,) int (위→아래 0부터)
+
+        세로 중심 오름차순으로 정렬 후, 직전 단어와 중심 차이가 두 단어 높이 중 작은 값의
+        LINE_OVERLAP_RATIO 배를 넘으면 새 줄 (같은 높이의 좌우 열 단어는 같은 줄 = 표의 한 행).
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        cy = (self.boxes[:, 1] + self.boxes[:, 3]) / 2
+        height = self.boxes[:, 3] - self.boxes[:, 1]
+        order = np.argsort(cy, kind='stable')
+        limit = np.minimum(height[order][1:], height[order][:-1]) * LINE_OVERLAP_RATIO
+        starts = np.concatenate(([0], np.cumsum(np.diff(cy[order]) > limit)))
+        labels = np.empty(len(self), dtype=np.intp)
+        labels[order] = starts
+        return labels
+
+    def reading_order(self) -> np.ndarray:
+        """줄 → 왼쪽부터 정렬 인덱스"""
+        return np.lexsort((self.boxes[:, 0], self.line_labels()))
+
+    def lines(self) -> List[str]:
+        """줄별 텍스트 (단어는 공백으로 연결)"""
+        labels = self.line_labels()
+        lines: List[List[str]] = [[] for _ in range(int(labels.max()) + 1)] if len(self) else []
+        for i in self.reading_order():
+            lines[labels[i]].append(self.text[i])
+        return [' '.join(words) for words in lines]
+
+
+def _split_words(codes: np.ndarray, boxes: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    글자 배열 → 단어 구간 [(start, end)] (공백 글자 제외)
+
+    경계: 공백/줄바꿈 글자, 글자 간격 > WORD_GAP_RATIO x 높이, 왼쪽으로 되돌아감, 기준선 변화
+    """
+    visible = np.array([code not in _WHITESPACE for code in codes.tolist()], dtype=bool)
+    visible &= (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+    index = np.flatnonzero(visible)
+    if index.size == 0:
+        return []
+
+    box = boxes[index]
+    height = box[:, 3] - box[:, 1]
+    gap = box[1:, 0] - box[:-1, 2]
+    limit = np.minimum(height[1:], height[:-1])
+    breaks = (
+        (np.diff(index) > 1)                                   # 사이에 공백/제외 글자
+        | (gap > limit * WORD_GAP_RATIO)                       # 글자 간격
+        | (box[1:, 0] < box[:-1, 0] - limit)                   # 왼쪽으로 되돌아감 (다음 줄/열)
+        | (np.abs(box[1:, 3] - box[:-1, 3]) > limit * LINE_OVERLAP_RATIO)  # 기준선 변화
+    )
+    starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+    ends = np.concatenate((starts[1:], [index.size]))
+    return [(int(index[s]), int(index[e - 1]) + 1) for s, e in zip(starts, ends)]
+
+
+def extract_page_words(page) -> Optional[PageWords]:
+    """
+    pypdfium2 페이지 → 단어 + 경계 상자 (TextPage 글자 상자 기반)
+
+    Args:
+        page: pypdfium2.PdfPage
+
+    Returns:
+        PageWords (회전된 페이지는 None - 렌더링 좌표와 불일치)
+    """
+    if page.get_rotation():
+        return None
+    left, bottom, right, top = page.get_cropbox()
+    width, height = right - left, top - bottom
+
+    textpage = page.get_textpage()
+    try:
+        count = textpage.count_chars()
+        codes = np.array([pdfium_c.FPDFText_GetUnicode(textpage, i) for i in range(count)], dtype=np.int64)
+        # loose: 폰트 ascent/descent 기준 상자 → 같은 줄 글자 높이 일정
+        boxes = np.array([textpage.get_charbox(i, loose=True) for i in range(count)], dtype=np.float64)
+    finally:
+        textpage.close()
+
+    if count == 0:
+        return PageWords([], np.empty((0, 4)), (float(width), float(height)))
+
+    # PDF (left, bottom, right, top) → 왼쪽 위 원점 (x0, y0, x1, y1) pt
+    boxes = np.stack([boxes[:, 0] - left, top - boxes[:, 3], boxes[:, 2] - left, top - boxes[:, 1]], axis=1)
+
+    spans = _split_words(codes, boxes)
+    text = [''.join(map(chr, codes[s:e].tolist())).replace('\r', '').replace('\n', '') for s, e in spans]
+    word_boxes = np.array([
+        [boxes[s:e, 0].min(), boxes[s:e, 1].min(), boxes[s:e, 2].max(), boxes[s:e, 3].max()] for s, e in spans
+    ]).reshape(-1, 4)
+    scale = np.array([width, height, width, height])
+    return PageWords(text, np.clip(word_boxes / scale, 0.0, 1.0), (float(width), float(height)))
+
+
+def column_separators(words: PageWords, x_range: Tuple[float, float]) -> np.ndarray:
+    """
+    열 구분선 x (페이지 비율) - 줄별 단어 점유 프로파일의 빈 구간 중심
+
+    1pt 해상도로 각 x를 덮는 줄 수를 세어, COLUMN_MAX_OCCUPANCY 이하인 구간이
+    COLUMN_MIN_GAP pt 이상 이어지면 열 경계 (여러 열에 걸친 제목 줄은 허용).
+
+    Args:
+        words: 표 영역 단어
+        x_range: (x0, x1) 표 영역 좌우 경계 (페이지 비율)
+
+    Returns:
+        (K,) 내부 열 구분선 (바깥 경계 제외)
+    """
+    if not len(words):
+        return np.empty(0)
+    page_width = words.page_size[0]
+    x0, x1 = x_range
+    size = max(1, int(np.ceil((x1 - x0) * page_width)))
+
+    labels = words.line_labels()
+    n_lines = int(labels.max()) + 1
+    # 줄별 점유 (같은 줄 단어 겹침은 1회) → 줄 수 프로파일
+    occupied = np.zeros((n_lines, size + 1), dtype=np.int32)
+    starts = np.clip(np.floor((words.boxes[:, 0] - x0) * page_width).astype(np.intp), 0, size)
+    ends = np.clip(np.ceil((words.boxes[:, 2] - x0) * page_width).astype(np.intp), 0, size)
+    np.add.at(occupied, (labels, starts), 1)
+    np.add.at(occupied, (labels, ends), -1)
+    profile = (np.cumsum(occupied, axis=1)[:, :size] > 0).sum(axis=0)
+
+    empty = profile <= n_lines * COLUMN_MAX_OCCUPANCY
+    # 빈 구간 (앞뒤 여백 제외)
+    edges = np.diff(np.concatenate(([0], empty.astype(np.int8), [0])))
+    run_starts, run_ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    inner = (run_starts > 0) & (run_ends < size) & (run_ends - run_starts >= COLUMN_MIN_GAP)
+    centers = (run_starts[inner] + run_ends[inner]) / 2.0
+    return x0 + centers / page_width
+
+
+def text_grid(words: PageWords, bbox: Sequence[float]) -> Optional[TableGrid]:
+    """
+    괘선 없는 표 → 줄/열 클러스터 격자 (source='text', 병합 셀 없음)
+
+    Args:
+        words: 페이지 단어
+        bbox: [x0, y0, x1, y1] 표 영역 (페이지 비율)
+
+    Returns:
+        TableGrid (줄 또는 열이 1개 이하이면 None)
+    """
+    region = words.within(bbox)
+    if not len(region):
+        return None
+    x0, y0, x1, y1 = bbox
+
+    labels = region.line_labels()
+    n_lines = int(labels.max()) + 1
+    tops = np.full(n_lines, np.inf)
+    bottoms = np.full(n_lines, -np.inf)
+    np.minimum.at(tops, labels, region.boxes[:, 1])
+    np.maximum.at(bottoms, labels, region.boxes[:, 3])
+    rows = np.concatenate(([y0], (bottoms[:-1] + tops[1:]) / 2, [y1]))
+    cols = np.concatenate(([x0], column_separators(region, (x0, x1)), [x1]))
+    if n_lines < 2 or cols.size < 3:
+        return None
+
+    cell_index = np.arange(n_lines * (cols.size - 1), dtype=np.int32).reshape(n_lines, cols.size - 1)
+    row_idx, col_idx = np.indices(cell_index.shape)
+    cells = np.stack([cols[col_idx.ravel()], rows[row_idx.ravel()],
+                      cols[col_idx.ravel() + 1], rows[row_idx.ravel() + 1]], axis=1)
+    return TableGrid(
+        bbox=np.array([x0, y0, x1, y1], dtype=np.float64),
+        rows=rows,
+        cols=cols,
+        cells=cells,
+        cell_index=cell_index,
+        source='text'
+    )
+
+
+def cell_texts(words: PageWords, grid: TableGrid) -> List[str]:
+    """
+    셀별 텍스트 (grid.cells 순서) - 단어 중심이 속한 격자 칸 → 셀 번호, 셀 안에서는 줄 → 왼쪽부터
+
+    Returns:
+        len(grid.cells)개 문자열 (빈 셀은 '')
+    """
+    texts: List[List[str]] = [[] for _ in range(len(grid.cells))]
+    region = words.within(grid.bbox)
+    if not len(region):
+        return [''] * len(grid.cells)
+
+    cx = (region.boxes[:, 0] + region.boxes[:, 2]) / 2
+    cy = (region.boxes[:, 1] + region.boxes[:, 3]) / 2
+    rows = np.clip(np.searchsorted(grid.rows, cy, side='right') - 1, 0, grid.shape[0] - 1)
+    cols = np.clip(np.searchsorted(grid.cols, cx, side='right') - 1, 0, grid.shape[1] - 1)
+    labels = grid.cell_index[rows, cols]
+
+    for i in region.reading_order():
+        texts[labels[i]].append(region.text[i])
+    return [' '.join(parts) for parts in texts]
+
+
+def table_rows(words: PageWords, grid: TableGrid) -> List[List[str]]:
+    """
+    표 → 행 x 열 셀 텍스트 (병합 셀 텍스트는 덮는 칸마다 반복 → 행 단위로 독립 해석 가능)
+    """
+    texts = cell_texts(words, grid)
+    return [[texts[label] for label in row] for row in grid.cell_index.tolist()]
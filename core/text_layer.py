@@ -0,0 +1,406 @@
+"""
+core/text_layer.py
+PRISM Phase 1.0 - PDF Text Layer Extractor (Pluggable Backend)
+
+✅ 기능:
+1. 백엔드 레지스트리: pdfium (기본, 네이티브 TextPage) / pypdf (대체)
+2. pdfium 백엔드: 대용량 문서는 프로세스 풀 병렬 추출 (워커별 문서 핸들)
+3. 페이지별 텍스트 + 페이지 시작 오프셋 반환 (PdfTextLayer)
+4. (PDF SHA-256, 백엔드) 키 디스크 캐시
+5. PageOffsetIndex: 문자 오프셋 → 페이지 번호 (bisect), 텍스트 정제 후에도 추적
+
+환경 변수:
+- PRISM_TEXT_BACKEND: 기본 백엔드 (pdfium | pypdf)
+- PRISM_TEXT_WORKERS: pdfium 추출 프로세스 수 (기본: CPU 수, 최대 4)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import json
+import bisect
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from .disk_cache import DiskCache, file_sha256, get_cache
+except ImportError:
+    from core.disk_cache import DiskCache, file_sha256, get_cache
+
+logger = logging.getLogger(__name__)
+
+# 페이지 연결 구분자 (기존 extract_pdf_text_layer 출력 형식 유지)
+PAGE_SEPARATOR = '\n\n'
+
+
+class PageOffsetIndex:
+    """
+    문자 오프셋 → 페이지 번호 인덱스
+
+    페이지 시작 오프셋 배열을 bisect로 조회.
+    텍스트 정제(라인/개행 삭제)로 오프셋이 바뀌면 after_removals()로
+    삭제 구간을 반영한 새 인덱스를 만들어 청크까지 페이지 정보를 유지.
+    """
+
+    def __init__(self, page_starts: Sequence[int]):
+        """
+        초기화
+
+        Args:
+            page_starts: 페이지별 시작 오프셋 (0-based 페이지 순서, 비감소)
+        """
+        self.page_starts = list(page_starts)
+
+    def __len__(self) -> int:
+        return len(self.page_starts)
+
+    def page_at(self, offset: int) -> int:
+        """
+        오프셋이 속한 페이지 번호 (1-based)
+
+        빈 페이지는 다음 페이지와 시작 오프셋이 같으므로 내용이 있는 페이지가 선택됨.
+        """
+        if not self.page_starts:
+            return 1
+        return max(1, bisect.bisect_right(self.page_starts, max(0, offset)))
+
+    def page_span(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        [start, end) 구간의 (시작 페이지, 끝 페이지) - 1-based
+        """
+        return self.page_at(start), self.page_at(max(start, end - 1))
+
+    def after_removals(self, removed_spans: Iterable[Tuple[int, int]]) -> "PageOffsetIndex":
+        """
+        삭제 구간 반영 후 인덱스
+
+        Args:
+            removed_spans: 삭제 전 텍스트 기준 [start, end) 구간들 (겹치지 않음)
+
+        Returns:
+            삭제 후 텍스트 기준 새 PageOffsetIndex
+        """
+        spans = sorted(span for span in removed_spans if span[1] > span[0])
+        if not spans:
+            return PageOffsetIndex(self.page_starts)
+
+        span_starts = [s for s, _ in spans]
+        removed_before = [0]
+        for s, e in spans:
+            removed_before.append(removed_before[-1] + (e - s))
+
+        new_starts = []
+        for offset in self.page_starts:
+            i = bisect.bisect_right(span_starts, offset)
+            shift = removed_before[i]
+            if i and spans[i - 1][1] > offset:
+                # 삭제 구간 내부 → 구간 끝(삭제 후 같은 위치)으로 이동
+                shift -= spans[i - 1][1] - offset
+            new_starts.append(offset - shift)
+
+        return PageOffsetIndex(new_starts)
+
+
+def removed_line_spans(lines: Sequence[str], keep: Sequence[bool]) -> List[Tuple[int, int]]:
+    """
+    '\n'.join(lines)에서 keep=False 라인을 제거할 때 삭제되는 문자 구간
+
+    Args:
+        lines: text.split('\n') 결과
+        keep: 라인별 유지 여부
+
+    Returns:
+        원본 텍스트 기준 [start, end) 구간들 ('\n'.join(유지 라인) 결과와 일치)
+    """
+    spans = []
+    pos = 0
+    last = len(lines) - 1
+    last_kept_end = None
+
+    for i, (line, kept) in enumerate(zip(lines, keep)):
+        end = pos + len(line)
+        if kept:
+            last_kept_end = end
+        else:
+            # 라인 + 뒤 개행 (마지막 라인은 개행 없음)
+            spans.append((pos, end + 1 if i < last else end))
+        pos = end + 1
+
+    # 끝부분 라인들이 삭제되면 마지막 유지 라인 뒤 개행도 사라짐
+    if lines and not keep[last] and last_kept_end is not None:
+        spans.append((last_kept_end, last_kept_end + 1))
+
+    return spans
+
+
+@dataclass
+class PdfTextLayer:
+    """
+    PDF 텍스트 레이어
+
+    Attributes:
+        pages: 페이지별 텍스트 (0-based, 빈 페이지는 빈 문자열)
+        page_starts: text 내 각 페이지 시작 오프셋 (빈 페이지는 다음 페이지 위치)
+        text: 비어 있지 않은 페이지를 PAGE_SEPARATOR로 연결한 전체 텍스트
+        backend: 사용한 추출 백엔드
+    """
+    pages: List[str]
+    page_starts: List[int] = field(default_factory=list)
+    text: str = ""
+    backend: str = ""
+
+    @classmethod
+    def from_pages(cls, pages: List[str], backend: str) -> "PdfTextLayer":
+        """페이지별 텍스트 → 전체 텍스트 + 시작 오프셋"""
+        parts = []
+        page_starts = []
+        offset = 0
+
+        for page_text in pages:
+            if page_text:
+                if parts:
+                    offset += len(PAGE_SEPARATOR)
+                parts.append(page_text)
+                page_starts.append(offset)
+                offset += len(page_text)
+            else:
+                page_starts.append(None)
+
+        # 빈 페이지 → 다음 페이지 시작 위치 (마지막이면 텍스트 끝)
+        next_start = offset
+        for i in range(len(page_starts) - 1, -1, -1):
+            if page_starts[i] is None:
+                page_starts[i] = next_start
+            else:
+                next_start = page_starts[i]
+
+        return cls(
+            pages=pages,
+            page_starts=page_starts,
+            text=PAGE_SEPARATOR.join(parts),
+            backend=backend
+        )
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def page_index(self) -> PageOffsetIndex:
+        """text 기준 페이지 오프셋 인덱스"""
+        return PageOffsetIndex(self.page_starts)
+
+
+# ============================================================
+# pdfium 백엔드
+# ============================================================
+
+# 이 페이지 수 미만이면 프로세스 풀 기동 비용이 더 큼 → 순차 추출
+PARALLEL_MIN_PAGES = 64
+
+# 워커 프로세스별 PdfDocument 핸들 (initializer에서 1회 오픈)
+_WORKER_PDF = None
+
+
+def _normalize_pdfium_text(text: str) -> str:
+    """pdfium 줄바꿈(\\r\\n) → \\n (pypdf 출력과 동일 형식)"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _pdfium_lock():
+    """
+    ✅ Phase 1.0: pdf_processor와 공유하는 프로세스 전역 pdfium 락
+
+    pdfium은 스레드 안전하지 않음 → 같은 프로세스의 렌더링 (PagePipeline 준비 스레드)과
+    텍스트 추출 (분석 스레드의 지연 추출)을 직렬화. pypdf 백엔드만 쓰면 import하지 않음.
+    """
+    try:
+        from .pdf_processor import _PDFIUM_LOCK
+    except ImportError:
+        from core.pdf_processor import _PDFIUM_LOCK
+    return _PDFIUM_LOCK
+
+
+def _pdfium_page_texts(pdf, start: int, end: int) -> List[str]:
+    """0-based [start, end) 페이지 텍스트 (페이지 단위로 락 → 렌더링과 번갈아 실행)"""
+    lock = _pdfium_lock()
+    texts = []
+    for index in range(start, end):
+        with lock:
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                texts.append(_normalize_pdfium_text(
+                    textpage.get_text_range(0, textpage.count_chars())
+                ))
+            finally:
+                textpage.close()
+                page.close()
+    return texts
+
+
+def _init_text_worker(pdf_path: str) -> None:
+    """프로세스 풀 워커 초기화 (워커마다 문서 1회 오픈)"""
+    global _WORKER_PDF
+    import pypdfium2 as pdfium
+    with _pdfium_lock():
+        _WORKER_PDF = pdfium.PdfDocument(pdf_path)
+
+
+def _extract_text_range(start: int, end: int) -> Tuple[int, List[str]]:
+    """프로세스 풀 워커 진입점"""
+    return start, _pdfium_page_texts(_WORKER_PDF, start, end)
+
+
+def _default_workers() -> int:
+    return int(os.getenv("PRISM_TEXT_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+def extract_pages_pdfium(pdf_path: str, workers: Optional[int] = None) -> List[str]:
+    """
+    pypdfium2 네이티브 TextPage 추출
+
+    Args:
+        pdf_path: PDF 파일 경로
+        workers: 프로세스 수 (기본: PRISM_TEXT_WORKERS)
+
+    Returns:
+        페이지별 텍스트
+    """
+    import pypdfium2 as pdfium
+
+    workers = _default_workers() if workers is None else max(1, workers)
+    lock = _pdfium_lock()
+
+    # ✅ Phase 1.0: 프로세스 내 문서 열기/닫기도 pdf_processor와 같은 락 (렌더링 스레드와 경합 방지)
+    with lock:
+        pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        with lock:
+            page_count = len(pdf)
+        if workers <= 1 or page_count < PARALLEL_MIN_PAGES:
+            return _pdfium_page_texts(pdf, 0, page_count)
+    finally:
+        with lock:
+            pdf.close()
+
+    # 워커당 여러 구간으로 나눠 부하 분산 (페이지별 텍스트 양 편차 대응)
+    chunk = max(1, -(-page_count // (workers * 4)))
+    ranges = [(s, min(s + chunk, page_count)) for s in range(0, page_count, chunk)]
+
+    logger.info(f"   ⚡ pdfium 병렬 추출: {workers}개 프로세스, {len(ranges)}개 구간")
+
+    pages: List[str] = [""] * page_count
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_text_worker,
+        initargs=(pdf_path,)
+    ) as executor:
+        for start, texts in executor.map(_extract_text_range, *zip(*ranges)):
+            pages[start:start + len(texts)] = texts
+
+    return pages
+
+
+# ============================================================
+# pypdf 백엔드 (대체)
+# ============================================================
+
+def extract_pages_pypdf(pdf_path: str, workers: Optional[int] = None) -> List[str]:
+    """
+    pypdf 순수 Python 추출 (workers 무시)
+
+    Args:
+        pdf_path: PDF 파일 경로
+        workers: 미사용 (백엔드 시그니처 통일)
+
+    Returns:
+        페이지별 텍스트
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(pdf_path)
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+# ============================================================
+# 백엔드 레지스트리
+# ============================================================
+
+TextBackend = Callable[[str, Optional[int]], List[str]]
+
+_BACKENDS: Dict[str, TextBackend] = {
+    'pdfium': extract_pages_pdfium,
+    'pypdf': extract_pages_pypdf,
+}
+
+DEFAULT_BACKEND = 'pdfium'
+FALLBACK_BACKEND = 'pypdf'
+
+
+def register_backend(name: str, extractor: TextBackend) -> None:
+    """
+    텍스트 레이어 백엔드 등록
+
+    Args:
+        name: 백엔드 이름 (캐시 키에 포함)
+        extractor: (pdf_path, workers) → 페이지별 텍스트
+    """
+    _BACKENDS[name] = extractor
+
+
+def available_backends() -> List[str]:
+    return list(_BACKENDS)
+
+
+def extract_text_layer(
+    pdf_path: str,
+    backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True
+) -> PdfTextLayer:
+    """
+    PDF 텍스트 레이어 추출
+
+    Args:
+        pdf_path: PDF 파일 경로
+        backend: 'pdfium' | 'pypdf' | 등록된 이름 (기본: PRISM_TEXT_BACKEND 또는 pdfium)
+        workers: 병렬 추출 프로세스 수 (pdfium)
+        use_cache: 디스크 캐시 사용 여부
+
+    Returns:
+        PdfTextLayer
+
+    Raises:
+        ValueError: 등록되지 않은 백엔드
+    """
+    backend = backend or os.getenv("PRISM_TEXT_BACKEND", DEFAULT_BACKEND)
+    if backend not in _BACKENDS:
+        raise ValueError(f"알 수 없는 텍스트 백엔드: {backend} (사용 가능: {available_backends()})")
+
+    cache = get_cache('text') if use_cache else None
+    key = DiskCache.make_key('text', file_sha256(pdf_path), backend) if cache else None
+
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        logger.info(f"✅ PDF 텍스트 캐시 적중 ({backend})")
+        return PdfTextLayer.from_pages(json.loads(cached.decode('utf-8')), backend)
+
+    try:
+        pages = _BACKENDS[backend](pdf_path, workers)
+    except Exception as e:
+        if backend == FALLBACK_BACKEND:
+            raise
+        logger.warning(f"⚠️ {backend} 텍스트 추출 실패 → {FALLBACK_BACKEND} 대체: {e}")
+        return extract_text_layer(pdf_path, FALLBACK_BACKEND, workers, use_cache)
+
+    if cache:
+        cache.put(key, json.dumps(pages, ensure_ascii=False).encode('utf-8'))
+
+    return PdfTextLayer.from_pages(pages, backend)
@@ -7,6 +7,9 @@ Phase 0.8.5 핵심 수정:
 - ✅ 모든 위치에서 조문 감지 가능
 - ✅ 제4조 누락 및 제28조 유령 조문 문제 해결
 
+✅ Phase 1.0:
+- page_index 전달 시 조문 노드에 pages {start, end} 기록 (구분자 제거 오프셋 반영)
+
 Author: 마창수산팀
 Date: 2025-11-19
 Version: Phase 0.8.5 Pattern Fix
@@ -17,6 +20,11 @@ import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    from .text_layer import PageOffsetIndex, removed_line_spans
+except ImportError:
+    from core.text_layer import PageOffsetIndex, removed_line_spans
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,21 +79,41 @@ class TreeBuilder:
         self,
         markdown: str,
         document_title: str = "",
-        enacted_date: Optional[str] = None
+        enacted_date: Optional[str] = None,
+        page_index: Optional[PageOffsetIndex] = None
     ) -> Dict[str, Any]:
         """
         Markdown을 Tree로 변환
+        
+        Args:
+            markdown: 입력 텍스트
+            document_title: 문서 제목
+            enacted_date: 시행일
+            page_index: ✅ Phase 1.0: markdown 기준 페이지 오프셋 인덱스 (선택)
         """
         logger.info(f"🌲 TreeBuilder 시작: {document_title}")
         
         # 페이지 구분자 제거
-        markdown, removed_count = self._clean_page_dividers(markdown)
+        removed_spans: List[Tuple[int, int]] = []
+        markdown, removed_count = self._clean_page_dividers(markdown, removed_spans)
         logger.info(f"   🗑️ 페이지 구분자 제거: {removed_count}개 라인")
         
         # 조문 파싱
         articles = self._parse_articles(markdown)
         logger.info(f"   📄 조문 파싱 완료: {len(articles)}개")
         
+        # ✅ Phase 1.0: 조문별 페이지 범위
+        if page_index is not None:
+            page_index = page_index.after_removals(removed_spans)
+            for article in articles:
+                start = article['position']['start']
+                end = article['position']['end']
+                # 다음 조문 전 공백(페이지 경계 포함)은 제외
+                while end > start and markdown[end - 1].isspace():
+                    end -= 1
+                page_start, page_end = page_index.page_span(start, end)
+                article['pages'] = {'start': page_start, 'end': page_end}
+        
         # 메타데이터
         metadata = {
             'title': document_title,
@@ -105,10 +133,21 @@ class TreeBuilder:
         logger.info(f"✅ TreeBuilder 완료")
         return document
     
-    def _clean_page_dividers(self, markdown: str) -> Tuple[str, int]:
-        """페이지 구분자 제거"""
+    def _clean_page_dividers(
+        self,
+        markdown: str,
+        removed_spans: Optional[List[Tuple[int, int]]] = None
+    ) -> Tuple[str, int]:
+        """
+        페이지 구분자 제거
+        
+        Args:
+            markdown: 입력 텍스트
+            removed_spans: ✅ Phase 1.0: 삭제된 [start, end) 구간을 추가할 리스트 (선택)
+        """
         lines = markdown.split('\n')
         cleaned_lines = []
+        keep = []
         removed_count = 0
         
         for line in lines:
@@ -116,6 +155,7 @@ class TreeBuilder:
             
             if not line_stripped:
                 cleaned_lines.append(line)
+                keep.append(True)
                 continue
             
             is_divider = False
@@ -127,6 +167,10 @@ class TreeBuilder:
             
             if not is_divider:
                 cleaned_lines.append(line)
+            keep.append(not is_divider)
+        
+        if removed_spans is not None and removed_count:
+            removed_spans.extend(removed_line_spans(lines, keep))
         
         return '\n'.join(cleaned_lines), removed_count
     
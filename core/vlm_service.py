@@ -12,6 +12,16 @@ PRISM Phase 0.3.4 P0 - VLM Service (호환성 래퍼 추가)
 - VLM 실패 100% → Fallback만 사용하는 치명적 문제
 - GPT 분석: "P0-1 최우선 수정 사항"
 
+✅ Phase 1.0:
+- acall_with_image() / call_many(): asyncio 기반 동시 호출
+- 프로바이더/모델별 프로세스 전역 동시성 제한 (PRISM_VLM_CONCURRENCY로 조정, call_with_image()에서 획득),
+  결과는 요청 순서 유지
+- 응답 디스크 캐시: (이미지, 프롬프트, OCR, 프로바이더, 모델, 검증 버전) SHA-256 키
+  (PRISM_VLM_CACHE_TTL_DAYS로 유효 기간, use_cache=False로 우회)
+- 프로세스 전역 토큰 버킷 제한 (RPM/TPM) + Retry-After 반영 + decorrelated jitter 백오프
+  (SDK 내부 재시도는 끔 → 재시도/백오프는 call_with_retry() + RateLimiter 한 곳에서만)
+- data URL MIME 타입은 이미지 매직 바이트로 판별 (PNG/JPEG/WebP, 인코딩 정책은 core/image_encoding.py)
+
 Author: 박준호 (AI/ML Lead) + 마창수산 팀  
 Date: 2025-11-08
 Version: Phase 0.3.4 P0
@@ -19,17 +29,36 @@ Version: Phase 0.3.4 P0
 
 import os
 import time
+import asyncio
+import hashlib
 import logging
 import base64
 import re
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Union
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    from .disk_cache import DiskCache, get_cache
+    from .image_encoding import sniff_mime_type
+    from .rate_limiter import (
+        DecorrelatedJitter, get_concurrency_limit, get_rate_limiter, is_rate_limit_error, retry_after_seconds
+    )
+except ImportError:
+    from core.disk_cache import DiskCache, get_cache
+    from core.image_encoding import sniff_mime_type
+    from core.rate_limiter import (
+        DecorrelatedJitter, get_concurrency_limit, get_rate_limiter, is_rate_limit_error, retry_after_seconds
+    )
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# ✅ Phase 1.0: 페이지 응답 수용 기준 (HybridExtractor._finish()와 공유, 미만이면 Fallback → 캐시 저장 안 함)
+MIN_RESPONSE_CHARS = 50
+
 
 class VLMServiceV50:
     """
@@ -50,10 +79,55 @@ class VLMServiceV50:
     # ✅ Phase 0.3.2: 허용 가능한 조문 번호 범위
     VALID_ARTICLE_RANGE = (1, 200)
     
-    def __init__(self, provider: str = 'azure_openai'):
-        """초기화"""
+    # ✅ Phase 1.0: 응답 후처리(조문 번호 검증) 버전 - 변경 시 캐시 키가 바뀜
+    POST_VALIDATION_VERSION = "0.3.2"
+    
+    # ✅ Phase 1.0: TPM 추정용 이미지 1장 토큰 수 (gpt-4o high detail 상한 근사)
+    IMAGE_TOKEN_ESTIMATE = 1105
+    
+    # ✅ Phase 1.0: 재시도 백오프 (decorrelated jitter, 초)
+    RATE_LIMIT_BACKOFF = (5.0, 60.0)
+    ERROR_BACKOFF = (1.0, 30.0)
+    
+    # ✅ Phase 1.0: 프로바이더별 기본 동시 요청 수
+    # (로컬 ollama는 GPU 1장 기준 순차 처리가 가장 빠름)
+    DEFAULT_CONCURRENCY = {
+        'azure_openai': 4,
+        'openai': 4,
+        'local_sllm': 1,
+    }
+    
+    def __init__(
+        self,
+        provider: str = 'azure_openai',
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True,
+        cache: Optional[DiskCache] = None
+    ):
+        """
+        초기화
+        
+        Args:
+            provider: 'azure_openai' | 'openai' | 'local_sllm'
+            max_concurrency: ✅ Phase 1.0: 동시 요청 수
+                             (기본: PRISM_VLM_CONCURRENCY 또는 DEFAULT_CONCURRENCY,
+                             같은 프로바이더/모델의 첫 인스턴스 값이 프로세스 전체에 적용)
+            use_cache: ✅ Phase 1.0: 응답 캐시 사용 여부
+            cache: ✅ Phase 1.0: 캐시 인스턴스 (기본: get_cache('vlm'))
+        """
         self.provider = provider
         
+        if use_cache and cache is None:
+            ttl_days = float(os.getenv("PRISM_VLM_CACHE_TTL_DAYS", "30"))
+            cache = get_cache('vlm', ttl_seconds=ttl_days * 86400)
+        self.cache = cache if use_cache else None
+        
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv(
+                "PRISM_VLM_CONCURRENCY",
+                str(self.DEFAULT_CONCURRENCY.get(provider, 1))
+            ))
+        
         if provider == 'azure_openai':
             from openai import AzureOpenAI
             
@@ -71,16 +145,18 @@ class VLMServiceV50:
             logger.info(f"   🌐 Endpoint: {endpoint}")
             logger.info(f"   🤖 Deployment: {deployment}")
             
+            # ✅ Phase 1.0: SDK 내부 재시도 끔 (429가 RateLimiter를 거치지 않고 재전송되는 것 방지)
             self.client = AzureOpenAI(
                 api_key=api_key,
                 api_version="2024-12-01-preview",
-                azure_endpoint=endpoint
+                azure_endpoint=endpoint,
+                max_retries=0
             )
             self.model = deployment
         
         elif provider == 'openai':
             from openai import OpenAI
-            self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
             self.model = "gpt-4o"
         
         elif provider == 'local_sllm':
@@ -91,7 +167,15 @@ class VLMServiceV50:
         else:
             raise ValueError(f"Unknown provider: {provider}")
         
+        # ✅ Phase 1.0: 동시 요청 한도 - 같은 배포를 쓰는 모든 인스턴스/스레드/이벤트 루프가 공유
+        self._concurrency, self.max_concurrency = get_concurrency_limit(provider, self.model, max_concurrency)
+        
         logger.info(f"✅ VLM Service Phase 0.3.4 P0 초기화 완료: {provider}")
+        logger.info(f"   ⚡ 동시 요청 한도: {self.max_concurrency}")
+        logger.info(f"   💾 응답 캐시: {'ON' if self.cache else 'OFF'}")
+        
+        # ✅ Phase 1.0: 같은 배포를 쓰는 모든 인스턴스/스레드가 공유
+        self.rate_limiter = get_rate_limiter(provider, self.model)
     
     # ✅ P0-1: call_with_image 호환 래퍼 추가
     def call_with_image(
@@ -122,16 +206,120 @@ class VLMServiceV50:
         ocr_text = kwargs.get('ocr_text', '')
         page_role = kwargs.get('page_role', 'general')
         max_retries = kwargs.get('max_retries', 3)
+        use_cache = kwargs.get('use_cache', True)
+        
+        # call_with_retry()로 위임 (✅ Phase 1.0: 프로세스 전역 동시 요청 한도 안에서)
+        with self._concurrency:
+            return self.call_with_retry(
+                image_data=image_data,
+                prompt=prompt,
+                ocr_text=ocr_text,
+                page_role=page_role,
+                max_retries=max_retries,
+                use_cache=use_cache
+            )
+    
+    def _cache_key(self, image_data: str, prompt: str, ocr_text: str) -> str:
+        """✅ Phase 1.0: 응답 캐시 키 (이미지 바이트 기준 해시)"""
+        image_hash = hashlib.sha256(base64.b64decode(image_data)).hexdigest()
+        return DiskCache.make_key(
+            'vlm',
+            image_hash,
+            hashlib.sha256(prompt.encode('utf-8')).hexdigest(),
+            hashlib.sha256(ocr_text.encode('utf-8')).hexdigest(),
+            self.provider,
+            self.model,
+            self.POST_VALIDATION_VERSION
+        )
+    
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """✅ Phase 1.0: Rate limiter 대기 시간 메트릭"""
+        return self.rate_limiter.stats()
+    
+    def _estimate_tokens(self, prompt: str, ocr_text: str) -> int:
+        """✅ Phase 1.0: TPM 버킷용 요청 토큰 추정 (한글 ≈ 1자 1토큰)"""
+        return len(prompt) + len(ocr_text) + self.IMAGE_TOKEN_ESTIMATE
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """✅ Phase 1.0: 응답 캐시 적중/미스 통계"""
+        if self.cache is None:
+            return {'namespace': 'vlm', 'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'enabled': False}
+        return {**self.cache.stats(), 'enabled': True}
+    
+    async def acall_with_image(
+        self,
+        image_data: str,
+        prompt: str,
+        page_num: int = 1,
+        **kwargs
+    ) -> str:
+        """
+        ✅ Phase 1.0: call_with_image() 비동기 버전
+        
+        동기 SDK 호출(재시도 포함)을 스레드에서 실행.
+        동시 실행 수는 call_with_image()의 프로세스 전역 한도(max_concurrency)로 제한
+        (이벤트 루프/스레드가 여러 개여도 합계 기준).
+        
+        Args:
+            call_with_image()와 동일
+        
+        Returns:
+            추출된 텍스트
+        """
+        return await asyncio.to_thread(
+            self.call_with_image,
+            image_data,
+            prompt,
+            page_num,
+            **kwargs
+        )
+    
+    async def acall_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[str, BaseException]]:
+        """
+        ✅ Phase 1.0: 여러 페이지 동시 호출 (요청 순서대로 결과 반환)
         
-        # call_with_retry()로 위임
-        return self.call_with_retry(
-            image_data=image_data,
-            prompt=prompt,
-            ocr_text=ocr_text,
-            page_role=page_role,
-            max_retries=max_retries
+        Args:
+            requests: call_with_image() 키워드 인자 dict 목록
+                      (image_data, prompt, page_num, page_role, ocr_text ...)
+            return_exceptions: True면 실패 요청 자리에 예외 객체 반환
+        
+        Returns:
+            요청 순서의 결과 리스트
+        """
+        return await asyncio.gather(
+            *(self.acall_with_image(**request) for request in requests),
+            return_exceptions=return_exceptions
         )
     
+    def call_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[str, BaseException]]:
+        """
+        ✅ Phase 1.0: acall_many() 동기 진입점 (Streamlit 등 동기 코드용)
+        
+        이미 이벤트 루프가 실행 중인 스레드에서 호출되면 별도 스레드에서 실행.
+        """
+        if not requests:
+            return []
+        
+        logger.info(f"   ⚡ VLM 동시 호출: {len(requests)}건 (한도 {self.max_concurrency})")
+        
+        coro_factory = lambda: self.acall_many(requests, return_exceptions)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro_factory())
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(coro_factory())).result()
+    
     def call(self, image_data: str, prompt: str, ocr_text: str = "") -> str:
         """
         VLM 호출 (조문 번호 검증 포함)
@@ -167,7 +355,8 @@ class VLMServiceV50:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_data}"
+                                    # ✅ Phase 1.0: 실제 인코딩 포맷으로 라벨링
+                                    "url": f"data:{sniff_mime_type(image_data)};base64,{image_data}"
                                 }
                             },
                             {"type": "text", "text": prompt}
@@ -238,7 +427,8 @@ class VLMServiceV50:
         prompt: str,
         ocr_text: str = "",
         page_role: str = "general",
-        max_retries: int = 3
+        max_retries: int = 3,
+        use_cache: bool = True
     ) -> str:
         """
         재시도 로직이 있는 VLM 호출
@@ -249,24 +439,66 @@ class VLMServiceV50:
             ocr_text: OCR 텍스트
             page_role: 페이지 역할
             max_retries: 최대 재시도 횟수
+            use_cache: ✅ Phase 1.0: False면 캐시 조회/저장 우회
         
         Returns:
             추출된 텍스트
         """
+        # ✅ Phase 1.0: 응답 캐시 (검증 후 결과 저장, 실패/수용 기준 미달 응답은 저장 안 함)
+        cache = self.cache if use_cache else None
+        cache_key = self._cache_key(image_data, prompt, ocr_text) if cache else None
+        if cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"      💾 VLM 캐시 적중")
+                return cached.decode('utf-8')
+        
+        result = self._call_with_retry(image_data, prompt, ocr_text, page_role, max_retries)
+        
+        if cache and result and len(result.strip()) >= MIN_RESPONSE_CHARS:
+            cache.put(cache_key, result.encode('utf-8'))
+        
+        return result
+    
+    def _call_with_retry(
+        self,
+        image_data: str,
+        prompt: str,
+        ocr_text: str,
+        page_role: str,
+        max_retries: int
+    ) -> str:
+        """
+        재시도 루프 (캐시 미스 시)
+        
+        ✅ Phase 1.0:
+        - 매 시도 전 공유 rate limiter 대기 (RPM/TPM + 서버 지정 정지)
+        - Rate limit: Retry-After 헤더 우선, 없으면 jitter → 모든 호출자에 적용
+        - 기타 오류/빈 응답: decorrelated jitter (호출자별)
+        """
         # 개정이력 페이지는 재시도 예산 2회
         if page_role == "revision_table":
             max_retries = min(max_retries, 2)
             logger.info(f"      🎯 개정이력 페이지 - 재시도 예산 {max_retries}회")
         
+        tokens = self._estimate_tokens(prompt, ocr_text)
+        rate_backoff = DecorrelatedJitter(*self.RATE_LIMIT_BACKOFF)
+        error_backoff = DecorrelatedJitter(*self.ERROR_BACKOFF)
+        
         for attempt in range(1, max_retries + 1):
+            self.rate_limiter.acquire(tokens)
+            
             try:
                 result = self.call(image_data, prompt, ocr_text)
                 
                 # 빈 응답 체크
                 if not result or len(result.strip()) < 10:
                     if attempt < max_retries:
-                        logger.warning(f"      ⚠️ 빈 응답 (시도 {attempt}/{max_retries}) - 재시도")
-                        time.sleep(2 ** attempt)
+                        wait_time = error_backoff.next()
+                        logger.warning(
+                            f"      ⚠️ 빈 응답 (시도 {attempt}/{max_retries}) - {wait_time:.1f}초 후 재시도"
+                        )
+                        time.sleep(wait_time)
                         continue
                     else:
                         logger.error(f"      ❌ 빈 응답 (최종 실패)")
@@ -275,16 +507,17 @@ class VLMServiceV50:
                 return result
             
             except Exception as e:
-                error_str = str(e).lower()
-                
                 # Rate limit 에러
-                if "rate" in error_str or "429" in error_str:
+                if is_rate_limit_error(e):
                     if attempt < max_retries:
-                        wait_time = 60
+                        retry_after = retry_after_seconds(e)
+                        wait_time = retry_after if retry_after is not None else rate_backoff.next()
                         logger.warning(
-                            f"      ⚠️ Rate limit (시도 {attempt}/{max_retries}) - {wait_time}초 대기"
+                            f"      ⚠️ Rate limit (시도 {attempt}/{max_retries}) - {wait_time:.1f}초 대기"
+                            f"{' (Retry-After)' if retry_after is not None else ''}"
                         )
-                        time.sleep(wait_time)
+                        # 다음 acquire()에서 대기 (다른 호출자도 함께 정지)
+                        self.rate_limiter.penalize(wait_time)
                         continue
                     else:
                         logger.error(f"      ❌ Rate limit (최종 실패)")
@@ -292,9 +525,9 @@ class VLMServiceV50:
                 
                 # 기타 에러
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
+                    wait_time = error_backoff.next()
                     logger.warning(
-                        f"      ⚠️ VLM 오류 (시도 {attempt}/{max_retries}): {e} - {wait_time}초 대기"
+                        f"      ⚠️ VLM 오류 (시도 {attempt}/{max_retries}): {e} - {wait_time:.1f}초 대기"
                     )
                     time.sleep(wait_time)
                     continue
@@ -302,4 +535,4 @@ class VLMServiceV50:
                     logger.error(f"      ❌ VLM 오류 (최종 실패): {e}")
                     return ""
         
-        return ""
\ No newline at end of file
+        return ""
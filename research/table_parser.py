@@ -8,6 +8,12 @@ Phase 0.9.1 Hotfix:
 - ✅ ROW_PATTERN 강화 (PDF 추출 텍스트 대응)
 - ✅ 규칙 기반 생성 fallback
 
+Phase 1.0:
+- ✅ parse_pdf(): 텍스트 레이어 좌표 기반 구조화 (글자 상자 → 표 셀, 정규식 행 매칭/VLM 없음)
+  - 벡터 괘선 격자 (없으면 제목 아래 괘선 없는 표를 줄/열 클러스터 격자로)
+  - pypdf 열 순서 뒤섞임과 무관, 좌우 반복 열 묶음 지원
+- ✅ parse_grid(): 셀 격자 → 텍스트 파싱과 같은 행 청크
+
 Author: 마창수산팀
 Date: 2025-11-20
 Version: Phase 0.9.1 Hotfix
@@ -15,7 +21,9 @@ Version: Phase 0.9.1 Hotfix
 
 import re
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +66,16 @@ class TableParser:
         re.compile(r'(\d{1,2})\s+(\d+)번까지'),
     ]
     
+    # ✅ Phase 1.0: 표 종류별 청크 메타 (격자 파싱도 텍스트 파싱과 같은 형식)
+    TABLE_META = {
+        '3급승진제외': {'table_id': 'annex_1_3급승진제외', 'table_title': '승진후보자범위(3급승진제외)', 'rule': '5배수'},
+        '3급승진': {'table_id': 'annex_1_3급승진', 'table_title': '승진후보자범위(3급승진)', 'rule': '2배수'},
+    }
+    
+    # ✅ Phase 1.0: 격자 머리글 열 (임용인원수 / 서열명부순위)
+    PEOPLE_HEADER = re.compile(r'인\s*원')
+    RANK_HEADER = re.compile(r'순\s*위|서\s*열')
+    
     def __init__(self):
         """초기화"""
         logger.info("✅ TableParser 초기화 완료 (Phase 0.9.1 Hotfix)")
@@ -92,6 +110,166 @@ class TableParser:
         
         return chunks
     
+    def detect_table_type(self, title: str) -> Optional[str]:
+        """
+        ✅ Phase 1.0: 제목 텍스트 → 표 종류 ('3급승진제외' 우선, 없으면 None)
+        """
+        for table_type in ('3급승진제외', '3급승진'):
+            if any(pattern.search(title) for pattern in self.TABLE_HEADER_PATTERNS[table_type]):
+                return table_type
+        return None
+    
+    def parse_grid(
+        self,
+        rows: List[List[str]],
+        title: str = '',
+        table_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        ✅ Phase 1.0: 표 셀 격자 → 행 청크 (규칙 기반 보완 없음, 문서에 있는 행만)
+        
+        - 표 종류: title의 TABLE_HEADER_PATTERNS (없으면 table_type, 예: 다음 페이지로 이어진 표)
+        - 열: 머리글 행의 '인원' 열과 그 오른쪽 첫 '순위/서열' 열을 짝지음 (좌우 반복 열 묶음 지원),
+              머리글이 없으면 (0, 1), (2, 3), ... 열 쌍
+        - 값: 셀의 첫 정수 ('5번까지' → 5), 둘 중 하나라도 없으면 건너뜀
+        
+        Args:
+            rows: 행 x 열 셀 텍스트 (core.text_geometry.table_rows)
+            title: 표 위 제목 텍스트
+            table_type: 제목으로 판별하지 못할 때 사용할 표 종류
+        
+        Returns:
+            임용인원수 순 행 청크 (parse()와 같은 형식)
+        """
+        table_type = self.detect_table_type(title) or table_type
+        if table_type is None or not rows:
+            return []
+        
+        header_row, pairs = self._column_pairs(rows)
+        found = {}
+        for row in rows[header_row + 1:]:
+            for people_col, rank_col in pairs:
+                people, rank = self._first_int(row[people_col]), self._first_int(row[rank_col])
+                if people is not None and rank is not None:
+                    found.setdefault(people, rank)
+        
+        meta = self.TABLE_META[table_type]
+        return [
+            {
+                'table_id': meta['table_id'],
+                'table_title': meta['table_title'],
+                '임용인원수': people,
+                '서열명부순위': found[people],
+                'rule': meta['rule']
+            }
+            for people in sorted(found)
+        ]
+    
+    def _column_pairs(self, rows: List[List[str]]) -> tuple:
+        """
+        ✅ Phase 1.0: (머리글 행 번호, [(인원 열, 순위 열)]) - 머리글이 없으면 (-1, 인접 열 쌍)
+        """
+        for r, row in enumerate(rows):
+            people = [c for c, text in enumerate(row) if self.PEOPLE_HEADER.search(text)]
+            ranks = [c for c, text in enumerate(row) if self.RANK_HEADER.search(text)]
+            pairs = [(p, min(k for k in ranks if k > p)) for p in people if any(k > p for k in ranks)]
+            if pairs:
+                return r, pairs
+        return -1, [(c, c + 1) for c in range(0, len(rows[0]) - 1, 2)]
+    
+    @staticmethod
+    def _first_int(text: str) -> Optional[int]:
+        match = re.search(r'\d+', text)
+        return int(match.group()) if match else None
+    
+    def parse_pdf(
+        self,
+        pdf_path: str,
+        pages: Optional[Iterable[int]] = None,
+        processor=None
+    ) -> List[Dict[str, Any]]:
+        """
+        ✅ Phase 1.0: PDF 텍스트 레이어 좌표로 표 구조화 (렌더링/VLM/정규식 행 매칭 없음)
+        
+        페이지별 벡터 괘선 격자 (없으면 표 제목 아래 영역을 줄/열 클러스터 격자로)에
+        단어 상자를 셀 배정 → parse_grid(). 제목 = 표 위 (이전 표 아래부터) 줄 텍스트,
+        제목이 없는 표는 직전 표 종류를 이어받음 (페이지 넘김).
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            pages: 페이지 번호들 (1-based, 기본: 전체)
+            processor: 공유 PDFProcessor (없으면 생성 후 닫음)
+        
+        Returns:
+            parse()와 같은 형식의 행 청크 (표/임용인원수 중복 제거), 표가 없으면 []
+        """
+        from core.pdf_processor import PDFProcessor
+        from core.quick_layout_analyzer import QuickLayoutAnalyzer
+        from core.text_geometry import table_rows
+        
+        own_processor = processor is None
+        processor = processor or PDFProcessor(use_cache=False)
+        analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+        
+        chunks, seen = [], set()
+        last_type = None
+        try:
+            if pages is None:
+                pages = range(1, processor.get_page_count(pdf_path) + 1)
+            
+            for page_num in pages:
+                words = processor.extract_words(pdf_path, page_num)
+                if not words:
+                    continue
+                lines = processor.extract_vector_lines(pdf_path, page_num)
+                grids = []
+                if lines is not None and not lines.needs_raster:
+                    grids = analyzer.detect_vector_regions(lines)[1]
+                if not grids:
+                    grids = self._text_grids(words)
+                
+                top = 0.0
+                for grid in grids:
+                    title = ' '.join(words.within([0.0, top, 1.0, grid.bbox[1]]).lines())
+                    top = grid.bbox[3]
+                    table_type = self.detect_table_type(title) or last_type
+                    rows = self.parse_grid(table_rows(words, grid), table_type=table_type)
+                    if rows:
+                        last_type = table_type
+                    for row in rows:
+                        key = (row['table_id'], row['임용인원수'])
+                        if key not in seen:
+                            seen.add(key)
+                            chunks.append(row)
+        finally:
+            if own_processor:
+                processor.close()
+        
+        if chunks:
+            logger.info(f"✅ TableParser: 좌표 기반 {len(chunks)}개 행 구조화")
+        return chunks
+    
+    def _text_grids(self, words) -> list:
+        """
+        ✅ Phase 1.0: 괘선 없는 표 - 표 제목 줄 아래 ~ 다음 제목 줄 위 영역의 줄/열 클러스터 격자
+        """
+        from core.text_geometry import text_grid
+        
+        labels = words.line_labels()
+        tops = np.full(int(labels.max()) + 1, np.inf)
+        bottoms = np.full(tops.size, -np.inf)
+        np.minimum.at(tops, labels, words.boxes[:, 1])
+        np.maximum.at(bottoms, labels, words.boxes[:, 3])
+        
+        titles = [i for i, line in enumerate(words.lines()) if self.detect_table_type(line)]
+        grids = []
+        for n, line in enumerate(titles):
+            bottom = tops[titles[n + 1]] if n + 1 < len(titles) else 1.0
+            grid = text_grid(words, [0.0, bottoms[line], 1.0, bottom])
+            if grid is not None:
+                grids.append(grid)
+        return grids
+    
     def _find_table_region(self, text: str, table_type: str) -> tuple:
         """
         테이블 영역 찾기
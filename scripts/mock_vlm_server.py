@@ -0,0 +1,358 @@
+"""
+scripts/mock_vlm_server.py
+PRISM Phase 1.0 - 로컬 Mock VLM 서버 (오프라인 처리량 벤치마크용)
+
+✅ 기능:
+1. OpenAI 호환 chat completions
+   - POST /v1/chat/completions, /chat/completions (OpenAI, OPENAI_BASE_URL)
+   - POST /openai/deployments/<배포>/chat/completions (Azure OpenAI, AZURE_OPENAI_ENDPOINT)
+2. Ollama chat: POST /api/chat (OLLAMA_HOST)
+3. 지연 분포: fixed / uniform / lognormal
+4. 장애 주입: 429 (retry-after-ms 헤더) / 빈 응답 비율
+   + 업로드 대역폭 (요청 본문 크기 비례 지연, 이미지 인코딩 벤치마크용)
+5. 결정적 응답: 이미지 해시 기반 조문 Markdown (같은 이미지 → 같은 응답)
+6. GET /stats: 수신 요청/429/빈 응답/최대 동시 처리 수/수신 바이트
+
+실행:
+    python scripts/mock_vlm_server.py --port 8765 --latency lognormal --mean-ms 800 --rate-limit 0.05
+
+    # 다른 터미널에서
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=mock python tests/benchmark_vlm.py
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import logging
+import argparse
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+OPENAI_PATH = re.compile(r'^(?:/v1)?/chat/completions$|^/openai/deployments/[^/]+/chat/completions$')
+OLLAMA_PATH = '/api/chat'
+
+
+@dataclass
+class MockVLMConfig:
+    """
+    Mock 서버 동작 설정
+
+    Attributes:
+        latency: 'fixed' | 'uniform' | 'lognormal'
+        mean_ms: 평균 지연 (uniform은 [0, 2*mean], lognormal은 평균 기준)
+        sigma: lognormal 분산 (클수록 꼬리가 김)
+        rate_limit_rate: 429 응답 비율 (0~1)
+        retry_after_ms: 429 응답의 retry-after-ms 헤더 값
+        empty_rate: 빈 응답 비율 (0~1)
+        upload_mbps: 업로드 대역폭 Mbps (0이면 제한 없음, 본문 크기만큼 추가 지연)
+        seed: 지연/장애 난수 시드
+    """
+    latency: str = 'fixed'
+    mean_ms: float = 500.0
+    sigma: float = 0.5
+    rate_limit_rate: float = 0.0
+    retry_after_ms: int = 200
+    empty_rate: float = 0.0
+    upload_mbps: float = 0.0
+    seed: Optional[int] = None
+
+
+def canned_markdown(image_data: str) -> str:
+    """
+    이미지 해시 기반 결정적 조문 Markdown
+
+    조문 번호는 1~200 범위 (VLMServiceV50 조문 번호 검증 통과)
+    """
+    digest = hashlib.sha256(image_data.encode('utf-8')).hexdigest()
+    article = int(digest[:8], 16) % 200 + 1
+    items = int(digest[8:10], 16) % 4 + 2
+
+    lines = [f"### 제{article}조(목적)", ""]
+    lines += [f"{i}. 이 규정은 항목 {digest[10 + i:16 + i]}에 적용한다." for i in range(1, items + 1)]
+    return '\n'.join(lines)
+
+
+class MockVLMServer:
+    """
+    Phase 1.0 Mock VLM 서버 (스레드 기반, 요청마다 스레드 1개)
+
+    사용 예:
+        with MockVLMServer(MockVLMConfig(mean_ms=50)) as server:
+            os.environ['OPENAI_BASE_URL'] = server.url + '/v1'
+    """
+
+    def __init__(self, config: Optional[MockVLMConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        초기화
+
+        Args:
+            config: 동작 설정 (기본: 500ms 고정 지연, 장애 없음)
+            host: 바인드 주소
+            port: 포트 (0이면 임의 빈 포트)
+        """
+        self.config = config or MockVLMConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.reset_stats()
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockVLMServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"✅ Mock VLM 서버 시작: {self.url} ({self.config.latency}, 평균 {self.config.mean_ms:.0f}ms)")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'MockVLMServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        with self._lock:
+            self.requests = 0
+            self.rate_limited = 0
+            self.empty = 0
+            self.active = 0
+            self.peak_active = 0
+            self.bytes_received = 0
+
+    def stats(self) -> Dict[str, int]:
+        """수신 통계"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'rate_limited': self.rate_limited,
+                'empty': self.empty,
+                'peak_active': self.peak_active,
+                'bytes_received': self.bytes_received
+            }
+
+    def _sample_latency(self) -> float:
+        """지연 시간(초) 샘플"""
+        cfg = self.config
+        mean = cfg.mean_ms / 1000.0
+        with self._lock:
+            if cfg.latency == 'uniform':
+                return self._random.uniform(0.0, 2 * mean)
+            if cfg.latency == 'lognormal':
+                # 평균이 mean이 되도록 mu 보정
+                mu = math.log(mean) - cfg.sigma ** 2 / 2 if mean > 0 else 0.0
+                return self._random.lognormvariate(mu, cfg.sigma) if mean > 0 else 0.0
+            return mean
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def _handle(self, payload: Dict[str, Any], size: int = 0) -> Dict[str, Any]:
+        """
+        요청 1건 처리
+
+        Args:
+            payload: 요청 JSON
+            size: 요청 본문 바이트 (업로드 대역폭 지연 계산)
+
+        Returns:
+            {'status': int, 'headers': dict, 'content': str | None}
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += size
+
+        if self.config.upload_mbps > 0:
+            time.sleep(size * 8 / (self.config.upload_mbps * 1_000_000))
+
+        if self._roll(self.config.rate_limit_rate):
+            with self._lock:
+                self.rate_limited += 1
+            return {
+                'status': 429,
+                'headers': {
+                    'retry-after-ms': str(self.config.retry_after_ms),
+                    'retry-after': str(max(1, math.ceil(self.config.retry_after_ms / 1000)))
+                },
+                'content': None
+            }
+
+        with self._lock:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        try:
+            time.sleep(self._sample_latency())
+        finally:
+            with self._lock:
+                self.active -= 1
+
+        if self._roll(self.config.empty_rate):
+            with self._lock:
+                self.empty += 1
+            return {'status': 200, 'headers': {}, 'content': ""}
+
+        return {'status': 200, 'headers': {}, 'content': canned_markdown(_image_of(payload))}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.split('?')[0] == '/stats':
+                    self._send_json(200, server.stats())
+                else:
+                    self._send_json(404, {'error': {'message': 'not found'}})
+
+            def do_POST(self):
+                path = self.path.split('?')[0]
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b'{}')
+                except json.JSONDecodeError:
+                    self._send_json(400, {'error': {'message': 'invalid json'}})
+                    return
+
+                if OPENAI_PATH.match(path):
+                    result = server._handle(payload, length)
+                    if result['status'] == 429:
+                        self._send_json(429, _openai_error('Rate limit exceeded (mock)'), result['headers'])
+                    else:
+                        self._send_json(200, _openai_response(payload, result['content']))
+                elif path == OLLAMA_PATH:
+                    result = server._handle(payload, length)
+                    if result['status'] == 429:
+                        self._send_json(429, {'error': 'rate limit exceeded (mock)'}, result['headers'])
+                    else:
+                        self._send_json(200, _ollama_response(payload, result['content']))
+                else:
+                    self._send_json(404, {'error': {'message': f'unknown path: {path}'}})
+
+        return Handler
+
+
+def _image_of(payload: Dict[str, Any]) -> str:
+    """요청 본문에서 이미지 데이터 추출 (OpenAI image_url / Ollama images)"""
+    for message in payload.get('messages', []):
+        images = message.get('images')
+        if images:
+            return str(images[0])
+        content = message.get('content')
+        if isinstance(content, list):
+            for part in content:
+                if part.get('type') == 'image_url':
+                    return part.get('image_url', {}).get('url', '')
+    return ''
+
+
+def _openai_error(message: str) -> Dict[str, Any]:
+    return {'error': {'message': message, 'type': 'requests', 'code': 'rate_limit_exceeded'}}
+
+
+def _openai_response(payload: Dict[str, Any], content: str) -> Dict[str, Any]:
+    return {
+        'id': 'chatcmpl-mock',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': payload.get('model', 'mock'),
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop'
+        }],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': len(content), 'total_tokens': len(content)}
+    }
+
+
+def _ollama_response(payload: Dict[str, Any], content: str) -> Dict[str, Any]:
+    return {
+        'model': payload.get('model', 'mock'),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'message': {'role': 'assistant', 'content': content},
+        'done': True
+    }
+
+
+def main():
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description='PRISM Mock VLM 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', choices=['fixed', 'uniform', 'lognormal'], default='fixed')
+    parser.add_argument('--mean-ms', type=float, default=500.0)
+    parser.add_argument('--sigma', type=float, default=0.5)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='429 응답 비율 (0~1)')
+    parser.add_argument('--retry-after-ms', type=int, default=200)
+    parser.add_argument('--empty', type=float, default=0.0, help='빈 응답 비율 (0~1)')
+    parser.add_argument('--upload-mbps', type=float, default=0.0, help='업로드 대역폭 Mbps (0이면 제한 없음)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    config = MockVLMConfig(
+        latency=args.latency,
+        mean_ms=args.mean_ms,
+        sigma=args.sigma,
+        rate_limit_rate=args.rate_limit,
+        retry_after_ms=args.retry_after_ms,
+        empty_rate=args.empty,
+        upload_mbps=args.upload_mbps,
+        seed=args.seed
+    )
+
+    server = MockVLMServer(config, host=args.host, port=args.port)
+    print(f"🚀 Mock VLM 서버: {server.url}")
+    print(f"   OpenAI: OPENAI_BASE_URL={server.url}/v1")
+    print(f"   Azure:  AZURE_OPENAI_ENDPOINT={server.url}")
+    print(f"   Ollama: OLLAMA_HOST={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
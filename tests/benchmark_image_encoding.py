@@ -0,0 +1,157 @@
+"""
+benchmark_image_encoding.py - PRISM Phase 1.0 VLM Image Encoding Benchmark
+인코딩 설정별 전송 바이트 / 인코딩 시간 / Mock VLM 서버 왕복 지연 측정
+
+Usage:
+    python tests/benchmark_image_encoding.py [--pdf 규정.pdf] [--pages 5] [--dpi 300]
+                                             [--upload-mbps 20] [--mean-ms 300]
+                                             [--settings png jpeg:q=90 webp:q=80 jpeg:q=85,kb=300]
+
+    설정 형식: <png|jpeg|webp>[:q=품질][,edge=최대 긴 변 px][,kb=바이트 예산 KB]
+    --pdf 미지정 시 합성 규정 PDF (본문 + 표) 사용
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+# PRISM 모듈 import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.image_encoding import ImageEncodingPolicy, encode_image
+from core.pdf_processor import PDFProcessor, RenderedPage
+from core.rate_limiter import RateLimiter
+from scripts.mock_vlm_server import MockVLMConfig, MockVLMServer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS = ['png', 'jpeg:q=90', 'jpeg:q=75', 'webp:q=80', 'jpeg:q=85,edge=2000', 'jpeg:q=85,kb=300']
+
+
+def parse_setting(spec: str) -> ImageEncodingPolicy:
+    """'jpeg:q=85,edge=2000,kb=300' → ImageEncodingPolicy"""
+    fmt, _, options = spec.partition(':')
+    kwargs: Dict[str, Any] = {'format': fmt.lower().replace('jpg', 'jpeg')}
+    for option in filter(None, options.split(',')):
+        key, _, value = option.partition('=')
+        if key == 'q':
+            kwargs['quality'] = int(value)
+        elif key == 'edge':
+            kwargs['max_long_edge'] = int(value)
+        elif key == 'kb':
+            kwargs['max_bytes'] = int(float(value) * 1024)
+        else:
+            raise ValueError(f"알 수 없는 옵션: {option}")
+    return ImageEncodingPolicy(**kwargs)
+
+
+def _synthetic_pdf(path: Path, pages: int) -> Path:
+    """본문 40줄 + 표 페이지가 섞인 합성 PDF"""
+    body = [f"Article {n}. This regulation applies to item {n * 7} of the annex." for n in range(1, 41)]
+    return make_pdf(
+        path,
+        [body for _ in range(pages)],
+        tables={i: (72, 120, 520, 330, 8, 5) for i in range(0, pages, 2)}
+    )
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[int(q) - 1]
+
+
+def benchmark_setting(spec: str, pages: List[RenderedPage], service) -> Dict[str, Any]:
+    """
+    설정 1개 측정 (페이지 순차 처리: 인코딩 → VLM 호출)
+
+    Returns:
+        평균/최대 전송 KB, 인코딩 ms, 왕복 지연 p50/p95
+    """
+    policy = parse_setting(spec)
+    payload_kb, encode_ms, e2e_ms = [], [], []
+
+    for page in pages:
+        start = time.perf_counter()
+        encoded = encode_image(page.pixels, policy)
+        encoded_at = time.perf_counter()
+        service.call_with_image(encoded.base64, '이 페이지를 Markdown으로 변환하세요.', page.page_num, use_cache=False)
+        end = time.perf_counter()
+
+        payload_kb.append(len(encoded.base64) / 1024)
+        encode_ms.append((encoded_at - start) * 1000)
+        e2e_ms.append((end - start) * 1000)
+
+    return {
+        'setting': spec,
+        'mime_type': policy.mime_type,
+        'size': f"{encoded.width}x{encoded.height}",
+        'payload_kb_mean': round(statistics.mean(payload_kb), 1),
+        'payload_kb_max': round(max(payload_kb), 1),
+        'encode_ms_mean': round(statistics.mean(encode_ms), 1),
+        'e2e_ms_p50': round(_percentile(e2e_ms, 50), 1),
+        'e2e_ms_p95': round(_percentile(e2e_ms, 95), 1)
+    }
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description='PRISM VLM 이미지 인코딩 벤치마크 (Mock 서버)')
+    parser.add_argument('--pdf', default=None, help='측정할 PDF (미지정 시 합성 PDF)')
+    parser.add_argument('--pages', type=int, default=5)
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--settings', nargs='+', default=DEFAULT_SETTINGS)
+    parser.add_argument('--upload-mbps', type=float, default=20.0, help='Mock 서버 업로드 대역폭')
+    parser.add_argument('--mean-ms', type=float, default=300.0, help='Mock 서버 응답 지연')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or str(_synthetic_pdf(Path(tmp) / "bench.pdf", args.pages))
+        processor = PDFProcessor(use_cache=False)
+        pages = list(processor.iter_rendered_pages(pdf_path, max_pages=args.pages, dpi=args.dpi))
+
+    server = MockVLMServer(MockVLMConfig(mean_ms=args.mean_ms, upload_mbps=args.upload_mbps)).start()
+    os.environ['OPENAI_BASE_URL'] = f"{server.url}/v1"
+    os.environ.setdefault('OPENAI_API_KEY', 'mock')
+
+    from core.vlm_service import VLMServiceV50
+    service = VLMServiceV50(provider='openai', use_cache=False)
+    service.rate_limiter = RateLimiter("bench:encoding")
+
+    print(f"\n📊 이미지 인코딩 ({len(pages)}페이지, {args.dpi} DPI, 업로드 {args.upload_mbps:g}Mbps, 지연 {args.mean_ms:g}ms)")
+    print(f"   {'설정':<22} {'MIME':<11} {'크기':>10} {'평균KB':>8} {'최대KB':>8} {'인코딩':>8} {'p50':>8} {'p95':>8}")
+
+    results = []
+    try:
+        for spec in args.settings:
+            result = benchmark_setting(spec, pages, service)
+            results.append(result)
+            print(
+                f"   {spec:<22} {result['mime_type']:<11} {result['size']:>10} "
+                f"{result['payload_kb_mean']:>8.0f} {result['payload_kb_max']:>8.0f} "
+                f"{result['encode_ms_mean']:>6.0f}ms {result['e2e_ms_p50']:>6.0f}ms {result['e2e_ms_p95']:>6.0f}ms"
+            )
+    finally:
+        server.stop()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
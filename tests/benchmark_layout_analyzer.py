@@ -0,0 +1,204 @@
+"""
+benchmark_layout_analyzer.py - PRISM Phase 1.0 QuickLayoutAnalyzer Benchmark
+페이지당 레이아웃 분석 시간 (300 DPI) vs 문서화된 0.5초 예산
+
+- 페이지 전체 analyze() p50/p95/최대 (OCR 제외: Tesseract 시간은 엔진/언어팩 의존)
+- 단계별 평균 (LayoutMasks 공유 마스크는 처음 사용하는 단계에 집계)
+- 벡터 표 검출 (PDF 경로 객체 괘선, 렌더링 없음) vs 렌더링 + 래스터 영역 검출
+- 페이지 전체 analyze(): 벡터 괘선 (래스터 선 마스크 생략) vs 래스터 (렌더링 제외, OCR 제외)
+
+Usage:
+    python tests/benchmark_layout_analyzer.py [--pdf 규정.pdf] [--pages 6] [--dpi 300]
+                                              [--repeat 3] [--budget-ms 500]
+
+    --pdf 미지정 시 합성 규정 PDF (본문 / 표 페이지 + 스캔 유사 노이즈 버전)
+    p95가 예산을 넘으면 exit code 1
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import time
+import logging
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+# PRISM 모듈 import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import LayoutMasks, QuickLayoutAnalyzer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def _synthetic_pdf(path: Path, pages: int) -> Path:
+    """본문 40줄 페이지 + 표 페이지 교대"""
+    body = [f"Article {n}. This regulation applies to item {n * 7} of the annex." for n in range(1, 41)]
+    return make_pdf(
+        path,
+        [body for _ in range(pages)],
+        tables={i: (72, 120, 520, 330, 8, 5) for i in range(0, pages, 2)}
+    )
+
+
+def _scanned_page(pixels: np.ndarray) -> np.ndarray:
+    """스캔 유사 페이지 (센서 노이즈 σ=12 + 3x3 블러 → 이진화/엣지 잡음 증가)"""
+    rng = np.random.default_rng(7)
+    noisy = pixels.astype(np.int16) + rng.normal(0, 12, size=pixels.shape)
+    return cv2.GaussianBlur(np.clip(noisy, 0, 255).astype(np.uint8), (3, 3), 0)
+
+
+def _stages(analyzer: QuickLayoutAnalyzer) -> List[Tuple[str, Callable[[LayoutMasks], object]]]:
+    """analyze()와 같은 순서의 힌트 단계"""
+    return [
+        ('text', analyzer._detect_text),
+        ('map', analyzer._detect_map),
+        ('table', analyzer._detect_tables),
+        ('numbers', analyzer._detect_numbers),
+        ('diagrams', analyzer._count_diagrams),
+        ('grid', analyzer._count_grid_intersections_conservative),
+        ('density', analyzer._calculate_line_density_conservative),
+        ('regions', analyzer._detect_regions),
+    ]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[int(q) - 1]
+
+
+def benchmark_pages(pages: List[np.ndarray], dpi: int, repeat: int) -> Dict[str, object]:
+    """
+    페이지별 analyze() 최소 시간 (repeat회 중) + 단계별 평균
+
+    Returns:
+        {'page_ms': [...], 'stage_ms': {단계: 평균 ms}}
+    """
+    analyzer = QuickLayoutAnalyzer()
+    analyzer.tesseract_available = False
+    scale = dpi / analyzer.REFERENCE_DPI
+
+    # 워밍업 (OpenCV 초기화)
+    analyzer.analyze(pages[0], dpi=dpi)
+
+    page_ms = []
+    stage_ms: Dict[str, List[float]] = {}
+    for pixels in pages:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            analyzer.analyze(pixels, dpi=dpi)
+            best = min(best, time.perf_counter() - start)
+        page_ms.append(best * 1000)
+
+        start = time.perf_counter()
+        masks = LayoutMasks(pixels, scale)
+        stage_ms.setdefault('gray', []).append((time.perf_counter() - start) * 1000)
+        for name, stage in _stages(analyzer):
+            start = time.perf_counter()
+            stage(masks)
+            stage_ms.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+
+    return {
+        'page_ms': page_ms,
+        'stage_ms': {name: statistics.mean(values) for name, values in stage_ms.items()}
+    }
+
+
+def benchmark_vector(pdf_path: str, pages: int, dpi: int, repeat: int) -> Dict[str, float]:
+    """
+    페이지당 표 영역 검출 시간 (repeat회 중 최소, 평균 ms)
+
+    Returns:
+        {'vector_ms': 경로 객체 괘선 + 격자, 'raster_ms': 렌더링 + 래스터 영역 검출,
+         'analyze_vector_ms': analyze(vector_lines=...), 'analyze_raster_ms': analyze()}
+    """
+    processor = PDFProcessor(use_cache=False)
+    analyzer = QuickLayoutAnalyzer()
+    analyzer.tesseract_available = False
+    scale = dpi / analyzer.REFERENCE_DPI
+    vector_ms, raster_ms = [], []
+    analyze_ms: Dict[str, List[float]] = {'vector': [], 'raster': []}
+    for page_num in range(1, pages + 1):
+        best_vector = best_raster = float('inf')
+        page = processor.render_page(pdf_path, page_num, dpi=dpi)
+        lines = processor.extract_vector_lines(pdf_path, page_num)
+        for source, vector_lines in (('vector', lines), ('raster', None)):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                analyzer.analyze(page, vector_lines=vector_lines)
+                best = min(best, time.perf_counter() - start)
+            analyze_ms[source].append(best * 1000)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            analyzer.detect_vector_regions(processor.extract_vector_lines(pdf_path, page_num))
+            best_vector = min(best_vector, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            page = processor.render_page(pdf_path, page_num, dpi=dpi)
+            analyzer._detect_regions(LayoutMasks(page.pixels, scale))
+            best_raster = min(best_raster, time.perf_counter() - start)
+        vector_ms.append(best_vector * 1000)
+        raster_ms.append(best_raster * 1000)
+    return {
+        'vector_ms': statistics.mean(vector_ms),
+        'raster_ms': statistics.mean(raster_ms),
+        'analyze_vector_ms': statistics.mean(analyze_ms['vector']),
+        'analyze_raster_ms': statistics.mean(analyze_ms['raster'])
+    }
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description='PRISM QuickLayoutAnalyzer 페이지당 분석 시간')
+    parser.add_argument('--pdf', default=None, help='측정할 PDF (미지정 시 합성 PDF)')
+    parser.add_argument('--pages', type=int, default=6)
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget-ms', type=float, default=500.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or str(_synthetic_pdf(Path(tmp) / "bench.pdf", args.pages))
+        processor = PDFProcessor(use_cache=False)
+        pages = [page.pixels for page in processor.iter_rendered_pages(pdf_path, max_pages=args.pages, dpi=args.dpi)]
+        tables = benchmark_vector(pdf_path, len(pages), args.dpi, args.repeat)
+    if not args.pdf:
+        pages += [_scanned_page(pixels) for pixels in pages[:2]]
+
+    height, width = pages[0].shape[:2]
+    result = benchmark_pages(pages, args.dpi, args.repeat)
+    page_ms = result['page_ms']
+    p50, p95 = _percentile(page_ms, 50), _percentile(page_ms, 95)
+
+    print(f"\n📊 레이아웃 분석 ({len(pages)}페이지, {args.dpi} DPI, {width}x{height}, OCR 제외)")
+    print(f"   페이지: p50 {p50:.0f}ms, p95 {p95:.0f}ms, 최대 {max(page_ms):.0f}ms (예산 {args.budget_ms:.0f}ms)")
+    print("   단계별 평균:")
+    for name, ms in result['stage_ms'].items():
+        print(f"      {name:<10} {ms:7.1f}ms")
+    print(f"   표 영역: 벡터 {tables['vector_ms']:.1f}ms vs 렌더링+래스터 {tables['raster_ms']:.0f}ms "
+          f"({tables['raster_ms'] / max(tables['vector_ms'], 1e-3):.0f}배)")
+    print(f"   analyze(): 벡터 괘선 {tables['analyze_vector_ms']:.0f}ms vs 래스터 {tables['analyze_raster_ms']:.0f}ms "
+          f"(렌더링 제외)")
+
+    if p95 > args.budget_ms:
+        print(f"\n❌ 예산 초과: p95 {p95:.0f}ms > {args.budget_ms:.0f}ms")
+        sys.exit(1)
+    print("\n✅ 예산 이내")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+benchmark_vlm.py - PRISM Phase 1.0 VLM Throughput Benchmark
+Mock VLM 서버 대상 VLMServiceV50 동시성별 처리량/지연/재시도 측정
+
+Usage:
+    python tests/benchmark_vlm.py [--pages 40] [--concurrency 1 2 4 8]
+                                  [--latency lognormal] [--mean-ms 300]
+                                  [--rate-limit 0.05] [--empty 0.0]
+                                  [--provider openai|azure_openai|local_sllm]
+
+    --url 지정 시 내장 서버 대신 외부 서버(scripts/mock_vlm_server.py 등) 사용
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import logging
+import argparse
+import statistics
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# PRISM 모듈 import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rate_limiter import _CONCURRENCY, RateLimiter
+from scripts.mock_vlm_server import MockVLMConfig, MockVLMServer
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def _configure_provider(provider: str, url: str) -> None:
+    """프로바이더 SDK가 Mock 서버를 바라보도록 환경 변수 설정"""
+    if provider == 'openai':
+        os.environ['OPENAI_BASE_URL'] = f"{url}/v1"
+        os.environ.setdefault('OPENAI_API_KEY', 'mock')
+    elif provider == 'azure_openai':
+        os.environ['AZURE_OPENAI_ENDPOINT'] = url
+        os.environ['AZURE_OPENAI_API_KEY'] = 'mock'
+        os.environ.setdefault('AZURE_OPENAI_DEPLOYMENT', 'mock-vision')
+    elif provider == 'local_sllm':
+        os.environ['OLLAMA_HOST'] = url
+
+
+def _synthetic_pages(count: int) -> List[str]:
+    """페이지마다 다른 가짜 이미지 (Base64)"""
+    return [base64.b64encode(f"page-{i}".encode() * 64).decode() for i in range(1, count + 1)]
+
+
+def _server_stats(url: str) -> Dict[str, int]:
+    with urllib.request.urlopen(f"{url}/stats") as response:
+        return json.loads(response.read())
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[int(q) - 1]
+
+
+def benchmark_concurrency(
+    provider: str,
+    url: str,
+    pages: List[str],
+    concurrency: int,
+    server: Optional[MockVLMServer] = None
+) -> Dict[str, Any]:
+    """
+    동시성 1단계 측정 (응답 캐시 미사용, 전용 rate limiter)
+
+    Returns:
+        pages/sec, p50/p95 지연, 재시도 수 등
+    """
+    from core.vlm_service import VLMServiceV50
+
+    # 공유 동시 요청 한도는 첫 인스턴스 값 유지 → 단계마다 새로 생성
+    _CONCURRENCY.clear()
+    service = VLMServiceV50(provider=provider, max_concurrency=concurrency, use_cache=False)
+    service.rate_limiter = RateLimiter(f"bench:{concurrency}")
+
+    # 요청 지연 = 동시 요청 한도 획득 이후 (call_with_retry) 구간
+    latencies: List[float] = []
+    call_with_retry = service.call_with_retry
+
+    def timed_call(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return call_with_retry(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    service.call_with_retry = timed_call
+
+    before = server.stats() if server else _server_stats(url)
+    start = time.perf_counter()
+    results = service.call_many([
+        {'image_data': image, 'prompt': '이 페이지를 Markdown으로 변환하세요.', 'page_num': n}
+        for n, image in enumerate(pages, 1)
+    ])
+    elapsed = time.perf_counter() - start
+    after = server.stats() if server else _server_stats(url)
+
+    received = after['requests'] - before['requests']
+    return {
+        'concurrency': concurrency,
+        'pages': len(pages),
+        'succeeded': sum(1 for r in results if isinstance(r, str) and r),
+        'elapsed_sec': round(elapsed, 3),
+        'pages_per_sec': round(len(pages) / elapsed, 2),
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+        'p95_ms': round(_percentile(latencies, 95) * 1000, 1),
+        # 서비스 재시도 (call_with_retry, SDK 내부 재시도는 끔) - 서버 수신 기준
+        'retries': received - len(pages),
+        'rate_limited': after['rate_limited'] - before['rate_limited'],
+        'empty': after['empty'] - before['empty'],
+        'queue_wait_sec': service.rate_limit_stats()['total_wait_sec']
+    }
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description='PRISM VLM 처리량 벤치마크 (Mock 서버)')
+    parser.add_argument('--provider', choices=['openai', 'azure_openai', 'local_sllm'], default='openai')
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--latency', choices=['fixed', 'uniform', 'lognormal'], default='lognormal')
+    parser.add_argument('--mean-ms', type=float, default=300.0)
+    parser.add_argument('--sigma', type=float, default=0.5)
+    parser.add_argument('--rate-limit', type=float, default=0.0)
+    parser.add_argument('--retry-after-ms', type=int, default=200)
+    parser.add_argument('--empty', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--url', default=None, help='외부 Mock 서버 URL (미지정 시 내장 서버)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = args.url.rstrip('/')
+    else:
+        server = MockVLMServer(MockVLMConfig(
+            latency=args.latency,
+            mean_ms=args.mean_ms,
+            sigma=args.sigma,
+            rate_limit_rate=args.rate_limit,
+            retry_after_ms=args.retry_after_ms,
+            empty_rate=args.empty,
+            seed=args.seed
+        )).start()
+        url = server.url
+
+    _configure_provider(args.provider, url)
+    pages = _synthetic_pages(args.pages)
+
+    print(f"\n📊 VLM 처리량 ({args.provider}, {args.pages}페이지, {url})")
+    print(f"   {'동시성':>6} {'pages/s':>9} {'p50':>9} {'p95':>9} {'재시도':>6} {'429':>5} {'빈응답':>6}")
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            result = benchmark_concurrency(args.provider, url, pages, concurrency, server)
+            results.append(result)
+            print(
+                f"   {concurrency:>6} {result['pages_per_sec']:>9.2f} "
+                f"{result['p50_ms']:>7.0f}ms {result['p95_ms']:>7.0f}ms "
+                f"{result['retries']:>6} {result['rate_limited']:>5} {result['empty']:>6}"
+            )
+    finally:
+        if server:
+            server.stop()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+tests/pdf_fixtures.py - 테스트용 합성 PDF 생성기
+
+외부 라이브러리 없이 최소 PDF를 직접 작성:
+- 페이지별 텍스트 (Helvetica, ASCII)
+- 선택적 표 괘선 (벡터 path)
+
+Author: 마창수산팀
+Date: 2026-10-16
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+# A4 (pt)
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+
+
+def _escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _page_stream(
+    lines: Sequence[str],
+    table: Optional[Tuple[float, float, float, float, int, int]] = None,
+    words: Sequence[Tuple[float, float, str]] = ()
+) -> bytes:
+    """페이지 content stream 생성"""
+    ops = []
+
+    y = PAGE_HEIGHT - 72
+    for line in lines:
+        ops.append(f"BT /F1 12 Tf 72 {y} Td ({_escape(line)}) Tj ET")
+        y -= 18
+
+    for x, y_pos, word in words:
+        ops.append(f"BT /F1 10 Tf {x} {y_pos} Td ({_escape(word)}) Tj ET")
+
+    if table:
+        # (x0, y0, x1, y1, rows, cols) - PDF 좌표 (좌하단 원점)
+        x0, y0, x1, y1, rows, cols = table
+        ops.append("1 w")
+        for r in range(rows + 1):
+            ty = y0 + (y1 - y0) * r / rows
+            ops.append(f"{x0} {ty} m {x1} {ty} l S")
+        for c in range(cols + 1):
+            tx = x0 + (x1 - x0) * c / cols
+            ops.append(f"{tx} {y0} m {tx} {y1} l S")
+
+    return '\n'.join(ops).encode('latin-1')
+
+
+def make_pdf(
+    path: Path,
+    pages: List[Sequence[str]],
+    tables: Optional[dict] = None,
+    words: Optional[dict] = None
+) -> Path:
+    """
+    합성 PDF 작성
+
+    Args:
+        path: 출력 경로
+        pages: 페이지별 텍스트 줄 목록
+        tables: {page_index: (x0, y0, x1, y1, rows, cols)}
+        words: {page_index: [(x, y, text), ...]} 좌표 지정 텍스트
+
+    Returns:
+        작성된 경로
+    """
+    tables = tables or {}
+    words = words or {}
+
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add(b'')  # placeholder
+    pages_id = add(b'')    # placeholder
+    font_id = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    page_ids = []
+    for idx, lines in enumerate(pages):
+        stream = _page_stream(lines, tables.get(idx), words.get(idx, ()))
+        content_id = add(
+            b'<< /Length ' + str(len(stream)).encode() + b' >>\nstream\n' + stream + b'\nendstream'
+        )
+        page_id = add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        page_ids.append(page_id)
+
+    kids = ' '.join(f"{pid} 0 R" for pid in page_ids)
+    objects[catalog_id - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode()
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + body + b'\nendobj\n'
+
+    xref_pos = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n".encode()
+    out += b'0000000000 65535 f \n'
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root {catalog_id} 0 R >>\nstartxref\n{xref_pos}\n%%EOF\n".encode()
+
+    path = Path(path)
+    path.write_bytes(bytes(out))
+    return path
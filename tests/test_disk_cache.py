@@ -0,0 +1,112 @@
+"""
+tests/test_disk_cache.py - Phase 1.0 DiskCache 테스트
+
+테스트 범위:
+1. 저장/조회 + 적중/미스 통계
+2. 용량 초과 시 LRU 삭제 (최근 조회 항목 유지)
+3. file_sha256: 내용 기반 (경로 무관)
+4. TTL 만료 항목은 미스 + 삭제
+5. 같은 키 덮어쓰기 → 용량 집계는 크기 차이만 (조기 LRU 정리 없음), 동시 조회 통계 누락 없음
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.disk_cache import DiskCache, file_sha256
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_put_get_roundtrip(tmp_path):
+    """저장/조회 + 통계"""
+    cache = DiskCache(root=str(tmp_path), namespace="t")
+    key = DiskCache.make_key('page', 'abc', 0, 100, 'png')
+
+    assert cache.get(key) is None
+    cache.put(key, b"payload")
+    assert cache.get(key) == b"payload"
+
+    stats = cache.stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    assert not any(p.name.startswith('.tmp_') for p in tmp_path.rglob('*')), "❌ 임시 파일 잔존"
+
+
+def test_lru_eviction_keeps_recent(tmp_path):
+    """용량 초과: atime 오래된 항목부터 삭제"""
+    cache = DiskCache(root=str(tmp_path), namespace="t", max_bytes=2500)
+    keys = [DiskCache.make_key('k', i) for i in range(3)]
+
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, b"x" * 1000)
+        # atime 순서 고정 (파일시스템 relatime 영향 배제)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+
+    cache.get(keys[0])  # keys[0]을 최근 사용으로 갱신
+    cache.put(keys[2], b"x" * 1000)
+
+    assert cache.contains(keys[0]), "❌ 최근 조회 항목이 삭제됨"
+    assert not cache.contains(keys[1]), "❌ LRU 항목이 삭제되지 않음"
+    assert cache.contains(keys[2])
+
+
+def test_file_sha256_content_addressed(tmp_path):
+    """동일 내용 → 동일 해시 (경로 무관)"""
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"%PDF-1.4 same")
+    b.write_bytes(b"%PDF-1.4 same")
+
+    assert file_sha256(str(a)) == file_sha256(str(b))
+
+
+def test_ttl_expiry(tmp_path):
+    """쓰기 후 TTL 경과 → 미스 + 파일 삭제"""
+    cache = DiskCache(root=str(tmp_path), namespace="t", ttl_seconds=60)
+    key = DiskCache.make_key('vlm', 'x')
+    cache.put(key, b"cached")
+    assert cache.get(key) == b"cached"
+
+    old = os.stat(cache._path(key)).st_mtime - 120
+    os.utime(cache._path(key), (old, old))
+
+    assert cache.get(key) is None
+    assert not cache.contains(key)
+
+
+def test_overwrite_counts_size_delta(tmp_path, monkeypatch):
+    """같은 키 반복 저장: 용량 집계 = 실제 디렉터리 크기, LRU 정리 없음"""
+    cache = DiskCache(root=str(tmp_path), namespace="t", max_bytes=1000)
+    evictions = []
+    monkeypatch.setattr(cache, "_evict", lambda: evictions.append(cache._size))
+    key = DiskCache.make_key('page', 'abc')
+
+    for size in (400, 600, 300, 300, 300, 300):
+        cache.put(key, b"x" * size)
+
+    assert cache._size == cache._scan_size() == 300
+    assert evictions == []
+
+
+def test_concurrent_stats(tmp_path):
+    """여러 스레드 동시 조회 → 적중/미스 누락 없음"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = DiskCache(root=str(tmp_path), namespace="t")
+    key = DiskCache.make_key('hit')
+    cache.put(key, b"payload")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda n: cache.get(key if n % 2 else DiskCache.make_key('miss', n)), range(400)))
+
+    stats = cache.stats()
+    assert stats['hits'] == 200 and stats['misses'] == 200
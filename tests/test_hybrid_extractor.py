@@ -0,0 +1,148 @@
+"""
+tests/test_hybrid_extractor.py - Phase 1.0 HybridExtractor 전체 초기화 테스트
+
+테스트 범위:
+1. 실제 생성자 (하위 모듈 전체 import) + extract(): 스텁 VLM 응답 → source='vlm'
+2. extract_pages(): 순차 / call_many 묶음 경로 모두 페이지 순서대로 결과
+3. 짧은 VLM 응답 → 텍스트 레이어 Fallback
+4. PagePipeline 렌더링 실패 페이지 → 결과에 포함 (텍스트 레이어 Fallback)
+5. 텍스트 우선 라우팅 (한국어 텍스트 레이어): 표 키워드('원' 등)만 있는 본문 → text_layer,
+   괘선 표 페이지 → VLM
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.hybrid_extractor import HybridExtractor
+from core.page_pipeline import PagePipeline
+from core.pdf_processor import PDFProcessor
+from core.text_layer import PdfTextLayer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 합격 기준(50자) 이상 응답
+REPLY = "제{page}조(목적) 이 규정은 스텁 VLM 응답으로 추출된 페이지 {page}의 본문이며 길이 기준을 넘도록 작성합니다."
+
+# 품질 기준 통과 한국어 본문 ('직원'의 '원', '명령'의 '명' → 기존 표 키워드에 걸림)
+KOREAN_PAGE = (
+    "제{page}조(목적) 이 규정은 공사 직원의 임용, 승진 및 보수에 관한 사항을 정함을 목적으로 한다.\n"
+    "제{next}조(적용범위) 직원의 인사에 관하여 다른 규정이나 명령에 특별한 규정이 없으면 이 규정에 따른다."
+)
+
+class _StubVLM:
+    """페이지 번호가 들어간 고정 응답 (call_many 지원 여부 선택)"""
+
+    provider = 'stub'
+    model = 'stub-model'
+
+    def __init__(self, reply: str = REPLY, max_concurrency: int = 1):
+        self.reply = reply
+        self.max_concurrency = max_concurrency
+        self.calls = []
+
+    def call_with_image(self, image_data, prompt, page_num=1, **kwargs):
+        self.calls.append(page_num)
+        return self.reply.format(page=page_num)
+
+    def call_many(self, requests, return_exceptions=True):
+        return [self.call_with_image(**request) for request in requests]
+
+
+def _extractor(tmp_path: Path, vlm: _StubVLM, text_first: bool = False, tables=None) -> HybridExtractor:
+    pdf_path = make_pdf(tmp_path / "doc.pdf", [[f"Article {n} body text"] for n in (1, 2, 3)], tables=tables)
+    # 기본: 텍스트 레이어 우선/중복 생략 끔 → 모든 페이지 VLM 경로
+    return HybridExtractor(
+        vlm, str(pdf_path),
+        pdf_processor=PDFProcessor(use_cache=False),
+        text_first=text_first, dedup=False
+    )
+
+
+def test_extract_with_real_constructor(tmp_path):
+    """전체 생성자 → extract() VLM 결과 + 후처리"""
+    vlm = _StubVLM()
+    extractor = _extractor(tmp_path, vlm)
+    page = extractor.pdf_processor.render_page(extractor.pdf_path, 1, dpi=100)
+
+    result = extractor.extract(page, 1)
+
+    assert result['source'] == 'vlm' and result['page_num'] == 1
+    assert "페이지 1의 본문" in result['content']
+    assert vlm.calls == [1]
+
+
+def test_extract_pages_sequential_and_batched(tmp_path):
+    """순차 / 묶음 동시 호출 → 같은 결과, 페이지 순서 유지"""
+    for concurrency in (1, 2):
+        vlm = _StubVLM(max_concurrency=concurrency)
+        extractor = _extractor(tmp_path, vlm)
+        pages = extractor.pdf_processor.iter_rendered_pages(extractor.pdf_path, dpi=100)
+
+        results = list(extractor.extract_pages(pages))
+
+        assert [r['page_num'] for r in results] == [1, 2, 3]
+        assert [r['source'] for r in results] == ['vlm'] * 3
+        assert sorted(vlm.calls) == [1, 2, 3]
+
+
+def test_short_reply_falls_back(tmp_path):
+    """50자 미만 응답 → Fallback (텍스트 레이어)"""
+    extractor = _extractor(tmp_path, _StubVLM(reply="짧음"))
+    page = extractor.pdf_processor.render_page(extractor.pdf_path, 2, dpi=100)
+
+    result = extractor.extract(page, 2)
+
+    assert result['source'] == 'fallback'
+    assert "Article 2" in result['content']
+
+
+def test_pipeline_render_failure_falls_back(tmp_path, monkeypatch):
+    """분석 단계 렌더링 실패 → VLM 생략, 텍스트 레이어 Fallback (누락 없음)"""
+    vlm = _StubVLM()
+    extractor = _extractor(tmp_path, vlm)
+    real_render = extractor.pdf_processor.render_page
+
+    def _render(pdf_path, page_num, dpi=300):
+        if page_num == 2:
+            raise RuntimeError("bitmap allocation failed")
+        return real_render(pdf_path, page_num, dpi=dpi)
+
+    monkeypatch.setattr(extractor.pdf_processor, "render_page", _render)
+
+    results = list(PagePipeline(extractor, analyze_workers=0).run(extractor.pdf_path))
+
+    assert [r['source'] for r in results] == ['vlm', 'fallback', 'vlm']
+    assert results[1]['fallback'] == 'text_layer' and "Article 2" in results[1]['content']
+    assert results[1]['route']['decision'] == 'fallback'
+    assert sorted(vlm.calls) == [1, 3]
+
+
+def test_korean_text_layer_routing(tmp_path):
+    """한국어 텍스트 레이어 양호: 표 키워드만 → text_layer (VLM 생략), 괘선 표 → VLM"""
+    vlm = _StubVLM()
+    extractor = _extractor(tmp_path, vlm, text_first=True, tables={1: (72, 300, 520, 600, 6, 4)})
+    extractor._text_layer = PdfTextLayer.from_pages(
+        [KOREAN_PAGE.format(page=2 * n - 1, next=2 * n) for n in (1, 2, 3)], backend='test'
+    )
+
+    body = extractor.extract(extractor.pdf_processor.render_page(extractor.pdf_path, 1, dpi=100), 1)
+    table = extractor.extract(extractor.pdf_processor.render_page(extractor.pdf_path, 2, dpi=100), 2)
+
+    assert body['route']['decision'] == 'text_layer' and body['route']['quality']['passed']
+    assert body['source'] == 'text_layer' and "직원" in body['content']
+    assert table['route']['decision'] in ('vlm', 'vlm_regions')
+    assert vlm.calls == [2]
+
+    # 표 키워드로 역할이 'table'이어도 괘선/표 영역 근거가 없으면 텍스트 레이어
+    route, text = extractor._route(1, 'table', None, {'has_table': True, 'regions': [], 'grid_intersections': 0})
+    assert route['decision'] == 'text_layer' and "직원" in text
@@ -0,0 +1,91 @@
+"""
+tests/test_image_encoding.py - Phase 1.0 VLM 이미지 인코딩 정책 테스트
+
+테스트 범위:
+1. 포맷별 인코딩 + MIME 타입 일치 (매직 바이트 판별)
+2. 최대 긴 변 / 바이트 예산 자동 축소 (하한 유지)
+3. iter_pages() 정책 적용 + VLM data URL 라벨이 실제 포맷과 일치
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.image_encoding import ImageEncodingPolicy, encode_image, sniff_mime_type
+from core.pdf_processor import PDFProcessor
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _noisy_page(height: int = 2000, width: int = 1400) -> np.ndarray:
+    """압축이 잘 안 되는 스캔 유사 이미지"""
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+
+def test_formats_and_mime_types():
+    """png/jpeg/webp → 실제 매직 바이트와 MIME 일치, PNG는 무손실"""
+    pixels = _noisy_page(200, 140)
+    for fmt in ('png', 'jpeg', 'webp'):
+        encoded = encode_image(pixels, ImageEncodingPolicy(format=fmt, quality=80))
+        assert encoded.mime_type == f"image/{fmt}"
+        assert sniff_mime_type(encoded.base64) == encoded.mime_type
+        assert encoded.data_url.startswith(f"data:image/{fmt};base64,")
+
+    png = encode_image(pixels, ImageEncodingPolicy(format='png'))
+    decoded = cv2.imdecode(np.frombuffer(png.data, np.uint8), cv2.IMREAD_COLOR)
+    assert np.array_equal(decoded, pixels)
+
+    with pytest.raises(ValueError):
+        ImageEncodingPolicy(format='gif')
+
+
+def test_max_edge_and_byte_budget():
+    """긴 변 상한 적용, 예산 초과 시 축소하되 min_long_edge 아래로는 줄이지 않음"""
+    pixels = _noisy_page()
+
+    edged = encode_image(pixels, ImageEncodingPolicy(format='jpeg', max_long_edge=1000))
+    assert (edged.height, edged.width) == (1000, 700)
+
+    budget = 400 * 1024
+    fitted = encode_image(pixels, ImageEncodingPolicy(format='jpeg', quality=85, max_bytes=budget, min_long_edge=256))
+    assert fitted.size <= budget and fitted.height < 2000
+
+    floor = encode_image(pixels, ImageEncodingPolicy(format='jpeg', max_bytes=1024, min_long_edge=1500))
+    assert max(floor.width, floor.height) == 1500
+
+
+def test_iter_pages_and_vlm_label(tmp_path, monkeypatch):
+    """iter_pages(): 정책 포맷으로 인코딩 → VLM 요청 data URL도 같은 MIME"""
+    pdf_path = str(make_pdf(tmp_path / "doc.pdf", [["Article 1"]]))
+    processor = PDFProcessor(use_cache=False, image_policy=ImageEncodingPolicy(format='webp', quality=70))
+    image, _ = next(processor.iter_pages(pdf_path, dpi=50))
+    assert sniff_mime_type(image) == 'image/webp'
+
+    from core.vlm_service import VLMServiceV50
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    service = VLMServiceV50(provider='openai', use_cache=False)
+    sent = {}
+
+    def fake_create(model, messages):
+        sent['url'] = messages[0]['content'][0]['image_url']['url']
+        raise RuntimeError("stop after capture")
+
+    monkeypatch.setattr(service.client.chat.completions, "create", fake_create)
+    with pytest.raises(RuntimeError):
+        service.call(image, "p")
+    assert sent['url'].startswith("data:image/webp;base64,")
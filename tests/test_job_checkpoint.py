@@ -0,0 +1,111 @@
+"""
+tests/test_job_checkpoint.py - Phase 1.0 JobCheckpoint 테스트
+
+테스트 범위:
+1. 페이지 저장 → 같은 문서/설정 재오픈 시 완료 페이지 유지, 설정이 다르면 별도 작업
+2. 재개: 미완료 페이지만 파이프라인 처리
+3. 손상된 체크포인트는 미완료로 처리
+4. Fallback 결과는 재시도 대상 (완료 페이지 제외, 결과 조립에는 포함, 성공 시 완료로 교체)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.job_checkpoint import JobCheckpoint
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _pdf(tmp_path: Path, pages: int = 4) -> str:
+    return str(make_pdf(tmp_path / "doc.pdf", [[f"Article {n}"] for n in range(1, pages + 1)]))
+
+
+def _result(page_num: int) -> dict:
+    return {
+        'page_num': page_num,
+        'content': f"제{page_num}조(목적) 본문",
+        'source': 'vlm',
+        'hints': {'h_v_line_density': np.float64(0.25), 'grid_intersections': np.int64(3)},
+        'timings': {'vlm': 1.5}
+    }
+
+
+def test_save_and_reopen(tmp_path):
+    """재오픈 시 완료 페이지 유지, 설정 변경 시 새 작업"""
+    pdf_path = _pdf(tmp_path)
+    root = str(tmp_path / "jobs")
+
+    job = JobCheckpoint.for_document(pdf_path, {'model': 'a'}, total_pages=4, root=root)
+    job.save_page(_result(1))
+    job.save_page(_result(2))
+
+    reopened = JobCheckpoint.for_document(pdf_path, {'model': 'a'}, total_pages=4, root=root)
+    assert reopened.directory == job.directory
+    assert reopened.completed_pages() == {1, 2}
+
+    record = reopened.load_page(2)
+    assert record['content'] == "제2조(목적) 본문"
+    assert record['hints']['h_v_line_density'] == 0.25 and record['timings']['vlm'] == 1.5
+
+    other = JobCheckpoint.for_document(pdf_path, {'model': 'b'}, total_pages=4, root=root)
+    assert other.directory != job.directory and other.completed_pages() == set()
+
+
+def test_resume_processes_only_pending(tmp_path):
+    """완료 페이지는 파이프라인에 다시 넣지 않음"""
+    from core.page_pipeline import PagePipeline
+    from tests.test_page_pipeline import _FakeExtractor
+
+    pdf_path = _pdf(tmp_path)
+    job = JobCheckpoint.for_document(pdf_path, total_pages=4, root=str(tmp_path / "jobs"))
+    job.save_page(_result(1))
+    job.save_page(_result(3))
+
+    pending = [n for n in range(1, 5) if n not in job.completed_pages()]
+    pipeline = PagePipeline(_FakeExtractor(), analyze_workers=0)
+    for result in pipeline.run(pdf_path, pages=pending):
+        assert 'timings' in result
+        job.save_page(result)
+
+    assert pipeline.stats()['pages'] == 2
+    assert [r['page_num'] for r in job.iter_pages()] == [1, 2, 3, 4]
+    assert [r['content'] for r in job.iter_pages()][1] == "page 2"
+
+
+def test_corrupt_page_is_pending(tmp_path):
+    """손상된 페이지 파일 → None + 삭제"""
+    job = JobCheckpoint.for_document(_pdf(tmp_path), root=str(tmp_path / "jobs"))
+    job.save_page(_result(1))
+    (job.pages_dir / "00002.json").write_text("{broken", encoding='utf-8')
+
+    assert job.load_page(2) is None
+    assert job.completed_pages() == {1}
+
+
+def test_fallback_pages_are_retried(tmp_path):
+    """Fallback ([추출 실패] 포함) → completed_pages() 제외, iter_pages() 포함, 재처리 성공 시 완료"""
+    job = JobCheckpoint.for_document(_pdf(tmp_path), total_pages=4, root=str(tmp_path / "jobs"))
+    job.save_page(_result(1))
+    job.save_page({**_result(2), 'source': 'fallback', 'fallback': 'none', 'content': "# 페이지 2\n[추출 실패]"})
+    job.save_page({**_result(3), 'source': 'fallback', 'fallback': 'text_layer'})
+
+    assert job.completed_pages() == {1} and job.retry_pages() == {2, 3}
+    assert [r['source'] for r in job.iter_pages()] == ['vlm', 'fallback', 'fallback']
+
+    job.save_page(_result(2))
+    reopened = JobCheckpoint.for_document(_pdf(tmp_path), total_pages=4, root=str(tmp_path / "jobs"))
+    assert reopened.completed_pages() == {1, 2} and reopened.retry_pages() == {3}
+    assert reopened.load_page(2)['source'] == 'vlm'
+    assert not (job.pages_dir / "00002.retry.json").exists()
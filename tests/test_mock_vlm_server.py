@@ -0,0 +1,74 @@
+"""
+tests/test_mock_vlm_server.py - Phase 1.0 Mock VLM 서버 테스트
+
+테스트 범위:
+1. OpenAI SDK 경유 VLMServiceV50 호출 → 결정적 Markdown 응답
+2. 429 주입: retry-after-ms 헤더 포함 응답
+3. SDK 내부 재시도 없음 (429 1회 = 서버 요청 1회, 재시도는 서비스 계층만)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import json
+import logging
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.vlm_service import VLMServiceV50
+from scripts.mock_vlm_server import MockVLMConfig, MockVLMServer, canned_markdown
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_openai_roundtrip_deterministic(monkeypatch):
+    """같은 이미지 → 같은 응답, 서버 통계 반영"""
+    with MockVLMServer(MockVLMConfig(mean_ms=0)) as server:
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{server.url}/v1")
+        monkeypatch.setenv("OPENAI_API_KEY", "mock")
+        service = VLMServiceV50(provider='openai', use_cache=False)
+
+        first = service.call("aW1hZ2U=", "prompt")
+        assert first == service.call("aW1hZ2U=", "prompt")
+        assert first == canned_markdown("data:image/jpeg;base64,aW1hZ2U=")
+        assert first.startswith("### 제")
+        assert server.stats()['requests'] == 2
+
+
+def test_rate_limit_injection():
+    """rate_limit_rate=1 → 429 + retry-after-ms"""
+    with MockVLMServer(MockVLMConfig(mean_ms=0, rate_limit_rate=1.0, retry_after_ms=300)) as server:
+        request = urllib.request.Request(
+            f"{server.url}/v1/chat/completions",
+            data=json.dumps({'model': 'm', 'messages': []}).encode(),
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            urllib.request.urlopen(request)
+            assert False, "❌ 429 미발생"
+        except urllib.error.HTTPError as e:
+            assert e.code == 429
+            assert e.headers['retry-after-ms'] == '300'
+        assert server.stats()['rate_limited'] == 1
+
+
+def test_sdk_does_not_retry(monkeypatch):
+    """max_retries=0: call() 1회 = 서버 요청 1회 (429도 SDK가 재전송하지 않음)"""
+    with MockVLMServer(MockVLMConfig(mean_ms=0, rate_limit_rate=1.0, retry_after_ms=10)) as server:
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{server.url}/v1")
+        monkeypatch.setenv("OPENAI_API_KEY", "mock")
+        service = VLMServiceV50(provider='openai', use_cache=False)
+
+        try:
+            service.call("aW1hZ2U=", "prompt")
+            assert False, "❌ 429 미발생"
+        except Exception as e:
+            assert getattr(e, 'status_code', None) == 429
+        assert server.stats()['requests'] == 1 and server.stats()['rate_limited'] == 1
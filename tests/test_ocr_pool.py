@@ -0,0 +1,122 @@
+"""
+tests/test_ocr_pool.py - Phase 1.0 OCR 프로세스 풀 + 텍스트 레이어 우회 테스트
+
+테스트 범위:
+1. analyze(text_layer=...) → OCR 생략, 키워드/비율은 텍스트 레이어 기준 (표 판정은 괘선 교차만)
+2. OcrUsage: 우회 페이지 × 페이지당 OCR 시간 = 절약 시간
+3. 상주 OCR 풀: 워커당 엔진 초기화 1회, 영역/축소 입력
+4. HybridExtractor: 깨진 텍스트 레이어는 우회하지 않음
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import os
+import sys
+import types
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.quick_layout_analyzer as qla
+from core.hybrid_extractor import HybridExtractor
+from core.ocr_pool import OcrPool, OcrUsage
+from core.page_quality import PageQualityScorer
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from core.text_layer import PdfTextLayer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _SizeEngine:
+    """OCR 엔진 대역: 워커 PID / 엔진 id / 입력 크기 반환 (spawn 워커에서 import 가능해야 함)"""
+
+    def __init__(self, lang):
+        self.lang = lang
+
+    def ocr(self, gray):
+        return f"{os.getpid()} {id(self)} {gray.shape[1]}x{gray.shape[0]}"
+
+
+def test_text_layer_bypasses_ocr(tmp_path, monkeypatch):
+    """텍스트 레이어 전달 → Tesseract 호출 없음, 조항 비율은 텍스트 레이어에서 (표 판정은 괘선 기준)"""
+    calls = []
+
+    def fake_ocr(gray, lang=None):
+        calls.append(gray.shape)
+        return "Article 1"
+
+    monkeypatch.setattr(qla, 'pytesseract', types.SimpleNamespace(image_to_string=fake_ocr), raising=False)
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = True
+    page = PDFProcessor(use_cache=False).render_page(str(make_pdf(tmp_path / "doc.pdf", [["Article 1"]])), 1, dpi=100)
+
+    bypassed = analyzer.analyze(page, text_layer="제1조(목적) 이 규정의 합계는 다음과 같다.")
+    assert calls == [] and bypassed['text_source'] == 'text_layer'
+    assert bypassed['ocr_page_text'] is None and bypassed['ocr_sec'] == 0.0
+    assert bypassed['article_token_ratio'] > 0
+    # 텍스트 레이어의 표 키워드 ('합계', '원' ...) 는 표 판정에 쓰지 않음 → 괘선 없는 페이지는 표 아님
+    assert not bypassed['has_table']
+
+    ocr = analyzer.analyze(page, text_layer="   ")
+    assert len(calls) == 1 and ocr['text_source'] == 'ocr' and ocr['ocr_page_text'] == "Article 1"
+
+    usage = OcrUsage()
+    for hints in (bypassed, bypassed, {'text_source': 'ocr', 'ocr_sec': 2.0}):
+        usage.record(hints)
+    stats = usage.stats()
+    assert stats['bypassed_pages'] == 2 and stats['ocr_pages'] == 1
+    assert stats['saved_sec'] == 4.0 and not stats['estimated']
+    assert OcrUsage(sec_estimate=1.5).stats()['estimated']
+
+
+def test_text_layer_table_from_rulings(tmp_path):
+    """텍스트 레이어 페이지: '직원'/'%' 등 키워드와 무관하게 괘선 표가 있을 때만 has_table"""
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    text = "제3조(정원) 직원의 정원은 별표와 같으며 충원율은 95% 이상으로 한다."
+    pdf = make_pdf(tmp_path / "doc.pdf", [["Article 3"], ["Annex"]], tables={1: (72, 300, 520, 600, 6, 4)})
+    processor = PDFProcessor(use_cache=False)
+
+    body, table = (analyzer.analyze(processor.render_page(str(pdf), n, dpi=100), text_layer=text) for n in (1, 2))
+
+    assert body['text_source'] == table['text_source'] == 'text_layer'
+    assert not body['has_table'] and table['has_table']
+
+
+def test_pool_engine_once_per_worker():
+    """상주 워커: 엔진 1회 생성 후 재사용, 영역 자르기 + 긴 변 축소 후 전송"""
+    gray = np.full((2000, 1000), 255, dtype=np.uint8)
+    pool = OcrPool(workers=1, max_long_edge=500, engine_factory=_SizeEngine)
+    try:
+        first, sec = pool.submit(gray).result(timeout=60)
+        second, _ = pool.submit(gray, region=[0.0, 0.5, 1.0, 1.0]).result(timeout=60)
+    finally:
+        pool.shutdown()
+
+    pid, engine_id, size = first.split()
+    assert size == "250x500" and sec >= 0.0
+    assert second.split() == [pid, engine_id, "500x500"]
+    assert pid != str(os.getpid())
+
+
+def test_garbage_text_layer_not_used(tmp_path):
+    """깨진 문자 과다 / 글자 없는 텍스트 레이어 → 분석 OCR 유지"""
+    extractor = HybridExtractor.__new__(HybridExtractor)
+    extractor.quality_scorer = PageQualityScorer()
+    extractor._text_layer = PdfTextLayer.from_pages(
+        ["제1조(목적) 이 규정은 적용한다.", "(cid:12)(cid:34)(cid:56) 제2조", "- 3 -"],
+        backend='pdfium'
+    )
+
+    assert extractor._analysis_text(1) == "제1조(목적) 이 규정은 적용한다."
+    assert extractor._analysis_text(2) is None
+    assert extractor._analysis_text(3) is None
+    assert extractor._analysis_text(9) is None
@@ -0,0 +1,89 @@
+"""
+tests/test_page_dedup.py - Phase 1.0 페이지 중복/빈 페이지 감지 테스트
+
+테스트 범위:
+1. 빈 페이지 / 쪽번호만 있는 페이지는 blank, 한 줄짜리 페이지와 표 페이지는 blank 아님
+2. 같은 페이지는 같은 지문, 글자만 다른 페이지도 다른 지문
+3. PageDeduplicator: 문서 내 중복, 디스크 캐시로 문서 간 재사용, 절약 호출 수
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.disk_cache import DiskCache
+from core.page_dedup import PageDeduplicator, page_fingerprint
+from core.pdf_processor import PDFProcessor
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROMPT = "이 페이지를 Markdown으로 변환하세요."
+
+
+def _fingerprints(tmp_path: Path):
+    pdf_path = make_pdf(
+        tmp_path / "doc.pdf",
+        [[], ["Article 1"], ["Article 1"], ["Article 2"], [], ["Article 9"]],
+        tables={3: (72, 300, 520, 600, 6, 4)},
+        words={4: [(290, 30, "- 5 -")]}
+    )
+    processor = PDFProcessor(use_cache=False)
+    return [
+        page_fingerprint(processor.render_page(str(pdf_path), n, dpi=100).pixels)
+        for n in range(1, 7)
+    ]
+
+
+def test_blank_and_duplicate_detection(tmp_path):
+    """빈 페이지 판정 + 해시 일치/불일치"""
+    blank, article1, article1_again, article2_table, page_number_only, article9 = _fingerprints(tmp_path)
+
+    assert blank.blank and page_number_only.blank
+    assert not article1.blank and not article2_table.blank
+
+    assert (article1.dhash, article1.digest) == (article1_again.dhash, article1_again.digest)
+    assert article1.dhash != article2_table.dhash
+    assert article1.digest != article2_table.digest
+
+    # 레이아웃이 같은 본문 페이지: dHash가 같아도 다이제스트로 구분
+    assert article1.digest != article9.digest
+
+
+def test_deduplicator_reuses_results(tmp_path):
+    """문서 내 중복 → 원본 결과, 다른 문서(새 인스턴스) → 캐시 결과"""
+    _, article1, article1_again, article2_table, _, _ = _fingerprints(tmp_path)
+    cache = DiskCache(root=str(tmp_path / "cache"), namespace="vlm")
+
+    dedup = PageDeduplicator(cache=cache, key_parts=('mock', 'model-a'))
+    key1 = dedup.key(article1, PROMPT)
+    assert dedup.key(article1_again, PROMPT) == key1
+    assert dedup.key(article1, PROMPT, "Article 1") != key1  # 텍스트 레이어도 키에 포함
+    assert dedup.key(article1, PROMPT + " 표 주의") != key1
+
+    assert dedup.match(key1, 2) == (None, None, None)
+    dedup.record(key1, 2, "제1조 본문")
+    assert dedup.match(dedup.key(article1_again, PROMPT), 3) == ('duplicate', 2, None)
+    assert dedup.content_for(2) == "제1조 본문"
+    assert dedup.match(dedup.key(article2_table, PROMPT), 4) == (None, None, None)
+
+    # 다른 문서: 같은 캐시, 새 인스턴스
+    other = PageDeduplicator(cache=cache, key_parts=('mock', 'model-a'))
+    assert other.match(other.key(article1, PROMPT), 7) == ('cache', None, "제1조 본문")
+    assert other.match(other.key(article1_again, PROMPT), 9) == ('duplicate', 7, None)
+    assert other.content_for(7) == "제1조 본문"
+
+    # 모델이 다르면 캐시 미적용
+    other_model = PageDeduplicator(cache=cache, key_parts=('mock', 'model-b'))
+    assert other_model.match(other_model.key(article1, PROMPT), 1) == (None, None, None)
+
+    other.count('blank')
+    assert other.stats() == {'blank': 1, 'duplicate': 1, 'cache': 1, 'saved_calls': 3}
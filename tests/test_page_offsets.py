@@ -0,0 +1,60 @@
+"""
+tests/test_page_offsets.py - Phase 1.0 페이지 오프셋 추적 테스트
+
+테스트 범위:
+1. PageOffsetIndex.after_removals: 삭제 구간 반영
+2. LawParser → TreeBuilder → to_chunks: 조문 청크 page_start/page_end
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.law_parser import LawParser
+from core.text_layer import PageOffsetIndex, PdfTextLayer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def test_after_removals_shifts_starts():
+    """삭제 구간 이후 페이지 시작 오프셋 이동, 구간 내부는 구간 끝으로"""
+    index = PageOffsetIndex([0, 10, 20]).after_removals([(5, 12), (15, 16)])
+
+    assert index.page_starts == [0, 5, 12]
+    assert index.page_at(4) == 1 and index.page_at(5) == 2 and index.page_at(12) == 3
+
+
+def test_law_chunks_carry_pages():
+    """정제(아티팩트/구분자/개행) 후에도 조문 청크 페이지 범위 유지"""
+    pages = [
+        "제1장 총칙\n제1조(목적) 이 규정은 목적을 정한다.\n인사규정 402-1",
+        "Page 2\n\n\n\n제2조(정의) 용어의 뜻은 다음과 같다.\n1. 직원\n인사규정 402-2",
+        "",
+        "2. 임원\n제3조(적용) 모든 직원에게 적용한다.\n---\n인사규정 402-4",
+    ]
+    layer = PdfTextLayer.from_pages(pages, backend='test')
+
+    parser = LawParser()
+    parsed = parser.parse(layer.text, document_title="인사규정", page_index=layer.page_index())
+    chunks = parser.to_chunks(parsed)
+
+    spans = {
+        c['metadata']['article_number']: (c['metadata']['page_start'], c['metadata']['page_end'])
+        for c in chunks if c['metadata']['type'] == 'article'
+    }
+    assert spans == {'제1조': (1, 1), '제2조': (2, 4), '제3조': (4, 4)}, spans
+
+    chapter = next(c for c in chunks if c['metadata']['type'] == 'chapter')
+    assert chapter['metadata']['page_start'] == 1
+
+    # page_index 미전달 시 기존 메타데이터 그대로
+    plain = parser.to_chunks(parser.parse(layer.text, document_title="인사규정"))
+    assert all('page_start' not in c['metadata'] for c in plain)
@@ -0,0 +1,140 @@
+"""
+tests/test_page_pipeline.py - Phase 1.0 PagePipeline 테스트
+
+테스트 범위:
+1. 페이지 순서 유지 + VLM 동시 호출 (인라인 분석 / 프로세스 풀 분석)
+2. 소비자가 중간에 멈춰도 종료 (스레드/풀 정리)
+3. 단계별 시간 통계
+4. 렌더링/준비 실패 페이지 → 결과에서 빠지지 않고 오류와 함께 _finish() (Fallback)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.page_pipeline import PagePipeline
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _FakeVLM:
+    max_concurrency = 3
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def call_with_image(self, image_data, prompt, page_num=1, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.3)
+        with self.lock:
+            self.active -= 1
+        return f"page {page_num}"
+
+
+class _FakeExtractor:
+    """HybridExtractor 단계 인터페이스 (_prepare / _call_vlm / _finish)"""
+
+    def __init__(self, fail_prepare=()):
+        self.vlm_service = _FakeVLM()
+        self.layout_analyzer = QuickLayoutAnalyzer()
+        self.pdf_processor = PDFProcessor(use_cache=False)
+        self.fail_prepare = set(fail_prepare)
+
+    def _prepare(self, image_data, page_num, hints=None, fingerprint=None):
+        if page_num in self.fail_prepare:
+            raise ValueError(f"prepare {page_num}")
+        assert hints is not None and 'has_table' in hints
+        assert fingerprint is not None and not fingerprint.blank
+        return {
+            'page_num': page_num,
+            'text': None,
+            'error': None,
+            'vlm_request': {'image_data': '', 'prompt': 'p', 'page_num': page_num}
+        }
+
+    @staticmethod
+    def _failed_request(page_num, error, image_data=None):
+        return {'page_num': page_num, 'text': None, 'error': error, 'image': image_data}
+
+    @staticmethod
+    def _needs_vlm(request):
+        return request['text'] is None and request['error'] is None
+
+    def _call_vlm(self, request):
+        return self.vlm_service.call_with_image(**request['vlm_request'])
+
+    def _finish(self, request, content):
+        return {'page_num': request['page_num'], 'content': content}
+
+
+def _pdf(tmp_path: Path, pages: int = 6) -> str:
+    return str(make_pdf(tmp_path / "doc.pdf", [[f"Article {n}"] for n in range(1, pages + 1)]))
+
+
+def test_pipeline_ordered_and_concurrent(tmp_path):
+    """인라인 분석: 페이지 순서 유지, VLM 동시 호출, 통계"""
+    extractor = _FakeExtractor()
+    pipeline = PagePipeline(extractor, analyze_workers=0, max_buffered=2)
+
+    results = list(pipeline.run(_pdf(tmp_path)))
+
+    assert [r['content'] for r in results] == [f"page {n}" for n in range(1, 7)]
+    assert extractor.vlm_service.peak > 1, "❌ VLM 호출이 겹치지 않음"
+
+    stats = pipeline.stats()
+    assert stats['pages'] == 6 and stats['vlm_pages'] == 6
+    assert stats['stage_sec']['render'] > 0 and stats['stage_sec']['vlm'] >= 1.8
+    assert set(stats['stage_sec']) == {'render', 'analyze', 'prepare', 'vlm', 'finish'}
+
+
+def test_pipeline_process_pool_and_early_stop(tmp_path):
+    """프로세스 풀 분석 + max_pages + 중간 종료"""
+    extractor = _FakeExtractor()
+    pipeline = PagePipeline(extractor, analyze_workers=1, max_buffered=1)
+    pdf_path = _pdf(tmp_path, pages=8)
+
+    results = list(pipeline.run(pdf_path, max_pages=3))
+    assert [r['page_num'] for r in results] == [1, 2, 3]
+
+    run = pipeline.run(pdf_path)
+    assert next(run)['page_num'] == 1
+    run.close()
+    assert not any(t.name.startswith('prism-analyze') for t in threading.enumerate())
+
+
+def test_failed_pages_reach_finish(tmp_path, monkeypatch):
+    """렌더링 실패 / 준비 실패 페이지 → 오류가 _finish()로 전달, 페이지 순서 유지"""
+    extractor = _FakeExtractor(fail_prepare={4})
+    real_render = extractor.pdf_processor.render_page
+
+    def _render(pdf_path, page_num, dpi=300):
+        if page_num == 2:
+            raise RuntimeError("render 2")
+        return real_render(pdf_path, page_num, dpi=dpi)
+
+    monkeypatch.setattr(extractor.pdf_processor, "render_page", _render)
+    pipeline = PagePipeline(extractor, analyze_workers=0)
+
+    results = list(pipeline.run(_pdf(tmp_path, pages=5)))
+
+    assert [r['page_num'] for r in results] == [1, 2, 3, 4, 5]
+    assert [str(r['content']) for r in results] == ["page 1", "render 2", "page 3", "prepare 4", "page 5"]
+    assert isinstance(results[1]['content'], RuntimeError) and isinstance(results[3]['content'], ValueError)
+    assert pipeline.stats()['failed_pages'] == 2 and pipeline.stats()['vlm_pages'] == 3
@@ -0,0 +1,51 @@
+"""
+tests/test_page_quality.py - Phase 1.0 PageQualityScorer 테스트
+
+테스트 범위:
+1. 정상 규정 페이지 통과
+2. 스캔 페이지(텍스트 거의 없음) / 깨진 인코딩(PUA, cid) 탈락
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.page_quality import PageQualityScorer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REGULATION_PAGE = """제1조(목적) 이 규정은 마창수산 직원의 인사에 관한 사항을 정함을 목적으로 한다.
+제2조(적용범위) 직원의 인사에 관하여 다른 규정에 특별한 규정이 있는 경우를 제외하고는
+이 규정이 정하는 바에 따른다.
+제3조(정의) 이 규정에서 사용하는 용어의 뜻은 다음과 같다."""
+
+
+def test_regulation_page_passes():
+    """한글 조문 페이지 → 통과"""
+    quality = PageQualityScorer().score(REGULATION_PAGE)
+    assert quality.passed, quality.reason
+    assert quality.article_hits == 3
+    assert quality.hangul_ratio > 0.9 and quality.garbage_ratio == 0.0
+
+
+def test_scanned_and_garbled_pages_fail():
+    """텍스트 없음 / PUA / cid → 탈락"""
+    scorer = PageQualityScorer()
+
+    assert not scorer.score("").passed
+    assert not scorer.score("- 3 -").passed
+
+    pua = REGULATION_PAGE.replace("직원", "")
+    quality = scorer.score(pua)
+    assert not quality.passed and quality.garbage_ratio > 0.02
+
+    cid = " ".join(f"(cid:{n})" for n in range(100))
+    assert not scorer.score(cid).passed
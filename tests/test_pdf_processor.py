@@ -0,0 +1,173 @@
+"""
+tests/test_pdf_processor.py - Phase 1.0 PDFProcessor 테스트
+
+테스트 범위:
+1. 병렬 렌더링 결과 = 순차 렌더링 결과 (페이지 순서 보장)
+2. iter_pages() 스트리밍 (지연 생성)
+3. 렌더링 디스크 캐시 (선택 사항, 재실행 시 렌더링 생략, 썸네일은 저장 안 함)
+4. PdfDocumentPool (문서 1회 오픈 + mtime 변경 시 재오픈)
+5. 같은 문서 핸들을 여러 스레드가 사용 (렌더링/벡터 괘선/영역 텍스트) → pdfium 락으로 직렬화
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.pdf_processor import PDFProcessor
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _sample_pdf(tmp_path: Path, page_count: int = 5) -> str:
+    pages = [[f"Page {i + 1}", "Sample regulation text"] for i in range(page_count)]
+    return str(make_pdf(tmp_path / "sample.pdf", pages))
+
+
+def test_iter_pages_streams_in_order(tmp_path):
+    """iter_pages: 제너레이터 + 페이지 순서 + max_pages"""
+    pdf_path = _sample_pdf(tmp_path)
+    processor = PDFProcessor(use_cache=False)
+
+    pages = processor.iter_pages(pdf_path, max_pages=3, dpi=50, workers=2, lookahead=2)
+    assert not isinstance(pages, list), "❌ 리스트가 아닌 이터레이터여야 함"
+
+    first = next(pages)
+    assert first[1] == 1
+    assert [n for _, n in pages] == [2, 3], "❌ 스트리밍 페이지 순서 불일치"
+
+
+def test_parallel_render_matches_serial(tmp_path):
+    """병렬 렌더링: 순차와 동일한 결과 + 페이지 순서"""
+    pdf_path = _sample_pdf(tmp_path)
+    processor = PDFProcessor(use_cache=False)
+
+    serial = processor.pdf_to_images(pdf_path, dpi=50, workers=1)
+    parallel = processor.pdf_to_images(pdf_path, dpi=50, workers=2)
+
+    assert [n for _, n in parallel] == [1, 2, 3, 4, 5], "❌ 페이지 순서 불일치"
+    assert serial == parallel, "❌ 병렬/순차 렌더링 결과 불일치"
+
+
+def test_rendered_page_lazy_encoding(tmp_path):
+    """RenderedPage: 원시 BGR 버퍼 + Base64 지연 인코딩"""
+    import base64
+    import cv2
+    import numpy as np
+
+    pdf_path = _sample_pdf(tmp_path, page_count=1)
+    processor = PDFProcessor(use_cache=False)
+
+    page = next(processor.iter_rendered_pages(pdf_path, dpi=50))
+    assert page.pixels.dtype == np.uint8 and page.pixels.shape[2] == 3
+    assert page._base64 is None, "❌ 인코딩은 요청 시에만 수행되어야 함"
+
+    decoded = cv2.imdecode(np.frombuffer(base64.b64decode(page.base64), np.uint8), cv2.IMREAD_COLOR)
+    assert np.array_equal(decoded, page.pixels), "❌ PNG 왕복 결과 불일치 (무손실이어야 함)"
+
+
+def test_render_cache_skips_rendering(tmp_path, monkeypatch):
+    """캐시 적중: 동일 문서 재처리 시 렌더링 없이 동일 픽셀 (썸네일 해상도는 저장 안 함)"""
+    import numpy as np
+    from core import pdf_processor as module
+    from core.disk_cache import DiskCache, file_sha256
+
+    pdf_path = _sample_pdf(tmp_path, page_count=3)
+    cache = DiskCache(root=str(tmp_path / "cache"), namespace="pages")
+    processor = PDFProcessor(cache=cache)
+    monkeypatch.delenv("PRISM_PAGE_CACHE", raising=False)
+    assert PDFProcessor().cache is None, "❌ 캐시는 선택 사항 (기본 OFF)"
+
+    list(processor.iter_rendered_pages(pdf_path, dpi=PDFProcessor.LAYOUT_DPI))
+    assert not any(processor._is_page_cached(file_sha256(pdf_path), i, PDFProcessor.LAYOUT_DPI) for i in range(3))
+
+    first = list(processor.iter_rendered_pages(pdf_path, dpi=PDFProcessor.CACHE_MIN_DPI))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("❌ 캐시 적중 시 렌더링되면 안 됨")
+
+    monkeypatch.setattr(module, "_render_page", _fail)
+    monkeypatch.setattr(module.pdfium, "PdfDocument", _fail)
+
+    second = list(processor.iter_rendered_pages(pdf_path, dpi=PDFProcessor.CACHE_MIN_DPI, workers=2))
+    assert [p.page_num for p in second] == [1, 2, 3]
+    assert all(np.array_equal(a.pixels, b.pixels) for a, b in zip(first, second))
+    assert second[0].base64 == first[0].base64, "❌ 캐시된 PNG 재사용 불일치"
+
+
+def test_document_pool_single_open(tmp_path, monkeypatch):
+    """문서 핸들 풀: 텍스트/페이지 수/렌더링이 1회 오픈 공유, 변경 시 재오픈"""
+    import os
+    from core import pdf_processor as module
+
+    pdf_path = _sample_pdf(tmp_path, page_count=3)
+    opened = []
+    real_open = module.pdfium.PdfDocument
+
+    def _counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(module.pdfium, "PdfDocument", _counting_open)
+
+    with PDFProcessor(use_cache=False) as processor:
+        texts = processor.extract_texts(pdf_path)
+        assert [t.splitlines()[0] for t in texts] == ["Page 1", "Page 2", "Page 3"]
+        assert processor.extract_text(pdf_path, 2) == texts[1]
+        assert processor.get_page_count(pdf_path) == 3
+        processor.render_page(pdf_path, 1, dpi=50)
+        assert len(opened) == 1, f"❌ 문서가 {len(opened)}회 열림"
+
+        # 파일 변경(mtime) → 기존 핸들 폐기 후 재오픈
+        stat = os.stat(pdf_path)
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        processor.get_page_count(pdf_path)
+        assert len(opened) == 2 and len(processor.documents) == 1
+
+    assert len(processor.documents) == 0, "❌ with 종료 시 핸들이 닫히지 않음"
+
+
+def test_threads_share_document_under_lock(tmp_path, monkeypatch):
+    """분석 스레드 + 준비 스레드 동시 사용: pdfium 호출은 락 안에서만, 결과는 순차와 동일"""
+    from concurrent.futures import ThreadPoolExecutor
+    import numpy as np
+    from core import pdf_processor as module
+
+    pdf_path = str(make_pdf(tmp_path / "table.pdf", [["Annex"]] * 4, tables={i: (72, 300, 520, 600, 6, 4) for i in range(4)}))
+    unlocked = []
+    real_lines = module.extract_vector_lines
+
+    def _checked_lines(page):
+        # RLock 소유 여부 = 현재 스레드가 락 안에 있는지
+        if not module._PDFIUM_LOCK._is_owned():
+            unlocked.append(page)
+        return real_lines(page)
+
+    monkeypatch.setattr(module, "extract_vector_lines", _checked_lines)
+
+    with PDFProcessor(use_cache=False) as processor:
+        def _analyze(page_num):
+            page = processor.render_page(pdf_path, page_num, dpi=72)
+            return page.pixels, processor.extract_vector_lines(pdf_path, page_num).horizontal
+
+        def _prepare(page_num):
+            return processor.extract_text_boxes(pdf_path, page_num, [(0.0, 0.0, 1.0, 0.2)])
+
+        expected = [_analyze(n) for n in range(1, 5)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(5):
+                analyzed = executor.map(_analyze, range(1, 5))
+                prepared = executor.map(_prepare, range(1, 5))
+                for (pixels, lines), (want_pixels, want_lines) in zip(analyzed, expected):
+                    assert np.array_equal(pixels, want_pixels) and np.array_equal(lines, want_lines)
+                assert list(prepared) == [["Annex"]] * 4
+
+    assert not unlocked, "❌ 락 밖에서 pdfium 호출"
@@ -0,0 +1,130 @@
+"""
+tests/test_quick_layout_analyzer.py - Phase 1.0 QuickLayoutAnalyzer 테스트
+
+테스트 범위:
+1. 저해상도(100 DPI) 힌트가 300 DPI 힌트와 비교 가능한지 (DPI 비례 커널)
+2. 전체 OCR 텍스트(ocr_page_text) 보존 → Fallback 재사용
+3. 표/그림 영역 경계 상자 (해상도 무관 비율 좌표, 칸 수로 표/박스 구분)
+4. LayoutMasks 공유: 이진화/Canny는 페이지당 1회, 표 키워드는 analyze() OCR 재사용
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _table_pdf(tmp_path: Path) -> str:
+    return str(make_pdf(
+        tmp_path / "table.pdf",
+        [["Annex table"]],
+        tables={0: (72, 300, 520, 600, 6, 4)}
+    ))
+
+
+def test_low_dpi_hints_comparable(tmp_path):
+    """100 DPI 썸네일 힌트 = 300 DPI 힌트 (표 판정/교차 개수/다이어그램 수 동일, 선밀도 근사)"""
+    pdf_path = _table_pdf(tmp_path)
+    processor = PDFProcessor(use_cache=False)
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = False  # 표 키워드 없이 CV 판정만 비교
+
+    low = analyzer.analyze(processor.render_page(pdf_path, 1, dpi=100))
+    high = analyzer.analyze(processor.render_page(pdf_path, 1, dpi=300))
+
+    assert low['layout_dpi'] == 100 and high['layout_dpi'] == 300
+    ratio = low['h_v_line_density'] / high['h_v_line_density']
+    logger.info(f"   선밀도 비율 (100/300 DPI): {ratio:.2f}")
+    assert 0.5 < ratio < 2.0, f"❌ 해상도별 선밀도 편차 과다: {ratio:.2f}"
+
+    # 6x4 표 → 교차 7x5 = 35개, 표 1개 = 다이어그램 1개 (해상도 무관)
+    for key in ('has_table', 'grid_intersections', 'diagram_count'):
+        assert low[key] == high[key], f"❌ 해상도별 {key} 불일치: {low[key]} != {high[key]}"
+    assert high['has_table'] and high['grid_intersections'] == 35 and high['diagram_count'] == 1
+
+
+def test_full_ocr_text_kept_for_fallback(tmp_path, monkeypatch):
+    """hints['ocr_page_text']: 줄 구조 유지 전체 OCR, 지표용 ocr_text는 요약"""
+    import types
+    import core.quick_layout_analyzer as qla
+
+    lines = [f"제{n}조(목적) 이 규정은 항목 {n}에 적용한다." for n in range(1, 80)]
+    fake = types.SimpleNamespace(image_to_string=lambda gray, lang=None: '\n'.join(lines))
+    monkeypatch.setattr(qla, 'pytesseract', fake, raising=False)
+
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = True
+    page = PDFProcessor(use_cache=False).render_page(_table_pdf(tmp_path), 1, dpi=100)
+    hints = analyzer.analyze(page)
+
+    assert hints['ocr_page_text'].split('\n') == lines
+    assert '\n' not in hints['ocr_text'] and len(hints['ocr_text']) <= 500
+    assert analyzer.extract_page_text(page) == hints['ocr_page_text']
+
+
+def test_table_and_box_regions(tmp_path):
+    """표(6x4 격자) → table 영역 1개, 칸 없는 테두리 박스 → figure"""
+    pdf_path = str(make_pdf(
+        tmp_path / "regions.pdf",
+        [["Annex table"], ["Boxed note"], ["Article 1"]],
+        tables={0: (72, 300, 520, 600, 6, 4), 1: (72, 500, 520, 540, 1, 1)}
+    ))
+    processor = PDFProcessor(use_cache=False)
+    analyzer = QuickLayoutAnalyzer()
+
+    for dpi in (100, 300):
+        table = analyzer.analyze(processor.render_page(pdf_path, 1, dpi=dpi))['regions']
+        assert [r['kind'] for r in table] == ['table'] and table[0]['cells'] == 24
+        x0, y0, x1, y1 = table[0]['bbox']
+        # PDF 좌표 (72, 300)-(520, 600) pt, 원점 왼쪽 아래 → 비율 (여백 포함)
+        assert abs(x0 - 72 / 595) < 0.02 and abs(x1 - 520 / 595) < 0.02
+        assert abs(y0 - 242 / 842) < 0.02 and abs(y1 - 542 / 842) < 0.02
+
+    box = analyzer.analyze(processor.render_page(pdf_path, 2, dpi=100))['regions']
+    assert [r['kind'] for r in box] == ['figure']
+    assert analyzer.analyze(processor.render_page(pdf_path, 3, dpi=100))['regions'] == []
+
+
+def test_masks_computed_once_per_page(tmp_path, monkeypatch):
+    """analyze() 1회 = 적응 이진화 1회 + Canny 3회 (보수적/텍스트/표 엣지), Tesseract 1회"""
+    import types
+    import core.quick_layout_analyzer as qla
+
+    calls = {'threshold': 0, 'canny': 0, 'ocr': 0}
+    adaptive, canny = qla.cv2.adaptiveThreshold, qla.cv2.Canny
+
+    def counted(name, fn):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    def fake_ocr(gray, lang=None):
+        calls['ocr'] += 1
+        return "합계 100"
+
+    monkeypatch.setattr(qla.cv2, 'adaptiveThreshold', counted('threshold', adaptive))
+    monkeypatch.setattr(qla.cv2, 'Canny', counted('canny', canny))
+    monkeypatch.setattr(qla, 'pytesseract', types.SimpleNamespace(image_to_string=fake_ocr), raising=False)
+
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = True
+    page = PDFProcessor(use_cache=False).render_page(str(make_pdf(tmp_path / "text.pdf", [["Article 1"]])), 1, dpi=100)
+    hints = analyzer.analyze(page)
+
+    assert calls == {'threshold': 1, 'canny': 3, 'ocr': 1}
+    # 괘선 없는 페이지 → CV 교차점 없이 OCR 표 키워드로 표 판정
+    assert hints['has_table'] and hints['grid_intersections'] == 0
@@ -0,0 +1,75 @@
+"""
+tests/test_rate_limiter.py - Phase 1.0 Rate Limiter 테스트
+
+테스트 범위:
+1. TokenBucket: 버스트 소진 후 보충 속도만큼 간격
+2. Retry-After / x-ratelimit-reset 헤더 파싱
+3. penalize(): 서버 지정 정지가 대기 시간 메트릭에 반영
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rate_limiter import DecorrelatedJitter, RateLimiter, TokenBucket, retry_after_seconds
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _HTTPError(Exception):
+    def __init__(self, headers, status_code=429):
+        super().__init__("Error code: 429 - rate limit")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers)
+
+
+def test_token_bucket_paces_after_burst():
+    """버스트 1, 분당 600 → 두 번째 요청부터 0.1초 간격"""
+    bucket = TokenBucket(per_minute=600, burst=1)
+
+    waits = [bucket.reserve() for _ in range(3)]
+    assert waits[0] == 0.0
+    assert 0.08 < waits[1] <= 0.1 and 0.18 < waits[2] <= 0.2, waits
+
+
+def test_retry_after_headers():
+    """retry-after-ms > retry-after > x-ratelimit-reset-* 우선순위"""
+    assert retry_after_seconds(_HTTPError({'retry-after-ms': '250', 'retry-after': '9'})) == 0.25
+    assert retry_after_seconds(_HTTPError({'retry-after': '7'})) == 7.0
+    assert retry_after_seconds(_HTTPError({
+        'x-ratelimit-reset-requests': '1s',
+        'x-ratelimit-reset-tokens': '6m0s'
+    })) == 360.0
+    assert retry_after_seconds(_HTTPError({})) is None
+    assert retry_after_seconds(RuntimeError("no response")) is None
+
+
+def test_penalize_blocks_and_records_wait():
+    """penalize → 다음 acquire 대기, 메트릭 기록"""
+    limiter = RateLimiter("test:model")
+    limiter.penalize(0.2)
+
+    start = time.monotonic()
+    waited = limiter.acquire()
+    assert time.monotonic() - start >= 0.15 and waited >= 0.15
+
+    stats = limiter.stats()
+    assert stats['throttled'] == 1 and stats['requests'] == 1
+    assert stats['max_wait_sec'] >= 0.15
+
+
+def test_decorrelated_jitter_bounds():
+    """jitter: base 이상 cap 이하"""
+    backoff = DecorrelatedJitter(base=1.0, cap=5.0)
+    delays = [backoff.next() for _ in range(50)]
+    assert all(1.0 <= d <= 5.0 for d in delays)
@@ -0,0 +1,103 @@
+"""
+tests/test_region_crop.py - Phase 1.0 HybridExtractor 영역 크롭 VLM 테스트
+
+테스트 범위:
+1. 표 페이지 → 표 영역만 잘라 VLM 요청, 표 위/아래 본문은 텍스트 레이어로 순서대로 병합
+2. 영역 VLM 실패 → 해당 영역 텍스트 레이어로 대체 (전체 Fallback 없음)
+3. 영역이 너무 넓거나 Base64 입력이면 전체 페이지 VLM
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.hybrid_extractor import HybridExtractor
+from core.pdf_processor import PDFProcessor
+from core.prompt_rules import PromptRules
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _RegionVLM:
+    """영역 이미지 크기 기록 + 고정 응답 (fail=True면 예외)"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.images = []
+
+    def call_with_image(self, image_data, prompt, page_num=1, **kwargs):
+        self.images.append(image_data)
+        if self.fail:
+            raise RuntimeError("region failed")
+        return "| 구분 | 금액 |\n| 1 | 100 |"
+
+
+def _extractor(pdf_path: str, vlm) -> HybridExtractor:
+    # HybridExtractor 전체 초기화 대신 영역 크롭에 필요한 구성요소만 설정
+    extractor = HybridExtractor.__new__(HybridExtractor)
+    extractor.vlm_service = vlm
+    extractor.pdf_path = pdf_path
+    extractor.crop_regions = True
+    extractor.pdf_processor = PDFProcessor(use_cache=False)
+    extractor.prompt_rules = PromptRules()
+    return extractor
+
+
+def _page(tmp_path: Path):
+    pdf_path = str(make_pdf(
+        tmp_path / "annex.pdf",
+        [["Article 1 before the table"]],
+        tables={0: (72, 300, 520, 600, 6, 4)},
+        words={0: [(80, 580, "CellA"), (72, 200, "Article 2 after the table")]}
+    ))
+    page = PDFProcessor(use_cache=False).render_page(pdf_path, 1, dpi=100)
+    hints = QuickLayoutAnalyzer().analyze(page)
+    return pdf_path, page, hints
+
+
+def test_table_region_cropped_and_merged(tmp_path):
+    """표 영역만 VLM, 본문은 텍스트 레이어 → 위에서 아래 순서"""
+    pdf_path, page, hints = _page(tmp_path)
+    vlm = _RegionVLM()
+    extractor = _extractor(pdf_path, vlm)
+
+    regions = extractor._crop_candidates(hints, 'table', page)
+    assert [r['kind'] for r in regions] == ['table']
+    requests, texts, dpi = extractor._region_requests(page, 1, 'table', hints, regions)
+    assert dpi == 300 and len(requests) == 1
+    assert texts['regions'] == ['CellA']
+
+    request = {'region_requests': requests, 'region_texts': texts}
+    merged = extractor._merge_regions(request, extractor._call_vlm(request))
+    assert merged == "Article 1 before the table\n\n| 구분 | 금액 |\n| 1 | 100 |\n\nArticle 2 after the table"
+
+    # 전송 이미지: 300 DPI 전체 페이지보다 작은 영역 크롭
+    full = PDFProcessor(use_cache=False).render_page(pdf_path, 1, dpi=300)
+    assert len(vlm.images[0]) < len(full.base64)
+
+    # 영역 실패 → 영역 텍스트 레이어
+    failed = _extractor(pdf_path, _RegionVLM(fail=True))
+    merged = failed._merge_regions(request, failed._call_vlm(request))
+    assert merged == "Article 1 before the table\n\nCellA\n\nArticle 2 after the table"
+
+
+def test_full_page_when_not_croppable(tmp_path):
+    """넓은 영역 / Base64 입력 / 일반 페이지 → 영역 크롭 없음"""
+    pdf_path, page, hints = _page(tmp_path)
+    extractor = _extractor(pdf_path, _RegionVLM())
+
+    assert extractor._crop_candidates(hints, 'general', page) is None
+    assert extractor._crop_candidates(hints, 'table', page.base64) is None
+
+    wide = dict(hints, regions=[{'kind': 'table', 'bbox': [0.05, 0.1, 0.95, 0.9], 'cells': 20}])
+    assert extractor._crop_candidates(wide, 'table', page) is None
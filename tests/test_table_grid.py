@@ -0,0 +1,204 @@
+"""
+tests/test_table_grid.py - Phase 1.0 표 격자 (TableGrid) 테스트
+
+테스트 범위:
+1. 합성 PDF 표 → hints['tables'] 행/열 구분선 + 셀 사각형 (DPI 무관)
+2. 괘선 마스크 직접 작성 → 병합 셀 (가로/세로 병합) + 좌우 테두리 없는 표
+3. to_pixels() 크롭 좌표 / 체크포인트 JSON 직렬화
+4. 벡터 괘선 (PDF 경로 객체): 그리기 선 / 얇은 채움 사각형 → 렌더링 없이 같은 격자 (source='vector'),
+   스캔 페이지(이미지 위주)는 래스터 검출로 Fallback
+5. 벡터 괘선 표 힌트 (has_table / grid_intersections / h_v_line_density) = 래스터 힌트, 래스터 선 마스크 미계산
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.job_checkpoint import _json_default
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from core.table_grid import VectorLines, extract_vector_lines, grid_from_line_masks, merge_cells
+from tests.pdf_fixtures import PAGE_HEIGHT, PAGE_WIDTH, make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _line_masks(size, h_lines, v_lines, thickness=3):
+    """가로선 [(y, x0, x1)] / 세로선 [(x, y0, y1)] → (horizontal, vertical) uint8 마스크"""
+    height, width = size
+    horizontal = np.zeros((height, width), dtype=np.uint8)
+    vertical = np.zeros((height, width), dtype=np.uint8)
+    for y, x0, x1 in h_lines:
+        horizontal[y:y + thickness, x0:x1] = 255
+    for x, y0, y1 in v_lines:
+        vertical[y0:y1, x:x + thickness] = 255
+    return horizontal, vertical
+
+
+def test_pdf_table_grid(tmp_path):
+    """6x4 표 → 구분선 7/5개, 셀 24개 (PDF 좌표와 일치, 100/300 DPI 동일)"""
+    pdf = make_pdf(tmp_path / "table.pdf", [["Annex"]], tables={0: (72, 300, 520, 600, 6, 4)})
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = False
+
+    for dpi in (100, 300):
+        page = PDFProcessor(use_cache=False).render_page(str(pdf), 1, dpi=dpi)
+        hints = analyzer.analyze(page, dpi=dpi)
+        assert [r['kind'] for r in hints['regions']] == ['table']
+        (grid,) = hints['tables']
+
+        assert grid.shape == (6, 4) and grid.cells.shape == (24, 4)
+        assert grid.merged_cells == 0 and grid.source == 'raster'
+        # PDF y는 아래→위 (페이지 비율은 위→아래), 허용 오차 = 선 두께 + 반올림 (약 2pt)
+        assert np.allclose(grid.rows, 1 - np.linspace(600, 300, 7) / PAGE_HEIGHT, atol=0.003)
+        assert np.allclose(grid.cols, np.linspace(72, 520, 5) / PAGE_WIDTH, atol=0.004)
+        assert np.allclose(grid.bbox, [72 / PAGE_WIDTH, 1 - 600 / PAGE_HEIGHT, 520 / PAGE_WIDTH, 1 - 300 / PAGE_HEIGHT],
+                           atol=0.004)
+
+
+def test_merged_cells_from_masks():
+    """머리글 가로 병합 + 첫 열 세로 병합 → 셀 번호 공유, 셀 사각형은 칸들의 경계 상자"""
+    # 3행 x 3열 (x: 100/200/300/400, y: 100/150/200/250)
+    h_lines = [(100, 100, 403), (250, 100, 403), (150, 100, 403), (200, 200, 403)]  # 첫 열 2~3행 병합
+    v_lines = [(100, 100, 253), (400, 100, 253), (200, 100, 253), (300, 150, 253)]  # 머리글 2~3열 병합
+    horizontal, vertical = _line_masks((400, 500), h_lines, v_lines)
+
+    grid = grid_from_line_masks(horizontal, vertical, (100, 100, 303, 153), join=5)
+
+    assert grid.shape == (3, 3)
+    assert grid.cell_index.tolist() == [[0, 1, 1], [2, 3, 4], [2, 5, 6]]
+    assert len(grid.cells) == 7 and grid.merged_cells == 2
+    px = grid.to_pixels(500, 400)
+    assert np.allclose(px[1], [200, 100, 400, 150], atol=2)  # 머리글 병합 셀
+    assert np.allclose(px[2], [100, 150, 200, 250], atol=2)  # 첫 열 병합 셀
+
+
+def test_open_sided_table_uses_box_edges():
+    """좌우 세로 테두리 없는 표 → 상자 경계를 바깥 구분선으로 보완"""
+    h_lines = [(50, 20, 220), (100, 20, 220), (150, 20, 220)]
+    v_lines = [(120, 50, 153)]
+    horizontal, vertical = _line_masks((200, 240), h_lines, v_lines)
+
+    grid = grid_from_line_masks(horizontal, vertical, (20, 50, 200, 103), join=5)
+
+    assert grid.shape == (2, 2) and len(grid.cells) == 4
+    assert np.allclose(grid.cols * 240, [20, 121, 219], atol=1.5)
+
+
+def test_merge_cells_lattice():
+    """괘선 없는 경계만 연결 (행 우선 첫 등장 순서로 번호)"""
+    h_walls = np.array([[True, False]])
+    v_walls = np.array([[False], [True]])
+    assert merge_cells(h_walls, v_walls).tolist() == [[0, 0], [1, 0]]
+
+
+def test_grid_json_serialization():
+    """체크포인트 JSON: to_dict() 경유 직렬화"""
+    horizontal, vertical = _line_masks((100, 100), [(10, 10, 93), (90, 10, 93)], [(10, 10, 93), (90, 10, 93)])
+    grid = grid_from_line_masks(horizontal, vertical, (10, 10, 83, 83), join=5)
+
+    payload = json.loads(json.dumps({'tables': [grid]}, default=_json_default))
+    (table,) = payload['tables']
+    assert table['source'] == 'raster' and table['cell_index'] == [[0]]
+    assert len(table['rows']) == 2 and len(table['cells'][0]) == 4
+
+
+def test_vector_table_grid(tmp_path):
+    """그리기 괘선 → 벡터 격자 = 래스터 격자 (본문 글자가 괘선 위에 겹쳐도 병합 오검출 없음)"""
+    body = [f"Article {n}. This regulation applies to item {n * 7} of the annex." for n in range(1, 41)]
+    pdf_path = make_pdf(tmp_path / "table.pdf", [body], tables={0: (72, 120, 520, 330, 8, 5)})
+    processor = PDFProcessor(use_cache=False)
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = False
+
+    lines = processor.extract_vector_lines(str(pdf_path), 1)
+    assert lines.horizontal.shape == (9, 3) and lines.vertical.shape == (6, 3)
+    assert not lines.needs_raster
+
+    regions, tables = analyzer.detect_vector_regions(lines)
+    (grid,) = tables
+    assert grid.source == 'vector' and grid.shape == (8, 5) and len(grid.cells) == 40
+    assert regions[0]['kind'] == 'table' and regions[0]['cells'] == 40
+    assert np.allclose(grid.rows, 1 - np.linspace(330, 120, 9) / PAGE_HEIGHT, atol=0.003)
+
+    page = processor.render_page(str(pdf_path), 1, dpi=100)
+    hints = analyzer.analyze(page, vector_lines=lines)
+    assert hints['tables'][0].source == 'vector'
+    assert np.allclose(hints['tables'][0].bbox, analyzer.analyze(page)['tables'][0].bbox, atol=0.004)
+
+
+def test_vector_filled_rulings():
+    """얇은 채움 사각형 = 괘선, 두꺼운 채움 사각형 (셀 배경) 제외"""
+    pdf = pdfium.PdfDocument.new()
+    page = pdf.new_page(PAGE_WIDTH, PAGE_HEIGHT)
+    rects = [(100, y, 300, 1) for y in (500, 550, 600, 650)] + [(x, 500, 1, 151) for x in (100, 250, 400)]
+    for x, y, w, h in rects + [(50, 50, 200, 100)]:
+        obj = pdfium_c.FPDFPageObj_CreateNewRect(x, y, w, h)
+        pdfium_c.FPDFPath_SetDrawMode(obj, pdfium_c.FPDF_FILLMODE_ALTERNATE, False)
+        pdfium_c.FPDFPage_InsertObject(page, obj)
+    pdfium_c.FPDFPage_GenerateContent(page)
+
+    lines = extract_vector_lines(page)
+    assert lines.horizontal.shape == (4, 3) and lines.vertical.shape == (3, 3)
+    assert np.allclose(lines.horizontal[:, 0] * PAGE_HEIGHT, [341.5, 291.5, 241.5, 191.5])
+
+    _, tables = QuickLayoutAnalyzer(ocr_workers=0).detect_vector_regions(lines)
+    assert [grid.shape for grid in tables] == [(3, 2)]
+
+
+def test_scanned_page_uses_raster(tmp_path):
+    """이미지가 페이지 대부분 → needs_raster → 렌더링 이미지 래스터 검출"""
+    pdf_path = make_pdf(tmp_path / "table.pdf", [["Annex"]], tables={0: (72, 300, 520, 600, 6, 4)})
+    page = PDFProcessor(use_cache=False).render_page(str(pdf_path), 1, dpi=100)
+    scanned = VectorLines(np.empty((0, 3)), np.empty((0, 3)), (PAGE_WIDTH, PAGE_HEIGHT), image_coverage=0.98)
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = False
+
+    assert scanned.needs_raster
+    (grid,) = analyzer.analyze(page, vector_lines=scanned)['tables']
+    assert grid.source == 'raster' and grid.shape == (6, 4)
+
+
+def test_vector_table_hints_skip_raster_lines(tmp_path, monkeypatch):
+    """디지털 페이지: 표 힌트도 벡터 괘선 기준 (래스터와 같은 값), 이진화/표 엣지 Canny 미실행"""
+    import core.quick_layout_analyzer as qla
+
+    pdf_path = make_pdf(tmp_path / "table.pdf", [["Annex"]], tables={0: (72, 300, 520, 600, 6, 4)})
+    processor = PDFProcessor(use_cache=False)
+    page = processor.render_page(str(pdf_path), 1, dpi=300)
+    lines = processor.extract_vector_lines(str(pdf_path), 1)
+    analyzer = QuickLayoutAnalyzer(ocr_workers=0)
+    analyzer.tesseract_available = False
+    raster = analyzer.analyze(page)
+
+    calls = {'threshold': 0, 'canny': 0}
+    adaptive, canny = qla.cv2.adaptiveThreshold, qla.cv2.Canny
+
+    def counted(name, fn):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(qla.cv2, 'adaptiveThreshold', counted('threshold', adaptive))
+    monkeypatch.setattr(qla.cv2, 'Canny', counted('canny', canny))
+    vector = analyzer.analyze(page, vector_lines=lines)
+
+    # 텍스트/지도/다이어그램용 그레이 엣지 Canny 1회만 (보수적 선 마스크 / 표 엣지 생략)
+    assert calls == {'threshold': 0, 'canny': 1}
+    assert vector['tables'][0].source == 'vector'
+    assert vector['has_table'] and vector['grid_intersections'] == raster['grid_intersections'] == 35
+    assert np.isclose(vector['h_v_line_density'], raster['h_v_line_density'], rtol=0.2)
@@ -0,0 +1,103 @@
+"""
+tests/test_text_geometry.py - Phase 1.0 좌표 기반 텍스트 레이어 + 표 셀 구조화 테스트
+
+테스트 범위:
+1. 글자 상자 → 단어 / 줄 (content stream 순서와 무관하게 위→아래, 왼쪽→오른쪽)
+2. 괘선 격자 셀 배정 (table_rows), 괘선 없는 표 열 클러스터 (text_grid)
+3. TableParser.parse_grid: 머리글 열 쌍 (좌우 반복 묶음), 제목으로 표 종류 판별
+4. TableParser.parse_pdf: 벡터 격자 + 단어 상자 → 행 청크, 제목 없는 다음 페이지 표는 종류 이어받음
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import re
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.pdf_processor import PDFProcessor
+from core.quick_layout_analyzer import QuickLayoutAnalyzer
+from core.text_geometry import table_rows, text_grid
+from research.table_parser import TableParser
+from tests.pdf_fixtures import PAGE_HEIGHT, make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _cell_words(x0, y_top, col_width, row_height, rows):
+    """행 x 열 텍스트 → make_pdf words (PDF 좌표, 셀 왼쪽 아래 여백 4pt), 열/행 역순으로 작성"""
+    words = []
+    for r, row in enumerate(rows):
+        for c, text in enumerate(row):
+            words.append((x0 + c * col_width + 4, y_top - (r + 1) * row_height + 4, text))
+    return words[::-1]
+
+
+def test_words_to_ruled_cells(tmp_path):
+    """역순으로 쓴 단어도 줄 순서 복원 + 괘선 격자 셀에 배정 (여러 단어 셀 포함)"""
+    cells = [["No", "Rank"], ["1", "up to 5"], ["2", "up to 10"]]
+    pdf = make_pdf(
+        tmp_path / "cells.pdf", [["Annex table"]],
+        tables={0: (72, 500, 372, 620, 3, 2)},
+        words={0: _cell_words(72, 620, 150, 40, cells)}
+    )
+    processor = PDFProcessor(use_cache=False)
+    words = processor.extract_words(str(pdf), 1)
+
+    assert words.lines() == ["Annex table", "No Rank", "1 up to 5", "2 up to 10"]
+    assert words.boxes.shape == (len(words), 4) and (words.boxes[:, 2] > words.boxes[:, 0]).all()
+
+    _, (grid,) = QuickLayoutAnalyzer(ocr_workers=0).detect_vector_regions(processor.extract_vector_lines(str(pdf), 1))
+    assert table_rows(words, grid) == cells
+
+
+def test_borderless_columns(tmp_path):
+    """괘선 없는 표: 줄 = 행, x 점유 빈 구간 = 열 (여러 열에 걸친 제목 줄 제외 영역)"""
+    cells = [["Count", "Range", "Note"], ["1", "5", "a"], ["2", "10", "b"], ["3", "15", "c"]]
+    pdf = make_pdf(tmp_path / "plain.pdf", [["Annex 1"]], words={0: _cell_words(72, 700, 120, 20, cells)})
+    words = PDFProcessor(use_cache=False).extract_words(str(pdf), 1)
+
+    grid = text_grid(words, [0.0, 120 / PAGE_HEIGHT, 1.0, 1.0])
+    assert grid.source == 'text' and grid.shape == (4, 3)
+    assert table_rows(words, grid) == cells
+
+
+def test_parse_grid_column_pairs():
+    """좌우 반복 열 묶음 + '번까지' 셀 → 행 청크 (임용인원수 순)"""
+    parser = TableParser()
+    rows = [
+        ["임용하고자 하는 인원수", "서열명부 순위", "임용하고자 하는 인원수", "서열명부 순위"],
+        ["1", "5번까지", "6", "28번까지"],
+        ["2", "10번까지", "", ""],
+    ]
+
+    chunks = parser.parse_grid(rows, "임용하고자하는인원수에대한승진후보자범위(3급승진제외)")
+    assert [(c['임용인원수'], c['서열명부순위']) for c in chunks] == [(1, 5), (2, 10), (6, 28)]
+    assert chunks[0]['table_id'] == 'annex_1_3급승진제외' and chunks[0]['rule'] == '5배수'
+
+    assert parser.parse_grid(rows, "승진후보자범위(3급승진)")[0]['table_id'] == 'annex_1_3급승진'
+    assert parser.parse_grid(rows, "별표 2") == []
+    assert len(parser.parse_grid(rows[1:], table_type='3급승진')) == 3  # 머리글 없음 → 인접 열 쌍
+
+
+def test_parse_pdf_from_geometry(tmp_path, monkeypatch):
+    """표 제목 → 종류, 다음 페이지 제목 없는 표는 이어받음 (ASCII 폰트 → 제목 패턴 대체)"""
+    monkeypatch.setitem(TableParser.TABLE_HEADER_PATTERNS, '3급승진제외', [re.compile(r'EXCL')])
+    first = [["1", "5", "3", "15"], ["2", "10", "4", "20"]]
+    second = [["5", "25", "6", "28"]]
+    pdf = make_pdf(
+        tmp_path / "annex.pdf", [["Promotion range EXCL"], ["- 2 -"]],
+        tables={0: (72, 560, 472, 640, 2, 4), 1: (72, 600, 472, 640, 1, 4)},
+        words={0: _cell_words(72, 640, 100, 40, first), 1: _cell_words(72, 640, 100, 40, second)}
+    )
+
+    chunks = TableParser().parse_pdf(str(pdf))
+
+    assert [(c['임용인원수'], c['서열명부순위']) for c in chunks] == [(1, 5), (2, 10), (3, 15), (4, 20), (5, 25), (6, 28)]
+    assert {c['table_id'] for c in chunks} == {'annex_1_3급승진제외'}
@@ -0,0 +1,94 @@
+"""
+tests/test_text_layer.py - Phase 1.0 텍스트 레이어 추출 테스트
+
+테스트 범위:
+1. pdfium / pypdf 백엔드 페이지별 텍스트 일치
+2. 병렬 pdfium 추출 = 순차 추출 (페이지 순서)
+3. 페이지 시작 오프셋 (빈 페이지 포함)
+4. 프로세스 내 pdfium 추출은 pdf_processor 락 안에서만 (렌더링 스레드와 동시 실행)
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import text_layer
+from core.text_layer import PdfTextLayer, extract_text_layer
+from tests.pdf_fixtures import make_pdf
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _sample_pdf(tmp_path: Path, page_count: int = 4) -> str:
+    pages = [[f"Article {i + 1}", "Sample regulation text"] for i in range(page_count)]
+    return str(make_pdf(tmp_path / "sample.pdf", pages))
+
+
+def test_backends_agree(tmp_path):
+    """pdfium과 pypdf 페이지별 텍스트 동일 (공백 정규화 기준)"""
+    pdf_path = _sample_pdf(tmp_path)
+
+    pdfium_layer = extract_text_layer(pdf_path, backend='pdfium', use_cache=False)
+    pypdf_layer = extract_text_layer(pdf_path, backend='pypdf', use_cache=False)
+
+    normalize = lambda pages: [' '.join(p.split()) for p in pages]
+    assert normalize(pdfium_layer.pages) == normalize(pypdf_layer.pages)
+    assert '\r' not in pdfium_layer.text
+
+
+def test_parallel_pdfium_matches_serial(tmp_path, monkeypatch):
+    """병렬 추출: 순차와 동일한 페이지 순서/내용"""
+    pdf_path = _sample_pdf(tmp_path, page_count=9)
+
+    serial = text_layer.extract_pages_pdfium(pdf_path, workers=1)
+    monkeypatch.setattr(text_layer, "PARALLEL_MIN_PAGES", 2)
+    parallel = text_layer.extract_pages_pdfium(pdf_path, workers=2)
+
+    assert parallel == serial
+    assert parallel[8].startswith("Article 9")
+
+
+def test_in_process_pdfium_under_lock(tmp_path, monkeypatch):
+    """지연 텍스트 추출 (분석 스레드) + 렌더링 (준비 스레드) 동시: TextPage 읽기는 락 안에서만"""
+    from concurrent.futures import ThreadPoolExecutor
+    from core import pdf_processor
+    from core.pdf_processor import PDFProcessor
+
+    pdf_path = _sample_pdf(tmp_path, page_count=8)
+    expected = text_layer.extract_pages_pdfium(pdf_path, workers=1)
+    unlocked = []
+    real_normalize = text_layer._normalize_pdfium_text
+
+    def _checked(text):
+        # RLock 소유 여부 = 현재 스레드가 락 안에 있는지
+        if not pdf_processor._PDFIUM_LOCK._is_owned():
+            unlocked.append(text)
+        return real_normalize(text)
+
+    monkeypatch.setattr(text_layer, "_normalize_pdfium_text", _checked)
+
+    with PDFProcessor(use_cache=False) as processor, ThreadPoolExecutor(max_workers=4) as executor:
+        extracted = [executor.submit(text_layer.extract_pages_pdfium, pdf_path, 1) for _ in range(4)]
+        rendered = [executor.submit(processor.render_page, pdf_path, n, 72) for n in range(1, 9) for _ in range(2)]
+        assert all(future.result() == expected for future in extracted)
+        assert all(future.result().page_num > 0 for future in rendered)
+
+    assert not unlocked, "❌ 락 밖에서 pdfium 텍스트 추출"
+
+
+def test_page_starts_offsets():
+    """페이지 시작 오프셋: text[start:]가 해당 페이지로 시작"""
+    layer = PdfTextLayer.from_pages(["first", "", "third"], backend='test')
+
+    assert layer.text == "first\n\nthird"
+    assert layer.page_starts == [0, 7, 7]
+    for page_text, start in zip(layer.pages, layer.page_starts):
+        assert layer.text[start:start + len(page_text)] == page_text
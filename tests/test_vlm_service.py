@@ -0,0 +1,195 @@
+"""
+tests/test_vlm_service.py - Phase 1.0 VLMServiceV50 동시 호출 테스트
+
+테스트 범위:
+1. call_many(): 동시성 한도 준수 + 요청 순서대로 결과
+   (한도는 프로바이더/모델별 프로세스 전역 - 여러 스레드의 call_many()/인스턴스 합계 기준)
+2. 실패 요청은 예외 객체로 해당 위치에 반환
+3. 응답 캐시: 동일 입력 재호출 시 API 생략, 우회 플래그, 프롬프트 변경 시 미스,
+   수용 기준(MIN_RESPONSE_CHARS) 미달 응답은 저장 안 함
+4. Rate limit: Retry-After 헤더만큼 대기 후 재시도
+
+Author: 마창수산팀
+Date: 2026-10-16
+Version: Phase 1.0
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from core import rate_limiter
+from core.vlm_service import MIN_RESPONSE_CHARS, VLMServiceV50
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_concurrency_limits(monkeypatch):
+    # 공유 동시 요청 한도는 최초 생성 값 유지 → 테스트마다 새 레지스트리
+    monkeypatch.setattr(rate_limiter, "_CONCURRENCY", {})
+
+
+def _service(monkeypatch, max_concurrency: int = 1, cache=None) -> VLMServiceV50:
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return VLMServiceV50(
+        provider='openai',
+        max_concurrency=max_concurrency,
+        use_cache=cache is not None,
+        cache=cache
+    )
+
+
+def test_call_many_bounded_and_ordered(monkeypatch):
+    """동시 실행 수 ≤ 한도, 결과는 요청 순서"""
+    service = _service(monkeypatch, max_concurrency=3)
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def fake_call(image_data, prompt, **kwargs):
+        page_num = int(prompt)
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        # 뒤 페이지가 먼저 끝나도 순서 유지되는지 확인
+        time.sleep(0.05 * (10 - page_num) / 10)
+        with lock:
+            state['active'] -= 1
+        return f"page {page_num}"
+
+    monkeypatch.setattr(service, "call_with_retry", fake_call)
+
+    requests = [{'image_data': '', 'prompt': str(n), 'page_num': n} for n in range(1, 10)]
+    results = service.call_many(requests)
+
+    assert results == [f"page {n}" for n in range(1, 10)]
+    assert state['peak'] == 3, f"❌ 동시 실행 수 {state['peak']} (한도 3)"
+
+
+def test_concurrency_limit_shared_across_loops(monkeypatch):
+    """스레드 2개가 각자 call_many() (이벤트 루프 2개) + 인스턴스 2개 → 합계가 한도 이하"""
+    first = _service(monkeypatch, max_concurrency=2)
+    second = _service(monkeypatch, max_concurrency=5)
+    assert second.max_concurrency == 2, "❌ 같은 프로바이더/모델은 한도 공유"
+
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def fake_call(image_data, prompt, **kwargs):
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.05)
+        with lock:
+            state['active'] -= 1
+        return prompt
+
+    requests = [{'image_data': '', 'prompt': str(n), 'page_num': n} for n in range(1, 7)]
+    results = {}
+    threads = []
+    for name, service in (('first', first), ('second', second)):
+        monkeypatch.setattr(service, "call_with_retry", fake_call)
+        threads.append(threading.Thread(target=lambda n=name, s=service: results.update({n: s.call_many(requests)})))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results['first'] == results['second'] == [str(n) for n in range(1, 7)]
+    assert state['peak'] == 2, f"❌ 동시 실행 수 {state['peak']} (공유 한도 2)"
+
+
+def test_call_many_isolates_failures(monkeypatch):
+    """실패 요청 자리에 예외 객체, 나머지는 정상"""
+    service = _service(monkeypatch, max_concurrency=2)
+
+    def fake_call(image_data, prompt, page_num=1, **kwargs):
+        if page_num == 2:
+            raise RuntimeError("boom")
+        return f"page {page_num}"
+
+    monkeypatch.setattr(service, "call_with_image", fake_call)
+
+    results = service.call_many([{'image_data': '', 'prompt': 'p', 'page_num': n} for n in (1, 2, 3)])
+    assert results[0] == "page 1" and results[2] == "page 3"
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_response_cache_hits_and_bypass(tmp_path, monkeypatch):
+    """동일 (이미지, 프롬프트) → 캐시 적중, use_cache=False → 재호출"""
+    import base64
+    from core.disk_cache import DiskCache
+
+    service = _service(monkeypatch, cache=DiskCache(root=str(tmp_path), namespace="vlm"))
+    calls = []
+
+    def fake_call(image_data, prompt, ocr_text=""):
+        calls.append(prompt)
+        return f"제1조(목적) 응답 본문 - {prompt} " + "이 규정은 캐시 테스트용 본문이다. " * 3
+
+    monkeypatch.setattr(service, "call", fake_call)
+    image = base64.b64encode(b"png-bytes").decode()
+
+    first = service.call_with_image(image, "prompt A")
+    assert service.call_with_image(image, "prompt A") == first
+    assert len(calls) == 1, "❌ 캐시 적중 시 VLM 재호출"
+
+    service.call_with_image(image, "prompt A", use_cache=False)
+    service.call_with_image(image, "prompt B")
+    assert calls == ["prompt A", "prompt A", "prompt B"]
+
+    stats = service.cache_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 2
+
+
+def test_short_response_not_cached(tmp_path, monkeypatch):
+    """수용 기준 미달 응답 (Fallback 대상) → 캐시 저장 안 함, 다음 호출에서 재요청"""
+    import base64
+    from core.disk_cache import DiskCache
+
+    service = _service(monkeypatch, cache=DiskCache(root=str(tmp_path), namespace="vlm"))
+    replies = ["제1조(목적) 짧은 응답", "제1조(목적) " + "충분한 길이의 본문 " * 8]
+    monkeypatch.setattr(service, "call", lambda image_data, prompt, ocr_text="": replies.pop(0))
+    image = base64.b64encode(b"png-bytes").decode()
+
+    short = service.call_with_image(image, "prompt")
+    assert len(short.strip()) < MIN_RESPONSE_CHARS
+    accepted = service.call_with_image(image, "prompt")
+    assert len(accepted.strip()) >= MIN_RESPONSE_CHARS
+    assert service.call_with_image(image, "prompt") == accepted and not replies
+
+
+def test_retry_after_honored(monkeypatch):
+    """429 + Retry-After → 공유 limiter 정지 후 재시도 성공"""
+    from types import SimpleNamespace
+    from core.rate_limiter import RateLimiter
+
+    service = _service(monkeypatch)
+    service.rate_limiter = RateLimiter("openai:test")
+    attempts = []
+
+    class RateLimitError(Exception):
+        status_code = 429
+        response = SimpleNamespace(headers={'retry-after-ms': '150'})
+
+    def fake_call(image_data, prompt, ocr_text=""):
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise RateLimitError("Error code: 429")
+        return "제1조(목적) 재시도 성공 응답"
+
+    monkeypatch.setattr(service, "call", fake_call)
+
+    assert service.call_with_retry("", "prompt", use_cache=False).startswith("제1조")
+    assert attempts[1] - attempts[0] >= 0.14, "❌ Retry-After 미준수"
+
+    stats = service.rate_limit_stats()
+    assert stats['throttled'] == 1 and stats['requests'] == 2